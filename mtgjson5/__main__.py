@@ -134,6 +134,7 @@ def dispatcher(args: argparse.Namespace) -> None:
     from mtgjson5.build.writer import assemble_json_outputs, assemble_with_models
     from mtgjson5.compress_generator import compress_mtgjson_contents
     from mtgjson5.data import PipelineContext
+    from mtgjson5.data.requirements import required_inputs
     from mtgjson5.mtgjson_config import MtgjsonConfig
     from mtgjson5.mtgjson_s3_handler import MtgjsonS3Handler
     from mtgjson5.pipeline.core import build_cards
@@ -167,11 +168,24 @@ def dispatcher(args: argparse.Namespace) -> None:
             set_filter.append(code.upper())
             set_filter.append(f"T{code.upper()}")
         set_filter = sorted(set(set_filter))
+
+    decks_only = outputs_requested == {"decks"}
+
+    # Load only what the requested build reads; referrals may fall back to
+    # building an AssemblyContext from the pipeline, so they load everything
+    requirements = None
+    if not args.referrals:
+        requirements = required_inputs(
+            build_cards=bool(sets_to_build or args.all_sets or decks_only),
+            outputs=outputs_requested,
+            sets_only=sets_only,
+        )
     GlobalCache().load_all(
         set_codes=set_filter,
         output_types=outputs_requested,
         export_formats=export_formats,
         skip_mcm=args.skip_mcm,
+        requirements=requirements,
     )
     profiler.checkpoint("cache_loaded", top_n=10)
 
@@ -197,19 +211,28 @@ def dispatcher(args: argparse.Namespace) -> None:
         sets_to_build = list(set(sets_to_build).union(additional_set_keys))
         args.sets = sorted(sets_to_build)
 
-    decks_only = outputs_requested == {"decks"}
-
     # Create pipeline context
     ctx = PipelineContext.from_global_cache(args=args)
     profiler.checkpoint("context_created")
-    ctx.consolidate_lookups()
+    ctx.consolidate_lookups(requirements)
     profiler.checkpoint("lookups_consolidated")
 
     assembly_ctx = None  # Shared across assembly, exports, and referrals
 
     if sets_to_build or decks_only:
         batch_size = getattr(args, "batch_size", "auto")
-        build_cards(ctx, batch_size=batch_size)
+        workers = getattr(args, "pipeline_workers", 1)
+        incremental = not getattr(args, "no_incremental", False)
+        memory_gb = getattr(args, "pipeline_memory_gb", None)
+        resume = getattr(args, "resume_pipeline", False)
+        build_cards(
+            ctx,
+            batch_size=batch_size,
+            workers=workers,
+            incremental=incremental,
+            memory_gb=memory_gb,
+            resume=resume,
+        )
         profiler.checkpoint("pipeline_complete", top_n=10)
 
         # Release pipeline-only frames before assembly
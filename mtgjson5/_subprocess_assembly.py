@@ -63,7 +63,8 @@ def run_assembly_group(
         init_logger(log_file)
         _log = logging.getLogger(__name__)
 
-        from mtgjson5.profiler import SubprocessProfiler
+        from mtgjson5.pipeline.batching import BatchPeakMeter
+        from mtgjson5.profiler import SubprocessProfiler, get_peak_rss_mb
 
         sp = SubprocessProfiler(label=f"assembly_{group_label}", enabled=profile)
         sp.start()
@@ -71,33 +72,48 @@ def run_assembly_group(
         from mtgjson5.build.context import AssemblyContext
         from mtgjson5.build.formats.json import JsonOutputBuilder
 
-        skip = _GROUP_SKIP.get(group_label, frozenset())
-        ctx = AssemblyContext.from_cache(skip=skip)
-        sp.checkpoint("cache_loaded")
-
-        if ctx is None:
-            error_queue.put("AssemblyContext cache not found")
-            return
-
-        ctx.pretty = pretty
-        builder = JsonOutputBuilder(ctx)
-        out = Path(output_dir)
-        out.mkdir(parents=True, exist_ok=True)
         results: dict[str, Any] = {}
-
-        for task in tasks:
-            _log.info(f"Subprocess: building {task}")
-            _run_task(task, builder, ctx, out, set_codes, sets_only, include_decks, results)
-            sp.checkpoint(f"task_{task}")
-            _log.info(f"Subprocess: {task} complete")
+        # The group's footprint includes its set/deck worker pools
+        with BatchPeakMeter(interval=0.25, include_children=True) as meter:
+            skip = _GROUP_SKIP.get(group_label, frozenset())
+            ctx = AssemblyContext.from_cache(skip=skip)
+            sp.checkpoint("cache_loaded")
+
+            if ctx is None:
+                error_queue.put("AssemblyContext cache not found")
+                return
+
+            ctx.pretty = pretty
+            builder = JsonOutputBuilder(ctx)
+            out = Path(output_dir)
+            out.mkdir(parents=True, exist_ok=True)
+
+            for task in _coalesce_tasks(tasks):
+                _log.info(f"Subprocess: building {task}")
+                _run_task(task, builder, ctx, out, set_codes, sets_only, include_decks, results)
+                sp.checkpoint(f"task_{task}")
+                _log.info(f"Subprocess: {task} complete")
 
         sp.checkpoint("finish")
         results["_profile"] = sp.to_dict()
+        results["_peak_rss_mb"] = max(get_peak_rss_mb(), meter.peak_mb)
         results_queue.put(results)
     except Exception as exc:
         error_queue.put(f"assembly group {tasks}: {exc}\n{traceback.format_exc()}")
 
 
+def _coalesce_tasks(tasks: list[str]) -> list[str]:
+    """Merge tasks that share a single streaming pass.
+
+    AtomicCards and FormatAtomics are both produced from one walk of
+    ``AtomicCardsAssembler.iter_atomic``.
+    """
+    if "AtomicCards" in tasks and "FormatAtomics" in tasks:
+        merged = [t for t in tasks if t != "FormatAtomics"]
+        return ["AtomicOutputs" if t == "AtomicCards" else t for t in merged]
+    return list(tasks)
+
+
 def _run_task(
     task: str,
     builder: Any,
@@ -109,8 +125,6 @@ def _run_task(
     results: dict[str, int],
 ) -> None:
     """Dispatch a single assembly task to the appropriate builder method."""
-    import gc
-
     if task == "AllPrintings":
         count = builder.write_all_printings(
             out / "AllPrintings.json",
@@ -120,50 +134,19 @@ def _run_task(
         results["AllPrintings"] = count if isinstance(count, int) else len(count.data)
 
     elif task == "FormatPrintings":
-        from mtgjson5.models.files import AllPrintingsFile
-
-        ap_path = out / "AllPrintings.json"
-        if not ap_path.exists():
-            return
-        all_printings = AllPrintingsFile.read(ap_path)
-        printings_formats = ["legacy", "modern", "pioneer", "standard", "vintage"]
-        for fmt in printings_formats:
-            fmt_file = builder.write_format_file(all_printings, fmt, out / f"{fmt.title()}.json")
-            results[fmt.title()] = len(fmt_file.data)
-        del all_printings
-        gc.collect()
+        results.update(builder.write_format_printings(out, set_codes=set_codes))
 
     elif task == "AtomicCards":
-        count = builder.write_atomic_cards(out / "AtomicCards.json", streaming=True)
-        results["AtomicCards"] = count if isinstance(count, int) else len(count.data)
+        results.update(builder.write_atomic_outputs(out, format_names=[]))
 
     elif task == "FormatAtomics":
-        from mtgjson5.models.files import AtomicCardsFile
-
-        ac_path = out / "AtomicCards.json"
-        if not ac_path.exists():
-            # Ensure AtomicCards exists (may need to build it)
-            builder.write_atomic_cards(ac_path, streaming=True)
-        atomic_cards_file = AtomicCardsFile.read(ac_path)
-        atomic_formats = ["legacy", "modern", "pauper", "pioneer", "standard", "vintage"]
-        for fmt in atomic_formats:
-            atomic_file = builder.write_format_atomic(atomic_cards_file, fmt, out / f"{fmt.title()}Atomic.json")
-            results[f"{fmt.title()}Atomic"] = len(atomic_file.data)
-        del atomic_cards_file
-        gc.collect()
+        results.update(builder.write_atomic_outputs(out, atomic_cards=False))
+
+    elif task == "AtomicOutputs":
+        results.update(builder.write_atomic_outputs(out))
 
     elif task == "SetFiles":
-        from mtgjson5.models.files import IndividualSetFile
-        from mtgjson5.polars_utils import get_windows_safe_set_code
-
-        set_count = 0
-        valid_codes = set_codes
-        for code, set_data in ctx.sets.iter_sets(set_codes=valid_codes):
-            single = IndividualSetFile.from_set_data(set_data, ctx.meta)
-            safe_code = get_windows_safe_set_code(code)
-            single.write(out / f"{safe_code}.json", pretty=ctx.pretty)
-            set_count += 1
-        results["sets"] = set_count
+        results["sets"] = builder.write_set_files(out, set_codes=set_codes)
 
     elif task == "SetList":
         set_list = builder.write_set_list(out / "SetList.json")
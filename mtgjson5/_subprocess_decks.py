@@ -0,0 +1,94 @@
+"""Subprocess targets for writing deck files in parallel.
+
+This module is intentionally free of top-level side effects so that
+``multiprocessing.spawn`` can import it without re-executing the heavy
+init code in ``__main__.py`` (logger setup, urllib3 warnings, etc.).
+
+The parent builds the ``DeckCardIndex`` once and hands it to every worker
+through the pool initializer. Workers receive batches of raw deck rows,
+write each deck file and its ``.sha256`` sidecar, and return only counts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from mtgjson5.build.assemble import DeckCardIndex
+
+_WORKER_STATE: tuple[DeckCardIndex, dict[str, Any], Path, int] | None = None
+
+
+def deck_workers(deck_count: int) -> int:
+    """Deck writer processes, from ``MTGJSON_DECK_WORKERS`` (default: one per CPU)."""
+    configured = os.environ.get("MTGJSON_DECK_WORKERS")
+    if configured:
+        try:
+            return max(1, min(int(configured), deck_count))
+        except ValueError:
+            from mtgjson5.utils import LOGGER
+
+            LOGGER.warning(f"Ignoring invalid MTGJSON_DECK_WORKERS={configured!r}")
+    return max(1, min(os.cpu_count() or 1, deck_count))
+
+
+def write_deck_files(
+    decks: list[dict[str, Any]],
+    index: DeckCardIndex,
+    meta: dict[str, Any],
+    output_dir: Path,
+    orjson_opts: int,
+) -> int:
+    """Write one JSON file (plus sha256 sidecar) per deck row, returning the count."""
+    from mtgjson5.build.assemble import build_deck
+
+    count = 0
+    for deck_raw in decks:
+        deck = build_deck(deck_raw, index.expand)
+
+        safe_name = "".join(c for c in deck["name"].title() if c.isalnum())
+        set_code = deck.get("code", deck_raw.get("setCode", "UNK"))
+        filename = f"{safe_name}_{set_code}"
+
+        json_bytes = orjson.dumps({"meta": meta, "data": deck}, option=orjson_opts)
+        (output_dir / f"{filename}.json").write_bytes(json_bytes)
+        (output_dir / f"{filename}.json.sha256").write_text(hashlib.sha256(json_bytes).hexdigest())
+        count += 1
+    return count
+
+
+def init_deck_worker(
+    index: DeckCardIndex,
+    meta: dict[str, Any],
+    output_dir: str,
+    orjson_opts: int,
+    log_file: str | None = None,
+) -> None:
+    """ProcessPoolExecutor initializer: keep the parent's deck card index.
+
+    Args:
+        index: Card/token fragments referenced by the decks
+        meta: Meta block written into every deck file
+        output_dir: Directory receiving the deck files
+        orjson_opts: Serialization options of the parent builder
+        log_file: Parent's log file path (all subprocesses share one log)
+    """
+    global _WORKER_STATE
+
+    from mtgjson5.utils import init_logger
+
+    init_logger(log_file)
+    _WORKER_STATE = (index, meta, Path(output_dir), orjson_opts)
+
+
+def write_deck_batch(decks: list[dict[str, Any]]) -> int:
+    """Write a batch of decks in a worker, returning how many were written."""
+    if _WORKER_STATE is None:
+        raise RuntimeError("Deck worker was not initialized")
+    index, meta, output_dir, orjson_opts = _WORKER_STATE
+    return write_deck_files(decks, index, meta, output_dir, orjson_opts)
@@ -3,18 +3,29 @@
 This module is intentionally free of top-level side effects so that
 ``multiprocessing.spawn`` can import it without re-executing the heavy
 init code in ``__main__.py`` (logger setup, urllib3 warnings, etc.).
+
+The export subprocess writes the normalized tables to the cache once and
+fans the format writers out to a spawn pool; each worker memory-maps the
+same tables rather than rebuilding them.
 """
 
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import pathlib
 import traceback
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import Queue
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from mtgjson5.build.writer import FormatType, UnifiedOutputWriter
 
+# Assembly context members the export builders never read
+_EXPORT_SKIP = frozenset({"token_products"})
+
 # ------------------------------------------------------------------
 # Subprocess targets (top-level functions for pickling)
 # ------------------------------------------------------------------
@@ -46,8 +57,6 @@ def _run_price_build(
         sp = SubprocessProfiler(label="prices", enabled=profile)
         sp.start()
 
-        import pathlib
-
         from mtgjson5 import constants
         from mtgjson5.build.prices.price_builder import PolarsPriceBuilder
 
@@ -70,6 +79,46 @@ def _run_price_build(
         error_queue.put(f"price build: {exc}\n{traceback.format_exc()}")
 
 
+def _write_export_format(
+    fmt: str,
+    cache_dir: str,
+    tables_dir: str,
+    output_path: str,
+    pretty: bool,
+    log_file: str | None = None,
+) -> str | None:
+    """Pool target writing one export format from the shared on-disk tables.
+
+    The worker loads the assembly cache and memory-maps the normalized
+    tables materialized by the parent, so no table is rebuilt or copied.
+
+    Returns:
+        Output path as a string, or None if nothing was written
+    """
+    from mtgjson5.utils import init_logger
+
+    init_logger(log_file)
+
+    from mtgjson5.build.writer import UnifiedOutputWriter
+
+    writer = UnifiedOutputWriter.from_cache(pathlib.Path(cache_dir), skip=_EXPORT_SKIP)
+    if writer is None:
+        return None
+    writer.ctx.output_path = pathlib.Path(output_path)
+    writer.ctx.pretty = pretty
+    writer.ctx.load_export_tables(pathlib.Path(tables_dir))
+    path = writer.write(cast("FormatType", fmt))
+    return str(path) if path is not None else None
+
+
+def _export_workers(format_count: int) -> int:
+    """Format exporter processes, from ``MTGJSON_EXPORT_WORKERS`` (default: one per format)."""
+    configured = os.environ.get("MTGJSON_EXPORT_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return max(1, min(format_count, os.cpu_count() or 1))
+
+
 # ------------------------------------------------------------------
 # Main entry point
 # ------------------------------------------------------------------
@@ -106,9 +155,7 @@ def run_exports(
 
         from mtgjson5.build.writer import UnifiedOutputWriter
 
-        writer = UnifiedOutputWriter.from_cache(
-            skip=frozenset({"token_products"}),
-        )
+        writer = UnifiedOutputWriter.from_cache(skip=_EXPORT_SKIP)
         sp.checkpoint("cache_loaded")
         if writer is None:
             _log.warning("Subprocess: no assembly cache found, skipping exports")
@@ -120,8 +167,8 @@ def run_exports(
         has_parquet = bool("parquet" in formats)
         remaining = [f for f in formats if f != "parquet"]
 
-        if has_parquet and remaining:
-            _log.info("Exports: parquet + format writes")
+        if remaining:
+            _log.info("Exports: %sformat writes", "parquet + " if has_parquet else "")
             _run_format_exports(writer, formats, remaining, has_parquet, _log, sp)
         else:
             _log.info("Exports: writing all formats")
@@ -151,9 +198,13 @@ def _run_format_exports(
 
     Flow:
         1. Parquet data writes (without prices)
-        2. Build normalized_tables, release card_data
-        3. Run remaining formats in-process (uses normalized_tables)
+        2. Build normalized_tables once, write them to the cache as Arrow
+           IPC and release card data
+        3. Run remaining formats in parallel worker processes, each
+           memory-mapping the shared tables
     """
+    from mtgjson5.build.context import CACHE_EXPORT_TABLES_DIR
+
     # Phase 1: Parquet data writes (without prices)
     if has_parquet:
         from mtgjson5.build.formats.parquet import ParquetBuilder
@@ -164,18 +215,42 @@ def _run_format_exports(
             sp.checkpoint("parquet_data_complete")
         _log.info("Exports: parquet data writes complete (prices deferred)")
 
-    # Build normalized_tables and booster tables while card data is
-    # still cached, then release heavy card DataFrames.
-    _ = writer.ctx.normalized_tables
-    _ = writer.ctx.normalized_boosters
+    # Materialize normalized_tables and booster tables while card data is
+    # still cached, then swap them for memory-mapped copies.
+    # from_cache() roots parquet_dir in the cache directory.
+    cache_dir = writer.ctx.parquet_dir.parent
+    tables_dir = cache_dir / CACHE_EXPORT_TABLES_DIR
+    writer.ctx.save_export_tables(tables_dir)
     writer.ctx.release_card_data()
+    writer.ctx.load_export_tables(tables_dir)
     if sp:
         sp.checkpoint("normalized_tables_built")
-    _log.info("Exports: normalized_tables built, card data released")
-
-    # Phase 2: Run remaining formats in-process (only need normalized_tables)
-    for fmt in remaining:
-        writer.write(cast("FormatType", fmt))
+    _log.info("Exports: normalized_tables saved, card data released")
+
+    # Phase 2: Run remaining formats (only need normalized_tables)
+    workers = _export_workers(len(remaining))
+    if workers <= 1:
+        for fmt in remaining:
+            writer.write(cast("FormatType", fmt))
+    else:
+        from mtgjson5.utils import get_log_file
+
+        _log.info("Exports: writing %s across %d workers", ", ".join(remaining), workers)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {
+                fmt: pool.submit(
+                    _write_export_format,
+                    fmt,
+                    str(cache_dir),
+                    str(tables_dir),
+                    str(writer.ctx.output_path),
+                    writer.ctx.pretty,
+                    get_log_file(),
+                )
+                for fmt in remaining
+            }
+            for fmt, future in futures.items():
+                _log.info("Exports: %s -> %s", fmt, future.result())
     if sp:
         sp.checkpoint("formats_complete")
     _log.info("Exports: format writes complete")
@@ -0,0 +1,59 @@
+"""Subprocess targets for assembling set fragments in parallel.
+
+This module is intentionally free of top-level side effects so that
+``multiprocessing.spawn`` can import it without re-executing the heavy
+init code in ``__main__.py`` (logger setup, urllib3 warnings, etc.).
+
+Each worker loads ``AssemblyContext.from_cache()`` once, then assembles
+and serializes the sets it is handed into the shared ``SetFragmentStore``.
+Only set codes travel back to the parent, which reads the stored bytes in
+its own order.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mtgjson5.build.fragments import SetFragmentStore
+
+_WORKER_STORE: SetFragmentStore | None = None
+
+
+def init_fragment_worker(
+    cache_dir: str,
+    store_root: str,
+    pretty: bool,
+    log_file: str | None = None,
+) -> None:
+    """ProcessPoolExecutor initializer: load the assembly cache once per worker.
+
+    Args:
+        cache_dir: Directory holding the ``AssemblyContext`` cache
+        store_root: Base directory of the parent's fragment store
+        pretty: Whether fragments are pretty-printed
+        log_file: Parent's log file path (all subprocesses share one log)
+    """
+    global _WORKER_STORE
+
+    from mtgjson5.utils import init_logger
+
+    init_logger(log_file)
+
+    from mtgjson5.build.context import AssemblyContext
+    from mtgjson5.build.fragments import SetFragmentStore
+
+    ctx = AssemblyContext.from_cache(cache_dir=Path(cache_dir))
+    if ctx is None:
+        raise RuntimeError(f"AssemblyContext cache not found in {cache_dir}")
+    ctx.pretty = pretty
+    _WORKER_STORE = SetFragmentStore(ctx, root=Path(store_root))
+
+
+def build_set_fragment(code: str) -> str:
+    """Assemble and store one set's fragment, returning its code."""
+    if _WORKER_STORE is None:
+        raise RuntimeError("Fragment worker was not initialized")
+    _WORKER_STORE.get(code)
+    return code
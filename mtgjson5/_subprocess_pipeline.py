@@ -0,0 +1,97 @@
+"""Subprocess targets for running card-pipeline batches in parallel.
+
+This module is intentionally free of top-level side effects so that
+``multiprocessing.spawn`` can import it without re-executing the heavy
+init code in ``__main__.py`` (logger setup, urllib3 warnings, etc.).
+
+Each worker rebuilds a ``PipelineContext`` from the state written by
+``PipelineContext.dump_for_workers()`` (consolidated lookups as parquet,
+cache frames as lazy scan plans), runs one batch of sets through the stage
+groups, and sinks its own ``setCode=`` partitions. Workers are recycled after
+every batch so jemalloc allocations are reclaimed on process exit.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from mtgjson5.data import PipelineContext
+
+_WORKER_CTX: PipelineContext | None = None
+_WORKER_UUID_MAP: pl.LazyFrame | None = None
+_WORKER_PROFILE = False
+
+
+def init_pipeline_worker(
+    state_path: str,
+    uuid_map_path: str,
+    log_file: str | None = None,
+    profile: bool = False,
+    cache_path: str | None = None,
+) -> None:
+    """ProcessPoolExecutor initializer: load the shared pipeline state once per worker.
+
+    Args:
+        state_path: Pickled worker state from ``PipelineContext.dump_for_workers()``
+        uuid_map_path: Parquet file holding the global scryfallId -> uuid pre-pass
+        log_file: Parent's log file path (all subprocesses share one log)
+        profile: Whether to collect RSS checkpoints
+        cache_path: Parent's cache directory, so partitions land where it reads them
+    """
+    global _WORKER_CTX, _WORKER_UUID_MAP, _WORKER_PROFILE
+
+    from mtgjson5 import constants
+    from mtgjson5.utils import init_logger
+
+    init_logger(log_file)
+    if cache_path is not None:
+        constants.CACHE_PATH = Path(cache_path)
+
+    import polars as pl
+
+    from mtgjson5.data import PipelineContext
+
+    _WORKER_CTX = PipelineContext.from_worker_state(Path(state_path))
+    _WORKER_UUID_MAP = pl.scan_parquet(uuid_map_path)
+    _WORKER_PROFILE = profile
+
+
+def run_pipeline_batch(
+    batch_idx: int, batch_codes: list[str], checkpoint_dir: str | None = None
+) -> tuple[float, dict[str, Any]]:
+    """Run one batch of sets through the pipeline and sink its partitions.
+
+    Args:
+        batch_idx: Position of the batch in the serial ordering (for labels)
+        batch_codes: Upper-cased set codes in this batch
+        checkpoint_dir: Where the batch persists (and resumes from) its collect points
+
+    Returns:
+        Peak RSS growth of the batch in MB, and the subprocess profile dict
+        (empty when profiling is disabled).
+    """
+    from mtgjson5.pipeline.core import _process_batch
+    from mtgjson5.profiler import SubprocessProfiler
+
+    if _WORKER_CTX is None or _WORKER_UUID_MAP is None:
+        raise RuntimeError("Pipeline worker was not initialized")
+
+    label = f"batch_{batch_idx}"
+    sp = SubprocessProfiler(label=f"pipeline_{label}", enabled=_WORKER_PROFILE)
+    sp.start()
+
+    growth_mb = _process_batch(
+        _WORKER_CTX,
+        batch_codes,
+        scryfall_uuid_lf=_WORKER_UUID_MAP,
+        prof=sp,
+        label=label,
+        checkpoint_dir=Path(checkpoint_dir) if checkpoint_dir else None,
+    )
+
+    sp.checkpoint("finish")
+    return growth_mb, sp.to_dict()
@@ -174,7 +174,31 @@ def parse_args() -> argparse.Namespace:
         type=lambda s: s if s.lower() == "auto" else int(s),
         default="auto",
         metavar="N",
-        help="Sets per pipeline batch. Defaults to 'auto' (~50 sets/batch). Use an integer for custom batch size.",
+        help="Sets per pipeline batch. Defaults to 'auto' (sets packed by card count under --pipeline-memory-gb). Use an integer for a fixed batch size.",
+    )
+    pipeline_group.add_argument(
+        "--pipeline-workers",
+        type=lambda s: s if s.lower() == "auto" else int(s),
+        default=1,
+        metavar="N",
+        help="Worker processes running pipeline batches concurrently. Defaults to 1 (serial, in-process). Use 'auto' to size from available CPUs.",
+    )
+    pipeline_group.add_argument(
+        "--pipeline-memory-gb",
+        type=float,
+        default=None,
+        metavar="GB",
+        help="Memory ceiling shared by concurrent pipeline batches when --batch-size is 'auto'. Defaults to half the available memory.",
+    )
+    pipeline_group.add_argument(
+        "--resume-pipeline",
+        action="store_true",
+        help="Continue an interrupted card pipeline run from its first incomplete batch and latest stage checkpoint. Stage checkpoints are only written when this is set.",
+    )
+    pipeline_group.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Rebuild every set's card partitions even when its input fingerprint is unchanged since the last build.",
     )
     pipeline_group.add_argument(
         "--generate-types",
@@ -264,6 +288,10 @@ def parse_args() -> argparse.Namespace:
         parsed_args.build_all = bool(os.environ.get("MTGJSON_BUILD_ALL", False))
         batch_env = os.environ.get("MTGJSON_BATCH_SIZE", "auto")
         parsed_args.batch_size = (batch_env if batch_env.lower() == "auto" else int(batch_env)) if batch_env else "auto"
+        workers_env = os.environ.get("MTGJSON_PIPELINE_WORKERS", "1")
+        parsed_args.pipeline_workers = (
+            (workers_env if workers_env.lower() == "auto" else int(workers_env)) if workers_env else 1
+        )
         set_build_all_flags(parsed_args)
 
     return parsed_args
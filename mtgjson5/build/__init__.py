@@ -9,6 +9,7 @@ from .assemble import (
     TableAssembler,
 )
 from .context import AssemblyContext
+from .fragments import SetFragmentStore
 from .writer import (
     OutputWriter,
     UnifiedOutputWriter,
@@ -23,6 +24,7 @@ __all__ = [
     "DeckListAssembler",
     "OutputWriter",
     "SetAssembler",
+    "SetFragmentStore",
     "SetListAssembler",
     "TableAssembler",
     "UnifiedOutputWriter",
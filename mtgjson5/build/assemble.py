@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import polars as pl
 
 from mtgjson5.consts.fields import (
@@ -23,7 +24,17 @@ from mtgjson5.models.schemas import (
 )
 from mtgjson5.models.sets import SealedProduct
 
+from .keyed_json import (
+    KEY_COL,
+    UUID_PREFIXES,
+    VALUE_COL,
+    default_workers,
+    json_array,
+    json_object,
+    json_scalar,
+)
 from .languages import merge_set_languages
+from .shaping import printings_to_dicts
 
 if TYPE_CHECKING:
     from .context import AssemblyContext
@@ -46,6 +57,18 @@ def compute_format_legal_sets(
     MTGJSON omits "not_legal" entries, so key presence indicates the card is part
     of the format (Legal, Restricted, or Banned).
     """
+    return compute_formats_legal_sets(ctx, [format_name])[format_name]
+
+
+def compute_formats_legal_sets(
+    ctx: AssemblyContext,
+    format_names: list[str],
+) -> dict[str, set[str]]:
+    """
+    Compute format-legal sets for several formats in one parquet scan.
+
+    Same rules as ``compute_format_legal_sets``, evaluated per format.
+    """
     from mtgjson5.consts import SUPPORTED_SET_TYPES
 
     # Filter by set type using metadata
@@ -55,16 +78,84 @@ def compute_format_legal_sets(
 
     set_legality = (
         lf.filter(~pl.col("name").str.starts_with("A-"))
-        .with_columns(pl.col("legalities").struct.field(format_name).is_not_null().alias("_has_format_key"))
         .group_by("setCode")
-        .agg(pl.col("_has_format_key").all().alias("_all_have_key"))
-        .filter(pl.col("_all_have_key"))
-        .select("setCode")
+        .agg(pl.col("legalities").struct.field(fmt).is_not_null().all().alias(fmt) for fmt in format_names)
         .collect()
     )
 
-    format_legal = set(set_legality["setCode"].to_list())
-    return format_legal & valid_type_sets
+    return {fmt: set(set_legality.filter(pl.col(fmt))["setCode"].to_list()) & valid_type_sets for fmt in format_names}
+
+
+def _minimal_deck(deck: dict[str, Any], set_code: str) -> dict[str, Any]:
+    """Reduce a deck row to the reference embedded in its set."""
+    minimal_deck: dict[str, Any] = {
+        "code": deck.get("code", set_code),
+        "name": deck.get("name", ""),
+        "type": deck.get("type", ""),
+    }
+    if deck.get("releaseDate"):
+        minimal_deck["releaseDate"] = deck["releaseDate"]
+    if deck.get("source"):
+        minimal_deck["source"] = deck["source"]
+    sealed_uuids = deck.get("sealedProductUuids")
+    minimal_deck["sealedProductUuids"] = sealed_uuids if sealed_uuids else None
+    if deck.get("sourceSetCodes"):
+        minimal_deck["sourceSetCodes"] = deck["sourceSetCodes"]
+    for board in ["mainBoard", "sideBoard"]:
+        cards_list = deck.get(board)
+        if cards_list:
+            minimal_deck[board] = [
+                {k: v for k, v in c.items() if k in ("count", "uuid", "isFoil", "isEtched") and v not in (None, False)}
+                for c in cards_list
+                if isinstance(c, dict)
+            ]
+        else:
+            minimal_deck[board] = []
+    # Commander cards: include isEtched if present
+    for board in ["commander", "displayCommander"]:
+        cards_list = deck.get(board)
+        if cards_list:
+            minimal_deck[board] = [
+                {k: v for k, v in c.items() if k in ("count", "uuid", "isFoil", "isEtched") and v not in (None, False)}
+                for c in cards_list
+                if isinstance(c, dict)
+            ]
+        else:
+            minimal_deck[board] = []
+    # Other optional lists (tokens, planes, schemes) - no isEtched
+    for board in ["tokens", "planes", "schemes"]:
+        cards_list = deck.get(board)
+        if cards_list:
+            minimal_deck[board] = [
+                {k: v for k, v in c.items() if k in ("count", "uuid", "isFoil") and v not in (None, False)}
+                for c in cards_list
+                if isinstance(c, dict)
+            ]
+        else:
+            minimal_deck[board] = []
+    return minimal_deck
+
+
+def index_minimal_decks(decks_df: pl.DataFrame | None) -> dict[str, list[dict[str, Any]]]:
+    """Minimal deck references grouped by setCode, in one pass over ``decks_df``."""
+    if decks_df is None or decks_df.is_empty():
+        return {}
+    by_set: dict[str, list[dict[str, Any]]] = {}
+    for deck in decks_df.to_dicts():
+        set_code = deck["setCode"]
+        by_set.setdefault(set_code, []).append(_minimal_deck(deck, set_code))
+    return by_set
+
+
+def index_sealed_products(sealed_df: pl.DataFrame | None) -> dict[str, list[dict[str, Any]]]:
+    """Output sealed product dicts grouped by setCode, in one pass over ``sealed_df``."""
+    if sealed_df is None or len(sealed_df.columns) == 0 or sealed_df.is_empty():
+        return {}
+    by_set: dict[str, list[dict[str, Any]]] = {}
+    models = SealedProduct.from_dataframe(sealed_df)
+    for set_code, model in zip(sealed_df["setCode"].to_list(), models, strict=True):
+        by_set.setdefault(set_code, []).append(model.to_polars_dict(exclude_none=True))
+    return by_set
 
 
 class Assembler:
@@ -141,79 +232,12 @@ class Assembler:
         return merge_set_languages(set_code, languages)
 
     def build_minimal_decks(self, set_code: str) -> list[dict[str, Any]] | None:
-        """Build minimal deck references for a set, or None if no decks."""
-        if self.ctx.decks_df is None:
-            return None
-        set_decks = self.ctx.decks_df.filter(pl.col("setCode") == set_code)
-        if len(set_decks) == 0:
-            return None
-        minimal_decks = []
-        for deck in set_decks.to_dicts():
-            minimal_deck: dict[str, Any] = {
-                "code": deck.get("code", set_code),
-                "name": deck.get("name", ""),
-                "type": deck.get("type", ""),
-            }
-            if deck.get("releaseDate"):
-                minimal_deck["releaseDate"] = deck["releaseDate"]
-            if deck.get("source"):
-                minimal_deck["source"] = deck["source"]
-            sealed_uuids = deck.get("sealedProductUuids")
-            minimal_deck["sealedProductUuids"] = sealed_uuids if sealed_uuids else None
-            if deck.get("sourceSetCodes"):
-                minimal_deck["sourceSetCodes"] = deck["sourceSetCodes"]
-            for board in ["mainBoard", "sideBoard"]:
-                cards_list = deck.get(board)
-                if cards_list:
-                    minimal_deck[board] = [
-                        {
-                            k: v
-                            for k, v in c.items()
-                            if k in ("count", "uuid", "isFoil", "isEtched") and v not in (None, False)
-                        }
-                        for c in cards_list
-                        if isinstance(c, dict)
-                    ]
-                else:
-                    minimal_deck[board] = []
-            # Commander cards: include isEtched if present
-            for board in ["commander", "displayCommander"]:
-                cards_list = deck.get(board)
-                if cards_list:
-                    minimal_deck[board] = [
-                        {
-                            k: v
-                            for k, v in c.items()
-                            if k in ("count", "uuid", "isFoil", "isEtched") and v not in (None, False)
-                        }
-                        for c in cards_list
-                        if isinstance(c, dict)
-                    ]
-                else:
-                    minimal_deck[board] = []
-            # Other optional lists (tokens, planes, schemes) - no isEtched
-            for board in ["tokens", "planes", "schemes"]:
-                cards_list = deck.get(board)
-                if cards_list:
-                    minimal_deck[board] = [
-                        {k: v for k, v in c.items() if k in ("count", "uuid", "isFoil") and v not in (None, False)}
-                        for c in cards_list
-                        if isinstance(c, dict)
-                    ]
-                else:
-                    minimal_deck[board] = []
-            minimal_decks.append(minimal_deck)
-        return minimal_decks
+        """Minimal deck references for a set, or None if no decks."""
+        return self.ctx.decks_by_set.get(set_code)
 
     def build_sealed_products(self, set_code: str) -> list[dict[str, Any]] | None:
-        """Build sealed product list for a set, or None if no products."""
-        if self.ctx.sealed_df is None or len(self.ctx.sealed_df.columns) == 0:
-            return None
-        set_sealed = self.ctx.sealed_df.filter(pl.col("setCode") == set_code)
-        if len(set_sealed) == 0:
-            return None
-        models = SealedProduct.from_dataframe(set_sealed)
-        return [m.to_polars_dict(exclude_none=True) for m in models]
+        """Sealed product list for a set, or None if no products."""
+        return self.ctx.sealed_by_set.get(set_code)
 
     def iter_set_codes(self) -> list[str]:
         """Get list of all set codes to include in output.
@@ -458,13 +482,105 @@ class AtomicCardsAssembler(Assembler):
         return dict(self.iter_atomic())
 
 
+class DeckCardIndex:
+    """Deck-shaped card and token JSON keyed by uuid.
+
+    Every referenced printing is validated through ``CardDeck`` (or
+    ``CardToken``) once and kept as compact JSON bytes, so the index costs
+    one serialized fragment per distinct deck card. Expanding a reference
+    parses its fragment and adds the per-reference deck fields.
+    """
+
+    __slots__ = ("fragments", "token_uuids")
+
+    def __init__(self, fragments: dict[str, bytes] | None = None, token_uuids: frozenset[str] = frozenset()):
+        self.fragments = fragments or {}
+        self.token_uuids = token_uuids
+
+    def __len__(self) -> int:
+        return len(self.fragments)
+
+    def __contains__(self, uuid: object) -> bool:
+        return uuid in self.fragments
+
+    @classmethod
+    def from_printings(cls, cards: list[dict[str, Any]], tokens: list[dict[str, Any]]) -> DeckCardIndex:
+        """Validate set-shaped card/token dicts into deck-shaped fragments."""
+        fragments: dict[str, bytes] = {}
+        for card in cards:
+            # Placeholders satisfy CardDeck; the real values are per reference
+            deck_card = CardDeck.from_polars_row({**card, "count": 1, "isFoil": False, "isEtched": False})
+            out = deck_card.to_polars_dict(exclude_none=True, keep_empty_lists=True)
+            for field in ("count", "isFoil", "isEtched"):
+                out.pop(field, None)
+            fragments[card["uuid"]] = orjson.dumps(out)
+        token_uuids: set[str] = set()
+        for token in tokens:
+            out = CardToken.from_polars_row(token).to_polars_dict(exclude_none=True, keep_empty_lists=True)
+            fragments[token["uuid"]] = orjson.dumps(out)
+            token_uuids.add(token["uuid"])
+        return cls(fragments, frozenset(token_uuids))
+
+    def expand(self, refs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Expand deck references to full card/token dicts, skipping unknown uuids."""
+        result = []
+        for ref in refs:
+            uuid = ref.get("uuid")
+            if not uuid:
+                continue
+            fragment = self.fragments.get(uuid)
+            if fragment is None:
+                continue
+
+            card = orjson.loads(fragment)
+            card["count"] = ref.get("count", 1)
+            if uuid in self.token_uuids:
+                if ref.get("isFoil"):
+                    card["isFoil"] = True
+            else:
+                for field in ("isFoil", "isEtched"):
+                    value = ref.get(field, False)
+                    if value is not None:
+                        card[field] = value
+            result.append(card)
+        return result
+
+
+def build_deck(
+    deck_data: dict[str, Any],
+    expand: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+) -> dict[str, Any]:
+    """Build a complete Deck dict, expanding board references with ``expand``."""
+    result = {
+        "code": deck_data.get("code", deck_data.get("setCode", "")),
+        "name": deck_data.get("name", ""),
+        "type": deck_data.get("type", ""),
+        "releaseDate": deck_data.get("releaseDate"),
+        "source": deck_data.get("source"),
+    }
+
+    sealed_uuids = deck_data.get("sealedProductUuids")
+    result["sealedProductUuids"] = sealed_uuids if sealed_uuids else None
+
+    for board in ["mainBoard", "sideBoard"]:
+        refs = deck_data.get(board, [])
+        result[board] = expand(refs) if refs else []
+
+    for board in ["commander", "displayCommander", "planes", "schemes", "tokens"]:
+        refs = deck_data.get(board)
+        result[board] = expand(refs) if refs else []
+
+    result["sourceSetCodes"] = deck_data.get("sourceSetCodes") or []
+
+    return result
+
+
 class DeckAssembler(Assembler):
     """Assembles Deck objects with expanded card data."""
 
     def __init__(self, ctx: AssemblyContext):
         super().__init__(ctx)
-        self._uuid_index: dict[str, dict[str, Any]] | None = None
-        self._token_uuids: set[str] | None = None
+        self._uuid_index: DeckCardIndex | None = None
 
     def _collect_deck_uuids(self) -> set[str]:
         """Scan all deck boards to collect the set of referenced UUIDs."""
@@ -494,120 +610,47 @@ class DeckAssembler(Assembler):
         return uuids
 
     @property
-    def uuid_index(self) -> dict[str, dict[str, Any]]:
-        """Lazy-build UUID -> card/token dict index.
-
-        Uses CardSet for cards and CardToken for tokens.
-        Deck-specific fields (count, isFoil, isEtched) are added in expand_card_list().
-
-        Only loads cards/tokens that are actually referenced by decks to avoid
-        converting all ~100k+ cards through Pydantic.
+    def uuid_index(self) -> DeckCardIndex:
+        """Lazy-build the uuid -> deck card/token fragment index.
 
-        Note: After building the index, source DataFrames are deleted to free memory.
+        Only cards/tokens actually referenced by decks are loaded. They are
+        shaped column-wise like set printings, then validated through the
+        deck models once per uuid (not once per deck reference).
         """
         if self._uuid_index is None:
-            self._token_uuids = set()
             needed_uuids = self._collect_deck_uuids()
-            self._uuid_index = {}
-
-            chunk_size = 1000
 
             cards_lf = self.load_all_cards()
-            if needed_uuids:
-                cards_lf = cards_lf.filter(pl.col("uuid").is_in(needed_uuids))
-            cards_df = cards_lf.collect()
-            for start in range(0, len(cards_df), chunk_size):
-                chunk = cards_df.slice(start, chunk_size)
-                card_models = CardSet.from_dataframe(chunk)
-                for card in card_models:
-                    self._uuid_index[card.uuid] = card.to_output_dict()
-                del card_models, chunk
-            del cards_df
-
             tokens_lf = self.load_all_tokens()
             if needed_uuids:
+                cards_lf = cards_lf.filter(pl.col("uuid").is_in(needed_uuids))
                 tokens_lf = tokens_lf.filter(pl.col("uuid").is_in(needed_uuids))
+            cards_df = cards_lf.collect()
             tokens_df = tokens_lf.collect()
-            if not tokens_df.is_empty():
-                for start in range(0, len(tokens_df), chunk_size):
-                    chunk = tokens_df.slice(start, chunk_size)
-                    token_models = CardToken.from_dataframe(chunk)
-                    for token in token_models:
-                        self._uuid_index[token.uuid] = token.to_output_dict()
-                        self._token_uuids.add(token.uuid)
-                    del token_models, chunk
-            del tokens_df
+
+            cards = printings_to_dicts(cards_df, CardSet) if len(cards_df) else []
+            tokens = printings_to_dicts(tokens_df, CardToken) if len(tokens_df) else []
+            del cards_df, tokens_df
+            self._uuid_index = DeckCardIndex.from_printings(cards, tokens)
 
         return self._uuid_index
 
     def is_token(self, uuid: str) -> bool:
         """Check if a UUID belongs to a token."""
-        # Ensure index is built first
-        _ = self.uuid_index
-        return uuid in self._token_uuids  # type: ignore[operator]
+        return uuid in self.uuid_index.token_uuids
 
     def expand_card_list(self, refs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
         Expand card references to full card/token objects.
 
-        Cards are validated through CardDeck model.
-        Tokens use their existing data with deck fields (count, isFoil) added.
+        Cards are shaped by the CardDeck model and carry count/isFoil/isEtched;
+        tokens are shaped by CardToken with count (and isFoil when set).
         """
-        result = []
-        for ref in refs:
-            uuid = ref.get("uuid")
-            if not uuid:
-                continue
-
-            card = self.uuid_index.get(uuid)
-            if card is None:
-                continue
-
-            expanded = dict(card)
-            expanded["count"] = ref.get("count", 1)
-            expanded["isFoil"] = ref.get("isFoil", False)
-            expanded["isEtched"] = ref.get("isEtched", False)
-
-            if self.is_token(uuid):
-                # Tokens validated through CardToken model
-                # CardToken doesn't have deck fields, so add them after validation
-                deck_token = CardToken.from_polars_row(expanded)
-                token_dict = deck_token.to_polars_dict(exclude_none=True, keep_empty_lists=True)
-                token_dict["count"] = ref.get("count", 1)
-                if ref.get("isFoil"):
-                    token_dict["isFoil"] = True
-                result.append(token_dict)
-            else:
-                # Cards validated through CardDeck model (includes count/isFoil/isEtched)
-                deck_card = CardDeck.from_polars_row(expanded)
-                result.append(deck_card.to_polars_dict(exclude_none=True, keep_empty_lists=True))
-
-        return result
+        return self.uuid_index.expand(refs)
 
     def build(self, deck_data: dict[str, Any]) -> dict[str, Any]:
         """Build a complete Deck with expanded cards."""
-        result = {
-            "code": deck_data.get("code", deck_data.get("setCode", "")),
-            "name": deck_data.get("name", ""),
-            "type": deck_data.get("type", ""),
-            "releaseDate": deck_data.get("releaseDate"),
-            "source": deck_data.get("source"),
-        }
-
-        sealed_uuids = deck_data.get("sealedProductUuids")
-        result["sealedProductUuids"] = sealed_uuids if sealed_uuids else None
-
-        for board in ["mainBoard", "sideBoard"]:
-            refs = deck_data.get(board, [])
-            result[board] = self.expand_card_list(refs) if refs else []
-
-        for board in ["commander", "displayCommander", "planes", "schemes", "tokens"]:
-            refs = deck_data.get(board)
-            result[board] = self.expand_card_list(refs) if refs else []
-
-        result["sourceSetCodes"] = deck_data.get("sourceSetCodes") or []
-
-        return result
+        return build_deck(deck_data, self.expand_card_list)
 
     def to_dataframe(self, deck_data: dict[str, Any]) -> pl.DataFrame:
         """Build a deck and return as a flattened DataFrame for parquet/csv export.
@@ -684,18 +727,14 @@ class SetAssembler(Assembler):
         df = self.load_set_cards(set_code)
         if df.is_empty():
             return []
-        models = CardSet.from_dataframe(df)
-        models.sort()
-        return [m.to_polars_dict(exclude_none=True) for m in models]
+        return printings_to_dicts(df, CardSet)
 
     def get_tokens(self, set_code: str) -> list[dict[str, Any]]:
         """Load and serialize tokens for a set, sorted by collector number."""
         df = self.load_set_tokens(set_code)
         if df.is_empty():
             return []
-        models = CardToken.from_dataframe(df)
-        models.sort()
-        result = [m.to_polars_dict(exclude_none=True) for m in models]
+        result = printings_to_dicts(df, CardToken)
 
         # Merge token products from assembly context lookup
         if self.ctx.token_products:
@@ -875,6 +914,8 @@ class SetListAssembler(Assembler):
 class TcgplayerSkusAssembler(Assembler):
     """Assembles TcgplayerSkus.json - maps UUIDs to TCGPlayer SKU information."""
 
+    SKU_FIELDS = ["condition", "language", "printing", "productId", "skuId", "finish"]
+
     def __init__(self, ctx: AssemblyContext):
         super().__init__(ctx)
         self._tcg_skus_lf: pl.LazyFrame | None = None
@@ -1027,12 +1068,11 @@ class TcgplayerSkusAssembler(Assembler):
 
         return parts
 
-    def iter_skus(self) -> Iterator[tuple[str, list[dict[str, Any]]]]:
-        """Yield (uuid, sku_entries) pairs using a partitioned pipeline.
+    def _collect_flat_skus(self) -> pl.DataFrame | None:
+        """Collect the flat (uuid, SKU fields) frame, or None if TCG data is missing.
 
-        Collects the flat joined result first, then
-        processes in 16 UUID-prefix partitions so that the sort+group
-        intermediates stay small.
+        The result is also cached to parquet so the subprocess parquet
+        export can skip recomputation.
         """
         import gc
 
@@ -1042,7 +1082,7 @@ class TcgplayerSkusAssembler(Assembler):
 
         if self._tcg_skus_lf is None:
             LOGGER.warning("TCG SKUs data not found (tcg_skus.parquet missing). TcgplayerSkus.json will be empty.")
-            return
+            return None
 
         if (
             self._tcg_to_uuid_lf is None
@@ -1050,22 +1090,21 @@ class TcgplayerSkusAssembler(Assembler):
             and self._tcg_alt_foil_to_uuid_lf is None
         ):
             LOGGER.warning("TCG to UUID mappings not found, TcgplayerSkus.json will be empty")
-            return
+            return None
 
         flattened_lf = self._flatten_skus_lazy()
         if flattened_lf is None:
             LOGGER.warning("No 'skus' column in TCG data, TcgplayerSkus.json will be empty")
-            return
+            return None
 
         parts = self._join_all_lazy(flattened_lf)
         if not parts:
-            return
+            return None
 
         flat_df = pl.concat(parts).collect()
-        n_rows = len(flat_df)
         del parts, flattened_lf
         gc.collect()
-        LOGGER.info(f"TcgplayerSkus: collected {n_rows:,} flat rows, grouping by partition...")
+        LOGGER.info(f"TcgplayerSkus: collected {len(flat_df):,} flat rows, grouping by partition...")
 
         # Cache flat result so subprocess parquet export can skip recomputation
         from mtgjson5 import constants
@@ -1073,17 +1112,32 @@ class TcgplayerSkusAssembler(Assembler):
         cache_path = constants.CACHE_PATH / "_tcgplayer_skus_flat.parquet"
         flat_df.write_parquet(cache_path, compression="zstd", compression_level=3)
         LOGGER.info(f"TcgplayerSkus: cached flat result to {cache_path.name}")
+        return flat_df
+
+    def iter_skus(self) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """Yield (uuid, sku_entries) pairs using a partitioned pipeline.
+
+        Collects the flat joined result first, then
+        processes in 16 UUID-prefix partitions so that the sort+group
+        intermediates stay small.
+        """
+        import gc
+
+        from mtgjson5.utils import LOGGER
+
+        flat_df = self._collect_flat_skus()
+        if flat_df is None:
+            return
 
-        sku_fields = ["condition", "language", "printing", "productId", "skuId", "finish"]
         count = 0
-        for prefix in "0123456789abcdef":
+        for prefix in UUID_PREFIXES:
             chunk = flat_df.filter(pl.col("uuid").str.starts_with(prefix))
             if chunk.is_empty():
                 continue
             grouped = (
                 chunk.sort("skuId")
                 .group_by("uuid", maintain_order=True)
-                .agg(pl.struct(sku_fields).alias("skus"))
+                .agg(pl.struct(self.SKU_FIELDS).alias("skus"))
                 .sort("uuid")
             )
             del chunk
@@ -1102,6 +1156,44 @@ class TcgplayerSkusAssembler(Assembler):
         gc.collect()
         LOGGER.info(f"Built TcgplayerSkus with {count} UUIDs")
 
+    def iter_json_chunks(self, workers: int | None = None) -> Iterator[pl.DataFrame]:
+        """Yield per-prefix ``key`` (uuid) / ``value`` (SKU list JSON) frames in uuid order.
+
+        Produces the same JSON as ``iter_skus`` entries serialized with
+        sorted keys, without building per-SKU dicts. Prefix partitions are
+        encoded on ``workers`` threads.
+        """
+        from mtgjson5.utils import LOGGER, map_ordered
+
+        flat_df = self._collect_flat_skus()
+        if flat_df is None:
+            return
+
+        # Sorted member order; null finish is omitted, other nulls are kept
+        with_finish = sorted(self.SKU_FIELDS)
+        without_finish = [c for c in with_finish if c != "finish"]
+        sku_json = (
+            pl.when(pl.col("finish").is_null())
+            .then(pl.struct(without_finish).struct.json_encode())
+            .otherwise(pl.struct(with_finish).struct.json_encode())
+        )
+
+        def encode(prefix: str) -> pl.DataFrame:
+            return (
+                flat_df.filter(pl.col("uuid").str.starts_with(prefix))
+                .sort("skuId")
+                .group_by("uuid", maintain_order=True)
+                .agg(json_array(sku_json.implode()).alias(VALUE_COL))
+                .sort("uuid")
+                .rename({"uuid": KEY_COL})
+            )
+
+        count = 0
+        for chunk in map_ordered(encode, UUID_PREFIXES, workers or default_workers()):
+            count += chunk.height
+            yield chunk
+        LOGGER.info(f"Built TcgplayerSkus with {count} UUIDs")
+
     def build(self) -> dict[str, list[dict[str, Any]]]:
         """Build TcgplayerSkus data dict.
 
@@ -1407,18 +1499,12 @@ class CardTypesAssembler(Assembler):
 class AllIdentifiersAssembler(Assembler):
     """Assembles AllIdentifiers.json - UUID to card/token mapping."""
 
-    def iter_entries(self) -> Iterator[tuple[str, dict[str, Any]]]:
-        """Yield (uuid, data) pairs for all cards and tokens.
-
-        Reads all parquet partitions in one shot, deduplicates by uuid, then iterates rows through
-        the lightweight ``_clean_row()`` cleanup.
-        """
+    def _load_combined(self) -> pl.DataFrame | None:
+        """Cards and tokens, each deduplicated by uuid, concatenated and sorted by uuid."""
         import gc
 
         from mtgjson5.utils import LOGGER
 
-        count = 0
-
         frames = []
         for label, pq_dir in (
             ("cards", self.ctx.parquet_dir),
@@ -1436,10 +1522,27 @@ class AllIdentifiersAssembler(Assembler):
             LOGGER.info(f"  {label}: {len(df)} rows loaded")
             frames.append(df)
 
-        if frames:
-            combined = pl.concat(frames, how="diagonal").sort("uuid")
-            del frames
-            gc.collect()
+        if not frames:
+            return None
+        combined = pl.concat(frames, how="diagonal").sort("uuid")
+        del frames
+        gc.collect()
+        return combined
+
+    def iter_entries(self) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (uuid, data) pairs for all cards and tokens.
+
+        Reads all parquet partitions in one shot, deduplicates by uuid, then iterates rows through
+        the lightweight ``_clean_row()`` cleanup.
+        """
+        import gc
+
+        from mtgjson5.utils import LOGGER
+
+        count = 0
+
+        combined = self._load_combined()
+        if combined is not None:
             LOGGER.info(f"AllIdentifiers: {len(combined)} total rows, iterating sorted...")
             for row in combined.iter_rows(named=True):
                 uuid = row.get("uuid")
@@ -1454,6 +1557,37 @@ class AllIdentifiersAssembler(Assembler):
 
         LOGGER.info(f"Built AllIdentifiers with {count} entries")
 
+    def iter_json_chunks(self, workers: int | None = None) -> Iterator[pl.DataFrame]:
+        """Yield ``key`` (uuid) / ``value`` (entry JSON) frames in uuid order.
+
+        Same entries as ``iter_entries`` serialized with sorted keys, encoded
+        by ``_clean_row_json`` one uuid-prefix partition at a time on
+        ``workers`` threads.
+        """
+        from mtgjson5.utils import LOGGER, map_ordered
+
+        combined = self._load_combined()
+        if combined is None or "uuid" not in combined.columns:
+            LOGGER.info("Built AllIdentifiers with 0 entries")
+            return
+        combined = combined.filter(pl.col("uuid").is_not_null() & (pl.col("uuid") != ""))
+        LOGGER.info(f"AllIdentifiers: {len(combined)} total rows, encoding by prefix...")
+
+        entry_json = _clean_row_json(combined.schema)
+        prefixes = combined.select(pl.col("uuid").str.slice(0, 1).unique().sort()).to_series().to_list()
+
+        def encode(prefix: str) -> pl.DataFrame:
+            return combined.filter(pl.col("uuid").str.starts_with(prefix)).select(
+                pl.col("uuid").alias(KEY_COL), entry_json.alias(VALUE_COL)
+            )
+
+        count = 0
+        for chunk in map_ordered(encode, prefixes, workers or default_workers()):
+            count += chunk.height
+            yield chunk
+
+        LOGGER.info(f"Built AllIdentifiers with {count} entries")
+
 
 _WUBRG_ORDER = {"W": 0, "U": 1, "B": 2, "R": 3, "G": 4}
 _WUBRG_COLOR_LAYOUTS = frozenset({"split", "adventure", "prepare"})
@@ -1578,6 +1712,106 @@ def _clean_struct(d: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+def _clean_struct_json(expr: pl.Expr, dtype: pl.Struct) -> pl.Expr:
+    """JSON text of ``_clean_struct(value)``, as an object (``{}`` when all members drop)."""
+    fields = sorted(dtype.fields, key=lambda f: f.name)
+    return json_object([(f.name, _clean_nested_json(expr.struct.field(f.name), f.dtype)) for f in fields])
+
+
+def _clean_nested_json(expr: pl.Expr, dtype: Any) -> pl.Expr:
+    """JSON text of a value inside a cleaned struct; null when ``_clean_struct`` drops it."""
+    if isinstance(dtype, pl.Struct):
+        obj = _clean_struct_json(expr, dtype)
+        return pl.when(expr.is_not_null() & (obj != "{}")).then(obj)
+    if isinstance(dtype, pl.List):
+        if isinstance(dtype.inner, pl.Struct):
+            items = json_array(expr.list.eval(_clean_struct_json(pl.element(), dtype.inner)))
+        else:
+            items = json_scalar(expr)
+        return pl.when(expr.list.len() > 0).then(items)
+    return json_scalar(expr)
+
+
+def _rulings_json(expr: pl.Expr, inner: pl.Struct) -> pl.Expr:
+    """JSON text of ``_remap_rulings`` output, sorted by (date, text)."""
+    renames = {"publishedAt": "date", "comment": "text"}
+    targets = {f.name: renames.get(f.name, f.name) for f in inner.fields if f.name != "source"}
+    by_target = {target: name for name, target in targets.items()}
+    sort_fields = [by_target[t] for t in ("date", "text") if t in by_target]
+    if sort_fields:
+        element = pl.element()
+        expr = expr.list.eval(
+            element.sort_by(pl.struct([element.struct.field(f) for f in sort_fields]), maintain_order=True)
+        )
+    members = [
+        (targets[name], json_scalar(pl.element().struct.field(name)))
+        for name in sorted(targets, key=lambda n: targets[n])
+    ]
+    encoded = expr.list.eval(json_object(members))
+    return json_array(encoded.list.eval(pl.element().filter(pl.element() != "{}")))
+
+
+def _clean_row_json(schema: pl.Schema) -> pl.Expr:
+    """Expression producing the JSON text of ``_clean_row(row)`` for every row.
+
+    Mirrors ``_clean_row`` rule for rule, with keys sorted as
+    ``orjson.OPT_SORT_KEYS`` would emit them.
+    """
+    members: list[tuple[str, pl.Expr]] = []
+    for name in sorted(schema):
+        dtype = schema[name]
+        col = pl.col(name)
+
+        if name in ("legalities", "purchaseUrls"):
+            obj = _clean_struct_json(col, dtype) if isinstance(dtype, pl.Struct) else pl.lit("{}")
+            members.append((name, pl.when(col.is_not_null()).then(obj).otherwise(pl.lit("{}"))))
+            continue
+
+        if isinstance(dtype, pl.Struct):
+            obj = _clean_struct_json(col, dtype)
+            keep = col.is_not_null() if name in ALLOW_IF_FALSEY else col.is_not_null() & (obj != "{}")
+            members.append((name, pl.when(keep).then(obj)))
+            continue
+
+        if isinstance(dtype, pl.List):
+            if isinstance(dtype.inner, pl.Struct):
+                if name == "rulings":
+                    items = _rulings_json(col, dtype.inner)
+                else:
+                    values = col
+                    if name == "foreignData" and "language" in {f.name for f in dtype.inner.fields}:
+                        values = col.list.eval(
+                            pl.element().sort_by(pl.element().struct.field("language"), maintain_order=True)
+                        )
+                    items = json_array(values.list.eval(_clean_struct_json(pl.element(), dtype.inner)))
+            elif name in SORTED_LIST_FIELDS:
+                values = col.list.sort()
+                if name == "colors" and "layout" in schema:
+                    wubrg = col.list.eval(
+                        pl.element().sort_by(
+                            pl.element().replace_strict(_WUBRG_ORDER, default=99, return_dtype=pl.Int8),
+                            maintain_order=True,
+                        )
+                    )
+                    values = pl.when(pl.col("layout").is_in(list(_WUBRG_COLOR_LAYOUTS))).then(wubrg).otherwise(values)
+                items = json_scalar(values)
+            else:
+                items = json_scalar(col)
+            empty = pl.lit(None, dtype=pl.String) if name in OMIT_EMPTY_LIST_FIELDS else pl.lit("[]")
+            members.append((name, pl.when(col.list.len() > 0).then(items).when(col.is_not_null()).then(empty)))
+            continue
+
+        value = json_scalar(col)
+        if name not in ALLOW_IF_FALSEY:
+            if dtype == pl.Boolean:
+                value = pl.when(col).then(value)
+            elif dtype == pl.String:
+                value = pl.when(col != "").then(value)
+        members.append((name, value))
+
+    return json_object(members)
+
+
 class EnumValuesAssembler(Assembler):
     """Assembles EnumValues.json by collecting unique values from card/set data.
 
@@ -0,0 +1,156 @@
+"""
+Memory-aware scheduling for the JSON assembly subprocess groups.
+
+The assembly groups differ by an order of magnitude in footprint
+(AllPrintings against Keywords), so a fixed concurrency either wastes the
+machine or risks running it out of memory. Each group's peak RSS (its own
+process plus any set/deck worker pools it starts) and wall time are
+measured when it exits and stored in
+``_assembly_group_stats.json``; the next build uses them to:
+
+    - start the longest groups first, so the slowest group is never the
+      last one to be started
+    - admit a group only while the predicted peaks of everything running
+      fit under the memory ceiling (first fit: a small group may overtake
+      a large one that does not fit yet)
+
+Groups without history are assumed to be both long and heavy
+(``DEFAULT_GROUP_PEAK_MB``, or the full set-assembly worker pool for a
+group that writes AllPrintings), which keeps a first build conservative.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from mtgjson5 import constants
+from mtgjson5.utils import LOGGER
+
+GROUP_STATS_FILE = "_assembly_group_stats.json"
+
+# Used for groups that have never been measured
+DEFAULT_GROUP_PEAK_MB = 4096.0
+
+# Assumed footprint of one set-assembly worker (a disk-backed AssemblyContext)
+DEFAULT_WORKER_PEAK_MB = 1536.0
+
+# Measured peaks vary between builds; leave room above the last one
+_PEAK_HEADROOM = 1.15
+
+_MB = 1024 * 1024
+
+
+def assembly_budget_mb() -> float:
+    """Memory ceiling shared by the assembly groups (``MTGJSON_ASSEMBLY_MEMORY_GB``)."""
+    from mtgjson5.pipeline.batching import memory_ceiling_bytes
+
+    memory_gb = os.environ.get("MTGJSON_ASSEMBLY_MEMORY_GB")
+    return memory_ceiling_bytes(float(memory_gb) if memory_gb else None) / _MB
+
+
+def set_assembly_workers() -> int:
+    """
+    Worker processes assembling set fragments for AllPrintings.
+
+    ``MTGJSON_SET_ASSEMBLY_WORKERS`` wins when set; otherwise as many workers
+    as there are CPUs, limited to what fits the assembly memory budget at
+    ``DEFAULT_WORKER_PEAK_MB`` each.
+    """
+    configured = os.environ.get("MTGJSON_SET_ASSEMBLY_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    by_memory = int(assembly_budget_mb() // DEFAULT_WORKER_PEAK_MB)
+    return max(1, min(os.cpu_count() or 1, by_memory))
+
+
+def group_key(label: str, tasks: list[str]) -> str:
+    """Stats key for a group; the same label with other tasks is measured separately."""
+    return f"{label}:{'+'.join(tasks)}"
+
+
+def load_group_stats(stats_dir: Path | None = None) -> dict[str, dict[str, float]]:
+    """Peak RSS / duration per group measured by previous builds."""
+    path = (stats_dir or constants.CACHE_PATH) / GROUP_STATS_FILE
+    if not path.exists():
+        return {}
+    try:
+        with path.open(encoding="utf-8") as f:
+            groups = json.load(f).get("groups", {})
+    except (OSError, ValueError, AttributeError) as e:
+        LOGGER.warning(f"Ignoring unreadable assembly group stats {path}: {e}")
+        return {}
+    return {k: v for k, v in groups.items() if isinstance(v, dict)}
+
+
+def save_group_stats(measured: dict[str, dict[str, float]], stats_dir: Path | None = None) -> None:
+    """Merge newly measured groups into the stats file."""
+    if not measured:
+        return
+    stats_dir = stats_dir or constants.CACHE_PATH
+    stats = load_group_stats(stats_dir)
+    stats.update(measured)
+
+    stats_dir.mkdir(parents=True, exist_ok=True)
+    path = stats_dir / GROUP_STATS_FILE
+    tmp = path.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump({"groups": stats}, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def estimate_group(stats: dict[str, dict[str, Any]], label: str, tasks: list[str]) -> tuple[float, float | None]:
+    """
+    Predicted (peak MB, duration seconds) for a group.
+
+    Falls back to the heaviest measurement of the same label with other
+    tasks, then to ``DEFAULT_GROUP_PEAK_MB`` with an unknown duration. An
+    unmeasured group writing AllPrintings reserves at least its
+    ``set_assembly_workers()`` pool at ``DEFAULT_WORKER_PEAK_MB`` each.
+    """
+    entry = stats.get(group_key(label, tasks))
+    if entry is None:
+        same_label = [v for k, v in stats.items() if k.split(":", 1)[0] == label]
+        if same_label:
+            entry = max(same_label, key=lambda v: float(v.get("peak_rss_mb", 0.0)))
+    if not entry or float(entry.get("peak_rss_mb", 0.0)) <= 0:
+        if "AllPrintings" in tasks:
+            return max(DEFAULT_GROUP_PEAK_MB, set_assembly_workers() * DEFAULT_WORKER_PEAK_MB), None
+        return DEFAULT_GROUP_PEAK_MB, None
+    duration = entry.get("duration_s")
+    return float(entry["peak_rss_mb"]) * _PEAK_HEADROOM, float(duration) if duration is not None else None
+
+
+def order_groups(groups: list[tuple[str, list[str]]], stats: dict[str, dict[str, Any]]) -> list[tuple[str, list[str]]]:
+    """Longest predicted duration first; unmeasured groups lead, in their given order."""
+
+    def key(group: tuple[str, list[str]]) -> float:
+        _peak, duration = estimate_group(stats, *group)
+        return -duration if duration is not None else float("-inf")
+
+    return sorted(groups, key=key)
+
+
+def next_startable(
+    queue: list[tuple[str, list[str]]],
+    stats: dict[str, dict[str, Any]],
+    reserved_mb: float,
+    budget_mb: float,
+) -> int | None:
+    """
+    Index of the first queued group whose predicted peak fits the remaining budget.
+
+    With nothing running (``reserved_mb == 0``) the head of the queue always
+    starts, even if it alone exceeds the budget, so the schedule cannot stall.
+    """
+    if not queue:
+        return None
+    if reserved_mb <= 0:
+        return 0
+    for i, (label, tasks) in enumerate(queue):
+        peak_mb, _duration = estimate_group(stats, label, tasks)
+        if reserved_mb + peak_mb <= budget_mb:
+            return i
+    return None
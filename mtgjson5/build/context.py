@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import contextlib
 import json
+import os
 import pathlib
+import pickle
 from dataclasses import dataclass, field
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
@@ -31,13 +33,19 @@ if TYPE_CHECKING:
         SetListAssembler,
         TcgplayerSkusAssembler,
     )
+    from .fragments import SetFragmentStore
 
-# Cache file names for fast-path assembly
-CACHE_SET_META = "_assembly_set_meta.json"
-CACHE_BOOSTER_CONFIGS = "_assembly_boosters.json"
-CACHE_DECKS = "_assembly_decks.parquet"
-CACHE_SEALED = "_assembly_sealed.parquet"
-CACHE_TOKEN_PRODUCTS = "_assembly_token_products.json"
+# Cache layout for fast-path assembly written by save_cache: tabular members
+# as uncompressed Arrow IPC (memory-mapped by readers), dict members pickled
+# one per file so ``skip`` avoids loading what a subprocess does not use.
+CACHE_STATE_DIR = "_assembly_state"
+_STATE_DECKS = "decks.arrow"
+_STATE_SEALED = "sealed.arrow"
+
+# Normalized export tables materialized once per build (same Arrow IPC
+# layout), so every format exporter memory-maps them instead of rebuilding
+CACHE_EXPORT_TABLES_DIR = "_export_tables"
+_EXPORT_TABLE_GROUPS = ("normalized_tables", "normalized_boosters")
 
 
 def _enrich_set_metadata(
@@ -489,6 +497,13 @@ class AssemblyContext:
         instance.validate_assembly_data()
         return instance
 
+    @staticmethod
+    def cache_exists(cache_dir: pathlib.Path | None = None) -> bool:
+        """Whether ``save_cache`` output is present in ``cache_dir``."""
+        if cache_dir is None:
+            cache_dir = constants.CACHE_PATH
+        return (cache_dir / CACHE_STATE_DIR / "set_meta.pkl").exists()
+
     @classmethod
     def from_cache(
         cls,
@@ -509,142 +524,195 @@ class AssemblyContext:
         if cache_dir is None:
             cache_dir = constants.CACHE_PATH
 
-        parquet_dir = cache_dir / "_parquet"
-        tokens_dir = cache_dir / "_parquet_tokens"
-        set_meta_path = cache_dir / CACHE_SET_META
-        boosters_path = cache_dir / CACHE_BOOSTER_CONFIGS
-        decks_path = cache_dir / CACHE_DECKS
-        sealed_path = cache_dir / CACHE_SEALED
-
-        # Check required files exist
-        if not set_meta_path.exists():
-            LOGGER.warning(f"Assembly cache not found: {set_meta_path}")
+        state_dir = cache_dir / CACHE_STATE_DIR
+        if not (state_dir / "set_meta.pkl").exists():
+            LOGGER.warning(f"Assembly cache not found: {state_dir}")
             return None
+        return cls._from_cache_state(cache_dir, state_dir, skip)
+
+    @classmethod
+    def _from_cache_state(
+        cls,
+        cache_dir: pathlib.Path,
+        state_dir: pathlib.Path,
+        skip: frozenset[str],
+    ) -> AssemblyContext | None:
+        """Load the binary cache layout: pickled dicts and memory-mapped Arrow frames."""
+        parquet_dir = cache_dir / "_parquet"
         if not parquet_dir.exists():
             LOGGER.warning(f"Parquet directory not found: {parquet_dir}")
             return None
 
-        # Load set metadata (always required)
-        set_meta: dict[str, dict[str, Any]] = orjson.loads(set_meta_path.read_bytes())
-        LOGGER.info("Loading cached set metadata...")
-
-        # Load booster configs
-        booster_configs: dict[str, dict[str, Any]] = {}
-        if "boosters" not in skip and boosters_path.exists():
-            booster_configs = orjson.loads(boosters_path.read_bytes())
-        LOGGER.info("Loaded assembly cache.")
-
-        # Load decks DataFrame
-        decks_df: pl.DataFrame | None = None
-        if "decks" not in skip and decks_path.exists():
-            decks_df = pl.read_parquet(decks_path)
-            LOGGER.info("Loading cached deck data...")
+        def load(name: str) -> Any:
+            path = state_dir / f"{name}.pkl"
+            if not path.exists():
+                return None
+            with path.open("rb") as f:
+                return pickle.load(f)
 
-        # Load sealed products DataFrame
-        sealed_df: pl.DataFrame | None = None
-        if "sealed" not in skip and sealed_path.exists():
-            sealed_df = pl.read_parquet(sealed_path)
-            LOGGER.info("Loading cached sealed products...")
+        def map_frame(name: str) -> pl.DataFrame | None:
+            path = state_dir / name
+            return pl.read_ipc(path, memory_map=True) if path.exists() else None
 
-        # Load token products
-        token_products_path = cache_dir / CACHE_TOKEN_PRODUCTS
-        token_products: dict[str, list] = {}
-        if "token_products" not in skip and token_products_path.exists():
-            token_products = orjson.loads(token_products_path.read_bytes())
-            LOGGER.info("Loading cached token products...")
-
-        keyword_data: dict[str, list[str]] = {}
-        card_type_data: dict[str, list[str]] = {}
-        super_types: list[str] = []
-        planar_types: list[str] = []
-        keywords_cache = cache_dir / "scryfall_keywords.json"
-        types_cache = cache_dir / "scryfall_card_types.json"
-        if keywords_cache.exists():
-            data = orjson.loads(keywords_cache.read_bytes())
-            keyword_data = {
-                "abilityWords": sorted(data.get("ability_words", [])),
-                "keywordAbilities": sorted(data.get("keyword_abilities", [])),
-                "keywordActions": sorted(data.get("keyword_actions", [])),
-            }
-        if types_cache.exists():
-            data = orjson.loads(types_cache.read_bytes())
-            card_type_data = data.get("subtypes", {})
-            super_types = data.get("super_types", [])
-            planar_types = data.get("planar_types", [])
+        set_meta: dict[str, dict[str, Any]] = load("set_meta")
+        booster_configs = (load("booster_configs") if "boosters" not in skip else None) or {}
+        token_products = (load("token_products") if "token_products" not in skip else None) or {}
+        decks_df = map_frame(_STATE_DECKS) if "decks" not in skip else None
+        sealed_df = map_frame(_STATE_SEALED) if "sealed" not in skip else None
+        catalog: dict[str, Any] = load("catalog") or {}
 
-        # Create meta dict
         meta_obj = MtgjsonMeta()
-        meta_dict = {"date": meta_obj.date, "version": meta_obj.version}
-        LOGGER.info("Loading meta information...")
-
         instance = cls(
             parquet_dir=parquet_dir,
-            tokens_dir=tokens_dir,
+            tokens_dir=cache_dir / "_parquet_tokens",
             set_meta=set_meta,
-            meta=meta_dict,
+            meta={"date": meta_obj.date, "version": meta_obj.version},
             decks_df=decks_df,
             sealed_df=sealed_df,
             booster_configs=booster_configs,
             token_products=token_products,
-            keyword_data=keyword_data,
-            card_type_data=card_type_data,
-            super_types=super_types,
-            planar_types=planar_types,
+            keyword_data=catalog.get("keyword_data", {}),
+            card_type_data=catalog.get("card_type_data", {}),
+            super_types=catalog.get("super_types", []),
+            planar_types=catalog.get("planar_types", []),
         )
+        if decks_df is not None and (decks_by_set := load("decks_by_set")) is not None:
+            instance.__dict__["decks_by_set"] = decks_by_set
+        if sealed_df is not None and (sealed_by_set := load("sealed_by_set")) is not None:
+            instance.__dict__["sealed_by_set"] = sealed_by_set
+        LOGGER.info("Loaded assembly cache.")
+
         instance.validate_assembly_data(skip=skip)
         return instance
 
     def save_cache(self, cache_dir: pathlib.Path | None = None) -> None:
-        """Save context to cache for fast rebuilds."""
+        """Save context to cache for fast rebuilds.
+
+        Every file is written to a temporary name and swapped in with
+        ``os.replace``, so processes that memory-mapped the previous frames
+        keep reading intact data.
+        """
         if cache_dir is None:
             cache_dir = constants.CACHE_PATH
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        state_dir = cache_dir / CACHE_STATE_DIR
+        state_dir.mkdir(parents=True, exist_ok=True)
         LOGGER.info("Saving assembly cache...")
 
-        # Save set metadata (convert any non-serializable values)
-        set_meta_path = cache_dir / CACHE_SET_META
+        def dump(name: str, value: Any) -> None:
+            path = state_dir / f"{name}.pkl"
+            tmp = path.with_suffix(".pkl.tmp")
+            with tmp.open("wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+
+        def write_frame(name: str, df: pl.DataFrame | None) -> None:
+            path = state_dir / name
+            if df is None or len(df) == 0:
+                path.unlink(missing_ok=True)
+                return
+            tmp = path.with_suffix(".arrow.tmp")
+            df.write_ipc(tmp, compression="uncompressed")
+            os.replace(tmp, path)
+
+        # Frames and indexes first: set_meta.pkl marks the cache as complete
+        write_frame(_STATE_DECKS, self.decks_df)
+        write_frame(_STATE_SEALED, self.sealed_df)
+        LOGGER.info("Saved deck and sealed product frames to assembly cache.")
+
+        dump("booster_configs", self.booster_configs)
+        dump("token_products", self.token_products)
+        dump("decks_by_set", self.decks_by_set)
+        dump("sealed_by_set", self.sealed_by_set)
+        dump(
+            "catalog",
+            {
+                "keyword_data": self.keyword_data,
+                "card_type_data": self.card_type_data,
+                "super_types": self.super_types,
+                "planar_types": self.planar_types,
+            },
+        )
+
+        # Set metadata (drop None and any frame-valued entries)
         cleaned_meta: dict[str, Any] = {}
         for code, meta in self.set_meta.items():
             cleaned_meta[code] = {
                 k: v for k, v in meta.items() if v is not None and not isinstance(v, pl.DataFrame | pl.LazyFrame)
             }
-        set_meta_path.write_bytes(orjson.dumps(cleaned_meta))
-        LOGGER.info("Saved set metadata to assembly cache.")
-        LOGGER.debug(f"Saved cached set metadata for {len(cleaned_meta)} sets to {set_meta_path}")
-
-        # Save booster configs
-        boosters_path = cache_dir / CACHE_BOOSTER_CONFIGS
-        boosters_path.write_bytes(orjson.dumps(self.booster_configs))
-        LOGGER.info("Saved booster configurations to assembly cache.")
-        LOGGER.debug(f"Saved cached booster configurations for {len(self.booster_configs)} sets to {boosters_path}")
-
-        # Save decks DataFrame
-        if self.decks_df is not None and len(self.decks_df) > 0:
-            decks_path = cache_dir / CACHE_DECKS
-            self.decks_df.write_parquet(decks_path)
-            LOGGER.info("Saved decks DataFrame to assembly cache.")
-            LOGGER.debug(f"Saved cached decks DataFrame with {len(self.decks_df)} rows to {decks_path}")
-
-        # Save sealed products DataFrame
-        if self.sealed_df is not None and len(self.sealed_df) > 0:
-            sealed_path = cache_dir / CACHE_SEALED
-            self.sealed_df.write_parquet(sealed_path)
-            LOGGER.info("Saved sealed products DataFrame to assembly cache.")
-            LOGGER.debug(f"Saved cached sealed products DataFrame with {len(self.sealed_df)} rows to {sealed_path}")
-
-        # Save token products
-        if self.token_products:
-            token_products_path = cache_dir / CACHE_TOKEN_PRODUCTS
-            token_products_path.write_bytes(orjson.dumps(self.token_products))
-            LOGGER.info("Saved token products to assembly cache.")
-            LOGGER.debug(f"Saved cached token products for {len(self.token_products)} tokens to {token_products_path}")
+        dump("set_meta", cleaned_meta)
+        LOGGER.debug(f"Saved cached set metadata for {len(cleaned_meta)} sets to {state_dir}")
 
         LOGGER.info("Assembly cache saved successfully.")
 
+    def save_export_tables(self, root: pathlib.Path) -> None:
+        """Write ``normalized_tables`` and ``normalized_boosters`` under ``root``.
+
+        Each table is an uncompressed Arrow IPC file; ``manifest.pkl`` lists
+        the tables in order and is written last, so a partial set is never
+        loaded by :meth:`load_export_tables`.
+        """
+        manifest_path = root / "manifest.pkl"
+        manifest_path.unlink(missing_ok=True)
+
+        manifest: dict[str, list[str]] = {}
+        for group in _EXPORT_TABLE_GROUPS:
+            group_dir = root / group
+            group_dir.mkdir(parents=True, exist_ok=True)
+            tables: dict[str, pl.DataFrame] = getattr(self, group)
+            manifest[group] = []
+            for name, df in tables.items():
+                if df is None:
+                    continue
+                path = group_dir / f"{name}.arrow"
+                tmp = path.with_suffix(".arrow.tmp")
+                df.write_ipc(tmp, compression="uncompressed")
+                os.replace(tmp, path)
+                manifest[group].append(name)
+
+        tmp = manifest_path.with_suffix(".pkl.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(manifest, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, manifest_path)
+        LOGGER.info(f"Saved {sum(len(names) for names in manifest.values())} export tables to {root}")
+
+    def load_export_tables(self, root: pathlib.Path) -> bool:
+        """Use tables saved by :meth:`save_export_tables`, memory-mapped.
+
+        Replaces any built ``normalized_tables`` / ``normalized_boosters``.
+
+        Returns:
+            False when ``root`` holds no complete table set
+        """
+        manifest_path = root / "manifest.pkl"
+        if not manifest_path.exists():
+            return False
+        with manifest_path.open("rb") as f:
+            manifest: dict[str, list[str]] = pickle.load(f)
+
+        for group in _EXPORT_TABLE_GROUPS:
+            self.__dict__[group] = {
+                name: pl.read_ipc(root / group / f"{name}.arrow", memory_map=True) for name in manifest.get(group, [])
+            }
+        return True
+
     # =========================================================================
     # Assembler Properties
     # =========================================================================
 
+    @cached_property
+    def decks_by_set(self) -> dict[str, list[dict[str, Any]]]:
+        """Minimal deck references per set code, built once from ``decks_df``."""
+        from .assemble import index_minimal_decks
+
+        return index_minimal_decks(self.decks_df)
+
+    @cached_property
+    def sealed_by_set(self) -> dict[str, list[dict[str, Any]]]:
+        """Output sealed products per set code, built once from ``sealed_df``."""
+        from .assemble import index_sealed_products
+
+        return index_sealed_products(self.sealed_df)
+
     @cached_property
     def sets(self) -> SetAssembler:
         """Assembler for complete Set objects."""
@@ -652,6 +720,13 @@ class AssemblyContext:
 
         return SetAssembler(self)
 
+    @cached_property
+    def set_fragments(self) -> SetFragmentStore:
+        """Serialized per-set fragments shared by AllPrintings, set and format files."""
+        from .fragments import SetFragmentStore
+
+        return SetFragmentStore(self)
+
     @cached_property
     def atomic_cards(self) -> AtomicCardsAssembler:
         """Assembler for AtomicCards grouped by name."""
@@ -707,6 +782,7 @@ class AssemblyContext:
             "all_tokens_df",
             "sets_df",
             "sets",
+            "set_fragments",
             "atomic_cards",
             "set_list",
             "tcgplayer_skus",
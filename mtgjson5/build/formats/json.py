@@ -5,12 +5,15 @@ Writers handle file I/O
 
 from __future__ import annotations
 
+import contextlib
 import gc
 import multiprocessing
+import multiprocessing.connection
 import os
 import pathlib
+import time
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple
 
 import orjson
 
@@ -22,15 +25,18 @@ from mtgjson5.models.files import (
     CompiledListFile,
     DeckListFile,
     FormatAtomicFile,
+    FormatFilter,
     FormatPrintingsFile,
-    IndividualSetFile,
     KeywordsFile,
     MetaFile,
     SetListFile,
     TcgplayerSkusFile,
 )
 
+from ..serializers import _drop_nulls
+
 if TYPE_CHECKING:
+    from ..assemble import DeckCardIndex
     from ..context import AssemblyContext
 
 # Format definitions - single source of truth
@@ -40,8 +46,10 @@ _PRINTINGS_OUTPUTS = {fmt.title() for fmt in _PRINTINGS_FORMATS}
 _ATOMIC_OUTPUTS = {f"{fmt.title()}Atomic" for fmt in _ATOMIC_FORMATS}
 
 # Assembly task groups for subprocess isolation.
-# Ordered to avoid overlapping two heavy groups simultaneously.
-# Heavy groups (A, B, C, E) are interleaved with medium/light (D, F).
+# The scheduler reorders groups by measured duration and packs them by
+# measured peak RSS (see build.assembly_schedule); this order only applies
+# to groups without history. Heavy groups (A, B, C, E) are interleaved
+# with medium/light (D, F).
 _ASSEMBLY_GROUPS: list[tuple[str, list[str]]] = [
     ("A", ["AllPrintings", "FormatPrintings"]),
     ("D", ["DeckFiles", "DeckList"]),
@@ -57,6 +65,37 @@ _FORMAT_PRINTINGS_NAMES = _PRINTINGS_OUTPUTS
 _FORMAT_ATOMICS_NAMES = _ATOMIC_OUTPUTS
 
 
+class _RecordStream:
+    """Streams ``{"meta":...,"data":{key: value, ...}}`` to an open file one record at a time."""
+
+    def __init__(self, f: BinaryIO, meta_bytes: bytes, trailer: dict[str, str] | None = None):
+        self.f = f
+        self.count = 0
+        self._trailer = trailer or {}
+        f.write(b'{"meta":')
+        f.write(meta_bytes)
+        f.write(b',"data":{')
+
+    def add(self, key: str, value: bytes) -> None:
+        """Append one pre-serialized record."""
+        if self.count:
+            self.f.write(b",")
+        self.f.write(orjson.dumps(key))
+        self.f.write(b":")
+        self.f.write(value)
+        self.count += 1
+
+    def close(self) -> None:
+        """Close the data object, then append trailing top-level keys."""
+        self.f.write(b"}")
+        for key, value in sorted(self._trailer.items()):
+            self.f.write(b",")
+            self.f.write(orjson.dumps(key))
+            self.f.write(b":")
+            self.f.write(orjson.dumps(value))
+        self.f.write(b"}")
+
+
 def _spawn_assembly_group(
     tasks: list[str],
     output_dir: str,
@@ -99,6 +138,18 @@ def _spawn_assembly_group(
     return proc, results_queue, error_queue
 
 
+class _ActiveGroup(NamedTuple):
+    """A running assembly group subprocess."""
+
+    label: str
+    tasks: list[str]
+    proc: multiprocessing.process.BaseProcess
+    rq: multiprocessing.Queue
+    eq: multiprocessing.Queue
+    predicted_mb: float
+    started: float
+
+
 class JsonOutputBuilder:
     """Writes all JSON-based MTGJSON output files."""
 
@@ -135,8 +186,16 @@ class JsonOutputBuilder:
         output_path: pathlib.Path,
         set_codes: list[str] | None = None,
     ) -> int:
-        """Stream AllPrintings.json to disk."""
+        """Stream AllPrintings.json to disk from the shared set fragments.
+
+        Sets are assembled in ``set_assembly_workers()`` worker processes
+        (CPU count and memory budget, or ``MTGJSON_SET_ASSEMBLY_WORKERS``);
+        output order and bytes are unchanged.
+        """
+        from ..assembly_schedule import set_assembly_workers
+
         codes = set_codes or sorted(self.ctx.set_meta.keys())
+        workers = set_assembly_workers()
 
         with output_path.open("wb") as f:
             f.write(b'{"meta":')
@@ -146,7 +205,7 @@ class JsonOutputBuilder:
             first = True
             count = 0
 
-            for code, set_data in self.ctx.sets.iter_sets(set_codes=codes):
+            for code, fragment in self.ctx.set_fragments.iter_fragments(set_codes=codes, workers=workers):
                 if not first:
                     f.write(b",")
                 first = False
@@ -154,7 +213,7 @@ class JsonOutputBuilder:
                 f.write(b'"')
                 f.write(code.encode())
                 f.write(b'":')
-                f.write(orjson.dumps(set_data, option=self._orjson_opts))
+                f.write(fragment)
                 count += 1
 
             f.write(b"}}")
@@ -168,7 +227,7 @@ class JsonOutputBuilder:
     ) -> AtomicCardsFile | int:
         """Build AtomicCards.json. Returns count if streaming, else full file."""
         if streaming:
-            return self._write_atomic_cards_streaming(output_path)
+            return self.write_atomic_outputs(output_path.parent, format_names=[])["AtomicCards"]
 
         data = self.ctx.atomic_cards.build()
 
@@ -176,29 +235,62 @@ class JsonOutputBuilder:
         file.write(output_path, pretty=self.ctx.pretty)
         return file
 
-    def _write_atomic_cards_streaming(self, output_path: pathlib.Path) -> int:
-        """Stream AtomicCards.json to disk one name-group at a time."""
-        with output_path.open("wb") as f:
-            f.write(b'{"meta":')
-            f.write(orjson.dumps(self.ctx.meta, option=self._orjson_opts))
-            f.write(b',"data":{')
+    def write_atomic_outputs(
+        self,
+        output_dir: pathlib.Path,
+        atomic_cards: bool = True,
+        format_names: list[str] | None = None,
+    ) -> dict[str, int]:
+        """Stream AtomicCards.json and the format atomic files in one pass.
 
-            first = True
-            count = 0
+        Each name group from ``AtomicCardsAssembler.iter_atomic`` is
+        serialized once for AtomicCards.json and its legal printings are
+        routed to every ``{Format}Atomic.json`` as it is produced, so no
+        output is re-read or held in memory as a whole. Null fields are
+        dropped from the format files to match ``FormatAtomicFile.write``.
 
-            for name, cards in self.ctx.atomic_cards.iter_atomic():
-                if not first:
-                    f.write(b",")
-                first = False
+        Args:
+            output_dir: Output directory
+            atomic_cards: Whether to write AtomicCards.json
+            format_names: Formats to write (defaults to all atomic formats)
 
-                f.write(orjson.dumps(name))
-                f.write(b":")
-                f.write(orjson.dumps(cards, option=self._orjson_opts))
-                count += 1
+        Returns:
+            Dict mapping output names to the number of card names written.
+        """
+        formats = _ATOMIC_FORMATS if format_names is None else format_names
+        meta_bytes = orjson.dumps(self.ctx.meta, option=self._orjson_opts)
+
+        with contextlib.ExitStack() as stack:
+            atomic_stream = None
+            if atomic_cards:
+                f = stack.enter_context((output_dir / "AtomicCards.json").open("wb"))
+                atomic_stream = _RecordStream(f, meta_bytes)
+            format_streams = {
+                fmt: _RecordStream(
+                    stack.enter_context((output_dir / f"{fmt.title()}Atomic.json").open("wb")),
+                    meta_bytes,
+                    trailer={"format_name": fmt},
+                )
+                for fmt in formats
+            }
 
-            f.write(b"}}")
+            for name, cards in self.ctx.atomic_cards.iter_atomic():
+                if atomic_stream is not None:
+                    atomic_stream.add(name, orjson.dumps(cards, option=self._orjson_opts))
+                for fmt, stream in format_streams.items():
+                    legal = [_drop_nulls(c) for c in cards if FormatFilter.is_legal(c, fmt)]
+                    if legal:
+                        stream.add(name, orjson.dumps(legal, option=self._orjson_opts))
+
+            results: dict[str, int] = {}
+            if atomic_stream is not None:
+                atomic_stream.close()
+                results["AtomicCards"] = atomic_stream.count
+            for fmt, stream in format_streams.items():
+                stream.close()
+                results[f"{fmt.title()}Atomic"] = stream.count
 
-        return count
+        return results
 
     def write_set_list(self, output_path: pathlib.Path) -> SetListFile:
         """Build SetList.json."""
@@ -222,6 +314,60 @@ class JsonOutputBuilder:
         file.write(output_path, pretty=self.ctx.pretty)
         return file
 
+    def write_format_printings(
+        self,
+        output_dir: pathlib.Path,
+        format_names: list[str] | None = None,
+        set_codes: list[str] | None = None,
+    ) -> dict[str, int]:
+        """Stream every format printings file in one pass over the set fragments.
+
+        Each format-legal set is parsed once and its cards are routed to
+        every format it belongs to, so only one set is held in memory at a
+        time regardless of how many formats are written. Null fields are
+        dropped to match ``FormatPrintingsFile.write``.
+
+        Args:
+            output_dir: Output directory for ``{Format}.json`` files
+            format_names: Formats to write (defaults to all printings formats)
+            set_codes: Optional filter for specific set codes
+
+        Returns:
+            Dict mapping format output names to the number of sets written.
+        """
+        from ..assemble import compute_formats_legal_sets
+
+        formats = format_names or _PRINTINGS_FORMATS
+        legal_sets = compute_formats_legal_sets(self.ctx, formats)
+        any_legal = set().union(*legal_sets.values())
+        codes = [code for code in set_codes or sorted(any_legal) if code in any_legal]
+
+        meta_bytes = orjson.dumps(self.ctx.meta, option=self._orjson_opts)
+
+        with contextlib.ExitStack() as stack:
+            streams = {
+                fmt: _RecordStream(
+                    stack.enter_context((output_dir / f"{fmt.title()}.json").open("wb")),
+                    meta_bytes,
+                    trailer={"format_name": fmt},
+                )
+                for fmt in formats
+            }
+
+            for code, fragment in self.ctx.set_fragments.iter_fragments(set_codes=codes):
+                set_dict = _drop_nulls(orjson.loads(fragment))
+                for fmt, stream in streams.items():
+                    if code not in legal_sets[fmt]:
+                        continue
+                    cards = [c for c in set_dict.get("cards", []) if FormatFilter.is_legal(c, fmt)]
+                    if cards:
+                        stream.add(code, orjson.dumps({**set_dict, "cards": cards}, option=self._orjson_opts))
+
+            for stream in streams.values():
+                stream.close()
+
+        return {fmt.title(): stream.count for fmt, stream in streams.items()}
+
     def write_format_atomic(
         self,
         atomic_cards: AtomicCardsFile,
@@ -233,6 +379,35 @@ class JsonOutputBuilder:
         file.write(output_path, pretty=self.ctx.pretty)
         return file
 
+    def write_set_files(
+        self,
+        output_dir: pathlib.Path,
+        set_codes: list[str] | None = None,
+    ) -> int:
+        """Write one ``{CODE}.json`` per set by wrapping its shared fragment.
+
+        Args:
+            output_dir: Output directory
+            set_codes: Optional filter for specific set codes
+
+        Returns:
+            Number of set files written
+        """
+        from mtgjson5.polars_utils import get_windows_safe_set_code
+
+        meta_bytes = orjson.dumps(self.ctx.meta, option=self._orjson_opts)
+        count = 0
+        for code, fragment in self.ctx.set_fragments.iter_fragments(set_codes=set_codes):
+            safe_code = get_windows_safe_set_code(code)
+            with (output_dir / f"{safe_code}.json").open("wb") as f:
+                f.write(b'{"meta":')
+                f.write(meta_bytes)
+                f.write(b',"data":')
+                f.write(fragment)
+                f.write(b"}")
+            count += 1
+        return count
+
     def write_decks(
         self,
         output_dir: pathlib.Path | None = None,
@@ -240,9 +415,11 @@ class JsonOutputBuilder:
     ) -> int:
         """Write individual deck JSON files with expanded cards.
 
-        Uses a single DeckAssembler (builds the uuid_index once from
-        parquet) and iterates all decks. The uuid_index only contains
-        cards/tokens actually referenced by decks.
+        Uses a single DeckAssembler, whose uuid_index holds one serialized
+        fragment per card/token actually referenced by decks.
+        The files are written from ``deck_workers()`` worker processes
+        sharing the index (one per CPU, or ``MTGJSON_DECK_WORKERS``); ``1``
+        writes them in this process. File contents are unchanged.
 
         Args:
             output_dir: Output directory (defaults to ctx.output_path/decks)
@@ -251,10 +428,10 @@ class JsonOutputBuilder:
         Returns:
             Number of deck files written
         """
-        import hashlib
-
         import polars as pl
 
+        from mtgjson5._subprocess_decks import deck_workers, write_deck_files
+
         if self.ctx.decks_df is None or len(self.ctx.decks_df) == 0:
             return 0
 
@@ -270,31 +447,46 @@ class JsonOutputBuilder:
         if len(decks_df) == 0:
             return 0
 
-        meta_dict = self.ctx.meta
         assembler = self.ctx.deck_assembler()
-        count = 0
+        index = assembler.uuid_index
+        decks = decks_df.to_dicts()
+        workers = deck_workers(len(decks))
 
-        for deck_raw in decks_df.to_dicts():
-            deck = assembler.build(deck_raw)
+        if workers > 1:
+            count = self._write_decks_parallel(decks, index, output_dir, workers)
+        else:
+            count = write_deck_files(decks, index, self.ctx.meta, output_dir, self._orjson_opts)
 
-            safe_name = "".join(c for c in deck["name"].title() if c.isalnum())
-            set_code = deck.get("code", deck_raw.get("setCode", "UNK"))
-            filename = f"{safe_name}_{set_code}"
+        del assembler, index, decks
+        gc.collect()
 
-            output = {"meta": meta_dict, "data": deck}
-            json_path = output_dir / f"{filename}.json"
-            json_bytes = orjson.dumps(output, option=self._orjson_opts)
-            json_path.write_bytes(json_bytes)
+        return count
 
-            sha_path = output_dir / f"{filename}.json.sha256"
-            sha_path.write_text(hashlib.sha256(json_bytes).hexdigest())
+    def _write_decks_parallel(
+        self,
+        decks: list[dict[str, Any]],
+        index: DeckCardIndex,
+        output_dir: pathlib.Path,
+        workers: int,
+    ) -> int:
+        """Write deck files from a spawn pool that receives ``index`` once per worker."""
+        from concurrent.futures import ProcessPoolExecutor
 
-            count += 1
+        from mtgjson5._subprocess_decks import init_deck_worker, write_deck_batch
+        from mtgjson5.utils import LOGGER, get_log_file
 
-        del assembler
-        gc.collect()
+        # A few batches per worker keeps the pool busy when deck sizes vary
+        batch_size = max(1, -(-len(decks) // (workers * 4)))
+        batches = [decks[i : i + batch_size] for i in range(0, len(decks), batch_size)]
+        LOGGER.info(f"Writing {len(decks)} decks across {workers} workers ({len(index)} distinct cards)")
 
-        return count
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_deck_worker,
+            initargs=(index, self.ctx.meta, str(output_dir), self._orjson_opts, get_log_file()),
+        ) as pool:
+            return sum(pool.map(write_deck_batch, batches))
 
     def write_prices(self, output_dir: pathlib.Path) -> dict[str, int]:
         """Build AllPrices.json and AllPricesToday.json using Polars builder.
@@ -344,24 +536,19 @@ class JsonOutputBuilder:
         return file
 
     def _write_tcgplayer_skus_streaming(self, output_path: pathlib.Path) -> int:
-        """Stream TcgplayerSkus.json to disk one UUID at a time."""
+        """Stream TcgplayerSkus.json to disk from Polars-encoded uuid-prefix chunks."""
+        from ..keyed_json import write_keyed_object
+
         with output_path.open("wb") as f:
             f.write(b'{"meta":')
             f.write(orjson.dumps(self.ctx.meta, option=self._orjson_opts))
             f.write(b',"data":{')
 
-            first = True
-            count = 0
-
-            for uuid, skus in self.ctx.tcgplayer_skus.iter_skus():
-                if not first:
-                    f.write(b",")
-                first = False
-
-                f.write(orjson.dumps(uuid))
-                f.write(b":")
-                f.write(orjson.dumps(skus, option=self._orjson_opts))
-                count += 1
+            count = write_keyed_object(
+                f,
+                self.ctx.tcgplayer_skus.iter_json_chunks(),
+                redump_option=self._orjson_opts if self.ctx.pretty else None,
+            )
 
             f.write(b"}}")
 
@@ -432,25 +619,20 @@ class JsonOutputBuilder:
         """
         from mtgjson5.utils import LOGGER
 
-        count = 0
-        meta_dict = self.ctx.meta
+        from ..keyed_json import write_keyed_object
 
         with open(output_path, "wb") as f:
             f.write(b'{"meta": ')
-            f.write(orjson.dumps(meta_dict, option=self._orjson_opts))
+            f.write(orjson.dumps(self.ctx.meta, option=self._orjson_opts))
             f.write(b', "data": {')
 
-            first = True
-            for uuid, entry in self.ctx.all_identifiers.iter_entries():
-                if not first:
-                    f.write(b",")
-                first = False
-
-                f.write(b"\n")
-                f.write(orjson.dumps(uuid))
-                f.write(b": ")
-                f.write(orjson.dumps(entry, option=self._orjson_opts))
-                count += 1
+            count = write_keyed_object(
+                f,
+                self.ctx.all_identifiers.iter_json_chunks(),
+                entry_prefix=b"\n",
+                key_sep=b": ",
+                redump_option=self._orjson_opts if self.ctx.pretty else None,
+            )
 
             f.write(b"\n}}")
 
@@ -492,13 +674,30 @@ class JsonOutputBuilder:
         """
         from mtgjson5.utils import LOGGER
 
-        max_concurrent = int(os.environ.get("MTGJSON_MAX_ASSEMBLY_PROCS", "2"))
-        LOGGER.info(f"Assembly: subprocess mode (max_concurrent={max_concurrent})")
+        from ..assembly_schedule import (
+            assembly_budget_mb,
+            estimate_group,
+            group_key,
+            load_group_stats,
+            next_startable,
+            order_groups,
+            save_group_stats,
+        )
+
+        # Optional hard cap on top of the memory budget (0 = memory-bound only)
+        max_concurrent = int(os.environ.get("MTGJSON_MAX_ASSEMBLY_PROCS", "0"))
+        budget_mb = assembly_budget_mb()
+        LOGGER.info(
+            f"Assembly: subprocess mode (budget={budget_mb:.0f} MB, max_concurrent={max_concurrent or 'unbounded'})"
+        )
 
         # Release any cached card data in the parent — children load fresh.
         self.ctx.release_card_data()
         gc.collect()
 
+        # Children share set fragments for this run only
+        self.ctx.set_fragments.reset()
+
         # Build the filtered group list based on what outputs are requested.
         groups_to_run: list[tuple[str, list[str]]] = []
         for group_label, tasks in _ASSEMBLY_GROUPS:
@@ -541,19 +740,26 @@ class JsonOutputBuilder:
             ", ".join(f"{label}={tasks}" for label, tasks in groups_to_run),
         )
 
-        # Scheduler: run groups with limited concurrency.
+        # Scheduler: longest groups first, admitted while their predicted
+        # peaks fit the memory budget; woken by child exit.
+        stats = load_group_stats()
         is_profiling = profiler.enabled
         results: dict[str, int] = {}
-        active: list[tuple[str, multiprocessing.process.BaseProcess, multiprocessing.Queue, multiprocessing.Queue]] = []
-        group_queue = list(groups_to_run)
+        measured: dict[str, dict[str, float]] = {}
+        active: dict[int, _ActiveGroup] = {}
+        group_queue = order_groups(groups_to_run, stats)
 
         output_dir_str = str(output_dir)
 
         while group_queue or active:
-            # Start new groups up to max_concurrent
-            while group_queue and len(active) < max_concurrent:
-                label, tasks = group_queue.pop(0)
-                LOGGER.info(f"Assembly: spawning group {label} {tasks}")
+            while group_queue and (not max_concurrent or len(active) < max_concurrent):
+                reserved_mb = sum(group.predicted_mb for group in active.values())
+                idx = next_startable(group_queue, stats, reserved_mb, budget_mb)
+                if idx is None:
+                    break
+                label, tasks = group_queue.pop(idx)
+                predicted_mb, _duration = estimate_group(stats, label, tasks)
+                LOGGER.info(f"Assembly: spawning group {label} {tasks} (predicted peak {predicted_mb:.0f} MB)")
                 profiler.checkpoint_with_children(f"assembly/spawn_{label}")
                 proc, rq, eq = _spawn_assembly_group(
                     tasks,
@@ -565,31 +771,35 @@ class JsonOutputBuilder:
                     profile=is_profiling,
                     group_label=label,
                 )
-                active.append((label, proc, rq, eq))
-
-            # Wait for any active process to finish
-            if active:
-                # Poll active processes
-                finished = []
-                for i, (_label, proc, _rq, _eq) in enumerate(active):
-                    proc.join(timeout=1.0)
-                    if not proc.is_alive():
-                        finished.append(i)
-
-                # Collect results from finished processes
-                for i in reversed(finished):
-                    label, proc, rq, eq = active.pop(i)
-                    if not eq.empty():
-                        err = eq.get_nowait()
-                        LOGGER.error(f"Assembly subprocess {label} error: {err}")
-                    while not rq.empty():
-                        group_results = rq.get_nowait()
-                        sp_profile = group_results.pop("_profile", None)
-                        if sp_profile:
-                            profiler.add_subprocess_profile(sp_profile)
-                        results.update(group_results)
-                    profiler.checkpoint_with_children(f"assembly/joined_{label}")
-                    LOGGER.info(f"Assembly: group {label} complete (exit code {proc.exitcode})")
+                active[proc.sentinel] = _ActiveGroup(label, tasks, proc, rq, eq, predicted_mb, time.monotonic())
+
+            # Block until at least one child exits
+            ready = set(multiprocessing.connection.wait(list(active)))
+            for sentinel in [s for s in active if s in ready]:
+                group = active.pop(sentinel)
+                group.proc.join()
+                duration = time.monotonic() - group.started
+                if not group.eq.empty():
+                    err = group.eq.get_nowait()
+                    LOGGER.error(f"Assembly subprocess {group.label} error: {err}")
+                while not group.rq.empty():
+                    group_results = group.rq.get_nowait()
+                    sp_profile = group_results.pop("_profile", None)
+                    if sp_profile:
+                        profiler.add_subprocess_profile(sp_profile)
+                    peak_mb = group_results.pop("_peak_rss_mb", None)
+                    if group.proc.exitcode == 0 and peak_mb and peak_mb > 0:
+                        measured[group_key(group.label, group.tasks)] = {
+                            "peak_rss_mb": round(peak_mb, 1),
+                            "duration_s": round(duration, 1),
+                        }
+                    results.update(group_results)
+                profiler.checkpoint_with_children(f"assembly/joined_{group.label}")
+                LOGGER.info(
+                    f"Assembly: group {group.label} complete in {duration:.1f}s (exit code {group.proc.exitcode})"
+                )
+
+        save_group_stats(measured)
 
         # Handle AllPrices if explicitly requested (via --outputs AllPrices).
         # This uses PolarsPriceBuilder and runs in-process since it has its
@@ -665,6 +875,7 @@ class JsonOutputBuilder:
             )
 
         # --- In-process fallback (MTGJSON_NO_SUBPROCESS=1) ---
+        self.ctx.set_fragments.reset()
 
         # Build Meta
         if should_build("Meta"):
@@ -686,55 +897,33 @@ class JsonOutputBuilder:
                 all_printings if isinstance(all_printings, int) else len(all_printings.data)  # pylint: disable=no-member
             )
 
-        # Build format-specific files (require AllPrintings)
+        # Build format-specific files (filtered from the set fragments)
         if not sets_only or (outputs and (_PRINTINGS_OUTPUTS & outputs)):  # noqa: SIM102
             if outputs is None or (_PRINTINGS_OUTPUTS & outputs):
                 LOGGER.info("Building format-specific files...")
-                if all_printings is None or (streaming and isinstance(all_printings, int)):
-                    all_printings = AllPrintingsFile.read(output_dir / "AllPrintings.json")
-
-                if isinstance(all_printings, AllPrintingsFile):
-                    for fmt in _PRINTINGS_FORMATS:
-                        if should_build(fmt.title()):
-                            fmt_file = self.write_format_file(all_printings, fmt, output_dir / f"{fmt.title()}.json")
-                            results[fmt.title()] = len(fmt_file.data)
+                formats = [fmt for fmt in _PRINTINGS_FORMATS if should_build(fmt.title())]
+                if formats:
+                    results.update(self.write_format_printings(output_dir, formats, set_codes=valid_codes))
 
         del all_printings
         gc.collect()
         profiler.checkpoint("assembly/all_printings")
 
-        # Build AtomicCards (streaming to disk)
-        atomic_cards_count = None
-        if should_build("AtomicCards"):
-            LOGGER.info("Building AtomicCards.json...")
-            atomic_result = self.write_atomic_cards(
-                output_dir / "AtomicCards.json",
-                streaming=streaming,
-            )
-            if isinstance(atomic_result, int):
-                atomic_cards_count = atomic_result
-                results["AtomicCards"] = atomic_cards_count
-            else:
-                results["AtomicCards"] = len(atomic_result.data)
-        profiler.checkpoint("assembly/atomic_cards")
-
-        # Format atomic files (re-read AtomicCards from disk)
+        # Build AtomicCards and format atomic files in one streaming pass
+        atomic_formats: list[str] = []
         if not sets_only or (outputs and (_ATOMIC_OUTPUTS & outputs)):  # noqa: SIM102
             if outputs is None or (_ATOMIC_OUTPUTS & outputs):
-                # Ensure AtomicCards.json exists on disk
-                atomic_path = output_dir / "AtomicCards.json"
-                if not atomic_path.exists():
-                    self.write_atomic_cards(atomic_path, streaming=streaming)
-
-                # Read from disk for format filtering
-                atomic_cards_file = AtomicCardsFile.read(atomic_path)
-                for fmt in _ATOMIC_FORMATS:
-                    if should_build(f"{fmt.title()}Atomic"):
-                        atomic_file = self.write_format_atomic(
-                            atomic_cards_file, fmt, output_dir / f"{fmt.title()}Atomic.json"
-                        )
-                        results[f"{fmt.title()}Atomic"] = len(atomic_file.data)
-                del atomic_cards_file
+                atomic_formats = [fmt for fmt in _ATOMIC_FORMATS if should_build(f"{fmt.title()}Atomic")]
+        if should_build("AtomicCards") or atomic_formats:
+            LOGGER.info("Building AtomicCards.json and format atomic files...")
+            results.update(
+                self.write_atomic_outputs(
+                    output_dir,
+                    atomic_cards=should_build("AtomicCards"),
+                    format_names=atomic_formats,
+                )
+            )
+        profiler.checkpoint("assembly/atomic_cards")
 
         gc.collect()
         profiler.checkpoint("assembly/format_files")
@@ -747,16 +936,8 @@ class JsonOutputBuilder:
 
         # Build individual set files
         if outputs is None or not outputs or sets_only:
-            from mtgjson5.polars_utils import get_windows_safe_set_code
-
             LOGGER.info("Building individual set files...")
-            set_count = 0
-            for code, set_data in self.ctx.sets.iter_sets(set_codes=valid_codes):
-                single = IndividualSetFile.from_set_data(set_data, self.ctx.meta)
-                safe_code = get_windows_safe_set_code(code)
-                single.write(output_dir / f"{safe_code}.json", pretty=self.ctx.pretty)
-                set_count += 1
-            results["sets"] = set_count
+            results["sets"] = self.write_set_files(output_dir, set_codes=valid_codes)
         profiler.checkpoint("assembly/set_files")
 
         # Build deck files
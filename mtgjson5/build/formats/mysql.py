@@ -11,7 +11,7 @@ import polars as pl
 from mtgjson5.models.containers import MtgjsonMeta
 from mtgjson5.utils import LOGGER
 
-from ..serializers import escape_mysql, serialize_complex_types
+from ..serializers import serialize_complex_types, write_mysql_inserts
 from .sqlite import TABLE_INDEXES
 
 if TYPE_CHECKING:
@@ -77,6 +77,7 @@ class MySQLBuilder:
         - Backtick-quoted identifiers
         - ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
         - START TRANSACTION / COMMIT
+        - Multi-row INSERT statements
         - MySQL data types (BOOLEAN, FLOAT, etc.)
         """
         tables = self.ctx.normalized_tables
@@ -115,10 +116,7 @@ class MySQLBuilder:
                     f"ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n\n"
                 )
 
-                col_names = ", ".join([f"`{c}`" for c in serialized.columns])
-                for row in serialized.rows():
-                    values = ", ".join(escape_mysql(v) for v in row)
-                    f.write(f"INSERT INTO `{table_name}` ({col_names}) VALUES ({values});\n")
+                write_mysql_inserts(f, table_name, serialized)
 
                 if table_name in TABLE_INDEXES:
                     for idx_name, col in TABLE_INDEXES[table_name]:
@@ -11,7 +11,7 @@ import polars as pl
 from mtgjson5.models.containers import MtgjsonMeta
 from mtgjson5.utils import LOGGER
 
-from ..serializers import escape_postgres, serialize_complex_types
+from ..serializers import serialize_complex_types, write_postgres_copy
 from .sqlite import TABLE_INDEXES
 
 if TYPE_CHECKING:
@@ -62,14 +62,7 @@ class PostgresBuilder:
         f.write(f'DROP TABLE IF EXISTS "{table_name}" CASCADE;\n')
         f.write(f'CREATE TABLE "{table_name}" (\n    {col_defs}\n);\n\n')
 
-        col_names = ", ".join([f'"{c}"' for c in serialized.columns])
-        f.write(f'COPY "{table_name}" ({col_names}) FROM stdin;\n')
-
-        for row in serialized.rows():
-            escaped = [escape_postgres(v) for v in row]
-            f.write("\t".join(escaped) + "\n")
-
-        f.write("\\.\n\n")
+        write_postgres_copy(f, table_name, serialized)
 
         if table_name in TABLE_INDEXES:
             for idx_name, col in TABLE_INDEXES[table_name]:
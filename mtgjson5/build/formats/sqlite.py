@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import contextlib
+import os
 import pathlib
 import sqlite3
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
 import polars as pl
 
 from mtgjson5.models.containers import MtgjsonMeta
-from mtgjson5.utils import LOGGER
+from mtgjson5.utils import LOGGER, map_ordered
 
 from ..serializers import serialize_complex_types
 
@@ -39,6 +41,73 @@ TABLE_INDEXES = {
 }
 
 
+# Load-time settings for building a fresh database file: no rollback
+# journal or fsyncs (a failed build is rebuilt from scratch), an exclusive
+# lock and a 256 MiB page cache. None of them persist in the file.
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",
+)
+
+# Rows handed to each executemany call; slices are streamed, never materialized whole
+INSERT_BATCH_ROWS = 50_000
+
+# Threads serializing the next tables while the current one is inserted
+_PREPARE_WORKERS = min(4, os.cpu_count() or 1)
+
+
+@contextlib.contextmanager
+def bulk_load(path: pathlib.Path) -> Iterator[sqlite3.Cursor]:
+    """Open a new database at ``path`` for bulk loading inside one transaction.
+
+    Any existing file is replaced. The transaction is committed when the
+    block exits normally; on an error the file is removed, since without a
+    rollback journal a partial load can leave it corrupt.
+    """
+    if path.exists():
+        path.unlink()
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    try:
+        cursor = conn.cursor()
+        for pragma in BULK_LOAD_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.execute("BEGIN")
+        yield cursor
+        cursor.execute("COMMIT")
+    except BaseException:
+        conn.close()
+        path.unlink(missing_ok=True)
+        raise
+    finally:
+        conn.close()
+
+
+def insert_rows(cursor: sqlite3.Cursor, table_name: str, df: pl.DataFrame) -> int:
+    """Insert ``df`` into an existing table through one prepared statement, slice by slice."""
+    placeholders = ", ".join(["?" for _ in df.columns])
+    col_names = ", ".join([f'"{c}"' for c in df.columns])
+    sql = f'INSERT INTO "{table_name}" ({col_names}) VALUES ({placeholders})'
+    for batch in df.iter_slices(INSERT_BATCH_ROWS):
+        cursor.executemany(sql, batch.iter_rows())
+    return len(df)
+
+
+def create_indexes(
+    cursor: sqlite3.Cursor,
+    table_names: Iterable[str],
+    indexes: dict[str, list[tuple[str, str]]] | None = None,
+) -> None:
+    """Create ``idx_<table>_<name>`` indexes once the tables are loaded (default: ``TABLE_INDEXES``)."""
+    indexes = TABLE_INDEXES if indexes is None else indexes
+    for table_name in table_names:
+        for idx_name, col in indexes.get(table_name, []):
+            with contextlib.suppress(Exception):
+                cursor.execute(f'CREATE INDEX "idx_{table_name}_{idx_name}" ON "{table_name}" ("{col}")')
+
+
 def _polars_to_sqlite_type(dtype: pl.DataType) -> str:
     """Map Polars dtype to SQLite type."""
     if dtype.is_integer():
@@ -65,44 +134,28 @@ class SQLiteBuilder:
         self,
         cursor: sqlite3.Cursor,
         table_name: str,
-        df: pl.DataFrame,
+        serialized: pl.DataFrame,
     ) -> int:
-        """Write a single table to SQLite.
+        """Create and fill a single table from an already serialized frame.
 
+        Indexes are created separately, after every table is loaded.
         Returns the number of rows written.
         """
-        if df is None or len(df) == 0:
+        if serialized is None or len(serialized) == 0:
             return 0
 
-        serialized = serialize_complex_types(df)
-
         schema = serialized.schema
         cols = ", ".join([f'"{c}" {_polars_to_sqlite_type(schema[c])}' for c in serialized.columns])
         cursor.execute(f'CREATE TABLE IF NOT EXISTS "{table_name}" ({cols})')
 
-        # Batch insert rows
-        placeholders = ", ".join(["?" for _ in serialized.columns])
-        col_names = ", ".join([f'"{c}"' for c in serialized.columns])
-
-        batch_size = 10000
-        rows = serialized.rows()
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i : i + batch_size]
-            cursor.executemany(
-                f'INSERT INTO "{table_name}" ({col_names}) VALUES ({placeholders})',
-                batch,
-            )
-
-        if table_name in TABLE_INDEXES:
-            for idx_name, col in TABLE_INDEXES[table_name]:
-                with contextlib.suppress(Exception):
-                    cursor.execute(f'CREATE INDEX "idx_{table_name}_{idx_name}" ON "{table_name}" ("{col}")')
-
-        return len(serialized)
+        return insert_rows(cursor, table_name, serialized)
 
     def write(self, output_path: pathlib.Path | None = None) -> pathlib.Path | None:
         """Write SQLite database using native sqlite3.
 
+        Tables are serialized on a few threads ahead of the inserts, loaded in
+        one bulk-load transaction, and indexed once all data is in.
+
         Creates all normalized tables matching the CDN reference:
         - cards, cardIdentifiers, cardLegalities, cardForeignData, cardRulings, cardPurchaseUrls
         - tokens, tokenIdentifiers
@@ -117,31 +170,28 @@ class SQLiteBuilder:
         if output_path is None:
             output_path = self.ctx.output_path / "AllPrintings.sqlite"
 
-        if output_path.exists():
-            output_path.unlink()
-
         tables = dict(tables)  # shallow copy for adding meta/boosters
         tables.update(self.ctx.normalized_boosters)
 
         meta = MtgjsonMeta()
         tables["meta"] = pl.DataFrame({"date": [meta.date], "version": [meta.version]})
 
-        conn = sqlite3.connect(str(output_path))
-        cursor = conn.cursor()
+        items = [(name, df) for name, df in tables.items() if df is not None and len(df) > 0]
+
+        def prepare(item: tuple[str, pl.DataFrame]) -> tuple[str, pl.DataFrame]:
+            return item[0], serialize_complex_types(item[1])
 
         total_rows = 0
-        table_count = 0
+        written: list[str] = []
 
-        for table_name, df in tables.items():
-            if df is not None and len(df) > 0:
-                rows = self._write_table(cursor, table_name, df)
+        with bulk_load(output_path) as cursor:
+            for table_name, serialized in map_ordered(prepare, items, _PREPARE_WORKERS):
+                rows = self._write_table(cursor, table_name, serialized)
                 if rows > 0:
                     LOGGER.info(f"  {table_name}: {rows:,} rows")
                     total_rows += rows
-                    table_count += 1
-
-        conn.commit()
-        conn.close()
+                    written.append(table_name)
+            create_indexes(cursor, written)
 
-        LOGGER.info(f"Wrote AllPrintings.sqlite ({table_count} tables, {total_rows:,} total rows)")
+        LOGGER.info(f"Wrote AllPrintings.sqlite ({len(written)} tables, {total_rows:,} total rows)")
         return output_path
@@ -0,0 +1,174 @@
+"""Serialized set fragments shared by every set-shaped JSON output.
+
+A fragment is the ``orjson`` serialization of one assembled set (the value
+stored under ``data.<CODE>`` in AllPrintings.json). ``AllPrintings.json``,
+the per-set ``{CODE}.json`` files and the format printings files all embed
+the same bytes, so each set is assembled and serialized once per build and
+the result is shared through ``_set_fragments/`` in the cache directory:
+
+    _set_fragments/<compact|pretty>/<CODE>.json         fragment bytes
+    _set_fragments/<compact|pretty>/<CODE>.json.sha256  content hash
+
+Assembly subprocesses share the store: whichever group asks for a set first
+builds and stores it, later readers reuse it. Writes go through a temporary
+file and ``os.replace``; a fragment is only trusted when its hash sidecar
+matches, so a half-written or stale pair is rebuilt rather than reused.
+The store is cleared at the start of each assembly run.
+
+``iter_fragments`` can fan assembly out to spawned worker processes that
+load the assembly cache themselves and fill the store. The caller still
+receives fragments in set-code order: at most ``window`` sets are in
+flight ahead of the one being consumed, which bounds both the work queued
+on the pool and the fragments waiting on disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import multiprocessing
+import os
+import pathlib
+import shutil
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from mtgjson5.polars_utils import get_windows_safe_set_code
+from mtgjson5.utils import LOGGER
+
+if TYPE_CHECKING:
+    from .context import AssemblyContext
+
+CACHE_SET_FRAGMENTS = "_set_fragments"
+
+
+class SetFragmentStore:
+    """Build-or-reuse cache of serialized set fragments."""
+
+    def __init__(self, ctx: AssemblyContext, root: pathlib.Path | None = None):
+        self.ctx = ctx
+        self.base = root if root is not None else ctx.parquet_dir.parent / CACHE_SET_FRAGMENTS
+        self.root = self.base / ("pretty" if ctx.pretty else "compact")
+        self._orjson_opts = orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if ctx.pretty else 0)
+
+    def reset(self) -> None:
+        """Drop every stored fragment (start of a new assembly run)."""
+        shutil.rmtree(self.root.parent, ignore_errors=True)
+
+    def _paths(self, code: str) -> tuple[pathlib.Path, pathlib.Path]:
+        path = self.root / f"{get_windows_safe_set_code(code)}.json"
+        return path, path.with_name(f"{path.name}.sha256")
+
+    def _read(self, code: str) -> bytes | None:
+        """Return the stored fragment if present and its hash matches."""
+        path, sha_path = self._paths(code)
+        try:
+            expected = sha_path.read_text(encoding="utf-8").strip()
+            fragment = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(fragment).hexdigest() != expected:
+            return None
+        return fragment
+
+    def _write(self, code: str, fragment: bytes) -> None:
+        """Store a fragment and its hash; concurrent writers produce identical bytes."""
+        path, sha_path = self._paths(code)
+        self.root.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+
+        tmp = path.with_name(path.name + suffix)
+        tmp.write_bytes(fragment)
+        os.replace(tmp, path)
+
+        sha_tmp = sha_path.with_name(sha_path.name + suffix)
+        sha_tmp.write_text(hashlib.sha256(fragment).hexdigest(), encoding="utf-8")
+        os.replace(sha_tmp, sha_path)
+
+    def get(self, code: str) -> bytes:
+        """Return the serialized fragment for a set, assembling it on first use."""
+        fragment = self._read(code)
+        if fragment is None:
+            fragment = orjson.dumps(self.ctx.sets.build(code), option=self._orjson_opts)
+            self._write(code, fragment)
+        return fragment
+
+    def load(self, code: str) -> dict[str, Any]:
+        """Return a set's fragment parsed back into a dict."""
+        result: dict[str, Any] = orjson.loads(self.get(code))
+        return result
+
+    def iter_fragments(
+        self,
+        set_codes: list[str] | None = None,
+        workers: int = 1,
+        window: int | None = None,
+    ) -> Iterator[tuple[str, bytes]]:
+        """Iterate (code, fragment) in the same order and selection as ``SetAssembler.iter_sets``.
+
+        Args:
+            set_codes: Optional set codes to include (default: all, sorted)
+            workers: Worker processes assembling ahead of the consumer;
+                1 assembles in-process
+            window: Maximum sets in flight ahead of the consumer
+                (default: twice ``workers``)
+        """
+        available = set(self.ctx.sets.iter_set_codes())
+        codes = [code for code in (set_codes or sorted(available)) if code in available]
+        if workers > 1 and len(codes) > 1:
+            yield from self._iter_fragments_parallel(codes, workers, window or 2 * workers)
+            return
+        for code in codes:
+            yield code, self.get(code)
+
+    def _iter_fragments_parallel(self, codes: list[str], workers: int, window: int) -> Iterator[tuple[str, bytes]]:
+        """Assemble fragments in worker processes, yielding them in ``codes`` order."""
+        from mtgjson5._subprocess_fragments import build_set_fragment, init_fragment_worker
+        from mtgjson5.build.context import AssemblyContext
+        from mtgjson5.utils import get_log_file
+
+        cache_dir = self.ctx.parquet_dir.parent
+        if not AssemblyContext.cache_exists(cache_dir):
+            LOGGER.warning(f"Assembly cache not found in {cache_dir}; assembling set fragments in-process")
+            for code in codes:
+                yield code, self.get(code)
+            return
+
+        workers = min(workers, len(codes))
+        window = max(window, workers)
+        LOGGER.info(f"Assembling {len(codes)} set fragments across {workers} workers (window={window})")
+
+        prev_threads = os.environ.get("POLARS_MAX_THREADS")
+        os.environ["POLARS_MAX_THREADS"] = str(max(1, (os.cpu_count() or 1) // workers))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_fragment_worker,
+                initargs=(str(cache_dir), str(self.base), self.ctx.pretty, get_log_file()),
+            ) as pool:
+                pending: deque[tuple[str, Future[str]]] = deque()
+                remaining = iter(codes)
+                try:
+                    for code in remaining:
+                        pending.append((code, pool.submit(build_set_fragment, code)))
+                        if len(pending) >= window:
+                            break
+                    while pending:
+                        code, future = pending.popleft()
+                        future.result()
+                        next_code = next(remaining, None)
+                        if next_code is not None:
+                            pending.append((next_code, pool.submit(build_set_fragment, next_code)))
+                        yield code, self.get(code)
+                finally:
+                    for _code, future in pending:
+                        future.cancel()
+        finally:
+            if prev_threads is None:
+                os.environ.pop("POLARS_MAX_THREADS", None)
+            else:
+                os.environ["POLARS_MAX_THREADS"] = prev_threads
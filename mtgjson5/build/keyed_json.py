@@ -0,0 +1,118 @@
+"""Streaming writer for large ``{key: value}`` JSON objects built in Polars.
+
+AllIdentifiers, TcgplayerSkus and AllPrices are single objects keyed by
+uuid with hundreds of thousands of entries. Rather than turning every row
+into nested Python dicts for ``orjson.dumps``, each uuid-prefix chunk is
+encoded to a ``key`` / ``value`` frame of JSON text by Polars expressions,
+chunks are built on a small thread pool (Polars releases the GIL), and
+their bytes are concatenated in key order.
+
+The expression helpers emit the same bytes as compact ``orjson.dumps``:
+scalars go through ``struct.json_encode``, which escapes strings and
+formats floats exactly like orjson, and objects are assembled with their
+members in the order given.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Sequence
+from typing import BinaryIO
+
+import orjson
+import polars as pl
+
+KEY_COL = "key"
+VALUE_COL = "value"
+
+UUID_PREFIXES = "0123456789abcdef"
+
+
+def default_workers() -> int:
+    """Chunk builder threads, from ``MTGJSON_KEYED_JSON_WORKERS`` (default: up to 4)."""
+    configured = os.environ.get("MTGJSON_KEYED_JSON_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return min(4, os.cpu_count() or 1)
+
+
+def json_scalar(expr: pl.Expr) -> pl.Expr:
+    """JSON text of a scalar (or list of scalars) column; null stays null."""
+    encoded = pl.struct(expr.alias("v")).struct.json_encode().str.slice(5).str.strip_suffix("}")
+    return pl.when(expr.is_not_null()).then(encoded)
+
+
+def json_key(name: str) -> str:
+    """Literal ``"name":`` prefix of an object member."""
+    return orjson.dumps(name).decode() + ":"
+
+
+def json_object(members: Sequence[tuple[str, pl.Expr]]) -> pl.Expr:
+    """JSON object text from ``(name, encoded value)`` pairs; null values are omitted."""
+    if not members:
+        return pl.lit("{}")
+    parts = [pl.concat_str([pl.lit(json_key(name)), value]) for name, value in members]
+    return pl.concat_str([pl.lit("{"), pl.concat_list(parts).list.drop_nulls().list.join(","), pl.lit("}")])
+
+
+def json_array(items: pl.Expr) -> pl.Expr:
+    """JSON array text from a list column of encoded values; null stays null."""
+    return pl.concat_str([pl.lit("["), items.list.join(","), pl.lit("]")])
+
+
+def json_entries(keys: pl.Expr, values: pl.Expr) -> pl.Expr:
+    """Aggregation producing a JSON object from grouped key / encoded value columns."""
+    entries = pl.concat_str([json_scalar(keys.cast(pl.String)), pl.lit(":"), values])
+    return pl.concat_str([pl.lit("{"), entries.str.join(","), pl.lit("}")])
+
+
+def write_keyed_object(
+    f: BinaryIO,
+    chunks: Iterable[pl.DataFrame | None],
+    *,
+    entry_prefix: bytes = b"",
+    key_sep: bytes = b":",
+    redump_option: int | None = None,
+) -> int:
+    """Write the members of a JSON object from ordered ``key`` / ``value`` chunks.
+
+    The caller writes the enclosing braces. Members are separated by ``,``
+    and each is written as ``entry_prefix + "key" + key_sep + value``.
+
+    Args:
+        f: Open binary file positioned inside the object
+        chunks: Frames with ``key`` and ``value`` (JSON text) columns, in key order
+        entry_prefix: Bytes written before every member
+        key_sep: Bytes between a member's key and its value
+        redump_option: orjson option to re-serialize every value with
+            (e.g. indented output); None writes the encoded text as is
+
+    Returns:
+        Number of members written
+    """
+    count = 0
+    for chunk in chunks:
+        if chunk is None or chunk.is_empty():
+            continue
+        if count:
+            f.write(b",")
+        if redump_option is None:
+            member = pl.concat_str(
+                [
+                    pl.lit(entry_prefix.decode()),
+                    json_scalar(pl.col(KEY_COL)),
+                    pl.lit(key_sep.decode()),
+                    pl.col(VALUE_COL),
+                ]
+            )
+            f.write(chunk.select(member.str.join(",")).item().encode())
+        else:
+            first = True
+            for key, value in chunk.select(KEY_COL, VALUE_COL).iter_rows():
+                if not first:
+                    f.write(b",")
+                first = False
+                f.write(entry_prefix + orjson.dumps(key) + key_sep)
+                f.write(orjson.dumps(orjson.loads(value), option=redump_option))
+        count += chunk.height
+    return count
@@ -4,18 +4,25 @@ Price output writers: JSON streaming, SQL, CSV.
 
 from __future__ import annotations
 
-import contextlib
 import datetime
-import gc
 import logging
-import sqlite3
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any, BinaryIO
 
 import orjson
 import polars as pl
 
+from mtgjson5.build.keyed_json import (
+    KEY_COL,
+    UUID_PREFIXES,
+    VALUE_COL,
+    default_workers,
+    json_entries,
+    json_scalar,
+    write_keyed_object,
+)
 from mtgjson5.mtgjson_config import MtgjsonConfig
+from mtgjson5.utils import map_ordered
 
 LOGGER = logging.getLogger(__name__)
 
@@ -54,16 +61,17 @@ def stream_write_all_prices_json(
     path: Path,
     today_date: str,
     source_path: Path | None = None,
+    workers: int | None = None,
 ) -> None:
     """
     Stream-write AllPrices.json using Prefix Partitioning.
 
     When *source_path* points to a consolidated parquet file, each prefix
     creates an independent ``scan_parquet`` so no shared LazyFrame state
-    accumulates across iterations.
+    accumulates across iterations. Prefixes are collected and encoded on
+    ``workers`` threads and written in prefix order.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    prefixes = "0123456789abcdef"
 
     cat_cols = [
         pl.col("source").cast(pl.Categorical),
@@ -73,6 +81,25 @@ def stream_write_all_prices_json(
         pl.col("currency").cast(pl.Categorical),
     ]
 
+    def encode(prefix: str) -> pl.DataFrame | None:
+        # Independent scan per prefix to avoid shared LazyFrame caching
+        if source_path is not None:
+            chunk_lf = (
+                pl.scan_parquet(source_path).filter(pl.col("uuid").str.starts_with(prefix)).with_columns(cat_cols)
+            )
+        else:
+            chunk_lf = lf.filter(pl.col("uuid").str.starts_with(prefix)).with_columns(cat_cols)
+
+        try:
+            df_chunk = chunk_lf.collect()
+        except Exception as e:
+            LOGGER.error(f"Failed to collect chunk {prefix}: {e}")
+            return None
+
+        if df_chunk.height == 0:
+            return None
+        return _price_chunk_json(df_chunk)
+
     with open(path, "wb") as f:
         f.write(b'{"meta":')
         meta = {
@@ -82,118 +109,92 @@ def stream_write_all_prices_json(
         f.write(orjson.dumps(meta))
         f.write(b',"data":{')
 
-        total_processed = 0
-        first_chunk_written = False
-
-        for prefix in prefixes:
-            # Independent scan per prefix to avoid shared LazyFrame caching
-            if source_path is not None:
-                chunk_lf = (
-                    pl.scan_parquet(source_path).filter(pl.col("uuid").str.starts_with(prefix)).with_columns(cat_cols)
-                )
-            else:
-                chunk_lf = lf.filter(pl.col("uuid").str.starts_with(prefix)).with_columns(cat_cols)
-
-            try:
-                df_chunk = chunk_lf.collect()
-            except Exception as e:
-                LOGGER.error(f"Failed to collect chunk {prefix}: {e}")
-                continue
-
-            if df_chunk.height == 0:
-                del df_chunk, chunk_lf
-                gc.collect()
-                continue
-
-            # We sort here because we need grouped UUIDs for the iterator
-            df_chunk = df_chunk.sort(["uuid", "source", "provider", "price_type", "finish", "date"])
-
-            # Handle comma between chunks
-            if first_chunk_written:
-                f.write(b",")
-
-            items_written = _process_chunk_to_json(f, df_chunk)
-
-            if items_written > 0:
-                first_chunk_written = True
-                total_processed += items_written
-
-            # Release memory before next iteration
-            del df_chunk, chunk_lf
-            gc.collect()
+        def logged(chunks: Iterable[pl.DataFrame | None]) -> Iterator[pl.DataFrame | None]:
+            total = 0
+            for prefix, chunk in zip(UUID_PREFIXES, chunks, strict=True):
+                total += chunk.height if chunk is not None else 0
+                LOGGER.info(f"  Processed prefix '{prefix}' (Total: {total:,})")
+                yield chunk
 
-            LOGGER.info(f"  Processed prefix '{prefix}' (Total: {total_processed:,})")
+        total_processed = write_keyed_object(
+            f, logged(map_ordered(encode, UUID_PREFIXES, workers or default_workers()))
+        )
 
         f.write(b"}}")
 
     LOGGER.info(f"Finished streaming AllPrices.json. Total UUIDs: {total_processed:,}")
 
 
-def _process_chunk_to_json(f: BinaryIO, df: pl.DataFrame) -> int:
+def _price_chunk_json(df: pl.DataFrame) -> pl.DataFrame:
     """
-    Aggregates a materialized DataFrame and writes to the open file handle.
-    Returns number of UUIDs written.
+    Encode a materialized price chunk as ``key`` (uuid) / ``value`` (JSON) rows.
+
+    Each value is ``{source: {provider: {"buylist": {finish: {date: price}},
+    "retail": {...}, "currency": ...}}}``, built bottom-up with group_by
+    aggregations. Dates ascend within a finish (the last price wins on
+    duplicate dates); finishes, providers and sources are sorted.
     """
-    aggregated = (
-        df.group_by(["uuid", "source", "provider", "currency", "price_type", "finish"])
-        .agg([pl.col("date"), pl.col("price")])
-        .sort("uuid")
+    provider_keys = ["uuid", "source", "provider"]
+    type_keys = [*provider_keys, "price_type"]
+    finish_keys = [*type_keys, "finish"]
+
+    rows = (
+        df.with_columns(
+            pl.col("source", "provider", "price_type", "finish", "currency").cast(pl.String),
+            pl.col("date").cast(pl.String),
+            pl.col("price").cast(pl.Float64),
+        )
+        .sort([*finish_keys, "date"], maintain_order=True)
+        .unique(subset=[*finish_keys, "date"], keep="last", maintain_order=True)
+    )
+    currencies = rows.group_by(provider_keys).agg(pl.col("currency").first())
+
+    price_json = pl.when(pl.col("price").is_not_null()).then(json_scalar(pl.col("price"))).otherwise(pl.lit("null"))
+    finishes = (
+        rows.filter(pl.col("price_type").is_in(["buylist", "retail"]))
+        .group_by(finish_keys, maintain_order=True)
+        .agg(json_entries(pl.col("date"), price_json).alias("value"))
+        .sort(finish_keys)
+    )
+    types = finishes.group_by(type_keys, maintain_order=True).agg(
+        json_entries(pl.col("finish"), pl.col("value")).alias("value")
     )
 
-    current_uuid = None
-    uuid_data: dict[str, dict[str, dict[str, Any]]] = {}
-    written_count = 0
-    first_in_chunk = True
-
-    rows = aggregated.iter_rows(named=True)
-
-    for row in rows:
-        uuid = row["uuid"]
-
-        # Switch to new UUID
-        if uuid != current_uuid:
-            if current_uuid is not None:
-                # Flush previous UUID data
-                if not first_in_chunk:
-                    f.write(b",")
-
-                f.write(f'"{current_uuid}":'.encode())
-                f.write(orjson.dumps(uuid_data))
-                first_in_chunk = False
-                written_count += 1
-
-            current_uuid = uuid
-            uuid_data = {}
-
-        source = row["source"]
-        provider = row["provider"]
-        currency = row["currency"]
-        p_type = row["price_type"]
-        finish = row["finish"]
-
-        date_prices = dict(zip(row["date"], row["price"], strict=False))
-
-        if source not in uuid_data:
-            uuid_data[source] = {}
-        if provider not in uuid_data[source]:
-            uuid_data[source][provider] = {
-                "buylist": {},
-                "retail": {},
-                "currency": currency,
-            }
-
-        if p_type in uuid_data[source][provider]:
-            uuid_data[source][provider][p_type][finish] = date_prices
-
-    # Flush the final UUID of the chunk
-    if current_uuid is not None:
-        if not first_in_chunk:
-            f.write(b",")
-        f.write(f'"{current_uuid}":'.encode())
-        f.write(orjson.dumps(uuid_data))
-        written_count += 1
+    def price_type(name: str) -> pl.Expr:
+        return pl.col("value").filter(pl.col("price_type") == name).first()
 
-    return written_count
+    providers = (
+        currencies.join(
+            types.group_by(provider_keys).agg(
+                price_type("buylist").alias("buylist"), price_type("retail").alias("retail")
+            ),
+            on=provider_keys,
+            how="left",
+        )
+        .sort(provider_keys)
+        .select(
+            *provider_keys,
+            pl.concat_str(
+                [
+                    pl.lit('{"buylist":'),
+                    pl.col("buylist").fill_null("{}"),
+                    pl.lit(',"retail":'),
+                    pl.col("retail").fill_null("{}"),
+                    pl.lit(',"currency":'),
+                    json_scalar(pl.col("currency")).fill_null("null"),
+                    pl.lit("}"),
+                ]
+            ).alias("value"),
+        )
+    )
+    sources = providers.group_by(["uuid", "source"], maintain_order=True).agg(
+        json_entries(pl.col("provider"), pl.col("value")).alias("value")
+    )
+    return (
+        sources.group_by("uuid", maintain_order=True)
+        .agg(json_entries(pl.col("source"), pl.col("value")).alias(VALUE_COL))
+        .rename({"uuid": KEY_COL})
+    )
 
 
 def stream_write_today_prices_json(df: pl.DataFrame, path: Path, today_date: str) -> None:
@@ -222,46 +223,28 @@ def write_prices_sqlite(df: pl.DataFrame, path: Path) -> None:
     Creates a ``prices`` table and a ``meta`` table with indexes
     on uuid, date, and provider.
     """
+    from mtgjson5.build.formats.sqlite import bulk_load, create_indexes, insert_rows
     from mtgjson5.models.containers import MtgjsonMeta
 
     prepared = _prepare_price_df_for_sql(df)
 
-    if path.exists():
-        path.unlink()
-
-    conn = sqlite3.connect(str(path))
-    cursor = conn.cursor()
-
-    cols = ", ".join(_PRICE_SQL_COLUMNS)
-    cursor.execute(f'CREATE TABLE "prices" ({cols})')
+    with bulk_load(path) as cursor:
+        cols = ", ".join(_PRICE_SQL_COLUMNS)
+        cursor.execute(f'CREATE TABLE "prices" ({cols})')
+        insert_rows(cursor, "prices", prepared)
 
-    placeholders = ", ".join(["?" for _ in prepared.columns])
-    col_names = ", ".join([f'"{c}"' for c in prepared.columns])
-
-    batch_size = 10_000
-    rows = prepared.rows()
-    for i in range(0, len(rows), batch_size):
-        cursor.executemany(
-            f'INSERT INTO "prices" ({col_names}) VALUES ({placeholders})',
-            rows[i : i + batch_size],
-        )
+        meta = MtgjsonMeta()
+        cursor.execute('CREATE TABLE "meta" ("date" TEXT, "version" TEXT)')
+        cursor.execute('INSERT INTO "meta" VALUES (?, ?)', (meta.date, meta.version))
 
-    for idx_name, col in _PRICE_INDEXES:
-        with contextlib.suppress(Exception):
-            cursor.execute(f'CREATE INDEX "idx_prices_{idx_name}" ON "prices" ("{col}")')
+        create_indexes(cursor, ["prices"], {"prices": list(_PRICE_INDEXES)})
 
-    meta = MtgjsonMeta()
-    cursor.execute('CREATE TABLE "meta" ("date" TEXT, "version" TEXT)')
-    cursor.execute('INSERT INTO "meta" VALUES (?, ?)', (meta.date, meta.version))
-
-    conn.commit()
-    conn.close()
     LOGGER.info(f"Wrote {path.name} ({len(prepared):,} rows)")
 
 
 def write_prices_sql(df: pl.DataFrame, path: Path) -> None:
-    """Write price data as a MySQL text dump with INSERT statements."""
-    from mtgjson5.build.serializers import escape_mysql
+    """Write price data as a MySQL text dump with multi-row INSERT statements."""
+    from mtgjson5.build.serializers import escape_mysql, write_mysql_inserts
     from mtgjson5.models.containers import MtgjsonMeta
 
     prepared = _prepare_price_df_for_sql(df)
@@ -276,10 +259,7 @@ def write_prices_sql(df: pl.DataFrame, path: Path) -> None:
         f.write("DROP TABLE IF EXISTS `prices`;\n")
         f.write(f"CREATE TABLE `prices` (\n    {cols}\n) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n\n")
 
-        col_names = ", ".join([f"`{c}`" for c in prepared.columns])
-        for row in prepared.rows():
-            values = ", ".join(escape_mysql(v) for v in row)
-            f.write(f"INSERT INTO `prices` ({col_names}) VALUES ({values});\n")
+        write_mysql_inserts(f, "prices", prepared)
 
         for idx_name, col in _PRICE_INDEXES:
             f.write(f"CREATE INDEX `idx_prices_{idx_name}` ON `prices` (`{col}`);\n")
@@ -304,7 +284,7 @@ def write_prices_sql(df: pl.DataFrame, path: Path) -> None:
 
 def write_prices_psql(df: pl.DataFrame, path: Path) -> None:
     """Write price data as a PostgreSQL dump with COPY format."""
-    from mtgjson5.build.serializers import escape_postgres
+    from mtgjson5.build.serializers import write_postgres_copy
 
     prepared = _prepare_price_df_for_sql(df)
 
@@ -315,14 +295,7 @@ def write_prices_psql(df: pl.DataFrame, path: Path) -> None:
         cols = ",\n    ".join(_PRICE_SQL_COLUMNS)
         f.write(f'CREATE TABLE IF NOT EXISTS "prices" (\n    {cols}\n);\n\n')
 
-        col_names = ", ".join([f'"{c}"' for c in prepared.columns])
-        f.write(f'COPY "prices" ({col_names}) FROM stdin;\n')
-
-        for row in prepared.rows():
-            escaped = [escape_postgres(v) for v in row]
-            f.write("\t".join(escaped) + "\n")
-
-        f.write("\\.\n\n")
+        write_postgres_copy(f, "prices", prepared)
 
         for idx_name, col in _PRICE_INDEXES:
             f.write(f'CREATE INDEX IF NOT EXISTS "idx_prices_{idx_name}" ON "prices" ("{col}");\n')
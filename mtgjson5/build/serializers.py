@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import json
 from collections.abc import Iterator
-from typing import Any
+from typing import IO, Any
 
 import orjson
 import polars as pl
@@ -169,6 +169,91 @@ def escape_mysql(value: Any) -> str:
     return "'" + s + "'"
 
 
+# Rows rendered per Polars pass when writing SQL text dumps
+SQL_DUMP_CHUNK_ROWS = 20_000
+
+# Rows per multi-row MySQL INSERT statement
+MYSQL_INSERT_ROWS = 500
+
+_POSTGRES_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+_MYSQL_ESCAPES = (
+    ("\\", "\\\\"),
+    ("'", "\\'"),
+    ('"', '\\"'),
+    ("\n", "\\n"),
+    ("\r", "\\r"),
+    ("\t", "\\t"),
+    ("\0", "\\0"),
+)
+
+
+def _sql_text(name: str, dtype: pl.DataType, true: str, false: str, escapes: tuple[tuple[str, str], ...]) -> pl.Expr:
+    """Column rendered as SQL text: booleans as literals, numbers as is, others escaped."""
+    col = pl.col(name)
+    if dtype == pl.Boolean:
+        return pl.when(col).then(pl.lit(true)).when(col.not_()).then(pl.lit(false))
+    if dtype.is_numeric():
+        return col.cast(pl.String)
+    text = col.cast(pl.String)
+    for old, new in escapes:
+        text = text.str.replace_all(old, new, literal=True)
+    return text
+
+
+def postgres_copy_expr(name: str, dtype: pl.DataType) -> pl.Expr:
+    """Column as PostgreSQL COPY text, matching :func:`escape_postgres`."""
+    return _sql_text(name, dtype, "t", "f", _POSTGRES_ESCAPES).fill_null("\\N").alias(name)
+
+
+def mysql_literal_expr(name: str, dtype: pl.DataType) -> pl.Expr:
+    """Column as MySQL literals, matching :func:`escape_mysql`."""
+    text = _sql_text(name, dtype, "TRUE", "FALSE", _MYSQL_ESCAPES)
+    if dtype != pl.Boolean and not dtype.is_numeric():
+        text = pl.concat_str([pl.lit("'"), text, pl.lit("'")])
+    return text.fill_null("NULL").alias(name)
+
+
+def write_postgres_copy(f: IO[str], table_name: str, df: pl.DataFrame) -> int:
+    """Write a ``COPY ... FROM stdin`` block for an already serialized frame.
+
+    Rows are escaped column-wise by Polars and written a chunk at a time.
+
+    Returns:
+        Number of rows written
+    """
+    col_names = ", ".join([f'"{c}"' for c in df.columns])
+    f.write(f'COPY "{table_name}" ({col_names}) FROM stdin;\n')
+
+    line = pl.concat_str([postgres_copy_expr(c, t) for c, t in df.schema.items()], separator="\t")
+    for chunk in df.iter_slices(SQL_DUMP_CHUNK_ROWS):
+        f.write(chunk.select(line.str.join("\n")).item())
+        f.write("\n")
+
+    f.write("\\.\n\n")
+    return len(df)
+
+
+def write_mysql_inserts(f: IO[str], table_name: str, df: pl.DataFrame, rows_per_insert: int = MYSQL_INSERT_ROWS) -> int:
+    """Write multi-row ``INSERT`` statements for an already serialized frame.
+
+    Value tuples are built column-wise by Polars and grouped into
+    statements of ``rows_per_insert`` rows.
+
+    Returns:
+        Number of rows written
+    """
+    col_names = ", ".join([f"`{c}`" for c in df.columns])
+    prefix = f"INSERT INTO `{table_name}` ({col_names}) VALUES\n"
+
+    values = pl.concat_str([mysql_literal_expr(c, t) for c, t in df.schema.items()], separator=", ")
+    row = pl.concat_str([pl.lit("("), values, pl.lit(")")])
+    for chunk in df.iter_slices(SQL_DUMP_CHUNK_ROWS):
+        rows = chunk.select(row).to_series()
+        for start in range(0, len(rows), rows_per_insert):
+            f.write(prefix + rows.slice(start, rows_per_insert).str.join(",\n").item() + ";\n")
+    return len(df)
+
+
 def batched(iterable: Any, n: int) -> Iterator[list[Any]]:
     """Yield batches of n items."""
     batch: list[Any] = []
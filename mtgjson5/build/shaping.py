@@ -0,0 +1,236 @@
+"""Vectorized output shaping for set card and token printings.
+
+``SetAssembler`` used to turn every parquet row into a ``CardSet`` /
+``CardToken`` model and straight back into a dict. The models are the
+schema of record, so the rules that round-trip applied are derived from
+them here and evaluated as Polars expressions over the whole set frame:
+
+- only model fields are kept (nested TypedDict structs are projected to
+  their declared keys, with ``TYPEDDICT_FIELD_ALIASES`` renames applied)
+- ``False`` / ``""`` scalars outside ``ALLOW_IF_FALSEY`` become null
+- empty ``OMIT_EMPTY_LIST_FIELDS`` lists become null
+- ``SORTED_LIST_FIELDS`` are sorted, rulings by (date, text), foreign
+  data by language (missing keys sort first, like the model's ``""``
+  default), and colors in WUBRG order for split-style layouts
+- integer columns feeding float fields are cast to float
+
+What remains per row is dropping nulls and empty nested values, which is
+a plain dict walk, plus the collector-number sort.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, get_args, get_origin
+
+import polars as pl
+from pydantic import BaseModel
+
+from mtgjson5.consts import (
+    ALLOW_IF_FALSEY,
+    EXCLUDE_FROM_OUTPUT,
+    OMIT_EMPTY_LIST_FIELDS,
+    SORTED_LIST_FIELDS,
+    TYPEDDICT_FIELD_ALIASES,
+)
+from mtgjson5.models._typing import TypedDictUtils, is_union_type
+from mtgjson5.models.cards import _WUBRG_COLOR_LAYOUTS, _WUBRG_ORDER, CardPrintingBase
+
+REQUIRED_DICT_FIELDS = ("legalities", "purchaseUrls")
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Return the non-None member of an Optional annotation."""
+    if is_union_type(annotation):
+        non_none = [a for a in get_args(annotation) if a is not type(None)]
+        if non_none:
+            return non_none[0]
+    return annotation
+
+
+def _list_inner(annotation: Any) -> Any:
+    """Return the element type of a ``list[...]`` annotation, else None."""
+    if get_origin(annotation) is list and get_args(annotation):
+        return get_args(annotation)[0]
+    return None
+
+
+def _project_struct(expr: pl.Expr, dtype: Any, td: type, aliases: bool = True) -> pl.Expr:
+    """Project a struct onto the keys of a TypedDict, recursing into nested TypedDicts.
+
+    Renames from ``TYPEDDICT_FIELD_ALIASES`` only apply at the first level,
+    matching ``TypedDictUtils.apply_aliases``.
+    """
+    if not isinstance(dtype, pl.Struct):
+        return expr
+    td_fields = TypedDictUtils.get_fields(td)
+    fields: list[pl.Expr] = []
+    seen: set[str] = set()
+    for field in dtype.fields:
+        target = TYPEDDICT_FIELD_ALIASES.get((td.__name__, field.name), field.name) if aliases else field.name
+        if target not in td_fields or target in seen:
+            continue
+        seen.add(target)
+        annotation = _unwrap_optional(td_fields[target])
+        inner = _list_inner(annotation)
+        sub = expr.struct.field(field.name)
+        if TypedDictUtils.is_typeddict(annotation):
+            sub = _project_struct(sub, field.dtype, annotation, aliases=False)
+        elif (
+            inner is not None
+            and TypedDictUtils.is_typeddict(inner)
+            and isinstance(field.dtype, pl.List)
+            and isinstance(field.dtype.inner, pl.Struct)
+        ):
+            sub = sub.list.eval(_project_struct(pl.element(), field.dtype.inner, inner, aliases=False))
+        fields.append(sub.alias(target))
+    if not fields:
+        return pl.lit(None)
+    return pl.struct(fields)
+
+
+def _shape_column(expr: pl.Expr, name: str, annotation: Any, dtype: Any) -> pl.Expr:
+    """Build the output expression for one top-level model field."""
+    inner = _list_inner(annotation)
+
+    if TypedDictUtils.is_typeddict(annotation):
+        return _project_struct(expr, dtype, annotation)
+
+    if isinstance(dtype, pl.List):
+        if inner is not None and TypedDictUtils.is_typeddict(inner) and isinstance(dtype.inner, pl.Struct):
+            expr = expr.list.eval(_project_struct(pl.element(), dtype.inner, inner))
+            if name == "rulings":
+                expr = expr.list.eval(
+                    pl.element().sort_by(
+                        pl.struct(pl.element().struct.field("date"), pl.element().struct.field("text")),
+                        maintain_order=True,
+                    )
+                )
+            elif name == "foreignData":
+                expr = expr.list.eval(pl.element().sort_by(pl.element().struct.field("language"), maintain_order=True))
+        elif name in SORTED_LIST_FIELDS:
+            expr = expr.list.sort()
+        if name in OMIT_EMPTY_LIST_FIELDS:
+            expr = pl.when(expr.list.len() > 0).then(expr)
+        return expr
+
+    if name in ALLOW_IF_FALSEY:
+        pass
+    elif dtype == pl.Boolean:
+        expr = pl.when(expr).then(expr)
+    elif dtype == pl.String:
+        expr = pl.when(expr != "").then(expr)
+
+    if annotation is float and dtype.is_integer():
+        expr = expr.cast(pl.Float64)
+    return expr
+
+
+def shape_printings(df: pl.DataFrame, model: type[BaseModel]) -> pl.DataFrame:
+    """Apply a printing model's output rules to a set frame, column-wise."""
+    exprs: list[pl.Expr] = []
+    for field_name, info in model.model_fields.items():
+        name = info.alias or field_name
+        if name in EXCLUDE_FROM_OUTPUT or info.exclude:
+            continue
+        annotation = _unwrap_optional(info.annotation)
+        if name in df.schema:
+            exprs.append(_shape_column(pl.col(name), name, annotation, df.schema[name]).alias(name))
+            continue
+        # Missing columns take the model default, as validation would
+        default = None if info.is_required() else info.get_default(call_default_factory=True)
+        if isinstance(default, list):
+            dtype = pl.List(pl.String)
+            exprs.append(_shape_column(pl.lit(default, dtype=dtype), name, annotation, dtype).alias(name))
+        elif isinstance(default, str | int | float):
+            exprs.append(pl.lit(default).alias(name))
+
+    shaped = df.select(exprs)
+    if "colors" in shaped.schema and "layout" in shaped.schema:
+        shaped = shaped.with_columns(
+            pl.when(pl.col("layout").is_in(list(_WUBRG_COLOR_LAYOUTS)))
+            .then(
+                pl.col("colors").list.eval(
+                    pl.element().sort_by(
+                        pl.element().replace_strict(_WUBRG_ORDER, default=99, return_dtype=pl.Int8),
+                        maintain_order=True,
+                    )
+                )
+            )
+            .otherwise(pl.col("colors"))
+            .alias("colors")
+        )
+    return shaped
+
+
+def _clean(value: Any) -> Any:
+    """Drop None values and empty nested dicts/lists from a struct value."""
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if item is None:
+                continue
+            item = _clean(item)
+            if isinstance(item, dict | list) and not item:
+                continue
+            result[key] = item
+        return result
+    if isinstance(value, list):
+        items = [_clean(item) for item in value if item is not None]
+        return [item for item in items if not (isinstance(item, dict | list) and not item)]
+    return value
+
+
+def _finalize_row(row: dict[str, Any], keep_null: frozenset[str], required: frozenset[str]) -> dict[str, Any]:
+    """Drop nulls and empty nested values from a shaped row.
+
+    ``keep_null`` fields are emitted as null rather than dropped;
+    ``required`` dict fields are emitted as ``{}`` when null or empty.
+    """
+    result: dict[str, Any] = {}
+    for key, value in row.items():
+        if value is None:
+            if key in required:
+                result[key] = {}
+            elif key in keep_null:
+                result[key] = None
+            continue
+        if isinstance(value, dict):
+            cleaned = _clean(value)
+            if cleaned or key in required or key in keep_null:
+                result[key] = cleaned
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            result[key] = [_clean(item) for item in value if item is not None]
+        else:
+            result[key] = value
+    for key in keep_null:
+        result.setdefault(key, None)
+    for key in required:
+        result.setdefault(key, {})
+    return result
+
+
+def _printing_cmp(a: dict[str, Any], b: dict[str, Any]) -> int:
+    """Three-way compare two printing dicts by collector number, then side."""
+    a_key = (a.get("number") or "", a.get("side"), a.get("name") or "")
+    b_key = (b.get("number") or "", b.get("side"), b.get("name") or "")
+    if CardPrintingBase.printing_lt(*a_key, *b_key):
+        return -1
+    if CardPrintingBase.printing_lt(*b_key, *a_key):
+        return 1
+    return 0
+
+
+def printings_to_dicts(df: pl.DataFrame, model: type[BaseModel]) -> list[dict[str, Any]]:
+    """Shape a set frame and return output dicts sorted by collector number.
+
+    Produces the same dicts as ``model.from_dataframe(df)`` followed by
+    ``sort()`` and ``to_polars_dict(exclude_none=True)`` (key order aside,
+    which ``orjson.OPT_SORT_KEYS`` normalizes).
+    """
+    aliases = {name: info.alias or name for name, info in model.model_fields.items()}
+    required = frozenset(alias for alias in aliases.values() if alias in REQUIRED_DICT_FIELDS)
+    keep_null = frozenset(alias for name, alias in aliases.items() if name in ALLOW_IF_FALSEY and alias not in required)
+    rows = [_finalize_row(row, keep_null, required) for row in shape_printings(df, model).iter_rows(named=True)]
+    rows.sort(key=functools.cmp_to_key(_printing_cmp))
+    return rows
@@ -9,17 +9,23 @@ This module is our main Data Layer and is responsible for:
 """
 
 import asyncio
+import hashlib
 import json
+import os
 import pathlib
 import re
+import threading
 import time
 from argparse import Namespace
+from collections.abc import Collection
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import cast, overload
 
 import polars as pl
 
 from mtgjson5 import constants
+from mtgjson5.data.requirements import required_steps
+from mtgjson5.data.scheduler import LoadStep, critical_path, run_step_graph
 from mtgjson5.polars_utils import DynamicCategoricals, discover_categoricals
 from mtgjson5.providers import CardHoarderPriceProvider as CardHoarderProvider
 from mtgjson5.providers import (
@@ -32,8 +38,12 @@ from mtgjson5.providers import (
     SealedDataProvider,
     TCGProvider,
 )
+from mtgjson5.providers.cardkingdom.client import CK_API_V1, CK_API_V2, CK_SEALED
 from mtgjson5.providers.gatherer import GathererProvider
+from mtgjson5.providers.github.provider import TOKEN_PRODUCTS_DIR_URL
+from mtgjson5.providers.http_cache import VALIDATOR_FILE, HttpRevalidationCache
 from mtgjson5.providers.mtgwiki import SecretLairProvider
+from mtgjson5.providers.salt import EDHREC_CARDRANKS_URL
 from mtgjson5.providers.scryfall.orientation import OrientationDetector
 from mtgjson5.providers.whats_in_standard import WhatsInStandardProvider
 from mtgjson5.providers.wizards import WizardsProvider
@@ -58,6 +68,71 @@ def _cache_fresh(path: pathlib.Path, max_age_hours: float = 290.0) -> bool:
     return age_hours < max_age_hours
 
 
+# Leaf scans that read files; in-memory frames ("DF [...]") cannot be fingerprinted
+_PLAN_SCAN_RE = re.compile(r"(?:Parquet|NDJson|CSV|IPC) SCAN \[([^\]]*)\]")
+_DUMP_MANIFEST = "_dump_manifest.json"
+_DUMP_WORKERS = 4
+# Fraction of available RAM that concurrent dumps may hold at once
+_DUMP_MEMORY_FRACTION = 0.25
+_DUMP_MIN_BUDGET_BYTES = 512 * 1024**2
+# Estimated footprint of a lazy frame over in-memory data / decompression factor for file scans
+_DUMP_DEFAULT_FRAME_BYTES = 256 * 1024**2
+_DUMP_PARQUET_EXPANSION = 4
+
+
+def _lazy_plan_fingerprint(lf: pl.LazyFrame) -> tuple[str, list[pathlib.Path]] | None:
+    """
+    Digest of a frame that only reads files: its plan plus the size/mtime of every source.
+
+    Returns None when the plan holds in-memory data or its sources are elided,
+    since the digest could not tell whether the content changed.
+    """
+    plan = lf.explain(optimized=False)
+    if re.search(r"\bDF \[", plan) or "PYTHON SCAN" in plan:
+        return None
+    sources: list[pathlib.Path] = []
+    for match in _PLAN_SCAN_RE.finditer(plan):
+        if "other sources" in match.group(1):
+            return None
+        sources.extend(pathlib.Path(src.strip()) for src in match.group(1).split(", "))
+    if not sources:
+        return None
+    digest = hashlib.sha256(plan.encode())
+    for path in sources:
+        if not path.exists():
+            return None
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest(), sources
+
+
+class _MemoryBudget:
+    """Blocking byte budget; a frame larger than the cap runs once nothing else holds budget."""
+
+    def __init__(self, cap_bytes: int) -> None:
+        self.cap_bytes = cap_bytes
+        self._used = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, n_bytes: int) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._used == 0 or self._used + n_bytes <= self.cap_bytes)
+            self._used += n_bytes
+
+    def release(self, n_bytes: int) -> None:
+        with self._cond:
+            self._used -= n_bytes
+            self._cond.notify_all()
+
+
+def _dump_memory_budget() -> int:
+    """Memory cap for concurrent frame dumps."""
+    import psutil
+
+    available = int(psutil.virtual_memory().available * _DUMP_MEMORY_FRACTION)
+    return max(available, _DUMP_MIN_BUDGET_BYTES)
+
+
 def _snake_to_camel(name: str) -> str:
     """Convert snake_case to camelCase."""
     if "_" not in name:
@@ -111,6 +186,8 @@ class GlobalCache:
 
         constants.CACHE_PATH.mkdir(parents=True, exist_ok=True)
         self.cache_path = constants.CACHE_PATH
+        # ETag/Last-Modified validators for conditional upstream revalidation
+        self.http_cache = HttpRevalidationCache(self.cache_path / VALIDATOR_FILE)
 
         # Core Bulk Data LFs
         self.cards_lf: pl.LazyFrame | None = None
@@ -209,6 +286,8 @@ class GlobalCache:
         self._output_types: set[str] = set()
         self._export_formats: set[str] | None = None
         self._tcg_skus_future: Future[pl.LazyFrame] | None = None
+        # Frames already scanning a persistent parquet store (no dump needed)
+        self._store_backed_frames: set[str] = set()
 
     def release(self, *attrs: str) -> None:
         """Release specific cached data to free memory.
@@ -308,6 +387,7 @@ class GlobalCache:
         self._cardmarket = None
         self._github = None
         self._scryfall_id_filter = None
+        self._store_backed_frames = set()
         self._loaded = False
 
     def load_all(
@@ -316,6 +396,7 @@ class GlobalCache:
         output_types: set[str] | None = None,
         export_formats: set[str] | None = None,
         skip_mcm: bool = False,
+        requirements: Collection[str] | None = None,
     ) -> "GlobalCache":
         """
         Load all data sources and pre-compute aggregations.
@@ -329,6 +410,9 @@ class GlobalCache:
                 When specified, can be used to skip loading data not needed
                 for the requested formats.
             skip_mcm: Skip CardMarket data fetching (speeds up builds).
+            requirements: Attributes the build reads (see
+                ``requirements.required_inputs``). Only the load steps
+                producing them run; None loads everything.
         """
         self._output_types = output_types or set()
         self._export_formats = export_formats
@@ -338,54 +422,34 @@ class GlobalCache:
 
         prof = get_profiler()
 
-        self._download_bulk_data()
-        prof.checkpoint("bulk_download")
-        self._load_bulk_data()
-        prof.checkpoint("bulk_load")
-        self._load_resources()
-        self._load_sets_metadata()
-        self._load_missing_set_cards()
-        prof.checkpoint("resources_and_metadata")
+        if skip_mcm:
+            LOGGER.info("Skipping MCM data (--skip-mcm flag)")
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {
-                executor.submit(self._load_orientations): "orientations",
-                executor.submit(self._load_card_kingdom): "card_kingdom",
-                executor.submit(self._load_edhrec_salt): "edhrec",
-                executor.submit(self._load_spellbook): "spellbook",
-                executor.submit(self._load_gatherer): "gatherer",
-                executor.submit(self._load_whats_in_standard): "standard",
-                executor.submit(self._load_github_data): "github",
-                executor.submit(self._load_secretlair_subsets): "secretlair",
-                executor.submit(self._load_scryfall_catalogs): "scryfall_catalogs",
-            }
-            if not skip_mcm:
-                futures[executor.submit(self._load_mcm_lookup)] = "mcm"
-            else:
-                LOGGER.info("Skipping MCM data (--skip-mcm flag)")
+        steps = self._load_steps(skip_mcm)
+        if requirements is not None:
+            selected = required_steps(steps, requirements)
+            kept = {step.name for step in selected}
+            skipped = [step.name for step in steps if step.name not in kept]
+            if skipped:
+                LOGGER.info(f"Skipping load steps not needed by this build: {', '.join(skipped)}")
+            steps = selected
 
-            self._start_tcg_skus_fetch(executor)
-
-            for future in as_completed(futures):
-                name = futures[future]
-                try:
-                    future.result()
-                    LOGGER.info(f"Loaded {name}")
-                except Exception as e:
-                    LOGGER.error(f"Failed to load {name}: {e}")
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            if requirements is None or "tcg_skus_lf" in requirements:
+                self._start_tcg_skus_fetch(executor)
+
+            timings = run_step_graph(steps, executor)
+            prof.add_step_timings(
+                "global_cache",
+                {name: timing.to_dict() for name, timing in timings.items()},
+                critical_path(timings),
+            )
 
-            if self.cards_lf is None:
+            if self.cards_lf is None and (requirements is None or "cards_lf" in requirements):
                 raise RuntimeError("Bulk data not loaded")
 
-            self.unlimited_cards = self.scryfall.cards_without_limits
-
-            # Build scryfall_id filter for deck-only builds
-            if self._output_types == {"decks"} and self.decks_lf is not None:
-                self._build_deck_scryfall_filter()
-
             prof.checkpoint("providers_loaded")
 
-            self._load_cardsphere()
             self._normalize_all_columns()
             self._apply_categoricals()
             self._dump_and_reload_as_lazy()
@@ -394,6 +458,43 @@ class GlobalCache:
             self._loaded = True
             return self
 
+    def _load_steps(self, skip_mcm: bool = False) -> list[LoadStep]:
+        """
+        Declare every loading step of load_all() with the steps it reads from.
+
+        Bulk data, resources and set metadata are critical: a failure aborts
+        the load. Provider steps only log their failures.
+        """
+        steps = [
+            LoadStep("bulk_download", self._download_bulk_data, critical=True),
+            LoadStep("bulk_load", self._load_bulk_data, ("bulk_download",), critical=True),
+            LoadStep("resources", self._load_resources, critical=True),
+            LoadStep("sets_metadata", self._load_sets_metadata, critical=True),
+            LoadStep("missing_set_cards", self._load_missing_set_cards, ("bulk_load", "sets_metadata"), critical=True),
+            LoadStep("orientations", self._load_orientations, ("sets_metadata",)),
+            LoadStep("card_kingdom", self._load_card_kingdom),
+            LoadStep("edhrec", self._load_edhrec_salt),
+            LoadStep("spellbook", self._load_spellbook),
+            LoadStep("gatherer", self._load_gatherer),
+            LoadStep("standard", self._load_whats_in_standard),
+            # Inline sealed compilation reads the final cards_lf and uuid_cache_lf
+            LoadStep("github", self._load_github_data, ("missing_set_cards", "resources")),
+            LoadStep("secretlair", self._load_secretlair_subsets),
+            LoadStep("scryfall_catalogs", self._load_scryfall_catalogs),
+            LoadStep("cardsphere", self._load_cardsphere),
+            LoadStep("unlimited_cards", self._load_unlimited_cards),
+        ]
+        if not skip_mcm:
+            steps.append(LoadStep("mcm", self._load_mcm_lookup))
+        # Build scryfall_id filter for deck-only builds
+        if self._output_types == {"decks"}:
+            steps.append(LoadStep("deck_scryfall_filter", self._build_deck_scryfall_filter, ("github", "resources")))
+        return steps
+
+    def _load_unlimited_cards(self) -> None:
+        """Load the names of cards exempt from the four-copy deck limit."""
+        self.unlimited_cards = self.scryfall.cards_without_limits
+
     def _start_tcg_skus_fetch(self, executor: ThreadPoolExecutor) -> None:
         """Start TCGPlayer SKU fetch in background.
 
@@ -437,6 +538,11 @@ class GlobalCache:
         """
         Dump all DataFrames to parquet and reload as LazyFrames to free memory
         and optimize query planning.
+
+        Frames are sunk concurrently under a memory budget. A lazy frame that
+        only reads files is skipped when its plan and source files match the
+        previous dump recorded in ``lazy/_dump_manifest.json``; it is replaced
+        by a scan of the existing output instead.
         """
         import gc
 
@@ -475,31 +581,104 @@ class GlobalCache:
             "cardsphere_lf": "cardsphere_cards.parquet",
         }
 
+        manifest_path = lazy_cache_path / _DUMP_MANIFEST
+        manifest = self._load_dump_manifest(manifest_path)
+
+        jobs: list[tuple[str, str, pl.LazyFrame | pl.DataFrame, str | None, int]] = []
+        reused: list[str] = []
         for attr, filename in dataframes_to_dump.items():
             df_or_lf = getattr(self, attr, None)
             if df_or_lf is None:
                 continue
+            if attr in self._store_backed_frames and isinstance(df_or_lf, pl.LazyFrame):
+                # Already a typed parquet scan; re-dumping would rewrite the whole store
+                continue
 
             parquet_path = lazy_cache_path / filename
+            if isinstance(df_or_lf, pl.DataFrame):
+                if len(df_or_lf) == 0:
+                    continue
+                jobs.append((attr, filename, df_or_lf, None, int(df_or_lf.estimated_size())))
+                continue
+            if not isinstance(df_or_lf, pl.LazyFrame):
+                continue
+
+            fingerprint = _lazy_plan_fingerprint(df_or_lf)
+            if fingerprint is not None:
+                digest, sources = fingerprint
+                if parquet_path in sources:
+                    # Already a view of its own dump file
+                    reused.append(attr)
+                    continue
+                if parquet_path.exists() and manifest.get(filename) == digest:
+                    setattr(self, attr, pl.scan_parquet(parquet_path))
+                    reused.append(attr)
+                    continue
+                estimate = sum(p.stat().st_size for p in sources) * _DUMP_PARQUET_EXPANSION
+                jobs.append((attr, filename, df_or_lf, digest, estimate))
+            else:
+                jobs.append((attr, filename, df_or_lf, None, _DUMP_DEFAULT_FRAME_BYTES))
 
+        budget = _MemoryBudget(_dump_memory_budget())
+
+        def dump(frame: pl.LazyFrame | pl.DataFrame, parquet_path: pathlib.Path, estimate: int) -> None:
+            # Write aside and swap so frames still scanning the old file are unaffected
+            tmp_path = parquet_path.with_suffix(".parquet.tmp")
+            budget.acquire(estimate)
             try:
-                if isinstance(df_or_lf, pl.LazyFrame):
-                    df_or_lf.sink_parquet(parquet_path)
-                    del df_or_lf
-                elif isinstance(df_or_lf, pl.DataFrame):
-                    if len(df_or_lf) == 0:
-                        continue
-                    df_or_lf.write_parquet(parquet_path)
+                if isinstance(frame, pl.LazyFrame):
+                    frame.sink_parquet(tmp_path)
                 else:
+                    frame.write_parquet(tmp_path)
+                os.replace(tmp_path, parquet_path)
+            finally:
+                budget.release(estimate)
+                tmp_path.unlink(missing_ok=True)
+
+        # Largest first so small frames fill in around them
+        jobs.sort(key=lambda job: job[4], reverse=True)
+        with ThreadPoolExecutor(max_workers=_DUMP_WORKERS) as executor:
+            futures = {
+                executor.submit(dump, frame, lazy_cache_path / filename, estimate): (attr, filename, job_digest)
+                for attr, filename, frame, job_digest, estimate in jobs
+            }
+            del jobs
+            for future in as_completed(futures):
+                attr, filename, dumped_digest = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    LOGGER.error(f"Failed to dump/reload {attr}: {e}")
+                    manifest.pop(filename, None)
                     continue
+                if dumped_digest is None:
+                    manifest.pop(filename, None)
+                else:
+                    manifest[filename] = dumped_digest
+                setattr(self, attr, pl.scan_parquet(lazy_cache_path / filename))
 
-                setattr(self, attr, None)
-                new_lf = pl.scan_parquet(parquet_path)
-                setattr(self, attr, new_lf)
-            except Exception as e:
-                LOGGER.error(f"Failed to dump/reload {attr}: {e}")
+        self._save_dump_manifest(manifest_path, manifest)
+        LOGGER.info(f"Dumped {len(futures)} frames to {lazy_cache_path} ({len(reused)} unchanged, reused)")
+        gc.collect()
 
-            gc.collect()
+    @staticmethod
+    def _load_dump_manifest(path: pathlib.Path) -> dict[str, str]:
+        """Load the filename -> plan digest map of the previous lazy dump."""
+        if not path.exists():
+            return {}
+        try:
+            with path.open(encoding="utf-8") as f:
+                return dict(json.load(f))
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_dump_manifest(path: pathlib.Path, manifest: dict[str, str]) -> None:
+        """Atomically write the lazy dump manifest."""
+        tmp = path.with_suffix(".json.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(dict(sorted(manifest.items())), f, indent=1)
+        os.replace(tmp, path)
 
     def _apply_categoricals(self) -> None:
         """Apply dynamic categoricals to relevant DataFrames."""
@@ -565,82 +744,54 @@ class GlobalCache:
         LOGGER.warning("uuid_cache not available, cannot build scryfall_id filter")
 
     def _download_bulk_data(self, force_refresh: bool = False) -> None:
-        """Download Scryfall bulk data if missing or stale."""
-        cards_path = self.cache_path / "all_cards.ndjson"
-        default_cards_path = self.cache_path / "default_cards.ndjson"
-        rulings_path = self.cache_path / "rulings.ndjson"
+        """Download Scryfall bulk data if missing, or revalidate the cached files upstream."""
+        bulk_types = ["all_cards", "default_cards", "rulings"]
+        paths = [self.cache_path / f"{bulk_type}.ndjson" for bulk_type in bulk_types]
+        have_all = all(p.exists() and p.stat().st_size > 0 for p in paths)
 
-        needs_download = force_refresh
-        if not cards_path.exists() or cards_path.stat().st_size == 0:
-            needs_download = True
-        if not default_cards_path.exists() or default_cards_path.stat().st_size == 0:
-            needs_download = True
-        if not rulings_path.exists() or rulings_path.stat().st_size == 0:
-            needs_download = True
-
-        # Check age (72h max)
-        if not needs_download and cards_path.exists():
-            age_hours = (time.time() - cards_path.stat().st_mtime) / 3600
-            if age_hours > 72:
-                LOGGER.info(f"Bulk data is {age_hours:.1f}h old, refreshing...")
-                needs_download = True
-
-        if needs_download:
-            LOGGER.info("Downloading bulk scryfall data...")
+        LOGGER.info("Checking bulk scryfall data..." if have_all else "Downloading bulk scryfall data...")
+        try:
             self.bulkdata.download_bulk_files_sync(
                 self.cache_path,
-                ["all_cards", "default_cards", "rulings"],
+                bulk_types,
                 force_refresh,
+                http_cache=self.http_cache,
             )
-        else:
-            LOGGER.info("Using cached bulk data")
+        except Exception as e:
+            if not have_all or force_refresh:
+                raise
+            LOGGER.warning(f"Could not revalidate bulk data ({e}), using cached files")
+
+    def _upstream_fresh(self, urls: list[str], *artifacts: pathlib.Path, max_age_hours: float = 290.0) -> bool:
+        """Whether cache files built from ``urls`` can be reused (every URL revalidated)."""
+        # Probe every URL (no short-circuit) so each one stages its new validators
+        results = [self.http_cache.is_fresh(url, artifacts, max_age_hours) for url in urls]
+        return all(results)
 
     def _load_bulk_data(self) -> None:
-        """Load bulk NDJSON files into LazyFrames."""
+        """Load bulk data into LazyFrames.
+
+        Cards come from the set-partitioned parquet store built at download
+        time (typed columns, partition pruning on ``set``); the NDJSON file is
+        only scanned directly if the store cannot be built.
+        """
         LOGGER.info("Loading LazyFrames...")
 
         cards_path = self.cache_path / "all_cards.ndjson"
         rulings_path = self.cache_path / "rulings.ndjson"
 
-        # Columns that may be numeric in some records but should be strings
-        string_cast_columns = [
-            "power",
-            "toughness",
-            "loyalty",
-            "defense",
-            "hand_modifier",
-            "life_modifier",
-        ]
-
-        # Scan without schema overrides first
-        self.cards_lf = pl.scan_ndjson(
-            cards_path,
-            infer_schema_length=100000,
-        )
-
-        schema = self.cards_lf.collect_schema()
-
-        # Build cast expressions
-        cast_exprs = []
-        for col_name in string_cast_columns:
-            if col_name in schema:
-                cast_exprs.append(pl.col(col_name).cast(pl.Utf8))
-
-        if cast_exprs:
-            self.cards_lf = self.cards_lf.with_columns(cast_exprs)
-
-        # Ensure optional columns exist
-        optional_columns = {
-            "defense": pl.Utf8,
-            "flavor_name": pl.Utf8,
-        }
-        missing_cols = []
-        for col_name, dtype in optional_columns.items():
-            if col_name not in schema:
-                missing_cols.append(pl.lit(None).cast(dtype).alias(col_name))
+        store_dir = None
+        try:
+            store_dir = self.bulkdata.ensure_bulk_parquet(self.cache_path, "all_cards")
+        except Exception as e:
+            LOGGER.warning(f"Failed to build all_cards parquet store, scanning NDJSON: {e}")
 
-        if missing_cols:
-            self.cards_lf = self.cards_lf.with_columns(missing_cols)
+        if store_dir is not None:
+            self.cards_lf = self.bulkdata.scan_bulk_parquet(store_dir)
+            self._store_backed_frames.add("cards_lf")
+        else:
+            self.cards_lf = self.bulkdata.pin_bulk_schema(pl.scan_ndjson(cards_path, infer_schema_length=100000))
+            self._store_backed_frames.discard("cards_lf")
 
         self.rulings_lf = pl.scan_ndjson(rulings_path, infer_schema_length=1000)
 
@@ -783,12 +934,13 @@ class GlobalCache:
     def _load_sets_metadata(self) -> None:
         """Load set metadata from Scryfall."""
         cache_path = self.cache_path / "sets.parquet"
+        sets_url = self.scryfall.ALL_SETS_URL
 
-        if _cache_fresh(cache_path):
+        if self._upstream_fresh([sets_url], cache_path):
             self.sets_lf = pl.scan_parquet(cache_path)
             return
 
-        sets_response = self.scryfall.download(self.scryfall.ALL_SETS_URL)
+        sets_response = self.scryfall.download(sets_url)
         if sets_response.get("object") == "error":
             return
 
@@ -818,6 +970,7 @@ class GlobalCache:
         )
 
         sets_df.write_parquet(cache_path)
+        self.http_cache.commit(sets_url)
         self.sets_lf = sets_df.lazy()
 
     def _load_missing_set_cards(self) -> None:
@@ -860,21 +1013,18 @@ class GlobalCache:
             new_cards_df = pl.DataFrame(all_new_cards)
             LOGGER.info(f"Adding {len(all_new_cards)} cards from {missing_sets.height} preview sets")
 
-            if isinstance(self.cards_lf, pl.LazyFrame):
-                cards_df = self.cards_lf.collect()
-            else:
-                cards_df = self.cards_lf
+            # Schema only - the bulk cards stay lazy (partition-pruned scans)
+            cards_schema = self.cards_lf.collect_schema()
 
-            existing_cols = set(cards_df.columns)
+            existing_cols = set(cards_schema.names())
             new_cols = set(new_cards_df.columns)
 
             for col in existing_cols - new_cols:
                 new_cards_df = new_cards_df.with_columns(pl.lit(None).alias(col))
 
-            new_cards_df = new_cards_df.select([c for c in cards_df.columns if c in new_cards_df.columns])
+            new_cards_df = new_cards_df.select([c for c in cards_schema.names() if c in new_cards_df.columns])
 
-            # Cast new_cards_df columns to match cards_df schema to avoid type errors
-            cards_schema = cards_df.schema
+            # Cast new_cards_df columns to match cards schema to avoid type errors
             cast_exprs = []
             for col in new_cards_df.columns:
                 if col in cards_schema:
@@ -888,14 +1038,15 @@ class GlobalCache:
             if cast_exprs:
                 new_cards_df = new_cards_df.select(cast_exprs)
 
-            self.cards_lf = pl.concat([cards_df, new_cards_df], how="diagonal").lazy()
+            self.cards_lf = pl.concat([self.cards_lf.lazy(), new_cards_df.lazy()], how="diagonal")
 
     def _load_card_kingdom(self) -> None:
         """Load Card Kingdom data with caching."""
         pivoted_cache = self.cache_path / "ck_pivoted.parquet"
         raw_cache = self.cache_path / "ck_raw.parquet"
+        ck_urls = [CK_API_V1, CK_API_V2, CK_SEALED]
 
-        if _cache_fresh(pivoted_cache) and _cache_fresh(raw_cache):
+        if self._upstream_fresh(ck_urls, pivoted_cache, raw_cache):
             self.card_kingdom_lf = pl.scan_parquet(pivoted_cache)
             self.card_kingdom_raw_lf = pl.scan_parquet(raw_cache)
             return
@@ -937,6 +1088,9 @@ class GlobalCache:
                 self.card_kingdom._raw_df.write_parquet(raw_cache)
                 self.card_kingdom_raw_lf = self.card_kingdom._raw_df.lazy()
 
+            if pivoted_cache.exists() and raw_cache.exists():
+                self.http_cache.commit(*ck_urls)
+
         except Exception as e:
             LOGGER.warning(f"Failed to fetch Card Kingdom data: {e}")
 
@@ -944,13 +1098,14 @@ class GlobalCache:
         """Load EDHREC saltiness data."""
         cache_path = self.cache_path / "edhrec_salt.parquet"
 
-        if _cache_fresh(cache_path):
+        if self._upstream_fresh([EDHREC_CARDRANKS_URL], cache_path):
             self.salt_lf = pl.scan_parquet(cache_path)
             return
 
         salt_df = self.edhrec.get_data_frame()
         if salt_df is not None and len(salt_df) > 0:
             salt_df.write_parquet(cache_path)
+            self.http_cache.commit(EDHREC_CARDRANKS_URL)
             self.salt_lf = salt_df.lazy()
 
     def _load_spellbook(self) -> None:
@@ -1019,16 +1174,15 @@ class GlobalCache:
         booster_cache = self.cache_path / "github_booster.parquet"
         token_products_cache = self.cache_path / "github_token_products.parquet"
 
-        all_cached = all(
-            _cache_fresh(p)
-            for p in [
-                card_to_products_cache,
-                sealed_products_cache,
-                sealed_contents_cache,
-                decks_cache,
-                booster_cache,
-                token_products_cache,
-            ]
+        github_urls = [*SealedDataProvider.URLS.values(), SealedDataProvider.TARBALL_URL, TOKEN_PRODUCTS_DIR_URL]
+        all_cached = self._upstream_fresh(
+            github_urls,
+            card_to_products_cache,
+            sealed_products_cache,
+            sealed_contents_cache,
+            decks_cache,
+            booster_cache,
+            token_products_cache,
         )
 
         if all_cached:
@@ -1154,6 +1308,10 @@ class GlobalCache:
             still_missing = [name for name in expected if getattr(self, name, None) is None]
             if still_missing:
                 LOGGER.error(f"GitHub data still missing after sync retry: {still_missing}")
+                return
+
+        if all(path.exists() for path in expected.values()):
+            self.http_cache.commit(*github_urls)
 
     def _load_orientations(self) -> None:
         """Load orientation data for Art Series cards from Scryfall."""
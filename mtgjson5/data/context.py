@@ -5,7 +5,9 @@ Pipeline context for MTGJSON ELT Pipeline.
 from __future__ import annotations
 
 import json
+import pickle
 from argparse import Namespace
+from collections.abc import Collection
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -18,6 +20,7 @@ if TYPE_CHECKING:
     from mtgjson5.polars_utils import DynamicCategoricals
 
 from mtgjson5.consts import LANGUAGE_MAP
+from mtgjson5.data.requirements import LOOKUP_INPUTS
 from mtgjson5.models import (
     CardAtomic,
     CardDeck,
@@ -28,6 +31,48 @@ from mtgjson5.utils import LOGGER, get_expanded_set_codes
 
 _DNS_NAMESPACE = "6ba7b810-9dad-11d1-80b4-00c04fd430c8"
 
+# Consolidated lookups persisted as parquet for spawned pipeline workers.
+_WORKER_LOOKUP_FILES: dict[str, str] = {
+    "identifiers_lf": "identifiers.parquet",
+    "tcg_alt_foil_lf": "tcg_alt_foil.parquet",
+    "oracle_data_lf": "oracle_data.parquet",
+    "set_number_lf": "set_number.parquet",
+    "name_lf": "name.parquet",
+    "signatures_lf": "signatures.parquet",
+    "watermark_overrides_lf": "watermark_overrides.parquet",
+    "face_flavor_names_df": "face_flavor_names.parquet",
+    "face_foreign_lf": "face_foreign.parquet",
+    "_mcm_lookup_enriched": "mcm_lookup_enriched.parquet",
+}
+
+# GlobalCache members read by the stage modules. Frames are parquet-backed
+# scans after _dump_and_reload_as_lazy(), so they pickle as cheap lazy plans.
+_WORKER_CACHE_FRAMES: tuple[str, ...] = (
+    "cards_lf",
+    "sets_lf",
+    "uuid_cache_lf",
+    "card_kingdom_raw_lf",
+    "mcm_lookup_lf",
+    "sld_subsets_lf",
+    "gatherer_lf",
+    "sealed_cards_lf",
+    "sealed_products_lf",
+    "sealed_contents_lf",
+    "decks_lf",
+    "boosters_lf",
+    "languages_lf",
+)
+_WORKER_CACHE_RESOURCES: tuple[str, ...] = (
+    "meld_triplets",
+    "meld_overrides",
+    "manual_overrides",
+    "scryfall_overrides",
+    "set_code_watermarks",
+    "standard_legal_sets",
+    "unlimited_cards",
+    "card_enrichment",
+)
+
 
 @dataclass
 class PipelineContext:
@@ -443,6 +488,79 @@ class PipelineContext:
         sets = get_expanded_set_codes(arg_sets)
         return {s.upper() for s in sets} if sets else None
 
+    def dump_for_workers(self, state_dir: Path) -> Path:
+        """
+        Persist everything a spawned pipeline worker needs to run a batch.
+
+        Consolidated lookups are written as parquet so workers scan them from
+        disk instead of receiving a pickled copy; raw cache frames and resource
+        dicts are pickled alongside the pipeline configuration.
+
+        Returns:
+            Path to the pickled worker state file.
+        """
+        state_dir.mkdir(parents=True, exist_ok=True)
+
+        lookups: dict[str, str] = {}
+        for attr, filename in _WORKER_LOOKUP_FILES.items():
+            frame = getattr(self, attr)
+            if frame is None:
+                continue
+            path = state_dir / filename
+            if isinstance(frame, pl.LazyFrame):
+                frame.sink_parquet(path)
+            else:
+                frame.write_parquet(path)
+            lookups[attr] = str(path)
+
+        state = {
+            "lookups": lookups,
+            "cache_frames": {name: getattr(self, name) for name in _WORKER_CACHE_FRAMES},
+            "cache_resources": {name: getattr(self, name) for name in _WORKER_CACHE_RESOURCES},
+            "args": self.args,
+            "scryfall_id_filter": self.scryfall_id_filter,
+            "categoricals": self.categoricals,
+            "resource_path": self.resource_path,
+            "mcm_set_map": self.mcm_set_map,
+        }
+
+        state_path = state_dir / "worker_state.pkl"
+        with state_path.open("wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        LOGGER.info(f"Pipeline worker state written to {state_dir} ({len(lookups)} lookups)")
+        return state_path
+
+    @classmethod
+    def from_worker_state(cls, state_path: Path) -> PipelineContext:
+        """
+        Rebuild a PipelineContext inside a spawned pipeline worker.
+
+        Raw frames and resources are restored onto the worker's own
+        GlobalCache singleton so property access behaves as in the parent.
+        """
+        from mtgjson5.data.cache import GLOBAL_CACHE
+
+        with state_path.open("rb") as f:
+            state = pickle.load(f)
+
+        for name, value in {**state["cache_frames"], **state["cache_resources"]}.items():
+            setattr(GLOBAL_CACHE, name, value)
+
+        ctx = cls(
+            _cache=GLOBAL_CACHE,
+            args=state["args"],
+            scryfall_id_filter=state["scryfall_id_filter"],
+            categoricals=state["categoricals"],
+            resource_path=state["resource_path"],
+            mcm_set_map=state["mcm_set_map"],
+        )
+        for attr, path in state["lookups"].items():
+            if attr.endswith("_df"):
+                setattr(ctx, attr, pl.read_parquet(path))
+            else:
+                setattr(ctx, attr, pl.scan_parquet(path))
+        return ctx
+
     def get_mcm_extras_set_id(self, set_name: str) -> int | None:
         """
         Get MKM 'Extras' set ID (e.g. 'Throne of Eldraine: Extras').
@@ -454,6 +572,16 @@ class PipelineContext:
         entry = self.mcm_set_map.get(extras_key)
         return int(entry["mcmId"]) if entry else None
 
+    def get_face_foreign_lookup(self) -> pl.LazyFrame | None:
+        """
+        Per-face foreign printed text, built on first use and kept for the build.
+
+        :return: face_foreign_lf, or None when no card data is available
+        """
+        if self.face_foreign_lf is None:
+            self._build_face_foreign_lookup()
+        return self.face_foreign_lf
+
     @classmethod
     def from_global_cache(cls, args: Namespace | None = None) -> PipelineContext:
         """
@@ -543,12 +671,17 @@ class PipelineContext:
             resource_path=resource_path,
         )
 
-    def consolidate_lookups(self) -> PipelineContext:
+    def consolidate_lookups(self, requirements: Collection[str] | None = None) -> PipelineContext:
         """
         Consolidate separate lookup tables into combined tables by join key.
 
         This is where PipelineContext does actual work - building derived
         lookups from the raw cached data.
+
+        Args:
+            requirements: Names the build reads (see
+                ``requirements.required_inputs``). Lookups not listed are
+                not built; None builds every lookup.
         """
         import gc
 
@@ -556,32 +689,52 @@ class PipelineContext:
 
         prof = get_profiler()
 
+        def wanted(lookup: str) -> bool:
+            return requirements is None or lookup in requirements
+
+        skipped = [lookup for lookup in LOOKUP_INPUTS if not wanted(lookup)]
+        if len(skipped) == len(LOOKUP_INPUTS):
+            LOGGER.info("No lookup tables needed by this build")
+            return self
+        if skipped:
+            LOGGER.info(f"Skipping lookups not needed by this build: {', '.join(skipped)}")
+
         LOGGER.info("Consolidating lookup tables...")
 
-        # Collect cards_lf once for the two sub-methods that need it,
+        # Collect cards_lf once for the sub-methods that need it,
         # instead of re-scanning from disk twice.
         cards_df: pl.DataFrame | None = None
         cards_raw = self.cards_lf
-        if cards_raw is not None:
+        if cards_raw is not None and any(map(wanted, ("oracle_data_lf", "set_number_lf", "face_foreign_lf"))):
             cards_df = cards_raw.collect() if isinstance(cards_raw, pl.LazyFrame) else cards_raw
 
-        self._build_identifiers_lookup()
-        prof.checkpoint("lookup_identifiers")
-        self._build_oracle_data_lookup(cards_df=cards_df)
-        prof.checkpoint("lookup_oracle")
-        self._build_set_number_lookup(cards_df=cards_df)
-        prof.checkpoint("lookup_set_number")
+        if wanted("identifiers_lf"):
+            self._build_identifiers_lookup()
+            prof.checkpoint("lookup_identifiers")
+        if wanted("oracle_data_lf"):
+            self._build_oracle_data_lookup(cards_df=cards_df)
+            prof.checkpoint("lookup_oracle")
+        if wanted("set_number_lf"):
+            self._build_set_number_lookup(cards_df=cards_df)
+            prof.checkpoint("lookup_set_number")
+        if wanted("face_foreign_lf"):
+            self._build_face_foreign_lookup(cards_df=cards_df)
 
         del cards_df
         gc.collect()
 
-        self._build_name_lookup()
-        self._build_signatures_lookup()
-        self._build_watermark_overrides_lookup()
-        self._load_face_flavor_names()
-        self._build_mcm_set_map()
-        self._build_mcm_lookup()
-        self._build_tcg_alt_foil_lookup()
+        remaining = (
+            ("name_lf", self._build_name_lookup),
+            ("signatures_lf", self._build_signatures_lookup),
+            ("watermark_overrides_lf", self._build_watermark_overrides_lookup),
+            ("face_flavor_names_df", self._load_face_flavor_names),
+            ("mcm_set_map", self._build_mcm_set_map),
+            ("_mcm_lookup_enriched", self._build_mcm_lookup),
+            ("tcg_alt_foil_lf", self._build_tcg_alt_foil_lookup),
+        )
+        for lookup, build in remaining:
+            if wanted(lookup):
+                build()
         prof.checkpoint("lookup_remaining")
 
         return self
@@ -820,6 +973,62 @@ class PipelineContext:
         self.set_number_lf = result.lazy()
         LOGGER.info(f"set_number_lf: {result.height:,} rows x {len(result.columns)} cols")
 
+    def _build_face_foreign_lookup(self, cards_df: pl.DataFrame | None = None) -> None:
+        """Build per-face printed text of non-English multi-face cards.
+
+        Keyed by setCode + number + language + face_index. foreignData in
+        set_number_lf carries first-face values only; the pipeline joins this
+        lookup to correct the entries of the other faces.
+
+        Args:
+            cards_df: Pre-collected cards DataFrame (avoids redundant collect).
+        """
+        is_foreign_multiface = (pl.col("lang") != "en") & (pl.col("cardFaces").list.len() > 1)
+        columns = ["lang", "cardFaces", "set", "collectorNumber"]
+
+        if cards_df is not None:
+            cards = cards_df.filter(is_foreign_multiface).select(columns)
+        else:
+            cards_raw = self.cards_lf
+            if cards_raw is None:
+                LOGGER.info("face_foreign: No cards_lf, skipping")
+                return
+            if isinstance(cards_raw, pl.LazyFrame):
+                cards = cards_raw.filter(is_foreign_multiface).select(columns).collect()
+            else:
+                cards = cards_raw.filter(is_foreign_multiface).select(columns)
+
+        result = (
+            cards.with_columns(
+                [
+                    pl.col("set").str.to_uppercase().alias("setCode"),
+                    pl.col("lang").replace_strict(LANGUAGE_MAP, default=pl.col("lang")).alias("language"),
+                    pl.int_ranges(pl.col("cardFaces").list.len()).alias("_face_idx"),
+                ]
+            )
+            .explode(["cardFaces", "_face_idx"])
+            .select(
+                [
+                    "setCode",
+                    pl.col("collectorNumber").alias("number"),
+                    "language",
+                    pl.col("_face_idx").alias("face_index"),
+                    pl.coalesce(
+                        pl.col("cardFaces").struct.field("printed_name"),
+                        pl.col("cardFaces").struct.field("name"),
+                    ).alias("_faceName"),
+                    pl.col("cardFaces").struct.field("printed_text").alias("_text"),
+                    pl.col("cardFaces").struct.field("printed_type_line").alias("_type"),
+                    pl.col("cardFaces").struct.field("flavor_text").alias("_flavorText"),
+                    # Marks a matched join even when every face field is null
+                    pl.lit(True).alias("_has_face_data"),
+                ]
+            )
+        )
+
+        self.face_foreign_lf = result.lazy()
+        LOGGER.info(f"face_foreign_lf: {result.height:,} rows")
+
     def _build_default_language_lookup(self, cards: pl.DataFrame) -> pl.DataFrame:
         """Build default language card lookup for foreign UUID generation."""
         languages_raw = self.languages_lf
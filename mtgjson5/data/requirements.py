@@ -0,0 +1,194 @@
+"""
+Declared data dependencies of builds, lookups and GlobalCache load steps.
+
+Every consumer of cached data (the card pipeline, set-file assembly and the
+compiled outputs) declares the GlobalCache attributes and consolidated
+lookups it reads, every lookup declares the attributes its builder reads,
+and every load step declares the attributes it populates. A build request
+resolves to the transitive closure of those names, and only the load steps
+producing them (plus their dependencies) run.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .scheduler import LoadStep
+
+# GlobalCache attributes populated by each load step of GlobalCache.load_all()
+STEP_PROVIDES: dict[str, frozenset[str]] = {
+    # Downloads the bulk files that bulk_load reads; pulled in as a dependency
+    "bulk_download": frozenset(),
+    "bulk_load": frozenset({"cards_lf", "rulings_lf", "languages_lf"}),
+    "resources": frozenset(
+        {
+            "base_set_sizes",
+            "card_enrichment",
+            "duel_deck_sides",
+            "foreigndata_exceptions",
+            "keyrune_code_overrides",
+            "manual_overrides",
+            "meld_data",
+            "meld_overrides",
+            "meld_triplets",
+            "multiverse_bridge_lf",
+            "scryfall_overrides",
+            "set_code_watermarks",
+            "set_translations",
+            "tcgplayer_set_id_overrides",
+            "uuid_cache_lf",
+            "world_championship_signatures",
+        }
+    ),
+    "sets_metadata": frozenset({"sets_lf"}),
+    "missing_set_cards": frozenset({"cards_lf"}),
+    "orientations": frozenset({"orientation_lf"}),
+    "card_kingdom": frozenset({"card_kingdom_lf", "card_kingdom_raw_lf"}),
+    "edhrec": frozenset({"salt_lf"}),
+    "spellbook": frozenset({"spellbook_lf"}),
+    "gatherer": frozenset({"gatherer_lf", "gatherer_map"}),
+    "standard": frozenset({"standard_legal_sets"}),
+    "github": frozenset(
+        {
+            "boosters_lf",
+            "decks_lf",
+            "sealed_cards_lf",
+            "sealed_contents_lf",
+            "sealed_products_lf",
+            "token_products_lf",
+        }
+    ),
+    "secretlair": frozenset({"sld_subsets_lf"}),
+    "scryfall_catalogs": frozenset(
+        {
+            "ability_words",
+            "card_type_subtypes",
+            "keyword_abilities",
+            "keyword_actions",
+            "planar_types",
+            "super_types",
+        }
+    ),
+    "cardsphere": frozenset({"cardsphere_lf"}),
+    "unlimited_cards": frozenset({"unlimited_cards"}),
+    "mcm": frozenset({"mcm_lookup_lf"}),
+    "deck_scryfall_filter": frozenset({"_scryfall_id_filter"}),
+}
+
+# GlobalCache attributes read by each PipelineContext.consolidate_lookups() builder
+LOOKUP_INPUTS: dict[str, frozenset[str]] = {
+    "identifiers_lf": frozenset(
+        {"uuid_cache_lf", "card_kingdom_lf", "cardsphere_lf", "multiverse_bridge_lf", "orientation_lf"}
+    ),
+    "oracle_data_lf": frozenset({"cards_lf", "rulings_lf", "salt_lf"}),
+    "set_number_lf": frozenset({"cards_lf", "languages_lf", "foreigndata_exceptions", "duel_deck_sides"}),
+    "face_foreign_lf": frozenset({"cards_lf"}),
+    "name_lf": frozenset({"meld_triplets", "spellbook_lf"}),
+    # Built from resource files only
+    "signatures_lf": frozenset(),
+    "watermark_overrides_lf": frozenset({"set_code_watermarks"}),
+    "face_flavor_names_df": frozenset(),
+    # Reads the raw MCM cache file written by the mcm step
+    "mcm_set_map": frozenset({"mcm_lookup_lf"}),
+    "_mcm_lookup_enriched": frozenset({"mcm_lookup_lf", "sets_lf"}),
+    "tcg_alt_foil_lf": frozenset({"cards_lf", "tcg_skus_lf", "uuid_cache_lf"}),
+}
+
+# Read by the card pipeline stages (build_cards) directly or via a lookup
+CARD_PIPELINE_INPUTS: frozenset[str] = frozenset(LOOKUP_INPUTS) | {
+    "_scryfall_id_filter",
+    "card_enrichment",
+    "cards_lf",
+    "gatherer_lf",
+    "languages_lf",
+    "manual_overrides",
+    "mcm_lookup_lf",
+    "meld_overrides",
+    "meld_triplets",
+    "scryfall_overrides",
+    "sealed_cards_lf",
+    "sets_lf",
+    "sld_subsets_lf",
+    "standard_legal_sets",
+    "unlimited_cards",
+    "uuid_cache_lf",
+    "world_championship_signatures",
+}
+
+# Read by AssemblyContext.from_pipeline() for set files, decks and sealed products
+SET_FILE_INPUTS: frozenset[str] = frozenset(
+    {
+        "base_set_sizes",
+        "boosters_lf",
+        "card_kingdom_raw_lf",
+        "decks_lf",
+        "keyrune_code_overrides",
+        "mcm_set_map",
+        "sealed_contents_lf",
+        "sealed_products_lf",
+        "set_translations",
+        "sets_lf",
+        "tcgplayer_set_id_overrides",
+        "token_products_lf",
+    }
+)
+
+# Extra inputs of compiled outputs, keyed by lower-cased output name
+OUTPUT_INPUTS: dict[str, frozenset[str]] = {
+    "keywords": frozenset({"ability_words", "keyword_abilities", "keyword_actions"}),
+    "cardtypes": frozenset({"card_type_subtypes", "planar_types", "super_types"}),
+    "tcgplayerskus": frozenset({"tcg_skus_lf"}),
+}
+
+
+def required_inputs(
+    build_cards: bool,
+    outputs: Iterable[str] | None = None,
+    sets_only: bool = False,
+) -> frozenset[str]:
+    """
+    Resolve a build request to the cached attributes and lookups it reads.
+
+    Args:
+        build_cards: Whether the card pipeline and assembly run at all
+        outputs: Requested output names (case-insensitive); empty means
+            every compiled output unless ``sets_only``
+        sets_only: Only individual set files are written
+
+    Returns:
+        Attribute and lookup names, closed over the inputs of each lookup.
+    """
+    if not build_cards:
+        return frozenset()
+
+    names = set(CARD_PIPELINE_INPUTS | SET_FILE_INPUTS)
+    requested = {o.lower() for o in outputs or ()}
+    if not requested and not sets_only:
+        requested = set(OUTPUT_INPUTS)
+    for output in requested:
+        names |= OUTPUT_INPUTS.get(output, frozenset())
+    for lookup in LOOKUP_INPUTS.keys() & names:
+        names |= LOOKUP_INPUTS[lookup]
+    return frozenset(names)
+
+
+def required_steps(steps: Iterable[LoadStep], inputs: Iterable[str]) -> list[LoadStep]:
+    """
+    Select the load steps that populate ``inputs``, plus their dependencies.
+
+    Steps without a ``STEP_PROVIDES`` entry are always kept, so a newly added
+    step is never dropped before its outputs have been declared.
+    """
+    steps = list(steps)
+    inputs = frozenset(inputs)
+    by_name = {step.name: step for step in steps}
+
+    pending = [step.name for step in steps if step.name not in STEP_PROVIDES or STEP_PROVIDES[step.name] & inputs]
+    keep: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name in keep:
+            continue
+        keep.add(name)
+        pending.extend(by_name[name].deps)
+    return [step for step in steps if step.name in keep]
@@ -0,0 +1,190 @@
+"""
+Dependency-graph scheduler for GlobalCache loading steps.
+
+Each ``_load_*`` step declares the steps whose outputs it reads. The
+scheduler starts every step as soon as all of its dependencies have
+finished, so total load time is bounded by the critical path of the graph
+rather than by the sum of serial phases.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from mtgjson5.utils import LOGGER
+
+
+@dataclass(frozen=True)
+class LoadStep:
+    """A named loading step and the steps it depends on.
+
+    Args:
+        name: Unique step name (also the profiler label)
+        fn: Zero-argument callable doing the work
+        deps: Names of steps that must finish before this one starts
+        critical: Abort the whole graph if this step raises; non-critical
+            failures are logged and dependents still run
+    """
+
+    name: str
+    fn: Callable[[], Any]
+    deps: tuple[str, ...] = ()
+    critical: bool = False
+
+
+@dataclass
+class StepTiming:
+    """Wall-clock offsets (seconds since graph start) for one executed step."""
+
+    start: float
+    end: float
+    deps: tuple[str, ...] = ()
+    error: str | None = None
+
+    @property
+    def seconds(self) -> float:
+        """Step duration in seconds."""
+        return self.end - self.start
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable form for the profiler report."""
+        data: dict[str, Any] = {
+            "start": round(self.start, 3),
+            "end": round(self.end, 3),
+            "seconds": round(self.seconds, 3),
+            "deps": list(self.deps),
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+@dataclass
+class _GraphState:
+    t0: float
+    timings: dict[str, StepTiming] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _validate(steps: Iterable[LoadStep]) -> dict[str, LoadStep]:
+    """Index steps by name, rejecting duplicates, unknown dependencies and cycles."""
+    by_name: dict[str, LoadStep] = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"Duplicate load step: {step.name}")
+        by_name[step.name] = step
+    for step in by_name.values():
+        unknown = [d for d in step.deps if d not in by_name]
+        if unknown:
+            raise ValueError(f"Load step {step.name} depends on unknown steps: {unknown}")
+
+    # Kahn's algorithm: anything left over sits on a cycle
+    pending = {name: set(step.deps) for name, step in by_name.items()}
+    ready = [name for name, deps in pending.items() if not deps]
+    while ready:
+        done = ready.pop()
+        del pending[done]
+        for name, deps in pending.items():
+            if done in deps:
+                deps.discard(done)
+                if not deps:
+                    ready.append(name)
+    if pending:
+        raise ValueError(f"Load step dependency cycle among: {sorted(pending)}")
+    return by_name
+
+
+def run_step_graph(
+    steps: Iterable[LoadStep],
+    executor: ThreadPoolExecutor,
+) -> dict[str, StepTiming]:
+    """
+    Run ``steps`` on ``executor``, starting each one once its dependencies finish.
+
+    Args:
+        steps: Steps to run (dependencies must be part of the same graph)
+        executor: Thread pool to run steps on
+
+    Returns:
+        Timing for every step that ran, keyed by step name.
+
+    Raises:
+        ValueError: If the graph is malformed.
+        Exception: The first exception raised by a critical step; steps that
+            have not started yet are cancelled.
+    """
+    by_name = _validate(steps)
+    state = _GraphState(t0=time.perf_counter())
+
+    dependents: dict[str, list[str]] = {name: [] for name in by_name}
+    remaining = {name: len(step.deps) for name, step in by_name.items()}
+    for step in by_name.values():
+        for dep in step.deps:
+            dependents[dep].append(step.name)
+
+    def run(step: LoadStep) -> None:
+        start = time.perf_counter() - state.t0
+        error: str | None = None
+        try:
+            step.fn()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            end = time.perf_counter() - state.t0
+            with state.lock:
+                state.timings[step.name] = StepTiming(start, end, step.deps, error)
+
+    in_flight: dict[Future[None], LoadStep] = {}
+
+    def submit(name: str) -> None:
+        step = by_name[name]
+        in_flight[executor.submit(run, step)] = step
+
+    for name, count in remaining.items():
+        if count == 0:
+            submit(name)
+
+    while in_flight:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            step = in_flight.pop(future)
+            exc = future.exception()
+            if exc is not None:
+                if step.critical:
+                    for other in in_flight:
+                        other.cancel()
+                    raise exc
+                LOGGER.error(f"Failed to load {step.name}: {exc}")
+            else:
+                LOGGER.info(f"Loaded {step.name} ({state.timings[step.name].seconds:.1f}s)")
+
+            for name in dependents[step.name]:
+                remaining[name] -= 1
+                if remaining[name] == 0:
+                    submit(name)
+
+    return state.timings
+
+
+def critical_path(timings: dict[str, StepTiming]) -> list[str]:
+    """
+    Chain of steps that bounded the graph's wall time.
+
+    Walks back from the step that finished last, following at each step the
+    dependency that finished last.
+    """
+    if not timings:
+        return []
+    current: str | None = max(timings, key=lambda name: timings[name].end)
+    path = []
+    while current is not None:
+        path.append(current)
+        deps = [d for d in timings[current].deps if d in timings]
+        current = max(deps, key=lambda name: timings[name].end) if deps else None
+    return path[::-1]
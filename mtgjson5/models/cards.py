@@ -381,32 +381,43 @@ class CardPrintingBase(CardBase):
         """
         if not isinstance(other, CardPrintingBase):
             return NotImplemented
-
-        self_side = self.side or ""
-        other_side = other.side or ""
-
-        if self.number == other.number:
+        return self.printing_lt(self.number, self.side, self.name, other.number, other.side, other.name)
+
+    @staticmethod
+    def printing_lt(
+        self_number: str,
+        self_side: str | None,
+        self_name: str,
+        other_number: str,
+        other_side: str | None,
+        other_name: str,
+    ) -> bool:
+        """Collector-number ordering behind ``__lt__``, usable on plain row values."""
+        self_side = self_side or ""
+        other_side = other_side or ""
+
+        if self_number == other_number:
             return self_side < other_side
 
-        self_number_clean = "".join(x for x in self.number if x.isdigit()) or "100000"
+        self_number_clean = "".join(x for x in self_number if x.isdigit()) or "100000"
         self_number_clean_int = int(self_number_clean)
 
-        other_number_clean = "".join(x for x in other.number if x.isdigit()) or "100000"
+        other_number_clean = "".join(x for x in other_number if x.isdigit()) or "100000"
         other_number_clean_int = int(other_number_clean)
 
-        if self.number == self_number_clean and other.number == other_number_clean:
+        if self_number == self_number_clean and other_number == other_number_clean:
             if self_number_clean_int == other_number_clean_int:
                 if len(self_number_clean) != len(other_number_clean):
                     return len(self_number_clean) < len(other_number_clean)
                 return self_side < other_side
             return self_number_clean_int < other_number_clean_int
 
-        if self.number == self_number_clean:
+        if self_number == self_number_clean:
             if self_number_clean_int == other_number_clean_int:
                 return True
             return self_number_clean_int < other_number_clean_int
 
-        if other.number == other_number_clean:
+        if other_number == other_number_clean:
             if self_number_clean_int == other_number_clean_int:
                 return False
             return self_number_clean_int < other_number_clean_int
@@ -416,9 +427,9 @@ class CardPrintingBase(CardBase):
             if self_side != other_side:
                 return self_side < other_side
             # Tiebreaker: multi-face cards sort by name, then by collector number
-            if self_side and self.name != other.name:
-                return self.name < other.name
-            return bool(self.number < other.number)
+            if self_side and self_name != other_name:
+                return self_name < other_name
+            return bool(self_number < other_number)
 
         if self_number_clean_int == other_number_clean_int:
             if len(self_number_clean) != len(other_number_clean):
@@ -426,9 +437,9 @@ class CardPrintingBase(CardBase):
             if self_side != other_side:
                 return self_side < other_side
             # Tiebreaker: multi-face cards sort by name, then by collector number
-            if self_side and self.name != other.name:
-                return self.name < other.name
-            return bool(self.number < other.number)
+            if self_side and self_name != other_name:
+                return self_name < other_name
+            return bool(self_number < other_number)
 
         return self_number_clean_int < other_number_clean_int
 
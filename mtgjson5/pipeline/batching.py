@@ -0,0 +1,196 @@
+"""
+Memory-budgeted batch planning for the card pipeline.
+
+Sets are packed into batches by their row count in the bulk data rather than
+by a fixed number of sets, so a batch holding Secret Lair or The List is not
+several times heavier than one of small promo sets. The row budget of a batch
+is the memory ceiling divided by a bytes-per-row estimate:
+
+    - measured by the previous build (peak RSS growth of each batch over its
+      row count), stored in ``_pipeline_batch_stats.json``
+    - otherwise a conservative default
+
+The ceiling comes from ``--pipeline-memory-gb`` or, when unset, a fraction of
+the memory available at planning time, and is shared by concurrent workers.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from mtgjson5 import constants
+from mtgjson5.utils import LOGGER
+
+BATCH_STATS_FILE = "_pipeline_batch_stats.json"
+
+# Used until a build has measured the pipeline's footprint
+DEFAULT_BYTES_PER_ROW = 128 * 1024
+
+# Share of available memory used as the ceiling when none is configured
+_AVAILABLE_MEMORY_FRACTION = 0.5
+
+_MIN_BUDGET_BYTES = 1024**3
+
+_GB = 1024**3
+_MB = 1024**2
+
+
+def count_set_rows(
+    cards_lf: pl.LazyFrame, set_codes: Iterable[str], scryfall_ids: set[str] | None = None
+) -> dict[str, int]:
+    """
+    Count bulk-data rows per set (upper-cased codes; sets without rows count 0).
+
+    Args:
+        cards_lf: Raw cards frame (``set`` and ``id`` columns)
+        set_codes: Sets to count
+        scryfall_ids: Optional scryfallId filter applied by the pipeline
+    """
+    codes = sorted(set(set_codes))
+    lf = cards_lf.filter(pl.col("set").str.to_uppercase().is_in(codes))
+    if scryfall_ids:
+        lf = lf.filter(pl.col("id").is_in(scryfall_ids))
+    counts = lf.group_by(pl.col("set").str.to_uppercase().alias("setCode")).agg(pl.len().alias("rows")).collect()
+    rows = dict(zip(counts["setCode"].to_list(), counts["rows"].to_list(), strict=True))
+    return {code: int(rows.get(code, 0)) for code in codes}
+
+
+def memory_ceiling_bytes(memory_gb: float | None = None) -> int:
+    """Total memory the pipeline batches may use at once."""
+    if memory_gb is not None and memory_gb > 0:
+        return int(memory_gb * _GB)
+    import psutil
+
+    available = int(psutil.virtual_memory().available * _AVAILABLE_MEMORY_FRACTION)
+    return max(available, _MIN_BUDGET_BYTES)
+
+
+def load_bytes_per_row(stats_dir: Path | None = None) -> float | None:
+    """Bytes-per-row measured by the previous build, if any."""
+    path = (stats_dir or constants.CACHE_PATH) / BATCH_STATS_FILE
+    if not path.exists():
+        return None
+    try:
+        with path.open(encoding="utf-8") as f:
+            value = json.load(f).get("bytes_per_row")
+    except (OSError, ValueError) as e:
+        LOGGER.warning(f"Ignoring unreadable batch stats {path}: {e}")
+        return None
+    return float(value) if isinstance(value, int | float) and value > 0 else None
+
+
+def save_batch_stats(batches: list[dict[str, Any]], stats_dir: Path | None = None) -> float | None:
+    """
+    Derive bytes-per-row from measured batches and store it for the next build.
+
+    Args:
+        batches: ``{"label", "rows", "rss_growth_mb"}`` per batch
+        stats_dir: Directory holding the stats file (default: CACHE_PATH)
+
+    Returns:
+        The stored estimate, or None when no batch was measurable.
+    """
+    ratios = [b["rss_growth_mb"] * _MB / b["rows"] for b in batches if b["rows"] > 0 and b["rss_growth_mb"] > 0]
+    if not ratios:
+        return None
+    # The heaviest batch per row bounds the next plan
+    bytes_per_row = float(max(ratios))
+
+    stats_dir = stats_dir or constants.CACHE_PATH
+    stats_dir.mkdir(parents=True, exist_ok=True)
+    path = stats_dir / BATCH_STATS_FILE
+    tmp = path.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump({"bytes_per_row": round(bytes_per_row, 1), "batches": batches}, f, indent=1)
+    os.replace(tmp, path)
+    LOGGER.info(f"Measured pipeline footprint: {bytes_per_row / 1024:.1f} KiB/row over {len(ratios)} batches")
+    return bytes_per_row
+
+
+class BatchPeakMeter:
+    """
+    Peak RSS growth of this process while a batch runs.
+
+    A daemon thread samples RSS from ``__enter__`` (the pre-batch baseline)
+    until ``__exit__``, so the measured peak does not depend on the profiler
+    being enabled or on when its checkpoints happen to fire. With
+    ``include_children`` every sample adds the RSS of all descendant
+    processes, so worker pools started inside the block are counted.
+    """
+
+    def __init__(self, interval: float = 0.05, include_children: bool = False) -> None:
+        self.interval = interval
+        self.include_children = include_children
+        self.baseline_mb = 0.0
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _rss_mb(self) -> float:
+        import psutil
+
+        proc = psutil.Process()
+        rss = proc.memory_info().rss
+        if self.include_children:
+            for child in proc.children(recursive=True):
+                # Workers may exit between listing and sampling
+                with contextlib.suppress(psutil.Error):
+                    rss += child.memory_info().rss
+        return float(rss / _MB)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, self._rss_mb())
+
+    def __enter__(self) -> BatchPeakMeter:
+        self.baseline_mb = self.peak_mb = self._rss_mb()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample, name="batch-peak-meter", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.peak_mb = max(self.peak_mb, self._rss_mb())
+
+    @property
+    def growth_mb(self) -> float:
+        """Peak RSS over the pre-batch baseline, in MB."""
+        return max(0.0, self.peak_mb - self.baseline_mb)
+
+
+def plan_batches(row_counts: dict[str, int], max_rows: int) -> list[list[str]]:
+    """
+    Pack sets into as few batches as fit ``max_rows`` each (first-fit decreasing).
+
+    A set larger than ``max_rows`` gets a batch of its own. Codes within a
+    batch are sorted, and batches are ordered heaviest first so the largest
+    batches start early when running concurrently.
+    """
+    max_rows = max(1, max_rows)
+    batches: list[list[str]] = []
+    loads: list[int] = []
+    for code in sorted(row_counts, key=lambda c: (-row_counts[c], c)):
+        rows = row_counts[code]
+        for i, load in enumerate(loads):
+            if load + rows <= max_rows:
+                batches[i].append(code)
+                loads[i] += rows
+                break
+        else:
+            if rows > max_rows:
+                LOGGER.warning(f"Set {code} ({rows:,} rows) exceeds the batch row budget of {max_rows:,}")
+            batches.append([code])
+            loads.append(rows)
+    return [sorted(batch) for batch in batches]
@@ -8,13 +8,40 @@ into MTGJSON format.
 from __future__ import annotations
 
 import gc
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import polars as pl
 
+from mtgjson5 import constants
 from mtgjson5.data import PipelineContext
 from mtgjson5.mtgjson_config import MtgjsonConfig
+from mtgjson5.pipeline.batching import (
+    DEFAULT_BYTES_PER_ROW,
+    BatchPeakMeter,
+    count_set_rows,
+    load_bytes_per_row,
+    memory_ceiling_bytes,
+    plan_batches,
+    save_batch_stats,
+)
+from mtgjson5.pipeline.fingerprint import (
+    compute_set_fingerprints,
+    has_partitions,
+    load_fingerprints,
+    save_fingerprints,
+)
+from mtgjson5.pipeline.resume import (
+    BatchManifest,
+    load_stage_checkpoint,
+    run_key,
+    save_stage_checkpoint,
+)
 from mtgjson5.pipeline.stages.basic_fields import (
     add_basic_fields,
     add_booster_types,
@@ -97,7 +124,7 @@ from mtgjson5.profiler import get_profiler
 from mtgjson5.utils import LOGGER
 
 if TYPE_CHECKING:
-    from mtgjson5.profiler import PipelineProfiler
+    from mtgjson5.profiler import PipelineProfiler, SubprocessProfiler
 
 # Re-export standalone builders for backwards compatibility
 __all__ = [
@@ -107,18 +134,40 @@ __all__ = [
     "build_set_metadata_df",
 ]
 
+# Frames materialized between stage groups, in pipeline order; persisted for resuming
+_COLLECT_POINTS = (
+    "collect_1_after_joins",
+    "collect_2_before_relationships",
+    "collect_3_before_enrichment",
+)
+
 
 def build_cards(
     ctx: PipelineContext,
     batch_size: int | str | None = "auto",
+    workers: int | str | None = 1,
+    incremental: bool = True,
+    memory_gb: float | None = None,
+    resume: bool = False,
 ) -> PipelineContext:
     """
     Main card building pipeline.
 
     Args:
         ctx: Pipeline context with loaded cache and consolidated lookups.
-        batch_size: Number of sets per batch. ``"auto"`` (default) picks
-            ~50 sets/batch. An integer sets a custom batch size.
+        batch_size: Number of sets per batch. ``"auto"`` (default) packs
+            sets by bulk row count under the memory ceiling. An integer sets
+            a fixed batch size.
+        workers: Number of spawned worker processes running batches
+            concurrently. ``1`` (default) runs batches serially in-process,
+            ``"auto"`` picks a count from available CPUs.
+        incremental: Reuse existing ``setCode=`` partitions for sets whose
+            input fingerprint is unchanged since the last build.
+        memory_gb: Memory ceiling shared by concurrent batches when
+            ``batch_size`` is ``"auto"``. Defaults to half the available memory.
+        resume: Continue an interrupted build of the same inputs from its
+            first incomplete batch and latest stage checkpoint. Stage
+            checkpoints are only written when this is set.
     """
     output_dir = MtgjsonConfig().output_path
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -127,25 +176,27 @@ def build_cards(
     prof = get_profiler()
     prof.checkpoint("pipeline_start")
 
-    effective_batch_size = _resolve_batch_size(batch_size, ctx.sets_to_build)
-    return _build_cards_batched(ctx, effective_batch_size, prof)
+    return _build_cards_batched(
+        ctx, batch_size, prof, workers=workers, incremental=incremental, memory_gb=memory_gb, resume=resume
+    )
 
 
-def _build_cards_batched(ctx: PipelineContext, batch_size: int, prof: PipelineProfiler) -> PipelineContext:
+def _build_cards_batched(
+    ctx: PipelineContext,
+    batch_size: int | str | None,
+    prof: PipelineProfiler,
+    *,
+    workers: int | str | None = 1,
+    incremental: bool = True,
+    memory_gb: float | None = None,
+    resume: bool = False,
+) -> PipelineContext:
     """Process the pipeline in batches of set codes to limit peak memory."""
     set_codes = ctx.sets_to_build
 
-    if ctx.sets_lf is None:
-        raise ValueError("sets_df is not available in context")
-    sets_raw = ctx.sets_lf.rename({"code": "set"})
-    sets_lf = sets_raw.lazy() if isinstance(sets_raw, pl.DataFrame) else sets_raw
-
     if ctx.cards_lf is None:
         raise ValueError("cards_lf is not available in context")
 
-    sets_schema = sets_lf.collect_schema().names()
-    set_select_exprs = _build_set_select_exprs(sets_schema)
-
     # Pre-pass: build global scryfallId -> uuid mapping for add_token_ids()
     scryfall_uuid_lf = _build_global_scryfall_uuid_map(ctx)
     prof.checkpoint("prepass_scryfall_uuid_map")
@@ -153,39 +204,217 @@ def _build_cards_batched(ctx: PipelineContext, batch_size: int, prof: PipelinePr
     # Determine batches
     all_codes = sorted(set_codes) if set_codes else _get_all_set_codes(ctx)
 
-    batches = [all_codes[i : i + batch_size] for i in range(0, len(all_codes), batch_size)]
-    LOGGER.info(f"Batched pipeline: {len(all_codes)} sets in {len(batches)} batches of ~{batch_size} sets each")
+    # Fingerprints describe full-set partitions; ID-filtered builds write partial ones
+    fingerprints: dict[str, str] = {}
+    if not ctx.scryfall_id_filter:
+        fingerprints = compute_set_fingerprints(ctx, all_codes, scryfall_uuid_lf)
+        prof.checkpoint("set_fingerprints")
+
+    key = run_key(all_codes, fingerprints, ctx.scryfall_id_filter)
+    manifest = BatchManifest.load(key) if resume else None
+    if manifest is not None:
+        LOGGER.info(f"Resuming pipeline: {len(manifest.completed)}/{len(manifest.batches)} batches already complete")
+        all_codes = [code for batch in manifest.batches for code in batch]
+    elif resume:
+        LOGGER.info("No resumable pipeline run for these inputs, starting from the first batch")
+
+    if manifest is None and incremental and fingerprints:
+        stored = load_fingerprints()
+        unchanged = {code for code in all_codes if stored.get(code) == fingerprints[code] and has_partitions(code)}
+        if unchanged:
+            LOGGER.info(f"Incremental build: reusing partitions for {len(unchanged)}/{len(all_codes)} unchanged sets")
+            all_codes = [code for code in all_codes if code not in unchanged]
+
+    fixed_size = _fixed_batch_size(batch_size)
+    # Needed for the plan and for the per-row footprint measured below
+    row_counts = count_set_rows(ctx.cards_lf, all_codes, ctx.scryfall_id_filter)
+    prof.checkpoint("set_row_counts")
+
+    if manifest is None:
+        if fixed_size is not None:
+            batches = [all_codes[i : i + fixed_size] for i in range(0, len(all_codes), fixed_size)]
+            LOGGER.info(f"Batched pipeline: {len(all_codes)} sets in {len(batches)} batches of ~{fixed_size} sets each")
+        else:
+            batches = _plan_memory_batches(row_counts, workers, memory_gb)
+        manifest = BatchManifest(key, batches)
+        manifest.clear()
+        manifest.save()
+    pending = manifest.pending()
+
+    n_workers = _resolve_pipeline_workers(workers, len(pending))
+    if n_workers > 1:
+        growth_mb = _run_batches_parallel(
+            ctx, manifest, scryfall_uuid_lf, n_workers, prof, fingerprints, checkpoints=resume
+        )
+    else:
+        growth_mb = {}
+        for batch_idx, batch_codes in pending.items():
+            batch_label = f"batch_{batch_idx}"
+            growth_mb[batch_idx] = _process_batch(
+                ctx,
+                batch_codes,
+                scryfall_uuid_lf=scryfall_uuid_lf,
+                prof=prof,
+                label=batch_label,
+                checkpoint_dir=manifest.batch_dir(batch_idx) if resume else None,
+            )
+            _record_batch_fingerprints(batch_codes, fingerprints)
+            manifest.mark_complete(batch_idx)
+            prof.checkpoint(f"{batch_label}/sink_complete")
+    manifest.clear()
 
-    for batch_idx, batch_codes in enumerate(batches):
-        batch_label = f"batch_{batch_idx}"
-        LOGGER.info(
-            f"[{batch_label}] Processing {len(batch_codes)} sets: "
-            f"{batch_codes[:5]}{'...' if len(batch_codes) > 5 else ''}"
+    if pending:
+        save_batch_stats(
+            [
+                {
+                    "label": f"batch_{batch_idx}",
+                    "sets": len(batch_codes),
+                    "rows": sum(row_counts.get(code, 0) for code in batch_codes),
+                    "rss_growth_mb": round(growth_mb.get(batch_idx, 0.0), 1),
+                }
+                for batch_idx, batch_codes in pending.items()
+            ]
         )
 
+    # Post-batch: build ID mappings from all parquet partitions
+    build_id_mappings_from_parquet(ctx)
+    prof.checkpoint("post_batch_id_mappings")
+
+    return ctx
+
+
+def _process_batch(
+    ctx: PipelineContext,
+    batch_codes: list[str],
+    *,
+    scryfall_uuid_lf: pl.LazyFrame,
+    prof: PipelineProfiler | SubprocessProfiler,
+    label: str,
+    checkpoint_dir: Path | None = None,
+) -> float:
+    """Run one batch of sets through every stage and sink its partitions.
+
+    Shared by the serial loop and the spawned workers in
+    ``_subprocess_pipeline`` so both paths produce identical output.
+    With a ``checkpoint_dir``, collect points are persisted there and the
+    batch restarts from the latest one found.
+
+    Returns:
+        Peak RSS growth of the batch over its pre-batch baseline, in MB.
+    """
+    LOGGER.info(
+        f"[{label}] Processing {len(batch_codes)} sets: {batch_codes[:5]}{'...' if len(batch_codes) > 5 else ''}"
+    )
+
+    with BatchPeakMeter() as meter:
+        sets_lf, set_select_exprs = _get_sets_join_inputs(ctx)
         lf = _prepare_batch_lf(ctx, batch_codes, sets_lf, set_select_exprs)
 
         try:
-            lf = _run_pipeline_stages(ctx, lf, scryfall_uuid_lf=scryfall_uuid_lf, prof=prof, label=batch_label)
+            lf = _run_pipeline_stages(
+                ctx, lf, scryfall_uuid_lf=scryfall_uuid_lf, prof=prof, label=label, checkpoint_dir=checkpoint_dir
+            )
         except Exception:
-            LOGGER.error(f"[{batch_label}] Pipeline failed for sets: {batch_codes}")
+            LOGGER.error(f"[{label}] Pipeline failed for sets: {batch_codes}")
             raise
 
         ctx.final_cards_lf = lf
         sink_cards(ctx, skip_id_mappings=True)
-        prof.checkpoint(f"{batch_label}/sink_complete")
 
-        # Release batch memory
-        ctx.final_cards_lf = None
-        del lf
-        gc.collect()
-        LOGGER.info(f"[{batch_label}] Complete")
+    # Release batch memory
+    ctx.final_cards_lf = None
+    del lf
+    gc.collect()
+    LOGGER.info(f"[{label}] Complete (peak +{meter.growth_mb:,.0f} MB)")
+    return meter.growth_mb
 
-    # Post-batch: build ID mappings from all parquet partitions
-    build_id_mappings_from_parquet(ctx)
-    prof.checkpoint("post_batch_id_mappings")
 
-    return ctx
+def _run_batches_parallel(
+    ctx: PipelineContext,
+    manifest: BatchManifest,
+    scryfall_uuid_lf: pl.LazyFrame,
+    workers: int,
+    prof: PipelineProfiler,
+    fingerprints: dict[str, str],
+    *,
+    checkpoints: bool = False,
+) -> dict[int, float]:
+    """Run batches across spawned worker processes.
+
+    The pre-pass mapping and consolidated lookups are written once to a
+    scratch directory; each worker loads them in its initializer and writes
+    its own ``setCode=`` partitions. Workers are recycled after every batch
+    so jemalloc pages are returned to the OS, and Polars' thread pool is
+    split between them to avoid oversubscription. Only the manifest's pending
+    batches run, and each is recorded complete as its worker finishes.
+    With ``checkpoints``, workers persist their collect points under the
+    manifest's batch directories.
+
+    Returns:
+        Peak RSS growth in MB of each batch that ran, by batch index.
+    """
+    from mtgjson5._subprocess_pipeline import init_pipeline_worker, run_pipeline_batch
+    from mtgjson5.utils import get_log_file
+
+    state_dir = constants.CACHE_PATH / "_pipeline_workers"
+    if state_dir.exists():
+        shutil.rmtree(state_dir)
+    state_dir.mkdir(parents=True)
+
+    uuid_map_path = state_dir / "scryfall_uuid.parquet"
+    scryfall_uuid_lf.collect().write_parquet(uuid_map_path)
+    state_path = ctx.dump_for_workers(state_dir)
+    prof.checkpoint("pipeline_workers_state_written")
+
+    batches = manifest.pending()
+    LOGGER.info(f"Running {len(batches)} batches across {workers} worker processes")
+    growth_mb: dict[int, float] = {}
+
+    prev_threads = os.environ.get("POLARS_MAX_THREADS")
+    os.environ["POLARS_MAX_THREADS"] = str(max(1, (os.cpu_count() or 1) // workers))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_pipeline_worker,
+            initargs=(
+                str(state_path),
+                str(uuid_map_path),
+                get_log_file(),
+                prof.enabled,
+                str(constants.CACHE_PATH),
+            ),
+            max_tasks_per_child=1,
+        ) as pool:
+            futures = {
+                pool.submit(
+                    run_pipeline_batch,
+                    batch_idx,
+                    batch_codes,
+                    str(manifest.batch_dir(batch_idx)) if checkpoints else None,
+                ): batch_idx
+                for batch_idx, batch_codes in batches.items()
+            }
+            for future in as_completed(futures):
+                batch_idx = futures[future]
+                try:
+                    growth_mb[batch_idx], sp_profile = future.result()
+                except Exception:
+                    LOGGER.error(f"[batch_{batch_idx}] Pipeline worker failed for sets: {batches[batch_idx]}")
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                prof.add_subprocess_profile(sp_profile)
+                _record_batch_fingerprints(batches[batch_idx], fingerprints)
+                manifest.mark_complete(batch_idx)
+                prof.checkpoint(f"batch_{batch_idx}/sink_complete")
+    finally:
+        if prev_threads is None:
+            os.environ.pop("POLARS_MAX_THREADS", None)
+        else:
+            os.environ["POLARS_MAX_THREADS"] = prev_threads
+        shutil.rmtree(state_dir, ignore_errors=True)
+    return growth_mb
 
 
 def _run_pipeline_stages(
@@ -193,8 +422,9 @@ def _run_pipeline_stages(
     lf: pl.LazyFrame,
     *,
     scryfall_uuid_lf: pl.LazyFrame,
-    prof: PipelineProfiler,
+    prof: PipelineProfiler | SubprocessProfiler,
     label: str,
+    checkpoint_dir: Path | None = None,
 ) -> pl.LazyFrame:
     """Run all pipeline stage groups on a LazyFrame.
 
@@ -205,9 +435,59 @@ def _run_pipeline_stages(
             ``add_token_ids()``.
         prof: Profiler instance.
         label: Prefix for profiler checkpoint names (e.g. "batch_0").
+        checkpoint_dir: Where collect points are persisted; the stage groups
+            up to the latest one already there are skipped.
     """
     prefix = f"{label}/" if label else ""
 
+    resumed = load_stage_checkpoint(checkpoint_dir, _COLLECT_POINTS) if checkpoint_dir is not None else None
+    start = 0
+    if resumed is not None:
+        name, lf = resumed
+        start = _COLLECT_POINTS.index(name) + 1
+        LOGGER.info(f"[{label}] Resuming from stage checkpoint {name}")
+
+    if start < 1:
+        lf = _run_stages_to_joins(ctx, lf, prof=prof, prefix=prefix)
+        lf = _materialize(lf, "collect_1_after_joins", "after joins", prof, prefix, checkpoint_dir)
+    if start < 2:
+        lf = _run_stages_to_uuids(ctx, lf, prof=prof, prefix=prefix)
+        lf = _materialize(
+            lf, "collect_2_before_relationships", "before relationship operations", prof, prefix, checkpoint_dir
+        )
+    if start < 3:
+        lf = _run_relationship_stages(ctx, lf, scryfall_uuid_lf=scryfall_uuid_lf, prof=prof, prefix=prefix)
+        lf = _materialize(lf, "collect_3_before_enrichment", "before final enrichment", prof, prefix, checkpoint_dir)
+
+    return _run_output_stages(ctx, lf, prof=prof, prefix=prefix)
+
+
+def _materialize(
+    lf: pl.LazyFrame,
+    name: str,
+    description: str,
+    prof: PipelineProfiler | SubprocessProfiler,
+    prefix: str,
+    checkpoint_dir: Path | None,
+) -> pl.LazyFrame:
+    """Collect the plan built so far (keeps Polars plans small), persisting it when resumable."""
+    LOGGER.info(f"Checkpoint: materializing {description}...")
+    df = lf.collect()
+    if checkpoint_dir is not None:
+        save_stage_checkpoint(checkpoint_dir, name, df)
+    LOGGER.info("  Checkpoint complete")
+    prof.checkpoint(f"{prefix}{name}", top_n=10)
+    return df.lazy()
+
+
+def _run_stages_to_joins(
+    ctx: PipelineContext,
+    lf: pl.LazyFrame,
+    *,
+    prof: PipelineProfiler | SubprocessProfiler,
+    prefix: str,
+) -> pl.LazyFrame:
+    """Stages 1-2: per-card transforms and identifier/data joins."""
     # Stage 1: Per-card transforms
     lf = (
         lf.pipe(explode_card_faces)
@@ -278,13 +558,17 @@ def _run_pipeline_stages(
         .pipe(fix_availability_from_ids)
     )
     prof.checkpoint(f"{prefix}stage2_joins")
+    return lf
 
-    # Collect 1: prevent Polars lazy plan complexity explosion
-    LOGGER.info("Checkpoint: materializing after joins...")
-    lf = lf.collect().lazy()
-    LOGGER.info("  Checkpoint complete")
-    prof.checkpoint(f"{prefix}collect_1_after_joins", top_n=10)
 
+def _run_stages_to_uuids(
+    ctx: PipelineContext,
+    lf: pl.LazyFrame,
+    *,
+    prof: PipelineProfiler | SubprocessProfiler,
+    prefix: str,
+) -> pl.LazyFrame:
+    """Stage 3: UUIDs, identifier structs, duel deck sides and Gatherer data."""
     # Stage 3: UUID & identifier structs
     lf = (
         lf.pipe(add_identifiers_struct)
@@ -309,15 +593,18 @@ def _run_pipeline_stages(
     prof.checkpoint(f"{prefix}stage3_uuids")
 
     lf = lf.pipe(calculate_duel_deck)
-    lf = lf.pipe(partial(join_gatherer_data, ctx=ctx))
-
-    # Collect 2: materialize before relationship operations
-    LOGGER.info("Checkpoint: materializing before relationship operations...")
-    lf = lf.collect().lazy()
+    return lf.pipe(partial(join_gatherer_data, ctx=ctx))
 
-    LOGGER.info("  Checkpoint complete")
-    prof.checkpoint(f"{prefix}collect_2_before_relationships", top_n=10)
 
+def _run_relationship_stages(
+    ctx: PipelineContext,
+    lf: pl.LazyFrame,
+    *,
+    scryfall_uuid_lf: pl.LazyFrame,
+    prof: PipelineProfiler | SubprocessProfiler,
+    prefix: str,
+) -> pl.LazyFrame:
+    """Stage 4: face, token and related-card relationships."""
     # Stage 4: Relationships
     lf = (
         lf.pipe(partial(add_other_face_ids, ctx=ctx))
@@ -333,13 +620,17 @@ def _run_pipeline_stages(
         .pipe(add_purchase_urls_struct)
     )
     prof.checkpoint(f"{prefix}stage4_relationships")
+    return lf
 
-    # Collect 3: materialize before final enrichment
-    LOGGER.info("Checkpoint: materializing before final enrichment...")
-    lf = lf.collect().lazy()
-    LOGGER.info("  Checkpoint complete")
-    prof.checkpoint(f"{prefix}collect_3_before_enrichment", top_n=10)
 
+def _run_output_stages(
+    ctx: PipelineContext,
+    lf: pl.LazyFrame,
+    *,
+    prof: PipelineProfiler | SubprocessProfiler,
+    prefix: str,
+) -> pl.LazyFrame:
+    """Stages 5-7: manual enrichment, signatures and per-finish SKU IDs."""
     # Stage 5: Manual enrichment
     lf = (
         lf.pipe(partial(apply_manual_overrides, ctx=ctx))
@@ -440,16 +731,62 @@ def _build_global_scryfall_uuid_map(ctx: PipelineContext) -> pl.LazyFrame:
     return result_df.lazy()
 
 
-def _resolve_batch_size(
-    batch_size: int | str | None,
-    set_codes: set[str] | None,
-) -> int:
-    """Resolve batch_size parameter to an integer."""
-    n_sets = len(set_codes) if set_codes else 749
+def _fixed_batch_size(batch_size: int | str | None) -> int | None:
+    """Sets per batch for an explicit batch size; None selects memory-budgeted planning."""
     if batch_size is None or (isinstance(batch_size, str) and batch_size.lower() == "auto"):
-        return max(30, n_sets // 15)
+        return None
     bs = int(batch_size)
-    return bs if bs > 0 else max(30, n_sets // 15)
+    return bs if bs > 0 else None
+
+
+def _plan_memory_batches(
+    row_counts: dict[str, int],
+    workers: int | str | None,
+    memory_gb: float | None,
+) -> list[list[str]]:
+    """Pack sets into batches whose estimated footprint fits the memory ceiling."""
+    concurrent = _resolve_pipeline_workers(workers, len(row_counts))
+    ceiling = memory_ceiling_bytes(memory_gb)
+    measured = load_bytes_per_row()
+    bytes_per_row = measured or DEFAULT_BYTES_PER_ROW
+    max_rows = int(ceiling / concurrent / bytes_per_row)
+
+    batches = plan_batches(row_counts, max_rows)
+    LOGGER.info(
+        f"Batched pipeline: {len(row_counts)} sets ({sum(row_counts.values()):,} rows) in {len(batches)} batches "
+        f"of <= {max_rows:,} rows ({ceiling / 1024**3:.1f} GB across {concurrent} worker(s), "
+        f"{bytes_per_row / 1024:.0f} KiB/row {'measured' if measured else 'default'})"
+    )
+    return batches
+
+
+def _record_batch_fingerprints(batch_codes: list[str], fingerprints: dict[str, str]) -> None:
+    """Persist fingerprints for a finished batch (dropping stale entries for sets without one)."""
+    stored = load_fingerprints()
+    for code in batch_codes:
+        if code in fingerprints:
+            stored[code] = fingerprints[code]
+        else:
+            stored.pop(code, None)
+    save_fingerprints(stored)
+
+
+def _resolve_pipeline_workers(workers: int | str | None, n_batches: int) -> int:
+    """Resolve the workers parameter to a process count (1 = serial in-process)."""
+    if n_batches <= 1 or workers is None:
+        return 1
+    if isinstance(workers, str) and workers.lower() == "auto":
+        return min(n_batches, max(1, (os.cpu_count() or 1) // 8))
+    return max(1, min(int(workers), n_batches))
+
+
+def _get_sets_join_inputs(ctx: PipelineContext) -> tuple[pl.LazyFrame, list[pl.Expr]]:
+    """Return the renamed sets frame and the column selection used to join it onto cards."""
+    if ctx.sets_lf is None:
+        raise ValueError("sets_df is not available in context")
+    sets_raw = ctx.sets_lf.rename({"code": "set"})
+    sets_lf = sets_raw.lazy() if isinstance(sets_raw, pl.DataFrame) else sets_raw
+    return sets_lf, _build_set_select_exprs(sets_lf.collect_schema().names())
 
 
 def _build_set_select_exprs(sets_schema: list[str]) -> list[pl.Expr]:
@@ -502,8 +839,9 @@ def _prepare_batch_lf(
 ) -> pl.LazyFrame:
     """Filter cards_lf to a batch of set codes and join set metadata."""
     assert ctx.cards_lf is not None, "cards_lf must be loaded before building"
-    base_lf = ctx.cards_lf.with_columns(pl.col("set").str.to_uppercase().alias("_set_upper"))
-    base_lf = base_lf.filter(pl.col("_set_upper").is_in(batch_codes))
+    # Filter on the raw set column first so partitioned scans prune whole sets
+    base_lf = ctx.cards_lf.filter(pl.col("set").str.to_uppercase().is_in(batch_codes))
+    base_lf = base_lf.with_columns(pl.col("set").str.to_uppercase().alias("_set_upper"))
 
     base_lf = _apply_tdm_name_fix(base_lf)
 
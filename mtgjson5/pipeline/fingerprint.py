@@ -0,0 +1,349 @@
+"""
+Per-set input fingerprints for incremental card builds.
+
+A set's fingerprint digests everything ``build_cards`` reads to produce its
+``_parquet/setCode=*`` partitions:
+
+    - the set's raw rows in ``cards_lf`` (all_cards.ndjson)
+    - rows of each provider lookup that join onto those cards, matched via
+      the same keys the stages join on (scryfallId, oracleId, name, ...)
+    - per-set resource overrides (card_enrichment, scryfall_overrides)
+    - global inputs with no per-set key (other resource files, legality sets)
+    - the code version (package sources + Polars version)
+
+Fingerprints are stored in ``_parquet/_fingerprints.json``. Sets whose
+fingerprint is unchanged and whose partitions still exist are skipped.
+
+Keyed matching only ever over-approximates: a lookup row is attributed to
+every set holding a card with a matching key, so a change can trigger
+extra rebuilds but never be missed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+import polars as pl
+
+from mtgjson5 import constants
+from mtgjson5.polars_utils import get_windows_safe_set_code
+from mtgjson5.utils import LOGGER
+
+if TYPE_CHECKING:
+    from mtgjson5.data import PipelineContext
+
+FINGERPRINT_FILE = "_fingerprints.json"
+
+# Bump when the fingerprint recipe itself changes
+_FINGERPRINT_VERSION = 1
+
+_HASH_SEED = 0
+
+# (context attribute, key column in that frame, card-side key kind)
+_KEYED_INPUTS: tuple[tuple[str, str, str], ...] = (
+    ("sets_lf", "code", "setCode"),
+    ("identifiers_lf", "scryfallId", "scryfallId"),
+    ("uuid_cache_lf", "scryfallId", "scryfallId"),
+    ("languages_lf", "scryfallId", "scryfallId"),
+    ("face_flavor_names_df", "scryfallId", "scryfallId"),
+    ("oracle_data_lf", "oracleId", "oracleId"),
+    ("set_number_lf", "setCode", "setCode"),
+    ("signatures_lf", "setCode", "setCode"),
+    ("watermark_overrides_lf", "setCode", "setCode"),
+    ("_mcm_lookup_enriched", "setCode", "setCode"),
+    ("mcm_lookup_lf", "name", "name"),
+    ("name_lf", "name", "name"),
+    ("gatherer_lf", "multiverseId", "multiverseId"),
+    ("tcg_alt_foil_lf", "tcgplayerProductId", "tcgplayerProductId"),
+    ("card_to_products_lf", "uuid", "uuid"),
+)
+
+# Lookups applied to a single set only (joined without a set key)
+_SET_SCOPED_INPUTS: dict[str, str] = {
+    "sld_subsets_lf": "SLD",
+}
+
+# Resource dicts keyed by set code or scryfallId
+_KEYED_RESOURCES: tuple[tuple[str, str], ...] = (
+    ("card_enrichment", "setCode"),
+    ("scryfall_overrides", "scryfallId"),
+)
+
+# Resource files whose contents reach the fingerprint through a keyed input
+_KEYED_RESOURCE_FILES = frozenset(
+    {
+        "card_enrichment.json",
+        "scryfall_overrides.json",
+        "set_code_watermarks.json",
+        "world_championship_signatures.json",
+    }
+)
+
+# Non-file inputs with no per-set key
+_GLOBAL_ATTRS: tuple[str, ...] = (
+    "unlimited_cards",
+    "standard_legal_sets",
+    "mcm_set_map",
+)
+
+
+def compute_set_fingerprints(
+    ctx: PipelineContext,
+    set_codes: list[str],
+    scryfall_uuid_lf: pl.LazyFrame,
+) -> dict[str, str]:
+    """
+    Compute the input fingerprint of each set in ``set_codes``.
+
+    Args:
+        ctx: Pipeline context with loaded cache and consolidated lookups.
+        set_codes: Upper-cased set codes to fingerprint.
+        scryfall_uuid_lf: Global scryfallId -> uuid pre-pass mapping.
+
+    Returns:
+        Dict of set code -> hex digest.
+    """
+    if ctx.cards_lf is None:
+        raise ValueError("cards_lf is not available in context")
+
+    cards_lf = ctx.cards_lf.with_columns(pl.col("set").str.to_uppercase().alias("_set_upper")).filter(
+        pl.col("_set_upper").is_in(set_codes)
+    )
+    card_keys = _build_card_keys(cards_lf, scryfall_uuid_lf)
+
+    components: dict[str, dict[str, Any]] = {}
+    global_parts: list[str] = [_code_version(), _resource_files_digest()]
+
+    components["cards"] = _group_digests(
+        cards_lf.select(pl.col("_set_upper"), _row_hash_expr(ctx.cards_lf.collect_schema()).alias("_h"))
+    )
+
+    for attr, frame_key, kind in _KEYED_INPUTS:
+        frame = getattr(ctx, attr)
+        if frame is None:
+            continue
+        lf = frame.lazy() if isinstance(frame, pl.DataFrame) else frame
+        if frame_key not in lf.collect_schema().names():
+            global_parts.append(f"{attr}={_frame_digest(lf)}")
+            continue
+        components[attr] = _keyed_digests(lf, frame_key, kind, card_keys)
+
+    for attr, frame_key in _KEYED_RESOURCES:
+        mapping = getattr(ctx, attr)
+        if mapping:
+            components[attr] = _keyed_digests(_dict_frame(mapping, frame_key), frame_key, frame_key, card_keys)
+
+    for attr, code in _SET_SCOPED_INPUTS.items():
+        frame = getattr(ctx, attr)
+        if frame is not None:
+            lf = frame.lazy() if isinstance(frame, pl.DataFrame) else frame
+            components[attr] = {code: _frame_digest(lf)}
+
+    for attr in _GLOBAL_ATTRS:
+        global_parts.append(f"{attr}={_json_digest(getattr(ctx, attr))}")
+
+    header = "\n".join(global_parts)
+    fingerprints: dict[str, str] = {}
+    for code in set_codes:
+        lines = [header, *(f"{name}={digests.get(code, 0)}" for name, digests in sorted(components.items()))]
+        fingerprints[code] = hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+    LOGGER.info(f"Computed input fingerprints for {len(fingerprints)} sets ({len(components)} keyed inputs)")
+    return fingerprints
+
+
+def load_fingerprints(parquet_dir: Path | None = None) -> dict[str, str]:
+    """Load stored set fingerprints (empty if missing, unreadable or outdated)."""
+    path = (parquet_dir or constants.CACHE_PATH / "_parquet") / FINGERPRINT_FILE
+    if not path.exists():
+        return {}
+    try:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        LOGGER.warning(f"Ignoring unreadable fingerprint file {path}: {e}")
+        return {}
+    if data.get("version") != _FINGERPRINT_VERSION:
+        return {}
+    return dict(data.get("sets", {}))
+
+
+def save_fingerprints(fingerprints: dict[str, str], parquet_dir: Path | None = None) -> None:
+    """Atomically write set fingerprints next to the card partitions."""
+    parquet_dir = parquet_dir or constants.CACHE_PATH / "_parquet"
+    parquet_dir.mkdir(parents=True, exist_ok=True)
+    path = parquet_dir / FINGERPRINT_FILE
+    tmp = path.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump({"version": _FINGERPRINT_VERSION, "sets": dict(sorted(fingerprints.items()))}, f, indent=1)
+    os.replace(tmp, path)
+
+
+def has_partitions(set_code: str) -> bool:
+    """Whether a set has a card or token partition on disk to reuse."""
+    safe_code = get_windows_safe_set_code(set_code)
+    return any(
+        (constants.CACHE_PATH / dir_name / f"setCode={safe_code}" / "0.parquet").exists()
+        for dir_name in ("_parquet", "_parquet_tokens")
+    )
+
+
+def _build_card_keys(cards_lf: pl.LazyFrame, scryfall_uuid_lf: pl.LazyFrame) -> dict[str, pl.LazyFrame]:
+    """Build (set, key) frames for every card-side key kind the stages join on."""
+    schema = cards_lf.collect_schema()
+    names = schema.names()
+
+    def _keys(*exprs: pl.Expr) -> pl.LazyFrame:
+        frames = [
+            cards_lf.select(pl.col("_set_upper"), expr.cast(pl.List(pl.String)).alias("_key")).explode("_key")
+            for expr in exprs
+        ]
+        return pl.concat(frames).drop_nulls("_key").unique()
+
+    def _face_field(field: str) -> pl.Expr | None:
+        dtype = schema.get("cardFaces")
+        if not isinstance(dtype, pl.List) or not isinstance(dtype.inner, pl.Struct):
+            return None
+        if field not in [f.name for f in dtype.inner.fields]:
+            return None
+        return pl.col("cardFaces").list.eval(pl.element().struct.field(field))
+
+    def _list(col: str) -> pl.Expr:
+        return pl.concat_list(pl.col(col))
+
+    scryfall_exprs = [_list("id")]
+    if "allParts" in names:
+        scryfall_exprs.append(pl.col("allParts").list.eval(pl.element().struct.field("id")))
+
+    oracle_exprs = [_list("oracleId")] if "oracleId" in names else []
+    face_oracle = _face_field("oracle_id")
+    if face_oracle is not None:
+        oracle_exprs.append(face_oracle)
+
+    name_exprs = [_list("name"), pl.col("name").str.split(" // ")]
+    face_name = _face_field("name")
+    if face_name is not None:
+        name_exprs.append(face_name)
+
+    tcg_exprs = [_list(c) for c in ("tcgplayerId", "tcgplayerEtchedId") if c in names]
+
+    keys: dict[str, pl.LazyFrame] = {
+        "setCode": cards_lf.select(pl.col("_set_upper"), pl.col("_set_upper").alias("_key")).unique(),
+        "scryfallId": _keys(*scryfall_exprs),
+        "name": _keys(*name_exprs).with_columns(_normalize_key(pl.col("_key"), "name")).unique(),
+    }
+    if oracle_exprs:
+        keys["oracleId"] = _keys(*oracle_exprs)
+    if "multiverseIds" in names:
+        keys["multiverseId"] = _keys(pl.col("multiverseIds"))
+    if tcg_exprs:
+        keys["tcgplayerProductId"] = _keys(*tcg_exprs)
+    keys["uuid"] = (
+        keys["scryfallId"]
+        .join(scryfall_uuid_lf.rename({"scryfallId": "_key"}), on="_key", how="inner")
+        .select(pl.col("_set_upper"), pl.col("uuid").alias("_key"))
+        .unique()
+    )
+    return keys
+
+
+def _normalize_key(expr: pl.Expr, kind: str) -> pl.Expr:
+    """Normalize a join key so card and lookup sides compare like the stages do."""
+    expr = expr.cast(pl.String)
+    if kind == "setCode":
+        return expr.str.to_uppercase()
+    if kind == "name":
+        # MCM joins on lowercased names with "(V.1)" variant suffixes stripped
+        return expr.str.to_lowercase().str.replace(r"\s*\(v\.\d+\)\s*$", "")
+    return expr
+
+
+def _keyed_digests(
+    lf: pl.LazyFrame,
+    frame_key: str,
+    kind: str,
+    card_keys: dict[str, pl.LazyFrame],
+) -> dict[str, int]:
+    """Digest the lookup rows matching each set's card keys."""
+    keys = card_keys.get(kind)
+    if keys is None:
+        return {}
+    hashed = lf.select(
+        _normalize_key(pl.col(frame_key), kind).alias("_key"),
+        _row_hash_expr(lf.collect_schema()).alias("_h"),
+    )
+    return _group_digests(keys.join(hashed, on="_key", how="inner").select("_set_upper", "_h"))
+
+
+def _row_hash_expr(schema: pl.Schema) -> pl.Expr:
+    """Hash every column of a row; categoricals hash by value, not physical index."""
+    cols = [
+        pl.col(name).cast(pl.String) if isinstance(dtype, (pl.Categorical, pl.Enum)) else pl.col(name)
+        for name, dtype in schema.items()
+    ]
+    return pl.struct(cols).hash(seed=_HASH_SEED)
+
+
+def _group_digests(lf: pl.LazyFrame) -> dict[str, int]:
+    """Combine per-row hashes into one order-independent digest per set."""
+    df = (
+        lf.group_by("_set_upper")
+        .agg(pl.col("_h").sort())
+        .with_columns(pl.col("_h").hash(seed=_HASH_SEED).alias("_digest"))
+        .select("_set_upper", "_digest")
+        .collect()
+    )
+    return dict(zip(df["_set_upper"].to_list(), df["_digest"].to_list(), strict=True))
+
+
+def _frame_digest(lf: pl.LazyFrame) -> str:
+    """Order-independent digest of a whole frame (wrapping sum of row hashes)."""
+    row = lf.select(
+        _row_hash_expr(lf.collect_schema()).sum().alias("_sum"),
+        pl.len().alias("_len"),
+    ).collect()
+    return f"{row['_sum'][0]}:{row['_len'][0]}"
+
+
+def _dict_frame(mapping: dict[str, Any], key_col: str) -> pl.LazyFrame:
+    """Turn a resource dict into a (key, serialized value) frame."""
+    return pl.LazyFrame(
+        {
+            key_col: list(mapping.keys()),
+            "_value": [orjson.dumps(v, option=orjson.OPT_SORT_KEYS).decode() for v in mapping.values()],
+        },
+        schema={key_col: pl.String, "_value": pl.String},
+    )
+
+
+def _json_digest(value: Any) -> str:
+    """Stable digest of a JSON-like value (sets are sorted)."""
+    if isinstance(value, (set, frozenset)):
+        value = sorted(value)
+    return hashlib.sha256(orjson.dumps(value, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _code_version() -> str:
+    """Digest of the package sources and Polars version."""
+    digest = hashlib.sha256(f"{_FINGERPRINT_VERSION}:{pl.__version__}".encode())
+    package_dir = constants.TOP_LEVEL_DIR / "mtgjson5"
+    for path in sorted(package_dir.rglob("*.py")):
+        digest.update(path.relative_to(package_dir).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _resource_files_digest() -> str:
+    """Digest of resource files not already covered by a keyed input."""
+    digest = hashlib.sha256()
+    for path in sorted(constants.RESOURCE_PATH.glob("*.json")):
+        if path.name in _KEYED_RESOURCE_FILES:
+            continue
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
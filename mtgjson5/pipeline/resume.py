@@ -0,0 +1,150 @@
+"""
+Resumable card pipeline state.
+
+A build writes a batch manifest before its first batch runs:
+
+    - the run key, a digest of the set fingerprints (or, for scryfallId-
+      filtered builds, of the set codes and ids) the plan was made for
+    - the planned batches, in order
+    - the indexes of batches whose ``setCode=`` partitions are complete
+
+Each running batch also persists the frames materialized at the pipeline's
+collect points, keeping only the latest. ``--resume-pipeline`` reuses the
+stored plan when the run key matches, skips completed batches and restarts
+the first incomplete one from its latest collect point. The state is removed
+once every batch has completed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import polars as pl
+
+from mtgjson5 import constants
+from mtgjson5.utils import LOGGER
+
+MANIFEST_FILE = "manifest.json"
+
+# Bump when the manifest layout or the collect points change
+_MANIFEST_VERSION = 1
+
+
+def resume_dir() -> Path:
+    """Directory holding the batch manifest and stage checkpoints."""
+    return constants.CACHE_PATH / "_pipeline_resume"
+
+
+def run_key(
+    set_codes: Iterable[str],
+    fingerprints: dict[str, str],
+    scryfall_ids: set[str] | None = None,
+) -> str:
+    """
+    Identify the inputs a batch plan was made for.
+
+    Args:
+        set_codes: Every set the build was asked for (before incremental skips)
+        fingerprints: Input fingerprints of those sets (empty for filtered builds)
+        scryfall_ids: Optional scryfallId filter of the build
+    """
+    payload = {
+        "sets": {code: fingerprints.get(code, "") for code in sorted(set_codes)},
+        "scryfall_ids": sorted(scryfall_ids or ()),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class BatchManifest:
+    """Planned batches of a pipeline run and which of them have completed."""
+
+    def __init__(
+        self,
+        key: str,
+        batches: list[list[str]],
+        completed: Iterable[int] = (),
+        root: Path | None = None,
+    ) -> None:
+        self.key = key
+        self.batches = batches
+        self.completed: set[int] = set(completed)
+        self.root = root or resume_dir()
+
+    @classmethod
+    def load(cls, key: str, root: Path | None = None) -> BatchManifest | None:
+        """Load the stored manifest if it was written for ``key``."""
+        root = root or resume_dir()
+        path = root / MANIFEST_FILE
+        if not path.exists():
+            return None
+        try:
+            with path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            LOGGER.warning(f"Ignoring unreadable pipeline manifest {path}: {e}")
+            return None
+        if data.get("version") != _MANIFEST_VERSION or data.get("key") != key:
+            return None
+        return cls(key, [list(batch) for batch in data["batches"]], data.get("completed", ()), root)
+
+    def save(self) -> None:
+        """Atomically write the manifest."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / MANIFEST_FILE
+        tmp = path.with_suffix(".json.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": _MANIFEST_VERSION,
+                    "key": self.key,
+                    "batches": self.batches,
+                    "completed": sorted(self.completed),
+                },
+                f,
+                indent=1,
+            )
+        os.replace(tmp, path)
+
+    def pending(self) -> dict[int, list[str]]:
+        """Batch index -> set codes of every batch still to run."""
+        return {idx: codes for idx, codes in enumerate(self.batches) if idx not in self.completed}
+
+    def batch_dir(self, batch_idx: int) -> Path:
+        """Stage checkpoint directory of one batch."""
+        return self.root / f"batch_{batch_idx}"
+
+    def mark_complete(self, batch_idx: int) -> None:
+        """Record a batch's partitions as complete and drop its stage checkpoints."""
+        self.completed.add(batch_idx)
+        self.save()
+        shutil.rmtree(self.batch_dir(batch_idx), ignore_errors=True)
+
+    def clear(self) -> None:
+        """Remove all resume state once the run has finished."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def save_stage_checkpoint(batch_dir: Path, name: str, df: pl.DataFrame) -> None:
+    """Persist a collect point's frame, replacing the batch's earlier checkpoints."""
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    path = batch_dir / f"{name}.parquet"
+    tmp = path.with_suffix(".parquet.tmp")
+    df.write_parquet(tmp, compression="lz4")
+    os.replace(tmp, path)
+    for stale in batch_dir.glob("*.parquet"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+
+def load_stage_checkpoint(batch_dir: Path, names: Sequence[str]) -> tuple[str, pl.LazyFrame] | None:
+    """Latest persisted collect point among ``names`` (in pipeline order), if any."""
+    for name in reversed(names):
+        path = batch_dir / f"{name}.parquet"
+        if path.exists():
+            return name, pl.scan_parquet(path)
+    return None
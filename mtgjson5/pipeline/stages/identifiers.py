@@ -9,7 +9,6 @@ from __future__ import annotations
 
 import polars as pl
 
-from mtgjson5.consts import LANGUAGE_MAP
 from mtgjson5.data import PipelineContext
 from mtgjson5.pipeline.stages.explode import _uuid5_concat_expr, _uuid5_expr
 
@@ -386,52 +385,8 @@ def fix_foreigndata_for_faces(
     """
     side_to_index = {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4}
 
-    # Build per-face lookup for non-primary faces
-    face_lookup = None
-    if ctx.cards_lf is not None:
-        cards_df = (
-            ctx.cards_lf.filter((pl.col("lang") != "en") & (pl.col("cardFaces").list.len() > 1))
-            .select(["lang", "cardFaces", "set", "collectorNumber"])
-            .collect()
-            if isinstance(ctx.cards_lf, pl.LazyFrame)
-            else ctx.cards_lf.filter((pl.col("lang") != "en") & (pl.col("cardFaces").list.len() > 1))
-        )
-
-        face_lookup = (
-            cards_df.with_columns(
-                [
-                    pl.col("set").str.to_uppercase().alias("setCode"),
-                    pl.col("lang").replace_strict(LANGUAGE_MAP, default=pl.col("lang")).alias("language"),
-                    pl.int_ranges(pl.col("cardFaces").list.len()).alias("_face_idx"),
-                ]
-            )
-            .explode(["cardFaces", "_face_idx"])
-            .with_columns(
-                [
-                    pl.col("_face_idx").alias("face_index"),
-                    pl.coalesce(
-                        pl.col("cardFaces").struct.field("printed_name"),
-                        pl.col("cardFaces").struct.field("name"),
-                    ).alias("_faceName"),
-                    pl.col("cardFaces").struct.field("printed_text").alias("_text"),
-                    pl.col("cardFaces").struct.field("printed_type_line").alias("_type"),
-                    pl.col("cardFaces").struct.field("flavor_text").alias("_flavorText"),
-                ]
-            )
-            .select(
-                [
-                    "setCode",
-                    pl.col("collectorNumber").alias("number"),
-                    "language",
-                    "face_index",
-                    "_faceName",
-                    "_text",
-                    "_type",
-                    "_flavorText",
-                ]
-            )
-            .lazy()
-        )
+    # Per-face lookup for non-primary faces, consolidated once per build
+    face_lookup = ctx.get_face_foreign_lookup()
 
     # Process all foreignData in one pass
     fd_processed = (
@@ -466,8 +421,7 @@ def fix_foreigndata_for_faces(
 
     # Join face lookup for non-primary faces if available
     if face_lookup is not None:
-        # Add a marker column to face_lookup to track successful joins
-        face_lookup = face_lookup.with_columns(pl.lit(True).alias("_has_face_data"))
+        # face_lookup carries a _has_face_data marker to track successful joins
         fd_processed = fd_processed.join(
             face_lookup,
             left_on=["setCode", "number", "_fd_lang", "_face_index"],
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import contextlib
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -35,6 +36,7 @@ from mtgjson5.models.schemas import (
 )
 from mtgjson5.pipeline.stages.derived import link_foil_nonfoil_versions
 from mtgjson5.pipeline.stages.relationships import add_variations
+from mtgjson5.polars_utils import get_windows_safe_set_code
 from mtgjson5.utils import LOGGER, to_camel_case
 
 
@@ -508,6 +510,43 @@ def build_id_mappings_from_parquet(ctx: PipelineContext) -> None:
     LOGGER.info("Post-batch ID mappings built from parquet partitions")
 
 
+# Rows per row group in set partition files; almost every set fits in one
+_PARTITION_ROW_GROUP_SIZE = 64 * 1024
+
+
+def write_set_partitions(df: pl.DataFrame, out_dir: Path) -> int:
+    """
+    Write one ``setCode=*/0.parquet`` partition per set, concurrently.
+
+    Polars releases the GIL while encoding, so the partitions are written
+    from a thread pool sized to Polars' own pool.
+
+    Args:
+        df: Collected cards or tokens with a ``setCode`` column
+        out_dir: Partition root (``_parquet`` or ``_parquet_tokens``)
+
+    Returns:
+        Number of partitions written.
+    """
+    partitions = df.partition_by("setCode", as_dict=True, maintain_order=False)
+
+    def _write(set_code: str, set_df: pl.DataFrame) -> None:
+        set_path = out_dir / f"setCode={get_windows_safe_set_code(set_code)}"
+        set_path.mkdir(exist_ok=True)
+        set_df.write_parquet(
+            set_path / "0.parquet",
+            statistics=True,
+            row_group_size=_PARTITION_ROW_GROUP_SIZE,
+        )
+
+    workers = max(1, min(len(partitions), pl.thread_pool_size()))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_write, key[0], set_df) for key, set_df in partitions.items()]
+        for future in futures:
+            future.result()
+    return len(partitions)
+
+
 def sink_cards(ctx: PipelineContext, skip_id_mappings: bool = False) -> None:
     """Sink cards and tokens to partitioned parquet files."""
     cards_dir = constants.CACHE_PATH / "_parquet"
@@ -550,7 +589,7 @@ def sink_cards(ctx: PipelineContext, skip_id_mappings: bool = False) -> None:
     ]:
         LOGGER.info(f"Collecting {label}...")
 
-        # Collect ONCE - don't re-evaluate the lazy plan for each chunk
+        # One frame in memory at a time; only the partition writes run concurrently
         df = lazy_frame.collect()
         LOGGER.info(f"  Collected {df.height:,} {label}")
 
@@ -558,22 +597,11 @@ def sink_cards(ctx: PipelineContext, skip_id_mappings: bool = False) -> None:
             LOGGER.info(f"  No {label} to write")
             continue
 
-        # Partition by setCode and write each partition
-        LOGGER.info(f"  Partitioning and writing {label}...")
-        partitions = df.partition_by("setCode", as_dict=False)
-        LOGGER.info(f"  Writing {len(partitions)} set partitions...")
-
-        for set_df in partitions:
-            s_code = set_df.get_column("setCode")[0]
-            from mtgjson5.polars_utils import get_windows_safe_set_code
-
-            safe_code = get_windows_safe_set_code(s_code)
-            set_path = out_dir / f"setCode={safe_code}"
-            set_path.mkdir(exist_ok=True)
-            set_df.write_parquet(set_path / "0.parquet")
+        written = write_set_partitions(df, out_dir)
+        del df
+        LOGGER.info(f"  {label} complete ({written} set partitions)")
 
-        del df, partitions
-        LOGGER.info(f"  {label} complete")
+    del clf, tlf
 
     # Data is on disk — release the in-memory pipeline DataFrame
     ctx.final_cards_lf = None
@@ -14,6 +14,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import sys
 import time
 from collections.abc import Iterator
 from contextlib import contextmanager
@@ -35,6 +36,23 @@ def _get_rss_mb() -> float:
         return -1.0
 
 
+def get_peak_rss_mb() -> float:
+    """Return this process's peak RSS in MB, or -1 if it cannot be measured."""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+
+            info = psutil.Process(os.getpid()).memory_info()
+            return float(getattr(info, "peak_wset", info.rss) / _MB)
+        except ImportError:
+            return -1.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return float(peak / _MB if sys.platform == "darwin" else peak / 1024)
+
+
 def _get_children_rss_mb() -> float:
     """Return total RSS of all child processes in MB, or 0 if unavailable."""
     try:
@@ -54,6 +72,7 @@ class PipelineProfiler:
         self._use_tracemalloc = use_tracemalloc
         self.snapshots: list[dict[str, Any]] = []
         self.subprocess_profiles: list[dict[str, Any]] = []
+        self.step_timings: dict[str, dict[str, Any]] = {}
         self._start_time: float = 0.0
         self._last_time: float = 0.0
         self._started = False
@@ -168,6 +187,31 @@ class PipelineProfiler:
             profile_dict.get("total_wall_seconds", 0),
         )
 
+    def add_step_timings(
+        self,
+        group: str,
+        timings: dict[str, dict[str, Any]],
+        critical_path: list[str] | None = None,
+    ) -> None:
+        """
+        Attach per-step timings of a concurrently executed step graph.
+
+        Args:
+            group: Label for the graph (e.g. ``"global_cache"``)
+            timings: Step name -> ``{"start", "end", "seconds", "deps"}``
+                (offsets in seconds from the start of the graph)
+            critical_path: Step names that bounded the graph's wall time
+        """
+        if not self.enabled or not timings:
+            return
+        self.step_timings[group] = {"steps": timings, "critical_path": critical_path or []}
+        LOGGER.info(
+            "[profile] %s: %d steps, critical path %s",
+            group,
+            len(timings),
+            " -> ".join(critical_path or []) or "-",
+        )
+
     def finish(self) -> dict[str, Any]:
         """Stop profiling and return the full report dict."""
         if not self.enabled or not self._started:
@@ -189,6 +233,8 @@ class PipelineProfiler:
 
         if self.subprocess_profiles:
             report["subprocesses"] = self.subprocess_profiles
+        if self.step_timings:
+            report["step_timings"] = self.step_timings
 
         if self._use_tracemalloc:
             import tracemalloc
@@ -214,6 +260,8 @@ class PipelineProfiler:
         }
         if self.subprocess_profiles:
             report["subprocesses"] = self.subprocess_profiles
+        if self.step_timings:
+            report["step_timings"] = self.step_timings
         if self._use_tracemalloc:
             report["tracemalloc_peak_mb"] = max((s.get("tracemalloc_peak_mb", 0) for s in self.snapshots), default=0)
 
@@ -276,6 +324,17 @@ class PipelineProfiler:
 
         lines.append("=" * 100)
 
+        # Step graphs (concurrent steps, so listed by start offset)
+        for group, graph in report.get("step_timings", {}).items():
+            lines.append("")
+            lines.append(f"Step graph: {group}  critical path: {' -> '.join(graph.get('critical_path', [])) or '-'}")
+            lines.append(f"  {'Step':<42} {'Start(s)':>8} {'End(s)':>8} {'Dur(s)':>8}")
+            lines.append("  " + "-" * 80)
+            steps = sorted(graph.get("steps", {}).items(), key=lambda kv: kv[1]["start"])
+            for name, step in steps:
+                marker = " !" if "error" in step else ""
+                lines.append(f"  {name:<42} {step['start']:>8.1f} {step['end']:>8.1f} {step['seconds']:>8.1f}{marker}")
+
         # Subprocess profiles
         for sp in report.get("subprocesses", []):
             lines.append("")
@@ -346,8 +405,12 @@ class SubprocessProfiler:
         self.pid = os.getpid()
         self.checkpoint("start")
 
-    def checkpoint(self, name: str) -> None:
-        """Record a named checkpoint with timing and RSS data."""
+    def checkpoint(self, name: str, *, top_n: int = 0) -> None:
+        """Record a named checkpoint with timing and RSS data.
+
+        ``top_n`` is accepted for signature parity with ``PipelineProfiler``
+        and ignored (subprocesses do not run tracemalloc).
+        """
         if not self.enabled:
             return
         now = time.perf_counter()
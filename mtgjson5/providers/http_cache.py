@@ -0,0 +1,237 @@
+"""
+Conditional HTTP revalidation cache shared by providers.
+
+Stores the ``ETag`` / ``Last-Modified`` validators of every upstream URL whose
+response has been persisted to the local cache. On later runs a conditional
+request (``If-None-Match`` / ``If-Modified-Since``) decides whether the cached
+artifacts (parquet, NDJSON, JSON) can be reused: a ``304 Not Modified`` means
+upstream has not changed and nothing needs to be re-downloaded.
+
+Two usage patterns:
+
+- Callers that own the download (e.g. the Scryfall bulk stream) send
+  ``conditional_headers(url)`` with the real request and ``record()`` the
+  response headers once the body has been persisted.
+- Loaders that delegate the download to a provider call ``is_fresh(url, ...)``
+  first. It probes with a conditional GET (headers only); on a ``200`` the new
+  validators are staged and promoted with ``commit(url)`` after the loader has
+  written its cache files, so a failed refresh never marks stale data fresh.
+
+URLs without stored validators (servers that send none, caches written before
+this layer existed) and network errors fall back to the file-age heuristic.
+Each entry also records when upstream last confirmed the cached copy, so a
+``304`` keeps that fallback meaningful without touching the artifacts (their
+mtimes feed the lazy-plan fingerprints in ``data.cache``).
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from mtgjson5 import constants
+
+LOGGER = logging.getLogger(__name__)
+
+VALIDATOR_FILE = "_http_validators.json"
+
+_PROBE_HEADERS = {"User-Agent": "MTGJSON/5.0 (https://mtgjson.com)"}
+
+
+def _extract_validators(headers: Mapping[str, str]) -> dict[str, Any]:
+    """Pick the cache validators out of a response header mapping."""
+    validators: dict[str, Any] = {}
+    etag = headers.get("ETag")
+    if etag:
+        validators["etag"] = etag
+    last_modified = headers.get("Last-Modified")
+    if last_modified:
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def artifacts_age_hours(artifacts: Iterable[Path]) -> float | None:
+    """Age of the oldest artifact in hours, or None if any is missing."""
+    oldest = None
+    for path in artifacts:
+        if not path.exists():
+            return None
+        mtime = path.stat().st_mtime
+        oldest = mtime if oldest is None else min(oldest, mtime)
+    if oldest is None:
+        return None
+    return (time.time() - oldest) / 3600
+
+
+class HttpRevalidationCache:
+    """Per-URL ETag/Last-Modified store with conditional-request helpers."""
+
+    def __init__(self, path: Path | None = None, timeout: float = 15.0) -> None:
+        self.path = path or constants.CACHE_PATH / VALIDATOR_FILE
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        self._pending: dict[str, dict[str, Any]] = {}
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                return dict(json.load(f))
+        except (OSError, ValueError) as e:
+            LOGGER.warning(f"Ignoring unreadable HTTP validator cache {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        """Atomically write the validator store (caller holds the lock)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(dict(sorted(self._entries.items())), f, indent=1)
+        os.replace(tmp, self.path)
+
+    def has_validators(self, url: str) -> bool:
+        """Whether validators are stored for ``url``."""
+        with self._lock:
+            return url in self._entries
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Request headers that make a GET for ``url`` conditional (empty if unknown)."""
+        with self._lock:
+            entry = self._entries.get(url, {})
+        headers = {}
+        if "etag" in entry:
+            headers["If-None-Match"] = entry["etag"]
+        if "last_modified" in entry:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(self, url: str, headers: Mapping[str, str]) -> None:
+        """Store the validators of a response whose body has been persisted."""
+        validators = _extract_validators(headers)
+        with self._lock:
+            self._pending.pop(url, None)
+            if validators:
+                self._entries[url] = validators
+            elif self._entries.pop(url, None) is None:
+                return
+            self._save()
+
+    def commit(self, *urls: str) -> None:
+        """Promote validators staged by ``is_fresh()`` after the cache files were rewritten."""
+        with self._lock:
+            changed = False
+            for url in urls:
+                if url not in self._pending:
+                    continue
+                validators = self._pending.pop(url)
+                if validators:
+                    self._entries[url] = validators
+                elif self._entries.pop(url, None) is None:
+                    continue
+                changed = True
+            if changed:
+                self._save()
+
+    def forget(self, url: str) -> None:
+        """Drop stored validators so the next check re-downloads ``url``."""
+        with self._lock:
+            self._pending.pop(url, None)
+            if self._entries.pop(url, None) is not None:
+                self._save()
+
+    def age_hours(self, url: str, artifacts: Iterable[Path]) -> float | None:
+        """
+        Hours since the cached ``artifacts`` were last known to match ``url``.
+
+        That is the younger of the artifacts' own age and the last successful
+        revalidation; None if any artifact is missing.
+        """
+        age_hours = artifacts_age_hours(artifacts)
+        if age_hours is None:
+            return None
+        with self._lock:
+            verified_at = self._entries.get(url, {}).get("verified_at")
+        if verified_at is None:
+            return age_hours
+        return min(age_hours, max(0.0, time.time() - float(verified_at)) / 3600)
+
+    def _mark_verified(self, url: str) -> None:
+        """Record that upstream confirmed the cached copy of ``url`` just now."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return
+            entry["verified_at"] = time.time()
+            self._save()
+
+    def is_fresh(
+        self,
+        url: str,
+        artifacts: Iterable[Path],
+        max_age_hours: float = 290.0,
+    ) -> bool:
+        """
+        Whether the cached ``artifacts`` downloaded from ``url`` can be reused.
+
+        Args:
+            url: Upstream URL the artifacts were built from
+            artifacts: Local cache files derived from the response
+            max_age_hours: Age fallback when ``url`` cannot be revalidated
+
+        Returns:
+            True on ``304 Not Modified`` (or a young enough cache when
+            revalidation is unavailable); False when the caller must refresh.
+        """
+        age_hours = self.age_hours(url, artifacts)
+        has_entry = self.has_validators(url)
+
+        # Caches without validators (or servers that send none): age heuristic,
+        # and only touch the network when a refresh is due anyway.
+        if age_hours is not None and not has_entry:
+            if age_hours < max_age_hours:
+                return True
+            self._probe(url, {})
+            return False
+
+        if age_hours is None:
+            self._probe(url, {})
+            return False
+
+        status = self._probe(url, self.conditional_headers(url))
+        if status == 304:
+            LOGGER.debug(f"Not modified upstream: {url}")
+            # Keep the age fallback meaningful for runs that cannot revalidate
+            self._mark_verified(url)
+            return True
+        if status is None:
+            return age_hours < max_age_hours
+        return False
+
+    def _probe(self, url: str, headers: dict[str, str]) -> int | None:
+        """Headers-only GET; stages validators from a 200. None on network/server errors."""
+        try:
+            with requests.get(
+                url,
+                headers={**_PROBE_HEADERS, **headers},
+                timeout=self.timeout,
+                stream=True,
+            ) as response:
+                status = response.status_code
+                if status == 200:
+                    validators = _extract_validators(response.headers)
+                    with self._lock:
+                        self._pending[url] = validators
+        except requests.RequestException as e:
+            LOGGER.debug(f"Revalidation of {url} failed: {e}")
+            return None
+        if status not in (200, 304):
+            return None
+        return status
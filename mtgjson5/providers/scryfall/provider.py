@@ -2,23 +2,100 @@
 Scryfall Provider (v2)
 Complete Scryfall provider - bulk downloads + API access.
 
-This module provides async streaming download and rapid NDJSON conversion
-of Scryfall bulk data files for Polars ingestion, plus API access methods.
+This module provides async streaming download with overlapped NDJSON
+conversion of Scryfall bulk data files for Polars ingestion, a set-partitioned parquet
+store of the card bulk file, plus API access methods.
 """
 
 import asyncio
 import gzip
+import io
 import json
 import logging
 import pathlib
+import queue
+import shutil
 import time
 from typing import IO, Any, cast
 
 import aiohttp
 import ijson
 import orjson
+import polars as pl
 
 from mtgjson5 import constants
+from mtgjson5.providers.http_cache import HttpRevalidationCache, artifacts_age_hours
+
+
+class _ChunkQueueReader(io.RawIOBase):
+    """
+    Readable byte stream fed from a bounded queue of download chunks.
+
+    The event loop pushes response chunks with ``feed()`` while a converter
+    thread reads them through the regular file API (``gzip``/``ijson``/line
+    iteration). ``feed(None)`` marks end of stream; ``abort()`` makes the
+    reader raise so the converter exits on a failed download, and closing the
+    reader tells the producer to stop feeding.
+    """
+
+    _POLL_SECONDS = 0.5
+
+    def __init__(self, max_chunks: int) -> None:
+        super().__init__()
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=max_chunks)
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._error: BaseException | None = None
+        self._consumer_closed = False
+
+    def readable(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self._consumer_closed = True
+        super().close()
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            if self._eof:
+                return 0
+            if self._error is not None:
+                raise OSError("Bulk download aborted") from self._error
+            try:
+                chunk = self._queue.get(timeout=self._POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if chunk is None:
+                self._eof = True
+                return 0
+            self._pending = memoryview(chunk)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    async def feed(self, chunk: bytes | None) -> bool:
+        """Queue a chunk (``None`` = end of stream); False once the consumer has closed."""
+        if self._consumer_closed:
+            return False
+        try:
+            self._queue.put_nowait(chunk)
+            return True
+        except queue.Full:
+            return await asyncio.to_thread(self._put_blocking, chunk)
+
+    def _put_blocking(self, chunk: bytes | None) -> bool:
+        while not self._consumer_closed:
+            try:
+                self._queue.put(chunk, timeout=self._POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def abort(self, exc: BaseException) -> None:
+        """Fail the consumer side with ``exc`` (producer hit an error)."""
+        self._error = exc
 
 
 class ScryfallProvider:
@@ -55,9 +132,35 @@ class ScryfallProvider:
     RATE_LIMIT_BACKOFF_BASE: float = 2.0
     RATE_LIMIT_MAX_RETRIES: int = 5
 
+    # Bulk types also persisted as a set-partitioned parquet store
+    PARQUET_BULK_TYPES: tuple[str, ...] = ("all_cards",)
+    # Columns Scryfall emits as numbers for some cards and strings for others
+    BULK_STRING_COLUMNS: tuple[str, ...] = (
+        "power",
+        "toughness",
+        "loyalty",
+        "defense",
+        "hand_modifier",
+        "life_modifier",
+    )
+    # Columns absent from some bulk exports that downstream stages expect
+    BULK_OPTIONAL_COLUMNS: dict[str, type[pl.DataType]] = {
+        "defense": pl.String,
+        "flavor_name": pl.String,
+    }
+    BULK_META_SUFFIX: str = ".meta.json"
+    # Reuse window for cached bulk files that have no stored HTTP validators
+    BULK_MAX_AGE_HOURS: float = 72.0
+
+    # Streaming download -> NDJSON conversion: chunk size and queue depth
+    # (bounds in-flight compressed data to ~16 MB between reader and converter)
+    STREAM_CHUNK_SIZE: int = 1024 * 256
+    STREAM_QUEUE_CHUNKS: int = 64
+
     def __init__(self) -> None:
         self._cards_without_limits: set[str] | None = None
         self._rate_limiter: asyncio.Semaphore = asyncio.Semaphore(2)
+        self._bulk_updated_at: dict[str, str] = {}
 
     def _delay_for_url(self, url: str) -> float:
         """Return the appropriate rate-limit delay based on the Scryfall endpoint."""
@@ -109,6 +212,8 @@ class ScryfallProvider:
             if item.get("type") == bulk_type:
                 download_uri = self._select_download_uri(item)
                 if download_uri:
+                    if item.get("updated_at"):
+                        self._bulk_updated_at[bulk_type] = str(item["updated_at"])
                     return download_uri
 
         raise ValueError(f"Unknown bulk type: {bulk_type}")
@@ -118,24 +223,50 @@ class ScryfallProvider:
         session: aiohttp.ClientSession,
         url: str,
         destination: pathlib.Path,
+        http_cache: HttpRevalidationCache | None = None,
+        *,
+        revalidate: bool = True,
     ) -> pathlib.Path:
-        """Stream a bulk file to a temp file, then convert it to NDJSON on disk."""
-        self.LOGGER.info(f"Downloading {url}...")
+        """Stream a bulk file into a converter thread that writes NDJSON as chunks arrive.
+
+        The response body never touches disk in its compressed form: chunks are
+        handed to a ``_ChunkQueueReader`` and decompressed/re-framed by
+        ``_convert_stream_to_ndjson`` while the download is still running, so the
+        total time is bounded by the network rather than network + conversion.
 
+        With ``http_cache`` and an existing ``destination`` the request is
+        conditional (unless ``revalidate`` is False); a ``304 Not Modified``
+        keeps the cached file untouched.
+        """
         destination.parent.mkdir(parents=True, exist_ok=True)
         tmp = destination.with_name(destination.name + ".part")
 
+        headers = {}
+        if http_cache is not None and revalidate and destination.exists():
+            headers = http_cache.conditional_headers(url)
+        self.LOGGER.info(f"{'Revalidating' if headers else 'Downloading'} {url}...")
+
         downloaded = 0
         last_log = time.monotonic()
         last_downloaded = 0
 
-        async with session.get(url) as response:
-            response.raise_for_status()
-            actual_size = int(response.headers.get("Content-Length", 0))
-
-            with tmp.open("wb") as f:
-                async for chunk in response.content.iter_chunked(1024 * 256):
-                    f.write(chunk)
+        reader = _ChunkQueueReader(self.STREAM_QUEUE_CHUNKS)
+        convert: asyncio.Future[int] | None = None
+
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    self.LOGGER.info(f"Not modified, using cached {destination.name}")
+                    return destination
+                response.raise_for_status()
+                response_headers = dict(response.headers)
+                actual_size = int(response.headers.get("Content-Length", 0))
+                convert = asyncio.ensure_future(asyncio.to_thread(self._convert_queued_to_ndjson, reader, tmp))
+
+                async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                    if not await reader.feed(chunk):
+                        # Converter stopped consuming (finished or failed)
+                        break
                     downloaded += len(chunk)
                     now = time.monotonic()
                     elapsed = now - last_log
@@ -155,33 +286,52 @@ class ScryfallProvider:
                             f"@ {speed_label}"
                         )
 
-        self.LOGGER.info(f"Downloaded {downloaded / (1024**2):.1f} MB, extracting...")
-
-        # asyncio.to_thread to offload the blocking file conversion
-        await asyncio.to_thread(self._convert_file_to_ndjson, tmp, destination)
-        tmp.unlink(missing_ok=True)
+            await reader.feed(None)
+            await convert
+        except BaseException as exc:
+            reader.abort(exc)
+            if convert is not None:
+                await asyncio.gather(convert, return_exceptions=True)
+            tmp.unlink(missing_ok=True)
+            raise
+
+        self.LOGGER.info(f"Downloaded {downloaded / (1024**2):.1f} MB")
+        tmp.replace(destination)
+        if http_cache is not None:
+            http_cache.record(url, response_headers)
         return destination
 
+    def _convert_queued_to_ndjson(self, reader: "_ChunkQueueReader", destination: pathlib.Path) -> int:
+        """Converter-thread entry point; closes ``reader`` so the producer stops feeding."""
+        try:
+            return self._convert_stream_to_ndjson(reader, destination)
+        finally:
+            reader.close()
+
     @staticmethod
-    def _open_maybe_gzip(path: pathlib.Path) -> IO[bytes]:
-        """Open ``path`` for binary reading, transparently decompressing gzip files."""
-        with open(path, "rb") as probe:
-            magic = probe.read(2)
-        if magic == b"\x1f\x8b":
-            return cast("IO[bytes]", gzip.open(path, "rb"))
-        return open(path, "rb")
+    def _wrap_maybe_gzip(stream: IO[bytes] | io.RawIOBase) -> io.BufferedReader | gzip.GzipFile:
+        """Buffer ``stream`` and transparently decompress it if it starts with the gzip magic."""
+        buffered = stream if isinstance(stream, io.BufferedReader) else io.BufferedReader(cast("io.RawIOBase", stream))
+        if buffered.peek(2)[:2] == b"\x1f\x8b":
+            return gzip.GzipFile(fileobj=buffered, mode="rb")
+        return buffered
 
     def _convert_file_to_ndjson(self, source: pathlib.Path, destination: pathlib.Path) -> int:
         """Convert a bulk file (JSONL or legacy JSON array, gzipped or plain) to NDJSON."""
+        with open(source, "rb") as src:
+            return self._convert_stream_to_ndjson(src, destination)
+
+    def _convert_stream_to_ndjson(self, stream: IO[bytes] | io.RawIOBase, destination: pathlib.Path) -> int:
+        """Convert a bulk byte stream (JSONL or legacy JSON array, gzipped or plain) to NDJSON."""
         destination.parent.mkdir(parents=True, exist_ok=True)
 
+        src = self._wrap_maybe_gzip(stream)
         # Sniff the first non-whitespace byte to tell a JSON array from JSONL.
-        with self._open_maybe_gzip(source) as probe:
-            head = probe.read(64).lstrip()
+        head = src.peek(64).lstrip()
         is_json_array = head[:1] == b"["
 
         count = 0
-        with self._open_maybe_gzip(source) as src, destination.open("wb") as dst:
+        with destination.open("wb") as dst:
             if is_json_array:
                 for item in ijson.items(src, "item"):
                     dst.write(orjson.dumps(item, default=str))
@@ -204,10 +354,15 @@ class ScryfallProvider:
         cache_dir: pathlib.Path,
         bulk_types: list[str],
         force_refresh: bool = False,
+        http_cache: HttpRevalidationCache | None = None,
     ) -> dict[str, pathlib.Path]:
         """
         Download multiple bulk files concurrently.
 
+        Cached files are revalidated with conditional requests when
+        ``http_cache`` holds validators for their URL; otherwise they are reused
+        until ``BULK_MAX_AGE_HOURS`` old.
+
         Returns dict mapping bulk_type to file path.
         """
         headers = {
@@ -223,32 +378,130 @@ class ScryfallProvider:
 
             # Download concurrently
             tasks = []
+            cached: set[str] = set()
             for bulk_type, url in urls.items():
                 dest = cache_dir / f"{bulk_type}.ndjson"
-                # local caching for dev convenience - wont matter in prod
                 if not force_refresh and dest.exists() and dest.stat().st_size > 0:
-                    self.LOGGER.info(f"Using cached {bulk_type}")
-                    continue
-                # send to executor to avoid blocking event loop
-                tasks.append(self.download_to_ndjson(session, url, dest))
+                    revalidate = http_cache is not None and http_cache.has_validators(url)
+                    age_hours = artifacts_age_hours([dest]) or 0.0
+                    if not revalidate and age_hours < self.BULK_MAX_AGE_HOURS:
+                        self.LOGGER.info(f"Using cached {bulk_type}")
+                        cached.add(bulk_type)
+                        continue
+                tasks.append(self.download_to_ndjson(session, url, dest, http_cache, revalidate=not force_refresh))
 
+            downloaded = [bt for bt in urls if bt not in cached]
             if tasks:
                 # we waits
                 await asyncio.gather(*tasks)
 
+        for bulk_type in downloaded:
+            self._write_bulk_meta(cache_dir / f"{bulk_type}.ndjson", self._bulk_updated_at.get(bulk_type))
+
+        # Convert once per bulk release so later runs scan typed, partitioned parquet
+        for bulk_type in bulk_types:
+            if bulk_type in self.PARQUET_BULK_TYPES:
+                await asyncio.to_thread(self.ensure_bulk_parquet, cache_dir, bulk_type)
+
         return {bt: cache_dir / f"{bt}.ndjson" for bt in bulk_types}
 
+    @staticmethod
+    def bulk_parquet_dir(cache_dir: pathlib.Path, bulk_type: str = "all_cards") -> pathlib.Path:
+        """Directory of the set-partitioned parquet store for a bulk type."""
+        return cache_dir / f"{bulk_type}_parquet"
+
+    def _write_bulk_meta(self, ndjson_path: pathlib.Path, updated_at: str | None) -> None:
+        """Record the bulk release a downloaded NDJSON file belongs to."""
+        meta_path = ndjson_path.with_name(ndjson_path.name + self.BULK_META_SUFFIX)
+        if updated_at is None:
+            meta_path.unlink(missing_ok=True)
+            return
+        meta_path.write_text(json.dumps({"updated_at": updated_at}), encoding="utf-8")
+
+    def _bulk_version(self, ndjson_path: pathlib.Path) -> str:
+        """Bulk release key: Scryfall's ``updated_at``, or file size/mtime for legacy caches."""
+        meta_path = ndjson_path.with_name(ndjson_path.name + self.BULK_META_SUFFIX)
+        if meta_path.exists():
+            try:
+                updated_at = json.loads(meta_path.read_text(encoding="utf-8")).get("updated_at")
+                if updated_at:
+                    return str(updated_at)
+            except ValueError:
+                pass
+        stat = ndjson_path.stat()
+        return f"stat:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def pin_bulk_schema(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Cast mixed-type columns to strings and add optional columns missing from the export."""
+        schema = lf.collect_schema()
+        cast_exprs = [pl.col(c).cast(pl.String) for c in self.BULK_STRING_COLUMNS if c in schema]
+        missing = [
+            pl.lit(None).cast(dtype).alias(c) for c, dtype in self.BULK_OPTIONAL_COLUMNS.items() if c not in schema
+        ]
+        if cast_exprs or missing:
+            lf = lf.with_columns(cast_exprs + missing)
+        return lf
+
+    def ensure_bulk_parquet(self, cache_dir: pathlib.Path, bulk_type: str = "all_cards") -> pathlib.Path | None:
+        """
+        Convert a bulk NDJSON file into a hive-partitioned (``set=<code>``) parquet store.
+
+        The store is keyed by the bulk release (``updated_at``) and only rebuilt
+        when the NDJSON file belongs to a different release. Every partition is
+        written from one scan, so all files share the same pinned schema.
+
+        Returns:
+            Store directory, or None if the NDJSON file is missing.
+        """
+        source = cache_dir / f"{bulk_type}.ndjson"
+        if not source.exists() or source.stat().st_size == 0:
+            return None
+
+        store_dir = self.bulk_parquet_dir(cache_dir, bulk_type)
+        meta_path = store_dir / f"_bulk{self.BULK_META_SUFFIX}"
+        version = self._bulk_version(source)
+        if meta_path.exists():
+            try:
+                if json.loads(meta_path.read_text(encoding="utf-8")).get("version") == version:
+                    return store_dir
+            except ValueError:
+                pass
+
+        self.LOGGER.info(f"Converting {source.name} to partitioned parquet ({version})...")
+        start = time.monotonic()
+        tmp_dir = store_dir.with_name(store_dir.name + ".tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        lf = self.pin_bulk_schema(pl.scan_ndjson(source, infer_schema_length=100000))
+        lf.sink_parquet(pl.PartitionBy(tmp_dir, key="set", include_key=False), mkdir=True)
+        (tmp_dir / meta_path.name).write_text(json.dumps({"version": version}), encoding="utf-8")
+
+        shutil.rmtree(store_dir, ignore_errors=True)
+        tmp_dir.rename(store_dir)
+        self.LOGGER.info(f"Wrote {store_dir} in {time.monotonic() - start:.1f}s")
+        return store_dir
+
+    @staticmethod
+    def scan_bulk_parquet(store_dir: pathlib.Path) -> pl.LazyFrame:
+        """Scan a partitioned bulk store; filters on ``set`` prune whole partitions."""
+        return pl.scan_parquet(
+            store_dir / "**/*.parquet",
+            hive_partitioning=True,
+            hive_schema={"set": pl.String},
+        )
+
     def download_bulk_files_sync(
         self,
         cache_dir: pathlib.Path,
         bulk_types: list[str] | None = None,
         force_refresh: bool = False,
+        http_cache: HttpRevalidationCache | None = None,
     ) -> dict[str, pathlib.Path]:
         """Sync wrapper for non-async contexts."""
         if bulk_types is None:
             bulk_types = ["all_cards", "rulings"]
         # convenience method for sync contexts
-        return asyncio.run(self.download_bulk_files(cache_dir, bulk_types, force_refresh))
+        return asyncio.run(self.download_bulk_files(cache_dir, bulk_types, force_refresh, http_cache))
 
     async def fetch_all_spellbooks(self) -> dict[str, list[str]]:
         """Fetch all alchemy spellbook mappings from Scryfall."""
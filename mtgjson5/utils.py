@@ -9,9 +9,10 @@ import logging
 import os
 import pathlib
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
-from typing import Any
+from typing import Any, TypeVar
 
 import polars as pl
 import requests
@@ -21,6 +22,9 @@ from .mtgjson_config import MtgjsonConfig
 
 LOGGER = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 _CURRENT_LOG_FILE: str | None = None
 
 
@@ -427,6 +431,31 @@ def deep_sort_keys(obj: Any) -> Any:
     return obj
 
 
+def map_ordered(fn: Callable[[T], R], items: Iterable[T], workers: int, window: int | None = None) -> Iterator[R]:
+    """Apply ``fn`` on a thread pool, yielding results in input order.
+
+    At most ``window`` (default ``workers + 1``) results are pending at a
+    time, which bounds the number of chunks held in memory.
+    """
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+
+    window = max(window or workers + 1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: collections.deque[Future[R]] = collections.deque()
+        try:
+            for item in items:
+                pending.append(pool.submit(fn, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 @lru_cache(maxsize=1)
 def _fetch_scryfall_sets() -> pl.LazyFrame:
     """Fetch and cache the Scryfall sets list (one HTTP request per build)."""
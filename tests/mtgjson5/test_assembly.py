@@ -5,7 +5,13 @@ from __future__ import annotations
 import polars as pl
 import pytest
 
-from mtgjson5.build.assemble import Assembler, AtomicCardsAssembler, DeckAssembler, DeckListAssembler
+from mtgjson5.build.assemble import (
+    Assembler,
+    AtomicCardsAssembler,
+    DeckAssembler,
+    DeckListAssembler,
+    index_minimal_decks,
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -153,6 +159,7 @@ class TestDeckAssemblers:
             tokens_dir = None
             set_meta = {}
             decks_df = _make_decks_df()
+            decks_by_set = index_minimal_decks(_make_decks_df())
             sealed_df = None
             booster_configs = {}
             token_products = {}
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import polars as pl
+import pytest
 
 from mtgjson5.build.context import (
+    CACHE_STATE_DIR,
+    AssemblyContext,
     _build_languages_by_set,
     _enrich_sets_with_decks,
     _enrich_sets_with_languages,
@@ -178,3 +181,106 @@ class TestEnrichSetsWithLanguages:
         records = [{"code": "ZZZ", "name": "No Cards"}]
         _enrich_sets_with_languages(records, self._make_cards_df("M10", ["French"]))
         assert records[0]["languages"] == ["English"]
+
+
+class TestPerSetIndexes:
+    def _make_ctx(self, tmp_path) -> AssemblyContext:
+        parquet_dir = tmp_path / "_parquet"
+        parquet_dir.mkdir()
+        return AssemblyContext(
+            parquet_dir=parquet_dir,
+            tokens_dir=tmp_path / "_parquet_tokens",
+            set_meta={"M10": {"code": "M10", "name": "Magic 2010"}},
+            meta={"date": "2025-01-01", "version": "5.3.0+test"},
+            decks_df=TestEnrichSetsWithDecks()._make_decks_df(),
+            sealed_df=TestEnrichSetsWithSealed()._make_sealed_df(),
+            output_path=tmp_path / "out",
+        )
+
+    def test_indexes_group_by_set(self, tmp_path):
+        ctx = self._make_ctx(tmp_path)
+
+        assert [d["name"] for d in ctx.decks_by_set["M10"]] == ["Intro Pack Red"]
+        assert [p["uuid"] for p in ctx.sealed_by_set["M10"]] == ["sealed-001"]
+        assert ctx.sets.build_minimal_decks("ZZZ") is None
+        assert ctx.sets.build_sealed_products("ZZZ") is None
+
+    def test_indexes_persisted_by_save_cache(self, tmp_path, monkeypatch):
+        ctx = self._make_ctx(tmp_path)
+        ctx.save_cache(tmp_path)
+        monkeypatch.setattr("mtgjson5.build.assemble.index_minimal_decks", lambda df: pytest.fail("deck index rebuilt"))
+
+        loaded = AssemblyContext.from_cache(cache_dir=tmp_path)
+
+        assert loaded is not None
+        assert loaded.decks_by_set == ctx.decks_by_set
+        assert loaded.sealed_by_set == ctx.sealed_by_set
+
+    def test_skipped_frames_skip_their_index(self, tmp_path):
+        self._make_ctx(tmp_path).save_cache(tmp_path)
+
+        loaded = AssemblyContext.from_cache(cache_dir=tmp_path, skip=frozenset({"decks"}))
+
+        assert loaded is not None
+        assert "decks_by_set" not in loaded.__dict__
+        assert loaded.decks_by_set == {}
+
+
+class TestCacheLayout:
+    def _make_ctx(self, tmp_path) -> AssemblyContext:
+        ctx = TestPerSetIndexes()._make_ctx(tmp_path)
+        ctx.booster_configs = {"M10": {"boosters": []}}
+        ctx.keyword_data = {"keywordAbilities": ["Flying"]}
+        ctx.super_types = ["Legendary"]
+        return ctx
+
+    def test_round_trip(self, tmp_path):
+        ctx = self._make_ctx(tmp_path)
+        ctx.save_cache(tmp_path)
+
+        loaded = AssemblyContext.from_cache(cache_dir=tmp_path)
+
+        assert loaded is not None
+        assert loaded.set_meta == ctx.set_meta
+        assert loaded.booster_configs == ctx.booster_configs
+        assert loaded.keyword_data == ctx.keyword_data
+        assert loaded.super_types == ctx.super_types
+        assert loaded.decks_df is not None
+        assert loaded.decks_df.equals(ctx.decks_df)
+        assert loaded.sealed_df is not None
+        assert loaded.sealed_df.equals(ctx.sealed_df)
+        assert not list((tmp_path / CACHE_STATE_DIR).glob("*.tmp"))
+
+    def test_resave_keeps_mapped_frames_readable(self, tmp_path):
+        ctx = self._make_ctx(tmp_path)
+        ctx.save_cache(tmp_path)
+        loaded = AssemblyContext.from_cache(cache_dir=tmp_path)
+        assert loaded is not None
+
+        ctx.decks_df = None
+        ctx.save_cache(tmp_path)
+
+        assert loaded.decks_df is not None
+        assert loaded.decks_df.height == 1
+        assert not (tmp_path / CACHE_STATE_DIR / "decks.arrow").exists()
+
+    def test_skip_leaves_defaults(self, tmp_path):
+        self._make_ctx(tmp_path).save_cache(tmp_path)
+
+        loaded = AssemblyContext.from_cache(cache_dir=tmp_path, skip=frozenset({"sealed", "boosters"}))
+
+        assert loaded is not None
+        assert loaded.sealed_df is None
+        assert loaded.booster_configs == {}
+        assert loaded.decks_df is not None
+
+    def test_legacy_layout_ignored(self, tmp_path):
+        (tmp_path / "_parquet").mkdir()
+        (tmp_path / "_assembly_set_meta.json").write_text('{"M10": {"code": "M10", "name": "Magic 2010"}}')
+
+        assert not AssemblyContext.cache_exists(tmp_path)
+        assert AssemblyContext.from_cache(cache_dir=tmp_path) is None
+
+    def test_missing_cache(self, tmp_path):
+        assert not AssemblyContext.cache_exists(tmp_path)
+        assert AssemblyContext.from_cache(cache_dir=tmp_path) is None
@@ -0,0 +1,123 @@
+"""Tests for memory-aware scheduling of the JSON assembly groups."""
+
+from __future__ import annotations
+
+from mtgjson5.build import assembly_schedule
+from mtgjson5.build.assembly_schedule import (
+    DEFAULT_GROUP_PEAK_MB,
+    DEFAULT_WORKER_PEAK_MB,
+    GROUP_STATS_FILE,
+    estimate_group,
+    group_key,
+    load_group_stats,
+    next_startable,
+    order_groups,
+    save_group_stats,
+    set_assembly_workers,
+)
+
+GROUPS = [
+    ("A", ["AllPrintings", "FormatPrintings"]),
+    ("F", ["Keywords"]),
+    ("B", ["AtomicCards"]),
+]
+
+STATS = {
+    group_key("A", ["AllPrintings", "FormatPrintings"]): {"peak_rss_mb": 8000.0, "duration_s": 300.0},
+    group_key("F", ["Keywords"]): {"peak_rss_mb": 500.0, "duration_s": 10.0},
+    group_key("B", ["AtomicCards"]): {"peak_rss_mb": 3000.0, "duration_s": 120.0},
+}
+
+
+class TestEstimates:
+    def test_unmeasured_group_uses_default(self):
+        assert estimate_group({}, "F", ["Keywords"]) == (DEFAULT_GROUP_PEAK_MB, None)
+
+    def test_unmeasured_all_printings_reserves_worker_pool(self, monkeypatch):
+        monkeypatch.setenv("MTGJSON_SET_ASSEMBLY_WORKERS", "8")
+
+        assert estimate_group({}, "A", ["AllPrintings"]) == (8 * DEFAULT_WORKER_PEAK_MB, None)
+
+    def test_measured_all_printings_ignores_worker_pool(self, monkeypatch):
+        monkeypatch.setenv("MTGJSON_SET_ASSEMBLY_WORKERS", "8")
+        stats = {group_key("A", ["AllPrintings"]): {"peak_rss_mb": 100.0, "duration_s": 5.0}}
+
+        peak, _duration = estimate_group(stats, "A", ["AllPrintings"])
+
+        assert peak < DEFAULT_GROUP_PEAK_MB
+
+    def test_same_label_fallback_takes_heaviest(self):
+        stats = {
+            group_key("A", ["AllPrintings"]): {"peak_rss_mb": 100.0, "duration_s": 5.0},
+            group_key("A", ["AllPrintings", "FormatPrintings"]): {"peak_rss_mb": 200.0, "duration_s": 9.0},
+        }
+
+        peak, duration = estimate_group(stats, "A", ["FormatPrintings"])
+
+        assert peak > 200.0
+        assert duration == 9.0
+
+
+class TestOrdering:
+    def test_longest_first(self):
+        assert [label for label, _ in order_groups(GROUPS, STATS)] == ["A", "B", "F"]
+
+    def test_unmeasured_groups_lead_in_given_order(self):
+        stats = {group_key("F", ["Keywords"]): STATS[group_key("F", ["Keywords"])]}
+
+        assert [label for label, _ in order_groups(GROUPS, stats)] == ["A", "B", "F"]
+
+
+class TestNextStartable:
+    def test_head_starts_when_idle_even_over_budget(self):
+        assert next_startable(GROUPS, STATS, reserved_mb=0, budget_mb=100) == 0
+
+    def test_first_fit_skips_groups_that_do_not_fit(self):
+        queue = [GROUPS[2], GROUPS[1]]
+
+        assert next_startable(queue, STATS, reserved_mb=9000, budget_mb=10000) == 1
+
+    def test_nothing_fits(self):
+        assert next_startable(GROUPS[1:], STATS, reserved_mb=9900, budget_mb=10000) is None
+
+
+class TestStatsFile:
+    def test_round_trip_merges(self, tmp_path):
+        save_group_stats({"A:AllPrintings": {"peak_rss_mb": 1.0, "duration_s": 2.0}}, tmp_path)
+        save_group_stats({"F:Keywords": {"peak_rss_mb": 3.0, "duration_s": 4.0}}, tmp_path)
+
+        assert load_group_stats(tmp_path) == {
+            "A:AllPrintings": {"peak_rss_mb": 1.0, "duration_s": 2.0},
+            "F:Keywords": {"peak_rss_mb": 3.0, "duration_s": 4.0},
+        }
+
+    def test_unreadable_file_ignored(self, tmp_path):
+        (tmp_path / GROUP_STATS_FILE).write_text("{not json", encoding="utf-8")
+
+        assert load_group_stats(tmp_path) == {}
+
+
+class TestSetAssemblyWorkers:
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("MTGJSON_SET_ASSEMBLY_WORKERS", "3")
+        assert set_assembly_workers() == 3
+
+    def test_default_bounded_by_memory_budget(self, monkeypatch):
+        monkeypatch.delenv("MTGJSON_SET_ASSEMBLY_WORKERS", raising=False)
+        monkeypatch.setattr(assembly_schedule.os, "cpu_count", lambda: 16)
+        monkeypatch.setenv("MTGJSON_ASSEMBLY_MEMORY_GB", str(4 * DEFAULT_WORKER_PEAK_MB / 1024))
+
+        assert set_assembly_workers() == 4
+
+    def test_default_bounded_by_cpus(self, monkeypatch):
+        monkeypatch.delenv("MTGJSON_SET_ASSEMBLY_WORKERS", raising=False)
+        monkeypatch.setattr(assembly_schedule.os, "cpu_count", lambda: 2)
+        monkeypatch.setenv("MTGJSON_ASSEMBLY_MEMORY_GB", "64")
+
+        assert set_assembly_workers() == 2
+
+    def test_small_budget_still_gets_one_worker(self, monkeypatch):
+        monkeypatch.delenv("MTGJSON_SET_ASSEMBLY_WORKERS", raising=False)
+        monkeypatch.setenv("MTGJSON_ASSEMBLY_MEMORY_GB", "0.5")
+
+        assert set_assembly_workers() == 1
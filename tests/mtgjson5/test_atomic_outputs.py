@@ -0,0 +1,66 @@
+"""Tests for the single-pass AtomicCards and format atomic writer."""
+
+from __future__ import annotations
+
+import orjson
+
+from mtgjson5._subprocess_assembly import _coalesce_tasks
+from mtgjson5.build.context import AssemblyContext
+from mtgjson5.build.formats.json import JsonOutputBuilder
+from mtgjson5.build.serializers import _drop_nulls
+from mtgjson5.models.files import AtomicCardsFile, FormatFilter
+
+
+class TestWriteAtomicOutputs:
+    def test_formats_filtered_from_atomic_stream(self, assembly_ctx: AssemblyContext, tmp_path) -> None:
+        builder = JsonOutputBuilder(assembly_ctx)
+
+        results = builder.write_atomic_outputs(tmp_path, format_names=["vintage", "pauper"])
+
+        atomic = orjson.loads((tmp_path / "AtomicCards.json").read_bytes())
+        assert atomic["data"] == assembly_ctx.atomic_cards.build()
+        assert results["AtomicCards"] == len(atomic["data"])
+        for fmt in ("vintage", "pauper"):
+            doc = orjson.loads((tmp_path / f"{fmt.title()}Atomic.json").read_bytes())
+            assert doc["format_name"] == fmt
+            assert results[f"{fmt.title()}Atomic"] == len(doc["data"])
+            for name, cards in doc["data"].items():
+                expected = [_drop_nulls(c) for c in atomic["data"][name] if FormatFilter.is_legal(c, fmt)]
+                assert cards == expected
+        assert not (tmp_path / "StandardAtomic.json").exists()
+
+    def test_formats_match_atomic_cards_filter(self, assembly_ctx: AssemblyContext, tmp_path) -> None:
+        builder = JsonOutputBuilder(assembly_ctx)
+        formats = ["vintage", "legacy", "modern", "pauper"]
+        builder.write_atomic_outputs(tmp_path, format_names=formats)
+        atomic = AtomicCardsFile.read(tmp_path / "AtomicCards.json")
+
+        for fmt in formats:
+            expected = tmp_path / "expected" / f"{fmt.title()}Atomic.json"
+            expected.parent.mkdir(exist_ok=True)
+            builder.write_format_atomic(atomic, fmt, expected)
+            assert (tmp_path / expected.name).read_bytes() == expected.read_bytes()
+
+    def test_formats_without_atomic_cards(self, assembly_ctx: AssemblyContext, tmp_path) -> None:
+        results = JsonOutputBuilder(assembly_ctx).write_atomic_outputs(
+            tmp_path, atomic_cards=False, format_names=["vintage"]
+        )
+
+        assert set(results) == {"VintageAtomic"}
+        assert results["VintageAtomic"] > 0
+        assert not (tmp_path / "AtomicCards.json").exists()
+
+    def test_write_atomic_cards_streaming_count(self, assembly_ctx: AssemblyContext, tmp_path) -> None:
+        count = JsonOutputBuilder(assembly_ctx).write_atomic_cards(tmp_path / "AtomicCards.json")
+
+        assert count == len(assembly_ctx.atomic_cards.build())
+        assert list(tmp_path.iterdir()) == [tmp_path / "AtomicCards.json"]
+
+
+class TestCoalesceTasks:
+    def test_atomic_tasks_merged(self) -> None:
+        assert _coalesce_tasks(["AtomicCards", "FormatAtomics"]) == ["AtomicOutputs"]
+
+    def test_lone_tasks_kept(self) -> None:
+        assert _coalesce_tasks(["FormatAtomics"]) == ["FormatAtomics"]
+        assert _coalesce_tasks(["AllPrintings", "FormatPrintings"]) == ["AllPrintings", "FormatPrintings"]
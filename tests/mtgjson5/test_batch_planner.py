@@ -0,0 +1,119 @@
+"""Tests for memory-budgeted pipeline batch planning."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+
+import polars as pl
+
+from mtgjson5.pipeline.batching import (
+    BATCH_STATS_FILE,
+    BatchPeakMeter,
+    count_set_rows,
+    load_bytes_per_row,
+    memory_ceiling_bytes,
+    plan_batches,
+    save_batch_stats,
+)
+
+# =============================================================================
+# Batch packing
+# =============================================================================
+
+
+class TestPlanBatches:
+    def test_packs_under_row_budget(self):
+        counts = {"SLD": 900, "PLST": 800, "A": 100, "B": 100, "C": 50}
+
+        batches = plan_batches(counts, max_rows=1000)
+
+        assert batches == [["A", "SLD"], ["B", "C", "PLST"]]
+        assert all(sum(counts[c] for c in batch) <= 1000 for batch in batches)
+
+    def test_oversized_set_gets_own_batch(self):
+        batches = plan_batches({"BIG": 5000, "X": 10}, max_rows=1000)
+
+        assert batches == [["BIG"], ["X"]]
+
+    def test_every_set_planned_once(self):
+        counts = {f"S{i}": i * 7 % 53 for i in range(40)}
+
+        batches = plan_batches(counts, max_rows=120)
+
+        planned = [code for batch in batches for code in batch]
+        assert sorted(planned) == sorted(counts)
+
+    def test_empty(self):
+        assert plan_batches({}, max_rows=100) == []
+
+
+# =============================================================================
+# Row counts
+# =============================================================================
+
+
+class TestCountSetRows:
+    def test_counts_upper_cased_sets(self):
+        lf = pl.LazyFrame({"set": ["abc", "abc", "xyz", "zzz"], "id": ["1", "2", "3", "4"]})
+
+        assert count_set_rows(lf, ["ABC", "XYZ", "NONE"]) == {"ABC": 2, "NONE": 0, "XYZ": 1}
+
+    def test_applies_scryfall_filter(self):
+        lf = pl.LazyFrame({"set": ["abc", "abc"], "id": ["1", "2"]})
+
+        assert count_set_rows(lf, ["ABC"], scryfall_ids={"2"}) == {"ABC": 1}
+
+
+# =============================================================================
+# Measured footprint
+# =============================================================================
+
+
+class TestBatchStats:
+    def test_round_trip_keeps_heaviest_ratio(self, tmp_path):
+        batches = [
+            {"label": "batch_0", "rows": 1000, "rss_growth_mb": 100.0},
+            {"label": "batch_1", "rows": 1000, "rss_growth_mb": 200.0},
+            {"label": "batch_2", "rows": 0, "rss_growth_mb": 50.0},
+        ]
+
+        stored = save_batch_stats(batches, tmp_path)
+
+        assert stored == 200 * 1024**2 / 1000
+        assert load_bytes_per_row(tmp_path) == round(stored, 1)
+
+    def test_nothing_measured_writes_nothing(self, tmp_path):
+        assert save_batch_stats([{"label": "batch_0", "rows": 10, "rss_growth_mb": 0.0}], tmp_path) is None
+        assert not (tmp_path / BATCH_STATS_FILE).exists()
+
+    def test_missing_or_corrupt_stats(self, tmp_path):
+        assert load_bytes_per_row(tmp_path) is None
+
+        (tmp_path / BATCH_STATS_FILE).write_text("{not json")
+        assert load_bytes_per_row(tmp_path) is None
+
+        (tmp_path / BATCH_STATS_FILE).write_text(json.dumps({"bytes_per_row": -1}))
+        assert load_bytes_per_row(tmp_path) is None
+
+    def test_peak_meter_sees_released_allocation(self):
+        with BatchPeakMeter(interval=0.01) as meter:
+            block = b"x" * (64 * 1024**2)
+            time.sleep(0.2)
+            del block
+
+        # The block is gone by __exit__, so only the sampler can have seen it
+        assert meter.growth_mb >= 48
+
+    def test_peak_meter_counts_children(self):
+        code = "import time; block = b'x' * (64 * 1024**2); time.sleep(1)"
+        with BatchPeakMeter(interval=0.01, include_children=True) as meter:
+            subprocess.run([sys.executable, "-c", code], check=True)
+
+        assert meter.growth_mb >= 48
+
+    def test_explicit_memory_ceiling(self):
+        assert memory_ceiling_bytes(2.0) == 2 * 1024**3
+        assert memory_ceiling_bytes() >= 1024**3
@@ -0,0 +1,158 @@
+"""Tests for the deck card index and deck file writer."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+
+import orjson
+import polars as pl
+import pytest
+
+from mtgjson5._subprocess_decks import deck_workers
+from mtgjson5.build.assemble import DeckCardIndex
+from mtgjson5.build.context import AssemblyContext
+from mtgjson5.build.formats.json import JsonOutputBuilder
+from mtgjson5.models.cards import CardDeck, CardSet, CardToken
+
+_REF = pl.Struct({"uuid": pl.String, "count": pl.Int64, "isFoil": pl.Boolean, "isEtched": pl.Boolean})
+_BOARDS = ("mainBoard", "sideBoard", "commander", "displayCommander", "tokens", "planes", "schemes")
+
+
+def _deck(name: str, code: str, **boards: list[dict]) -> dict:
+    return {
+        "setCode": code,
+        "code": code,
+        "name": name,
+        "type": "Intro Pack",
+        "releaseDate": "2025-01-01",
+        "sourceSetCodes": [code],
+        **{board: boards.get(board, []) for board in _BOARDS},
+    }
+
+
+@pytest.fixture
+def deck_ctx(assembly_ctx: AssemblyContext) -> AssemblyContext:
+    decks = [
+        _deck(
+            "Red Burn",
+            "TST",
+            mainBoard=[
+                {"uuid": "uuid-bolt-tst", "count": 4, "isFoil": False, "isEtched": False},
+                {"uuid": "uuid-not-printed", "count": 1, "isFoil": False, "isEtched": False},
+            ],
+            sideBoard=[{"uuid": "uuid-wear", "count": 2, "isFoil": True, "isEtched": None}],
+            tokens=[{"uuid": "uuid-zombie-001", "count": 1, "isFoil": True, "isEtched": None}],
+        ),
+        _deck(
+            "Second Wave", "TS2", mainBoard=[{"uuid": "uuid-bolt-ts2", "count": 1, "isFoil": None, "isEtched": None}]
+        ),
+        _deck("Tearing Up", "TST", commander=[{"uuid": "uuid-tear", "count": 1, "isFoil": False, "isEtched": True}]),
+    ]
+    schema = {board: pl.List(_REF) for board in _BOARDS}
+    decks_df = pl.DataFrame(decks, schema_overrides=schema)
+    return dataclasses.replace(assembly_ctx, decks_df=decks_df)
+
+
+def _model_expand(ctx: AssemblyContext, refs: list[dict]) -> list[dict]:
+    """Per-reference model validation, as deck expansion used to work."""
+    cards = {
+        c.uuid: c.to_output_dict() for c in CardSet.from_dataframe(pl.read_parquet(ctx.parquet_dir / "**/*.parquet"))
+    }
+    tokens = {
+        t.uuid: t.to_output_dict() for t in CardToken.from_dataframe(pl.read_parquet(ctx.tokens_dir / "**/*.parquet"))
+    }
+    result = []
+    for ref in refs:
+        if ref["uuid"] in tokens:
+            out = CardToken.from_polars_row(tokens[ref["uuid"]]).to_polars_dict(
+                exclude_none=True, keep_empty_lists=True
+            )
+            out["count"] = ref["count"]
+            if ref["isFoil"]:
+                out["isFoil"] = True
+        elif ref["uuid"] in cards:
+            expanded = {
+                **cards[ref["uuid"]],
+                "count": ref["count"],
+                "isFoil": ref["isFoil"],
+                "isEtched": ref["isEtched"],
+            }
+            out = CardDeck.from_polars_row(expanded).to_polars_dict(exclude_none=True, keep_empty_lists=True)
+        else:
+            continue
+        result.append(out)
+    return result
+
+
+class TestDeckCardIndex:
+    def test_expansion_matches_model_path(self, deck_ctx):
+        index = deck_ctx.deck_assembler().uuid_index
+
+        for deck in deck_ctx.decks_df.to_dicts():
+            for board in _BOARDS:
+                assert index.expand(deck[board]) == _model_expand(deck_ctx, deck[board])
+
+    def test_index_holds_referenced_printings_only(self, deck_ctx):
+        index = deck_ctx.deck_assembler().uuid_index
+
+        assert set(index.fragments) == {"uuid-bolt-tst", "uuid-wear", "uuid-zombie-001", "uuid-bolt-ts2", "uuid-tear"}
+        assert index.token_uuids == frozenset({"uuid-zombie-001"})
+        assert all(isinstance(fragment, bytes) for fragment in index.fragments.values())
+
+    def test_expanded_cards_are_independent(self):
+        index = DeckCardIndex({"u": orjson.dumps({"name": "Card", "uuid": "u"})})
+
+        first, second = index.expand([{"uuid": "u", "count": 1}, {"uuid": "u", "count": 3}])
+
+        assert first["count"] == 1
+        assert second["count"] == 3
+
+
+class TestWriteDecks:
+    def test_files_and_sidecars(self, deck_ctx, tmp_path, monkeypatch):
+        monkeypatch.setenv("MTGJSON_DECK_WORKERS", "1")
+        count = JsonOutputBuilder(deck_ctx).write_decks(tmp_path, set_codes=["tst"])
+
+        assert count == 2
+        raw = (tmp_path / "RedBurn_TST.json").read_bytes()
+        assert (tmp_path / "RedBurn_TST.json.sha256").read_text() == hashlib.sha256(raw).hexdigest()
+        doc = orjson.loads(raw)
+        assert doc["meta"] == deck_ctx.meta
+        assert [c["count"] for c in doc["data"]["mainBoard"]] == [4]
+        assert not (tmp_path / "SecondWave_TS2.json").exists()
+
+    def test_workers_write_identical_files(self, deck_ctx, tmp_path, monkeypatch):
+        # Workers log to the parent's file rather than a new one under LOG_PATH
+        monkeypatch.setattr("mtgjson5.utils._CURRENT_LOG_FILE", str(tmp_path / "workers.log"))
+        builder = JsonOutputBuilder(deck_ctx)
+        monkeypatch.setenv("MTGJSON_DECK_WORKERS", "1")
+        serial_count = builder.write_decks(tmp_path / "serial")
+        monkeypatch.setenv("MTGJSON_DECK_WORKERS", "2")
+
+        parallel_count = builder.write_decks(tmp_path / "parallel")
+
+        assert parallel_count == serial_count == 3
+        serial = {p.name: p.read_bytes() for p in (tmp_path / "serial").iterdir()}
+        parallel = {p.name: p.read_bytes() for p in (tmp_path / "parallel").iterdir()}
+        assert parallel == serial
+
+
+class TestDeckWorkers:
+    def test_default_one_per_cpu(self, monkeypatch):
+        monkeypatch.delenv("MTGJSON_DECK_WORKERS", raising=False)
+        monkeypatch.setattr("mtgjson5._subprocess_decks.os.cpu_count", lambda: 4)
+
+        assert deck_workers(100) == 4
+        assert deck_workers(2) == 2
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("MTGJSON_DECK_WORKERS", "3")
+
+        assert deck_workers(100) == 3
+
+    def test_invalid_value_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("MTGJSON_DECK_WORKERS", "many")
+        monkeypatch.setattr("mtgjson5._subprocess_decks.os.cpu_count", lambda: 2)
+
+        assert deck_workers(100) == 2
@@ -0,0 +1,84 @@
+"""Tests for the shared on-disk export tables and parallel format exports."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+
+import pytest
+
+from mtgjson5._subprocess_exports import _run_format_exports
+from mtgjson5.build.assemble import TableAssembler
+from mtgjson5.build.context import CACHE_EXPORT_TABLES_DIR, AssemblyContext
+from mtgjson5.build.writer import UnifiedOutputWriter
+
+
+def _load(cache_dir) -> AssemblyContext:
+    """Context from the cache, with tables built as the exports subprocess would."""
+    ctx = AssemblyContext.from_cache(cache_dir=cache_dir)
+    assert ctx is not None
+    assert ctx.all_cards_df is not None
+    # Fixture rulings carry no "source" field for build_all to drop
+    cards = ctx.all_cards_df.drop("rulings")
+    ctx.__dict__["normalized_tables"] = TableAssembler.build_all(cards, ctx.all_tokens_df, ctx.sets_df)
+    return ctx
+
+
+@pytest.fixture
+def cached_ctx(assembly_ctx: AssemblyContext, tmp_path) -> AssemblyContext:
+    cache_dir = tmp_path / "cache"
+    shutil.copytree(assembly_ctx.parquet_dir, cache_dir / "_parquet")
+    shutil.copytree(assembly_ctx.tokens_dir, cache_dir / "_parquet_tokens")
+    assembly_ctx.save_cache(cache_dir)
+    return _load(cache_dir)
+
+
+class TestExportTables:
+    def test_round_trip_keeps_order(self, cached_ctx, tmp_path):
+        root = tmp_path / "tables"
+        cached_ctx.save_export_tables(root)
+        fresh = AssemblyContext.from_cache(cache_dir=cached_ctx.parquet_dir.parent)
+        assert fresh is not None
+        assert "normalized_tables" not in fresh.__dict__
+
+        assert fresh.load_export_tables(root)
+
+        for group in ("normalized_tables", "normalized_boosters"):
+            expected = getattr(cached_ctx, group)
+            loaded = getattr(fresh, group)
+            assert list(loaded) == list(expected)
+            assert all(loaded[name].equals(df) for name, df in expected.items())
+        assert not list(root.rglob("*.tmp"))
+
+    def test_missing_manifest_is_not_loaded(self, cached_ctx, tmp_path):
+        root = tmp_path / "tables"
+        cached_ctx.save_export_tables(root)
+        (root / "manifest.pkl").unlink()
+
+        assert not cached_ctx.load_export_tables(tmp_path / "tables")
+
+
+class TestFormatExports:
+    def _export(self, ctx: AssemblyContext, output_dir, formats: list[str]) -> None:
+        ctx.output_path = output_dir
+        output_dir.mkdir(parents=True)
+        _run_format_exports(UnifiedOutputWriter(ctx), formats, formats, False, logging.getLogger(__name__))
+
+    def test_workers_write_identical_files(self, cached_ctx, tmp_path, monkeypatch):
+        # Workers log to the parent's file rather than a new one under LOG_PATH
+        monkeypatch.setattr("mtgjson5.utils._CURRENT_LOG_FILE", str(tmp_path / "workers.log"))
+        formats = ["csv", "psql", "sql"]
+        monkeypatch.setenv("MTGJSON_EXPORT_WORKERS", "1")
+        self._export(cached_ctx, tmp_path / "serial", formats)
+        parallel_ctx = AssemblyContext.from_cache(cache_dir=cached_ctx.parquet_dir.parent)
+        assert parallel_ctx is not None
+        parallel_ctx.__dict__["normalized_tables"] = cached_ctx.normalized_tables
+        monkeypatch.setenv("MTGJSON_EXPORT_WORKERS", "3")
+
+        self._export(parallel_ctx, tmp_path / "parallel", formats)
+
+        serial = {p.relative_to(tmp_path / "serial"): p.read_bytes() for p in (tmp_path / "serial").rglob("*.*")}
+        parallel = {p.relative_to(tmp_path / "parallel"): p.read_bytes() for p in (tmp_path / "parallel").rglob("*.*")}
+        assert parallel == serial
+        assert {p.name for p in serial} >= {"AllPrintings.psql", "AllPrintings.sql", "cards.csv"}
+        assert (cached_ctx.parquet_dir.parent / CACHE_EXPORT_TABLES_DIR / "manifest.pkl").exists()
@@ -0,0 +1,119 @@
+"""Tests for the consolidated per-face foreign data lookup."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from mtgjson5.data import PipelineContext
+from mtgjson5.pipeline.stages.identifiers import fix_foreigndata_for_faces
+
+_FACE = pl.Struct(
+    {
+        "name": pl.String,
+        "printed_name": pl.String,
+        "printed_text": pl.String,
+        "printed_type_line": pl.String,
+        "flavor_text": pl.String,
+    }
+)
+
+_FOREIGN = pl.Struct(
+    {
+        "faceName": pl.String,
+        "flavorText": pl.String,
+        "identifiers": pl.Struct({"scryfallId": pl.String}),
+        "language": pl.String,
+        "multiverseId": pl.Int64,
+        "name": pl.String,
+        "text": pl.String,
+        "type": pl.String,
+    }
+)
+
+
+def _cards_lf() -> pl.LazyFrame:
+    faces = [
+        {"name": "Day", "printed_name": "Tag", "printed_text": "T1", "printed_type_line": "Typ1", "flavor_text": None},
+        {
+            "name": "Night",
+            "printed_name": "Nacht",
+            "printed_text": "T2",
+            "printed_type_line": "Typ2",
+            "flavor_text": "F",
+        },
+    ]
+    return pl.LazyFrame(
+        {
+            "lang": ["de", "en"],
+            "cardFaces": [faces, faces],
+            "set": ["abc", "abc"],
+            "collectorNumber": ["1", "1"],
+        },
+        schema={"lang": pl.String, "cardFaces": pl.List(_FACE), "set": pl.String, "collectorNumber": pl.String},
+    )
+
+
+def _batch_lf() -> pl.LazyFrame:
+    entry = {
+        "faceName": "Tag",
+        "flavorText": None,
+        "identifiers": {"scryfallId": "de-1"},
+        "language": "German",
+        "multiverseId": None,
+        "name": "Tag // Nacht",
+        "text": "T1",
+        "type": "Typ1",
+    }
+    return pl.LazyFrame(
+        {
+            "scryfallId": ["en-1", "en-1"],
+            "setCode": ["ABC", "ABC"],
+            "number": ["1", "1"],
+            "side": ["a", "b"],
+            "foreignData": [[entry], [entry]],
+        },
+        schema={
+            "scryfallId": pl.String,
+            "setCode": pl.String,
+            "number": pl.String,
+            "side": pl.String,
+            "foreignData": pl.List(_FOREIGN),
+        },
+    )
+
+
+# =============================================================================
+# TestFaceForeignLookup
+# =============================================================================
+
+
+class TestFaceForeignLookup:
+    def test_one_row_per_foreign_face(self):
+        ctx = PipelineContext.for_testing(cards_lf=_cards_lf())
+
+        ctx._build_face_foreign_lookup()
+
+        assert ctx.face_foreign_lf is not None
+        df = ctx.face_foreign_lf.collect().sort("face_index")
+        assert df["language"].to_list() == ["German", "German"]
+        assert df["_faceName"].to_list() == ["Tag", "Nacht"]
+        assert df["_has_face_data"].to_list() == [True, True]
+
+    def test_stage_corrects_other_faces(self):
+        ctx = PipelineContext.for_testing(cards_lf=_cards_lf())
+
+        df = fix_foreigndata_for_faces(_batch_lf(), ctx).collect().sort("side")
+
+        front, back = (row[0] for row in df["foreignData"].to_list())
+        assert (front["faceName"], front["text"]) == ("Tag", "T1")
+        assert (back["faceName"], back["text"], back["flavorText"]) == ("Nacht", "T2", "F")
+        assert front["uuid"] != back["uuid"]
+
+    def test_stage_reuses_consolidated_lookup(self):
+        ctx = PipelineContext.for_testing(cards_lf=_cards_lf())
+        lookup = ctx.get_face_foreign_lookup()
+        assert lookup is not None
+
+        fix_foreigndata_for_faces(_batch_lf(), ctx).collect()
+
+        assert ctx.face_foreign_lf is lookup
@@ -0,0 +1,145 @@
+"""Tests for the conditional HTTP revalidation cache shared by providers."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+import requests
+
+from mtgjson5.providers import http_cache as http_cache_module
+from mtgjson5.providers.http_cache import VALIDATOR_FILE, HttpRevalidationCache
+
+URL = "https://example.invalid/data.json"
+
+
+class _FakeProbeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def probe(monkeypatch):
+    """Replace the probe GET; returns the list of request headers seen."""
+    calls: list[dict] = []
+    state = {"status": 200, "headers": {"ETag": '"v1"'}, "error": None}
+
+    def fake_get(url, headers=None, timeout=None, stream=False):
+        calls.append(dict(headers or {}))
+        err = state["error"]
+        if err is not None:
+            assert isinstance(err, BaseException)
+            raise err
+        return _FakeProbeResponse(state["status"], state["headers"])
+
+    monkeypatch.setattr(http_cache_module.requests, "get", fake_get)
+    return calls, state
+
+
+def _artifact(tmp_path, age_hours=0.0):
+    path = tmp_path / "data.parquet"
+    path.write_bytes(b"x")
+    stamp = time.time() - age_hours * 3600
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+# =============================================================================
+# Validator store
+# =============================================================================
+
+
+class TestValidatorStore:
+    def test_record_and_conditional_headers(self, tmp_path):
+        cache = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+        cache.record(URL, {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2026 00:00:00 GMT"})
+
+        reloaded = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+
+        assert reloaded.conditional_headers(URL) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2026 00:00:00 GMT",
+        }
+
+    def test_unknown_url_has_no_headers(self, tmp_path):
+        assert not HttpRevalidationCache(tmp_path / VALIDATOR_FILE).conditional_headers(URL)
+
+    def test_corrupt_store_ignored(self, tmp_path):
+        (tmp_path / VALIDATOR_FILE).write_text("{nope", encoding="utf-8")
+        assert not HttpRevalidationCache(tmp_path / VALIDATOR_FILE).has_validators(URL)
+
+    def test_forget(self, tmp_path):
+        cache = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+        cache.record(URL, {"ETag": '"abc"'})
+        cache.forget(URL)
+        assert not HttpRevalidationCache(tmp_path / VALIDATOR_FILE).has_validators(URL)
+
+
+# =============================================================================
+# Revalidation
+# =============================================================================
+
+
+class TestIsFresh:
+    def test_missing_artifact_stages_validators(self, tmp_path, probe):
+        cache = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+
+        assert not cache.is_fresh(URL, [tmp_path / "missing.parquet"])
+        assert not cache.has_validators(URL)
+
+        cache.commit(URL)
+        assert cache.conditional_headers(URL) == {"If-None-Match": '"v1"'}
+
+    def test_not_modified_reuses_cache(self, tmp_path, probe):
+        calls, state = probe
+        cache = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+        cache.record(URL, {"ETag": '"v1"'})
+        path = _artifact(tmp_path, age_hours=1000)
+        mtime = path.stat().st_mtime_ns
+        state["status"] = 304
+
+        assert cache.is_fresh(URL, [path])
+        assert calls[-1]["If-None-Match"] == '"v1"'
+        # Artifacts are left alone (their mtimes feed plan fingerprints)
+        assert path.stat().st_mtime_ns == mtime
+        # ...but the revalidation is recorded, so an offline run can reuse them
+        state["error"] = requests.ConnectionError("offline")
+        reloaded = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+        assert reloaded.is_fresh(URL, [path], max_age_hours=10)
+
+    def test_changed_upstream_requires_refresh(self, tmp_path, probe):
+        _, state = probe
+        cache = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+        cache.record(URL, {"ETag": '"v1"'})
+        state["headers"] = {"ETag": '"v2"'}
+
+        assert not cache.is_fresh(URL, [_artifact(tmp_path)])
+        # Staged validators are only promoted once the caller has rewritten its cache
+        assert cache.conditional_headers(URL) == {"If-None-Match": '"v1"'}
+        cache.commit(URL)
+        assert cache.conditional_headers(URL) == {"If-None-Match": '"v2"'}
+
+    def test_without_validators_uses_age(self, tmp_path, probe):
+        calls, _ = probe
+        cache = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+
+        assert cache.is_fresh(URL, [_artifact(tmp_path, age_hours=1)], max_age_hours=10)
+        assert calls == []
+        assert not cache.is_fresh(URL, [_artifact(tmp_path, age_hours=20)], max_age_hours=10)
+
+    def test_network_error_falls_back_to_age(self, tmp_path, probe):
+        _, state = probe
+        cache = HttpRevalidationCache(tmp_path / VALIDATOR_FILE)
+        cache.record(URL, {"ETag": '"v1"'})
+        state["error"] = requests.ConnectionError("offline")
+
+        assert cache.is_fresh(URL, [_artifact(tmp_path, age_hours=1)], max_age_hours=10)
+        assert not cache.is_fresh(URL, [_artifact(tmp_path, age_hours=20)], max_age_hours=10)
@@ -0,0 +1,195 @@
+"""Tests for the Polars-encoded keyed JSON writer and its three outputs."""
+
+from __future__ import annotations
+
+import io
+
+import orjson
+import polars as pl
+import pytest
+
+from mtgjson5.build.assemble import AllIdentifiersAssembler, TcgplayerSkusAssembler, _clean_row, _clean_row_json
+from mtgjson5.build.context import AssemblyContext
+from mtgjson5.build.formats.json import JsonOutputBuilder
+from mtgjson5.build.keyed_json import json_entries, json_scalar, write_keyed_object
+from mtgjson5.build.prices.price_writers import _price_chunk_json, stream_write_all_prices_json
+
+SORTED = orjson.OPT_SORT_KEYS
+PRETTY = orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+
+
+class TestPrimitives:
+    def test_scalars_match_orjson(self):
+        values = ['quote " slash \\ newline \n \x01', "", "é 🂡", None]
+        df = pl.DataFrame({"s": values, "f": [0.1, 1e16, 2.5e-5, None], "i": [1, -2, None, 4]})
+
+        encoded = df.select(json_scalar(pl.col(c)).alias(c) for c in df.columns)
+
+        for column in df.columns:
+            for value, text in zip(df[column], encoded[column], strict=True):
+                assert text == (None if value is None else orjson.dumps(value).decode())
+
+    def test_entries_aggregate_to_object(self):
+        df = pl.DataFrame({"g": ["a", "a", "b"], "k": ["x", "y", "z"], "v": ["1", "[2]", "null"]})
+
+        out = df.group_by("g", maintain_order=True).agg(json_entries(pl.col("k"), pl.col("v")).alias("o"))
+
+        assert out["o"].to_list() == ['{"x":1,"y":[2]}', '{"z":null}']
+
+    def test_write_keyed_object_joins_chunks(self):
+        chunks = [
+            pl.DataFrame({"key": ["a", "b"], "value": ['{"x":1}', "[]"]}),
+            None,
+            pl.DataFrame({"key": ["c"], "value": ["2"]}),
+        ]
+        f = io.BytesIO()
+
+        count = write_keyed_object(f, chunks, entry_prefix=b"\n", key_sep=b": ")
+
+        assert count == 3
+        assert f.getvalue() == b'\n"a": {"x":1},\n"b": [],\n"c": 2'
+
+    def test_redump_option(self):
+        chunk = pl.DataFrame({"key": ["a"], "value": ['{"y":1,"x":[1]}']})
+        f = io.BytesIO()
+
+        write_keyed_object(f, [chunk], redump_option=PRETTY)
+
+        assert f.getvalue() == b'"a":' + orjson.dumps({"y": 1, "x": [1]}, option=PRETTY)
+
+
+class TestCleanRowJson:
+    def test_matches_clean_row(self):
+        ruling = pl.Struct({"publishedAt": pl.String, "comment": pl.String, "source": pl.String})
+        foreign = pl.Struct(
+            {"language": pl.String, "name": pl.String, "identifiers": pl.Struct({"scryfallId": pl.String})}
+        )
+        df = pl.DataFrame(
+            {
+                "uuid": ["u1", "u2", "u3"],
+                "name": ["Fire // Ice", "", "Plain"],
+                "layout": ["split", "normal", "normal"],
+                "colors": [["U", "R"], ["U", "R"], []],
+                "keywords": [[], ["b", "a"], None],
+                "printings": [["M10", "2ED"], None, []],
+                "isPromo": [False, True, None],
+                "text": ["", "Deal 2.", None],
+                "manaValue": [2.0, 0.0, None],
+                "legalities": [{"vintage": "Legal", "modern": None}, None, {"vintage": None, "modern": None}],
+                "identifiers": [{"scryfallId": "sf", "mtgoId": None}, {"scryfallId": None, "mtgoId": None}, None],
+                "relatedCards": [{"tokens": [], "spellbook": ["x"]}, None, {"tokens": [], "spellbook": []}],
+                "rulings": [
+                    [
+                        {"publishedAt": "2020-01-01", "comment": "b", "source": "wotc"},
+                        {"publishedAt": "2019-01-01", "comment": "z", "source": None},
+                        {"publishedAt": "2020-01-01", "comment": "a", "source": "wotc"},
+                    ],
+                    [],
+                    None,
+                ],
+                "foreignData": [
+                    [
+                        {"language": "German", "name": "Feuer", "identifiers": {"scryfallId": None}},
+                        {"language": "French", "name": None, "identifiers": {"scryfallId": "fr"}},
+                    ],
+                    [],
+                    None,
+                ],
+            },
+            schema_overrides={"rulings": pl.List(ruling), "foreignData": pl.List(foreign)},
+        )
+
+        encoded = df.select(_clean_row_json(df.schema)).to_series().to_list()
+
+        for row, text in zip(df.iter_rows(named=True), encoded, strict=True):
+            assert text.encode() == orjson.dumps(_clean_row(row), option=SORTED)
+
+
+class TestAllIdentifiers:
+    def _expected(self, ctx: AssemblyContext, option: int) -> bytes:
+        """AllIdentifiers.json as the per-entry orjson writer produced it."""
+        body = b",".join(
+            b"\n" + orjson.dumps(uuid) + b": " + orjson.dumps(entry, option=option)
+            for uuid, entry in AllIdentifiersAssembler(ctx).iter_entries()
+        )
+        return b'{"meta": ' + orjson.dumps(ctx.meta, option=option) + b', "data": {' + body + b"\n}}"
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_file_matches_entry_writer(self, assembly_ctx, tmp_path, monkeypatch, pretty):
+        monkeypatch.setattr(assembly_ctx, "pretty", pretty)
+        monkeypatch.setenv("MTGJSON_KEYED_JSON_WORKERS", "2")
+        out = tmp_path / "AllIdentifiers.json"
+
+        count = JsonOutputBuilder(assembly_ctx).write_all_identifiers(out)
+
+        assert out.read_bytes() == self._expected(assembly_ctx, PRETTY if pretty else SORTED)
+        assert count == len(orjson.loads(out.read_bytes())["data"])
+
+
+class TestTcgplayerSkus:
+    @pytest.fixture
+    def assembler(self, assembly_ctx, monkeypatch) -> TcgplayerSkusAssembler:
+        flat = pl.DataFrame(
+            {
+                "uuid": ["b-2", "a-1", "a-1", "0-9", "a-1"],
+                "condition": ["NEAR MINT", "NEAR MINT", "LIGHTLY PLAYED", "NEAR MINT", None],
+                "language": ["ENGLISH", "ENGLISH", "ENGLISH", "JAPANESE", "ENGLISH"],
+                "printing": ["FOIL", "NON FOIL", "NON FOIL", "FOIL", "FOIL"],
+                "productId": [10, 20, 20, 30, 21],
+                "skuId": [5, 3, 1, 9, 2],
+                "finish": [None, None, None, "ETCHED", None],
+            }
+        )
+        assembler = TcgplayerSkusAssembler(assembly_ctx)
+        monkeypatch.setattr(assembler, "_collect_flat_skus", lambda: flat)
+        return assembler
+
+    def test_chunks_match_sku_dicts(self, assembler):
+        expected = [(uuid, orjson.dumps(skus, option=SORTED).decode()) for uuid, skus in assembler.iter_skus()]
+
+        got = [row for chunk in assembler.iter_json_chunks(workers=2) for row in chunk.iter_rows()]
+
+        assert got == expected
+        assert [uuid for uuid, _ in got] == ["0-9", "a-1", "b-2"]
+
+
+class TestAllPrices:
+    @staticmethod
+    def _reference(df: pl.DataFrame) -> dict:
+        data: dict = {}
+        for row in df.sort("date").iter_rows(named=True):
+            provider = data.setdefault(row["uuid"], {}).setdefault(row["source"], {})
+            entry = provider.setdefault(row["provider"], {"buylist": {}, "retail": {}, "currency": row["currency"]})
+            if row["price_type"] in ("buylist", "retail"):
+                entry[row["price_type"]].setdefault(row["finish"], {})[row["date"]] = row["price"]
+        return data
+
+    @pytest.fixture
+    def prices(self) -> pl.DataFrame:
+        rows = [
+            ("1abc", "2026-01-02", "paper", "tcgplayer", "retail", "normal", 1.5, "USD"),
+            ("1abc", "2026-01-01", "paper", "tcgplayer", "retail", "normal", 1.25, "USD"),
+            ("1abc", "2026-01-01", "paper", "tcgplayer", "buylist", "foil", 0.1, "USD"),
+            ("1abc", "2026-01-01", "paper", "cardmarket", "retail", "foil", 3.0, "EUR"),
+            ("1abc", "2026-01-01", "mtgo", "cardhoarder", "retail", "normal", 0.02, "USD"),
+            ("9fff", "2026-01-01", "paper", "cardkingdom", "buylist", "etched", 12.0, "USD"),
+            ("f000", "2026-01-01", "paper", "cardkingdom", "retail", "normal", None, "USD"),
+        ]
+        columns = ["uuid", "date", "source", "provider", "price_type", "finish", "price", "currency"]
+        return pl.DataFrame(rows, schema=columns, orient="row")
+
+    def test_chunk_matches_reference(self, prices):
+        chunk = _price_chunk_json(prices)
+
+        assert chunk["key"].to_list() == ["1abc", "9fff", "f000"]
+        assert {key: orjson.loads(value) for key, value in chunk.iter_rows()} == self._reference(prices)
+
+    def test_file_joins_prefixes(self, prices, tmp_path):
+        out = tmp_path / "AllPrices.json"
+
+        stream_write_all_prices_json(prices.lazy(), out, "2026-01-02", workers=3)
+
+        doc = orjson.loads(out.read_bytes())
+        assert doc["meta"]["date"] == "2026-01-02"
+        assert list(doc["data"]) == ["1abc", "9fff", "f000"]
+        assert doc["data"] == self._reference(prices)
@@ -0,0 +1,133 @@
+"""Tests for GlobalCache._dump_and_reload_as_lazy (concurrent, change-aware dump)."""
+
+from __future__ import annotations
+
+import os
+
+import polars as pl
+import pytest
+
+from mtgjson5.data.cache import (
+    _DUMP_MANIFEST,
+    GLOBAL_CACHE,
+    _lazy_plan_fingerprint,
+    _MemoryBudget,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """GLOBAL_CACHE pointed at tmp_path with every dumped frame cleared."""
+    attrs = [a for a in vars(GLOBAL_CACHE) if a.endswith("_lf")]
+    saved = {a: getattr(GLOBAL_CACHE, a) for a in attrs}
+    saved_path = GLOBAL_CACHE.cache_path
+    saved_store = set(GLOBAL_CACHE._store_backed_frames)
+    for a in attrs:
+        setattr(GLOBAL_CACHE, a, None)
+    GLOBAL_CACHE.cache_path = tmp_path
+    GLOBAL_CACHE._store_backed_frames = set()
+    yield GLOBAL_CACHE
+    for a, value in saved.items():
+        setattr(GLOBAL_CACHE, a, value)
+    GLOBAL_CACHE.cache_path = saved_path
+    GLOBAL_CACHE._store_backed_frames = saved_store
+
+
+def _source(tmp_path, values=(1, 2)):
+    path = tmp_path / "sets_source.parquet"
+    pl.DataFrame({"set_code": list(values)}).write_parquet(path)
+    return path
+
+
+def _sets_view(path):
+    return pl.scan_parquet(path).rename({"set_code": "setCode"})
+
+
+# =============================================================================
+# Dump / reuse
+# =============================================================================
+
+
+class TestDumpAndReload:
+    def test_dataframes_become_scans(self, cache, tmp_path):
+        cache.salt_lf = pl.DataFrame({"name": ["a"], "edhrecSaltiness": [1.5]})
+        cache.rulings_lf = pl.DataFrame({"a": [1]}).lazy()
+
+        cache._dump_and_reload_as_lazy()
+
+        assert isinstance(cache.salt_lf, pl.LazyFrame)
+        assert cache.salt_lf.collect()["name"].to_list() == ["a"]
+        assert cache.rulings_lf.collect()["a"].to_list() == [1]
+        assert (tmp_path / "lazy" / "salt.parquet").exists()
+        assert not list((tmp_path / "lazy").glob("*.tmp"))
+
+    def test_unchanged_file_view_is_not_rewritten(self, cache, tmp_path):
+        source = _source(tmp_path)
+        cache.sets_lf = _sets_view(source)
+        cache._dump_and_reload_as_lazy()
+        dumped = tmp_path / "lazy" / "sets.parquet"
+        before = dumped.stat().st_mtime_ns
+
+        cache.sets_lf = _sets_view(source)
+        cache._dump_and_reload_as_lazy()
+
+        assert dumped.stat().st_mtime_ns == before
+        assert cache.sets_lf.collect()["setCode"].to_list() == [1, 2]
+
+    def test_changed_source_is_redumped(self, cache, tmp_path):
+        source = _source(tmp_path)
+        cache.sets_lf = _sets_view(source)
+        cache._dump_and_reload_as_lazy()
+
+        source = _source(tmp_path, values=(3,))
+        # Guarantee a distinct mtime on coarse filesystems
+        os.utime(source, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns + 10**9))
+        cache.sets_lf = _sets_view(source)
+        cache._dump_and_reload_as_lazy()
+
+        assert cache.sets_lf.collect()["setCode"].to_list() == [3]
+
+    def test_manifest_only_tracks_file_backed_frames(self, cache, tmp_path):
+        cache.sets_lf = _sets_view(_source(tmp_path))
+        cache.decks_lf = pl.DataFrame({"code": ["X"]}).lazy()
+
+        cache._dump_and_reload_as_lazy()
+
+        manifest = (tmp_path / "lazy" / _DUMP_MANIFEST).read_text(encoding="utf-8")
+        assert "sets.parquet" in manifest
+        assert "decks.parquet" not in manifest
+
+    def test_store_backed_frames_skipped(self, cache, tmp_path):
+        cache.cards_lf = _sets_view(_source(tmp_path))
+        cache._store_backed_frames.add("cards_lf")
+
+        cache._dump_and_reload_as_lazy()
+
+        assert not (tmp_path / "lazy" / "cards.parquet").exists()
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class TestDumpHelpers:
+    def test_fingerprint_requires_file_sources(self, tmp_path):
+        assert _lazy_plan_fingerprint(pl.DataFrame({"a": [1]}).lazy()) is None
+
+        source = _source(tmp_path)
+        result = _lazy_plan_fingerprint(_sets_view(source))
+        assert result is not None
+        digest, sources = result
+        assert sources == [source]
+        again = _lazy_plan_fingerprint(_sets_view(source))
+        assert again is not None
+        assert digest == again[0]
+
+    def test_oversized_frame_runs_alone(self):
+        budget = _MemoryBudget(cap_bytes=10)
+        budget.acquire(100)
+        budget.release(100)
+        budget.acquire(5)
+        budget.acquire(5)
+        budget.release(10)
@@ -0,0 +1,103 @@
+"""Tests for demand-driven GlobalCache loading."""
+
+from __future__ import annotations
+
+from mtgjson5.data import PipelineContext
+from mtgjson5.data.cache import GLOBAL_CACHE
+from mtgjson5.data.requirements import (
+    LOOKUP_INPUTS,
+    OUTPUT_INPUTS,
+    STEP_PROVIDES,
+    required_inputs,
+    required_steps,
+)
+from mtgjson5.data.scheduler import LoadStep
+
+CATALOGS = OUTPUT_INPUTS["keywords"] | OUTPUT_INPUTS["cardtypes"]
+
+
+def _step_names(inputs):
+    return {step.name for step in required_steps(GLOBAL_CACHE._load_steps(), inputs)}
+
+
+# =============================================================================
+# Required inputs
+# =============================================================================
+
+
+class TestRequiredInputs:
+    def test_no_card_build_needs_nothing(self):
+        assert required_inputs(build_cards=False, outputs={"keywords"}) == frozenset()
+
+    def test_sets_only_skips_catalogs(self):
+        inputs = required_inputs(build_cards=True, sets_only=True)
+
+        assert "cards_lf" in inputs
+        assert not inputs & CATALOGS
+
+    def test_single_output_adds_its_inputs(self):
+        inputs = required_inputs(build_cards=True, outputs={"Keywords"})
+
+        assert OUTPUT_INPUTS["keywords"] <= inputs
+        assert not inputs & OUTPUT_INPUTS["cardtypes"]
+
+    def test_full_build_needs_every_output(self):
+        inputs = required_inputs(build_cards=True)
+
+        assert inputs >= CATALOGS
+        assert "tcg_skus_lf" in inputs
+
+    def test_closed_over_lookup_inputs(self):
+        inputs = required_inputs(build_cards=True, sets_only=True)
+
+        for lookup in LOOKUP_INPUTS:
+            assert LOOKUP_INPUTS[lookup] <= inputs
+
+
+# =============================================================================
+# Step selection
+# =============================================================================
+
+
+class TestRequiredSteps:
+    def test_every_load_step_declares_its_outputs(self):
+        assert {step.name for step in GLOBAL_CACHE._load_steps()} <= STEP_PROVIDES.keys()
+
+    def test_nothing_required_runs_nothing(self):
+        assert _step_names(frozenset()) == set()
+
+    def test_sets_only_skips_catalog_step(self):
+        names = _step_names(required_inputs(build_cards=True, sets_only=True))
+
+        assert "scryfall_catalogs" not in names
+        assert {"bulk_download", "github", "mcm"} <= names
+
+    def test_dependencies_are_pulled_in(self):
+        assert _step_names({"decks_lf"}) == {
+            "github",
+            "missing_set_cards",
+            "resources",
+            "bulk_load",
+            "bulk_download",
+            "sets_metadata",
+        }
+
+    def test_undeclared_step_is_kept(self):
+        steps = [LoadStep("brand_new", lambda: None), LoadStep("edhrec", lambda: None)]
+
+        assert [step.name for step in required_steps(steps, frozenset())] == ["brand_new"]
+
+
+# =============================================================================
+# Lookup consolidation
+# =============================================================================
+
+
+class TestConsolidateRequiredLookups:
+    def test_skips_unrequired_lookups(self):
+        ctx = PipelineContext.for_testing()
+
+        ctx.consolidate_lookups(frozenset())
+
+        assert ctx.identifiers_lf is None
+        assert ctx.tcg_alt_foil_lf is None
@@ -0,0 +1,112 @@
+"""Tests for the GlobalCache load-step dependency scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mtgjson5.data.cache import GLOBAL_CACHE
+from mtgjson5.data.scheduler import LoadStep, StepTiming, _validate, critical_path, run_step_graph
+
+
+def _run(steps, workers=4):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return run_step_graph(steps, executor)
+
+
+# =============================================================================
+# Graph execution
+# =============================================================================
+
+
+class TestRunStepGraph:
+    def test_dependencies_finish_first(self):
+        order: list[str] = []
+
+        def slow_a():
+            time.sleep(0.02)
+            order.append("a")
+
+        steps = [
+            LoadStep("c", lambda: order.append("c"), ("a", "b")),
+            LoadStep("a", slow_a),
+            LoadStep("b", lambda: order.append("b"), ("a",)),
+        ]
+
+        timings = _run(steps)
+
+        assert order == ["a", "b", "c"]
+        assert timings["b"].start >= timings["a"].end
+        assert timings["c"].start >= timings["b"].end
+
+    def test_independent_steps_overlap(self):
+        # Both steps must be running at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        steps = [LoadStep("a", barrier.wait), LoadStep("b", barrier.wait)]
+
+        timings = _run(steps)
+
+        assert set(timings) == {"a", "b"}
+
+    def test_non_critical_failure_still_runs_dependents(self):
+        ran: list[str] = []
+
+        def boom():
+            raise RuntimeError("provider down")
+
+        timings = _run([LoadStep("a", boom), LoadStep("b", lambda: ran.append("b"), ("a",))])
+
+        assert ran == ["b"]
+        assert timings["a"].error == "RuntimeError: provider down"
+
+    def test_critical_failure_aborts(self):
+        ran: list[str] = []
+
+        def boom():
+            raise RuntimeError("bulk missing")
+
+        with pytest.raises(RuntimeError, match="bulk missing"):
+            _run([LoadStep("a", boom, critical=True), LoadStep("b", lambda: ran.append("b"), ("a",))])
+
+        assert not ran
+
+    def test_rejects_unknown_dependency(self):
+        with pytest.raises(ValueError, match="unknown"):
+            _run([LoadStep("a", lambda: None, ("missing",))])
+
+    def test_rejects_cycle(self):
+        with pytest.raises(ValueError, match="cycle"):
+            _run([LoadStep("a", lambda: None, ("b",)), LoadStep("b", lambda: None, ("a",))])
+
+
+# =============================================================================
+# Critical path
+# =============================================================================
+
+
+class TestCriticalPath:
+    def test_follows_latest_dependency(self):
+        timings = {
+            "download": StepTiming(0.0, 5.0),
+            "resources": StepTiming(0.0, 1.0),
+            "load": StepTiming(5.0, 6.0, ("download",)),
+            "github": StepTiming(6.0, 9.0, ("load", "resources")),
+            "salt": StepTiming(0.0, 2.0),
+        }
+        assert critical_path(timings) == ["download", "load", "github"]
+
+    def test_empty(self):
+        assert not critical_path({})
+
+
+class TestGlobalCacheSteps:
+    def test_load_graph_is_valid(self):
+        steps = _validate(GLOBAL_CACHE._load_steps())
+        assert "mcm" in steps
+        assert set(steps["github"].deps) == {"missing_set_cards", "resources"}
+
+    def test_skip_mcm(self):
+        assert "mcm" not in _validate(GLOBAL_CACHE._load_steps(skip_mcm=True))
@@ -9,8 +9,12 @@ import pytest
 
 from mtgjson5.build.formats.sqlite import (
     TABLE_INDEXES,
+    SQLiteBuilder,
     _polars_to_sqlite_type,
+    bulk_load,
+    insert_rows,
 )
+from mtgjson5.build.prices.price_writers import write_prices_sqlite
 from mtgjson5.build.serializers import serialize_complex_types
 
 # =============================================================================
@@ -185,3 +189,103 @@ class TestTableIndexes:
         for (idx_name,) in indexes:
             assert idx_name.startswith("idx_cards_")
         conn.close()
+
+
+# =============================================================================
+# TestBulkLoad
+# =============================================================================
+
+
+class TestBulkLoad:
+    def test_rows_streamed_in_slices(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("mtgjson5.build.formats.sqlite.INSERT_BATCH_ROWS", 2)
+        df = pl.DataFrame({"uuid": [f"u{i}" for i in range(5)], "val": [1, None, 3, 4, 5]})
+        path = tmp_path / "bulk.sqlite"
+
+        with bulk_load(path) as cursor:
+            cursor.execute('CREATE TABLE "t" ("uuid" TEXT, "val" INTEGER)')
+            assert insert_rows(cursor, "t", df) == 5
+
+        conn = sqlite3.connect(str(path))
+        assert conn.execute("SELECT uuid, val FROM t ORDER BY uuid").fetchall() == df.rows()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        conn.close()
+
+    def test_existing_file_replaced(self, tmp_path):
+        path = tmp_path / "bulk.sqlite"
+        path.write_bytes(b"stale")
+
+        with bulk_load(path) as cursor:
+            cursor.execute('CREATE TABLE "t" ("x" TEXT)')
+
+        conn = sqlite3.connect(str(path))
+        assert conn.execute("SELECT name FROM sqlite_master").fetchall() == [("t",)]
+        conn.close()
+
+    def test_failed_load_removes_file(self, tmp_path):
+        path = tmp_path / "bulk.sqlite"
+
+        def load() -> None:
+            with bulk_load(path) as cursor:
+                cursor.execute('CREATE TABLE "t" ("x" TEXT)')
+                cursor.execute('INSERT INTO "missing" VALUES (1)')
+
+        with pytest.raises(sqlite3.OperationalError):
+            load()
+        assert not path.exists()
+
+    def test_builder_indexes_after_load(self, tmp_path):
+        class FakeCtx:
+            normalized_tables = {
+                "cards": pl.DataFrame(
+                    {"uuid": ["a", "b"], "name": ["X", "Y"], "setCode": ["TST", "TST"], "colors": [["W"], []]}
+                ),
+                "cardRulings": pl.DataFrame({"uuid": ["a"], "text": ["Ruling."]}),
+                "tokens": pl.DataFrame(),
+            }
+            normalized_boosters = {"setBoosterContents": pl.DataFrame({"setCode": ["TST"], "boosterName": ["play"]})}
+            output_path = tmp_path
+
+        path = SQLiteBuilder(FakeCtx()).write()
+
+        assert path == tmp_path / "AllPrintings.sqlite"
+        conn = sqlite3.connect(str(path))
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        assert tables == {"cards", "cardRulings", "setBoosterContents", "meta"}
+        assert indexes == {
+            "idx_cards_uuid",
+            "idx_cards_name",
+            "idx_cards_setCode",
+            "idx_cardRulings_uuid",
+            "idx_setBoosterContents_setCode",
+        }
+        assert conn.execute("SELECT colors FROM cards ORDER BY uuid").fetchall() == [("W",), ("",)]
+        conn.close()
+
+    def test_prices_sqlite(self, tmp_path):
+        df = pl.DataFrame(
+            {
+                "uuid": ["a", "b"],
+                "date": ["2026-01-01", "2026-01-01"],
+                "source": ["paper", "paper"],
+                "provider": ["tcgplayer", "cardkingdom"],
+                "price_type": ["retail", "buylist"],
+                "finish": ["normal", "foil"],
+                "price": [1.5, 0.25],
+                "currency": ["USD", "USD"],
+            }
+        )
+        path = tmp_path / "AllPricesToday.sqlite"
+
+        write_prices_sqlite(df, path)
+
+        conn = sqlite3.connect(str(path))
+        assert conn.execute("SELECT uuid, priceType, price FROM prices ORDER BY uuid").fetchall() == [
+            ("a", "retail", 1.5),
+            ("b", "buylist", 0.25),
+        ]
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        assert indexes == {"idx_prices_uuid", "idx_prices_date", "idx_prices_provider"}
+        assert conn.execute("SELECT COUNT(*) FROM meta").fetchone()[0] == 1
+        conn.close()
@@ -0,0 +1,169 @@
+"""Tests for the resumable card pipeline state."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from mtgjson5 import constants
+from mtgjson5.data import PipelineContext
+from mtgjson5.pipeline import core
+from mtgjson5.pipeline.resume import (
+    BatchManifest,
+    load_stage_checkpoint,
+    run_key,
+    save_stage_checkpoint,
+)
+from mtgjson5.profiler import PipelineProfiler
+
+# =============================================================================
+# Batch manifest
+# =============================================================================
+
+
+class TestBatchManifest:
+    def test_round_trip_with_completed_batches(self, tmp_path):
+        manifest = BatchManifest("k1", [["A", "B"], ["C"], ["D"]], root=tmp_path)
+        manifest.save()
+        manifest.mark_complete(1)
+
+        loaded = BatchManifest.load("k1", root=tmp_path)
+
+        assert loaded is not None
+        assert loaded.batches == [["A", "B"], ["C"], ["D"]]
+        assert loaded.pending() == {0: ["A", "B"], 2: ["D"]}
+
+    def test_other_inputs_are_not_resumed(self, tmp_path):
+        BatchManifest("k1", [["A"]], root=tmp_path).save()
+
+        assert BatchManifest.load("k2", root=tmp_path) is None
+
+    def test_mark_complete_drops_stage_checkpoints(self, tmp_path):
+        manifest = BatchManifest("k1", [["A"]], root=tmp_path)
+        save_stage_checkpoint(manifest.batch_dir(0), "collect_1_after_joins", pl.DataFrame({"x": [1]}))
+
+        manifest.mark_complete(0)
+
+        assert not manifest.batch_dir(0).exists()
+
+    def test_clear_removes_state(self, tmp_path):
+        root = tmp_path / "resume"
+        manifest = BatchManifest("k1", [["A"]], root=root)
+        manifest.save()
+
+        manifest.clear()
+
+        assert BatchManifest.load("k1", root=root) is None
+
+    def test_run_key_tracks_fingerprints_and_filter(self):
+        base = run_key(["A", "B"], {"A": "1", "B": "2"})
+
+        assert run_key(["B", "A"], {"A": "1", "B": "2"}) == base
+        assert run_key(["A", "B"], {"A": "1", "B": "3"}) != base
+        assert run_key(["A", "B"], {"A": "1", "B": "2"}, {"id-1"}) != base
+
+
+# =============================================================================
+# Stage checkpoints
+# =============================================================================
+
+
+class TestStageCheckpoints:
+    def test_latest_checkpoint_replaces_earlier(self, tmp_path):
+        save_stage_checkpoint(tmp_path, "collect_1_after_joins", pl.DataFrame({"x": [1]}))
+        save_stage_checkpoint(tmp_path, "collect_2_before_relationships", pl.DataFrame({"x": [2]}))
+
+        result = load_stage_checkpoint(tmp_path, core._COLLECT_POINTS)
+
+        assert result is not None
+        name, lf = result
+        assert name == "collect_2_before_relationships"
+        assert lf.collect()["x"].to_list() == [2]
+        assert [p.name for p in tmp_path.glob("*.parquet")] == ["collect_2_before_relationships.parquet"]
+
+    def test_no_checkpoint(self, tmp_path):
+        assert load_stage_checkpoint(tmp_path, core._COLLECT_POINTS) is None
+
+    def test_stages_resume_after_latest_collect(self, tmp_path, monkeypatch):
+        def _fail(*_args, **_kwargs):
+            pytest.fail("stage group before the checkpoint was rerun")
+
+        monkeypatch.setattr(core, "_run_stages_to_joins", _fail)
+        monkeypatch.setattr(core, "_run_stages_to_uuids", _fail)
+        monkeypatch.setattr(core, "_run_relationship_stages", _fail)
+        monkeypatch.setattr(core, "_run_output_stages", lambda _ctx, lf, **_kwargs: lf)
+        save_stage_checkpoint(tmp_path, "collect_3_before_enrichment", pl.DataFrame({"x": [3]}))
+
+        lf = core._run_pipeline_stages(
+            None,
+            pl.LazyFrame({"x": [0]}),
+            scryfall_uuid_lf=pl.LazyFrame(),
+            prof=PipelineProfiler(enabled=False),
+            label="batch_0",
+            checkpoint_dir=tmp_path,
+        )
+
+        assert lf.collect()["x"].to_list() == [3]
+
+    def test_collect_points_are_persisted(self, tmp_path, monkeypatch):
+        for stage in ("_run_stages_to_joins", "_run_stages_to_uuids", "_run_output_stages"):
+            monkeypatch.setattr(core, stage, lambda _ctx, lf, **_kwargs: lf)
+        monkeypatch.setattr(
+            core, "_run_relationship_stages", lambda _ctx, lf, **_kwargs: lf.with_columns(pl.col("x") + 1)
+        )
+
+        lf = core._run_pipeline_stages(
+            None,
+            pl.LazyFrame({"x": [0]}),
+            scryfall_uuid_lf=pl.LazyFrame(),
+            prof=PipelineProfiler(enabled=False),
+            label="batch_0",
+            checkpoint_dir=tmp_path,
+        )
+
+        assert lf.collect()["x"].to_list() == [1]
+        result = load_stage_checkpoint(tmp_path, core._COLLECT_POINTS)
+        assert result is not None
+        name, saved = result
+        assert name == "collect_3_before_enrichment"
+        assert saved.collect()["x"].to_list() == [1]
+
+
+# =============================================================================
+# Batch loop
+# =============================================================================
+
+
+class TestBatchLoopCheckpoints:
+    @pytest.fixture
+    def checkpoint_dirs(self, tmp_path, monkeypatch):
+        """Stub the batch loop's collaborators; returns each batch's checkpoint_dir."""
+        monkeypatch.setattr(constants, "CACHE_PATH", tmp_path)
+        monkeypatch.setattr(core, "_build_global_scryfall_uuid_map", lambda _ctx: pl.LazyFrame())
+        monkeypatch.setattr(core, "compute_set_fingerprints", lambda _ctx, codes, _lf: dict.fromkeys(codes, "f"))
+        monkeypatch.setattr(core, "count_set_rows", lambda _lf, codes, _ids: dict.fromkeys(codes, 1))
+        monkeypatch.setattr(core, "save_batch_stats", lambda _batches: None)
+        monkeypatch.setattr(core, "build_id_mappings_from_parquet", lambda _ctx: None)
+        monkeypatch.setattr(core, "_record_batch_fingerprints", lambda _codes, _fingerprints: None)
+        seen: list = []
+
+        def _process(_ctx, _codes, **kwargs):
+            seen.append(kwargs["checkpoint_dir"])
+            return 0.0
+
+        monkeypatch.setattr(core, "_process_batch", _process)
+        return seen
+
+    def _build(self, resume: bool) -> None:
+        ctx = PipelineContext.for_testing(cards_lf=pl.LazyFrame({"set": ["aaa", "bbb"], "id": ["1", "2"]}))
+        core._build_cards_batched(ctx, 1, PipelineProfiler(enabled=False), incremental=False, resume=resume)
+
+    def test_not_written_without_resume(self, checkpoint_dirs):
+        self._build(resume=False)
+
+        assert checkpoint_dirs == [None, None]
+
+    def test_written_per_batch_with_resume(self, checkpoint_dirs, tmp_path):
+        self._build(resume=True)
+
+        assert checkpoint_dirs == [tmp_path / "_pipeline_resume" / f"batch_{i}" for i in range(2)]
@@ -0,0 +1,303 @@
+"""Tests for the parallel card-pipeline batch workers.
+
+Covers the worker-state round-trip (``PipelineContext.dump_for_workers`` /
+``from_worker_state``), worker-count resolution in ``pipeline.core``, and
+that spawned workers write the same partitions as the serial batch loop.
+"""
+
+from __future__ import annotations
+
+import types
+import typing
+from argparse import Namespace
+from typing import Any
+
+import polars as pl
+import pytest
+from pydantic import BaseModel
+
+from mtgjson5 import constants
+from mtgjson5.data.cache import GLOBAL_CACHE, _normalize_columns
+from mtgjson5.data.context import (
+    _WORKER_CACHE_FRAMES,
+    _WORKER_CACHE_RESOURCES,
+    PipelineContext,
+)
+from mtgjson5.models.scryfall.models import CardFace, Legalities, ScryfallCard
+from mtgjson5.pipeline import core
+from mtgjson5.pipeline.core import _resolve_pipeline_workers
+from mtgjson5.pipeline.resume import BatchManifest
+from mtgjson5.polars_utils import discover_categoricals
+from mtgjson5.profiler import PipelineProfiler
+from mtgjson5.providers.scryfall.provider import ScryfallProvider
+
+
+@pytest.fixture
+def restore_global_cache():
+    """Snapshot the GlobalCache attributes that from_worker_state overwrites."""
+    names = (*_WORKER_CACHE_FRAMES, *_WORKER_CACHE_RESOURCES)
+    saved = {name: getattr(GLOBAL_CACHE, name, None) for name in names}
+    yield
+    for name, value in saved.items():
+        setattr(GLOBAL_CACHE, name, value)
+
+
+# =============================================================================
+# Worker state round-trip
+# =============================================================================
+
+
+class TestWorkerState:
+    def _make_ctx(self) -> PipelineContext:
+        cards = pl.LazyFrame({"id": ["a", "b"], "set": ["tst", "tst"]})
+        sets = pl.LazyFrame({"code": ["TST"], "name": ["Test Set"]})
+        ctx = PipelineContext.for_testing(
+            cards_lf=cards,
+            sets_lf=sets,
+            meld_triplets={"Bruna": ["Bruna", "Gisela", "Brisela"]},
+            args=Namespace(sets=["TST"], pretty=False),
+        )
+        ctx.identifiers_lf = pl.LazyFrame({"scryfallId": ["a"], "side": ["a"], "cachedUuid": ["u1"]})
+        ctx.face_flavor_names_df = pl.DataFrame({"scryfallId": ["b"], "faceFlavorName": ["Alt"]})
+        ctx.mcm_set_map = {"test set": {"mcmId": 1}}
+        ctx.scryfall_id_filter = {"a"}
+        return ctx
+
+    def test_lookups_written_as_parquet(self, tmp_path, restore_global_cache):
+        ctx = self._make_ctx()
+        state_path = ctx.dump_for_workers(tmp_path)
+
+        assert state_path.exists()
+        assert (tmp_path / "identifiers.parquet").exists()
+        assert (tmp_path / "face_flavor_names.parquet").exists()
+        # Unset lookups are skipped rather than written empty
+        assert not (tmp_path / "oracle_data.parquet").exists()
+
+    def test_round_trip_restores_context(self, tmp_path, restore_global_cache):
+        ctx = self._make_ctx()
+        state_path = ctx.dump_for_workers(tmp_path)
+
+        restored = PipelineContext.from_worker_state(state_path)
+
+        assert restored.args is not None
+        assert ctx.cards_lf is not None
+        assert ctx.sets_lf is not None
+        assert ctx.identifiers_lf is not None
+        assert restored.cards_lf is not None
+        assert restored.sets_lf is not None
+        assert restored.args.sets == ["TST"]
+        assert restored.scryfall_id_filter == {"a"}
+        assert restored.mcm_set_map == {"test set": {"mcmId": 1}}
+        assert restored.meld_triplets == {"Bruna": ["Bruna", "Gisela", "Brisela"]}
+        assert restored.cards_lf.collect().equals(ctx.cards_lf.collect())
+        assert restored.sets_lf.collect().equals(ctx.sets_lf.collect())
+
+        assert isinstance(restored.identifiers_lf, pl.LazyFrame)
+        assert restored.identifiers_lf.collect().equals(ctx.identifiers_lf.collect())
+        assert isinstance(restored.face_flavor_names_df, pl.DataFrame)
+        assert restored.face_flavor_names_df.equals(ctx.face_flavor_names_df)
+        assert restored.oracle_data_lf is None
+
+
+# =============================================================================
+# Serial / parallel equivalence
+# =============================================================================
+
+
+def _polars_dtype(annotation: Any) -> pl.DataType:
+    """Polars dtype for a ScryfallCard field annotation (for all-null columns)."""
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        return _polars_dtype(args[0])
+    if origin is list:
+        return pl.List(_polars_dtype(args[0]))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return pl.Struct({k: _polars_dtype(f.annotation) for k, f in annotation.model_fields.items()})
+    return {bool: pl.Boolean(), int: pl.Int64(), float: pl.Float64()}.get(annotation, pl.String())
+
+
+def _scryfall_card(i: int, set_code: str, name: str, **overrides: Any) -> dict[str, Any]:
+    """One bulk-data row with every ScryfallCard field present."""
+    legalities = dict.fromkeys(Legalities.model_fields, "not_legal") | {"vintage": "legal", "modern": "legal"}
+    row: dict[str, Any] = dict.fromkeys(ScryfallCard.model_fields)
+    row.update(
+        {
+            "object": "card",
+            "id": f"00000000-0000-0000-0000-00000000000{i}",
+            "oracle_id": f"10000000-0000-0000-0000-00000000000{i}",
+            "lang": "en",
+            "name": name,
+            "set": set_code,
+            "set_name": f"{set_code.upper()} Set",
+            "set_id": set_code,
+            "set_type": "core",
+            "collector_number": str(i),
+            "layout": "normal",
+            "mana_cost": "{R}",
+            "cmc": 1.0,
+            "type_line": "Instant",
+            "oracle_text": "Deal 3 damage to any target.",
+            "colors": ["R"],
+            "color_identity": ["R"],
+            "keywords": [],
+            "legalities": legalities,
+            "games": ["paper"],
+            "finishes": ["nonfoil", "foil"],
+            "foil": True,
+            "nonfoil": True,
+            "oversized": False,
+            "promo": False,
+            "reprint": False,
+            "variation": False,
+            "reserved": False,
+            "digital": False,
+            "booster": True,
+            "full_art": False,
+            "textless": False,
+            "story_spotlight": False,
+            "highres_image": True,
+            "image_status": "highres_scan",
+            "rarity": "common",
+            "artist": "Test Artist",
+            "border_color": "black",
+            "frame": "2015",
+            "released_at": "2020-01-01",
+            "uri": "https://example.test/card",
+            "scryfall_uri": "https://example.test/scryfall",
+            "rulings_uri": "https://example.test/rulings",
+            "prints_search_uri": "https://example.test/prints",
+            "set_uri": "https://example.test/set",
+            "set_search_uri": "https://example.test/set_search",
+            "scryfall_set_uri": "https://example.test/scryfall_set",
+        }
+    )
+    row.update(overrides)
+    return row
+
+
+def _pipeline_ctx() -> PipelineContext:
+    """Two-set context ready for ``_process_batch`` (incl. a foreign printing)."""
+    rows = [
+        _scryfall_card(1, "tst", "Bolt"),
+        _scryfall_card(2, "tst", "Shock"),
+        _scryfall_card(3, "ts2", "Bolt"),
+        _scryfall_card(
+            4,
+            "tst",
+            "Bolt",
+            lang="de",
+            collector_number="1",
+            printed_name="Blitz",
+            printed_text="Verursacht 3 Schaden.",
+            printed_type_line="Spontanzauber",
+        ),
+    ]
+    df = pl.DataFrame(
+        rows,
+        schema_overrides={"card_faces": pl.List(CardFace.polars_schema())},
+        infer_schema_length=None,
+    )
+    df = df.with_columns(
+        pl.col(name).cast(_polars_dtype(ScryfallCard.model_fields[name].annotation))
+        for name, dtype in df.schema.items()
+        if dtype in (pl.Null, pl.List(pl.Null))
+    )
+    cards = _normalize_columns(ScryfallProvider().pin_bulk_schema(df.lazy()))
+    sets = _normalize_columns(
+        pl.LazyFrame(
+            {
+                "code": ["tst", "ts2"],
+                "name": ["Test", "Test 2"],
+                "released_at": ["2020-01-01", "2021-01-01"],
+                "set_type": ["core", "core"],
+            }
+        )
+    )
+    rulings = _normalize_columns(
+        pl.LazyFrame(
+            {
+                "object": ["ruling"],
+                "oracle_id": ["10000000-0000-0000-0000-000000000001"],
+                "source": ["wotc"],
+                "published_at": ["2020-01-01"],
+                "comment": ["Note."],
+            }
+        )
+    )
+    salt = pl.LazyFrame(
+        {"oracleId": ["10000000-0000-0000-0000-000000000001"], "edhrecSaltiness": [0.51], "edhrecRank": [100]}
+    )
+    ctx = PipelineContext.for_testing(
+        cards_lf=cards,
+        sets_lf=sets,
+        rulings_lf=rulings,
+        salt_lf=salt,
+        meld_triplets={},
+        manual_overrides={},
+        args=Namespace(sets=["TST", "TS2"], pretty=False),
+    )
+    ctx.categoricals = discover_categoricals(cards, sets)
+    ctx.consolidate_lookups()
+    return ctx
+
+
+def _read_partitions(cache_path) -> dict[str, pl.DataFrame]:
+    """Every card/token partition under a cache dir, keyed by relative path."""
+    return {
+        str(path.relative_to(cache_path)): pl.read_parquet(path).sort("uuid")
+        for path in sorted(cache_path.glob("_parquet*/setCode=*/*.parquet"))
+    }
+
+
+class TestParallelBatches:
+    def test_matches_serial_partitions(self, tmp_path, monkeypatch, restore_global_cache):
+        # Workers log to the parent's file rather than a new one under LOG_PATH
+        monkeypatch.setattr("mtgjson5.utils._CURRENT_LOG_FILE", str(tmp_path / "workers.log"))
+        batches = [["TST"], ["TS2"]]
+        ctx = _pipeline_ctx()
+        uuid_lf = core._build_global_scryfall_uuid_map(ctx)
+        prof = PipelineProfiler(enabled=False)
+
+        serial_cache = tmp_path / "serial"
+        monkeypatch.setattr(constants, "CACHE_PATH", serial_cache)
+        for idx, codes in enumerate(batches):
+            core._process_batch(ctx, codes, scryfall_uuid_lf=uuid_lf, prof=prof, label=f"batch_{idx}")
+
+        parallel_cache = tmp_path / "parallel"
+        monkeypatch.setattr(constants, "CACHE_PATH", parallel_cache)
+        manifest = BatchManifest("key", batches, root=tmp_path / "resume")
+        core._run_batches_parallel(ctx, manifest, uuid_lf, 2, prof, {})
+
+        serial = _read_partitions(serial_cache)
+        parallel = _read_partitions(parallel_cache)
+        assert set(serial) >= {"_parquet/setCode=TST/0.parquet", "_parquet/setCode=TS2/0.parquet"}
+        assert list(parallel) == list(serial)
+        for name, df in serial.items():
+            assert parallel[name].equals(df), name
+        assert manifest.pending() == {}
+        assert not (parallel_cache / "_pipeline_workers").exists()
+
+
+# =============================================================================
+# Worker count resolution
+# =============================================================================
+
+
+class TestResolvePipelineWorkers:
+    def test_default_is_serial(self):
+        assert _resolve_pipeline_workers(1, 20) == 1
+        assert _resolve_pipeline_workers(None, 20) == 1
+
+    def test_capped_at_batch_count(self):
+        assert _resolve_pipeline_workers(8, 3) == 3
+
+    def test_single_batch_is_serial(self):
+        assert _resolve_pipeline_workers(4, 1) == 1
+
+    def test_auto_within_bounds(self):
+        n = _resolve_pipeline_workers("auto", 5)
+        assert 1 <= n <= 5
+
+    def test_non_positive_clamped(self):
+        assert _resolve_pipeline_workers(0, 10) == 1
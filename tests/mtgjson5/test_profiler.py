@@ -218,6 +218,22 @@ class TestPipelineProfilerEnabled:
         assert "export" in summary
         assert "prices" in summary
 
+    def test_step_timings_in_report_and_summary(self):
+        p = PipelineProfiler(enabled=True)
+        p.start()
+        p.add_step_timings(
+            "global_cache",
+            {
+                "bulk_download": {"start": 0.0, "end": 4.0, "seconds": 4.0, "deps": []},
+                "bulk_load": {"start": 4.0, "end": 5.0, "seconds": 1.0, "deps": ["bulk_download"]},
+            },
+            ["bulk_download", "bulk_load"],
+        )
+        report = p.finish()
+        assert report["step_timings"]["global_cache"]["critical_path"] == ["bulk_download", "bulk_load"]
+        summary = p._format_summary(report)
+        assert "bulk_download -> bulk_load" in summary
+
 
 # ---------------------------------------------------------------------------
 # PipelineProfiler with tracemalloc
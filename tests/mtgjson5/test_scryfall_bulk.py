@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import gzip
 import json
 
 import orjson
+import polars as pl
 import pytest
 
+from mtgjson5.providers.http_cache import VALIDATOR_FILE, HttpRevalidationCache
 from mtgjson5.providers.scryfall.provider import ScryfallProvider
 
 
@@ -104,3 +107,163 @@ class TestConvertFileToNdjson:
 
         assert count == 2
         assert _read_ndjson(dest) == CARDS
+
+
+# =============================================================================
+# TestStreamingDownload
+# =============================================================================
+
+
+class _FakeContent:
+    def __init__(self, body, fail_after=None):
+        self._body = body
+        self._fail_after = fail_after
+
+    async def iter_chunked(self, size):
+        for i, start in enumerate(range(0, len(self._body), 7)):
+            if self._fail_after is not None and i >= self._fail_after:
+                raise ConnectionResetError("connection dropped")
+            yield self._body[start : start + 7]
+
+
+class _FakeResponse:
+    def __init__(self, body, fail_after=None, status=200):
+        self.status = status
+        self.headers = {"Content-Length": str(len(body)), "ETag": '"v1"'}
+        self.content = _FakeContent(body, fail_after)
+
+    def raise_for_status(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, body, fail_after=None, status=200):
+        self._response = _FakeResponse(body, fail_after, status)
+        self.request_headers: dict = {}
+
+    def get(self, url, headers=None):
+        self.request_headers = headers or {}
+        return self._response
+
+
+class TestStreamingDownload:
+    def _download(self, provider, tmp_path, body, http_cache=None, **kwargs):
+        dest = tmp_path / "all_cards.ndjson"
+        session = _FakeSession(body, **kwargs)
+        return asyncio.run(provider.download_to_ndjson(session, "https://example.invalid/x", dest, http_cache))
+
+    def test_gzipped_jsonl_streamed(self, provider, tmp_path, monkeypatch):
+        # Tiny queue forces the producer to block on the converter
+        monkeypatch.setattr(ScryfallProvider, "STREAM_QUEUE_CHUNKS", 1)
+        body = gzip.compress(b"\n".join(orjson.dumps(c) for c in CARDS) + b"\n")
+
+        dest = self._download(provider, tmp_path, body)
+
+        assert _read_ndjson(dest) == CARDS
+        assert not dest.with_name(dest.name + ".part").exists()
+
+    def test_json_array_streamed(self, provider, tmp_path):
+        dest = self._download(provider, tmp_path, orjson.dumps(CARDS))
+
+        assert _read_ndjson(dest) == CARDS
+
+    def test_failed_download_leaves_no_output(self, provider, tmp_path):
+        body = b"\n".join(orjson.dumps(c) for c in CARDS) + b"\n"
+
+        with pytest.raises(ConnectionResetError):
+            self._download(provider, tmp_path, body, fail_after=2)
+
+        assert not list(tmp_path.iterdir())
+
+    def test_not_modified_keeps_cached_file(self, provider, tmp_path):
+        http_cache = HttpRevalidationCache(tmp_path / "validators" / VALIDATOR_FILE)
+        body = b"\n".join(orjson.dumps(c) for c in CARDS) + b"\n"
+        dest = self._download(provider, tmp_path, body, http_cache=http_cache)
+        assert http_cache.conditional_headers("https://example.invalid/x") == {"If-None-Match": '"v1"'}
+        before = dest.stat().st_mtime_ns
+
+        self._download(provider, tmp_path, b"", http_cache=http_cache, status=304)
+
+        assert dest.stat().st_mtime_ns == before
+        assert _read_ndjson(dest) == CARDS
+
+
+# =============================================================================
+# TestEnsureBulkParquet
+# =============================================================================
+
+
+BULK_ROWS = [
+    {"id": "a", "set": "10e", "name": "Alpha", "power": 2},
+    {"id": "b", "set": "con", "name": "Beta", "power": "*"},
+    {"id": "c", "set": "10e", "name": "Gamma"},
+]
+
+
+def _write_bulk(cache_dir, rows=None):
+    rows = BULK_ROWS if rows is None else rows
+    path = cache_dir / "all_cards.ndjson"
+    path.write_bytes(b"\n".join(orjson.dumps(r) for r in rows) + b"\n")
+    return path
+
+
+class TestEnsureBulkParquet:
+    def test_writes_set_partitions(self, provider, tmp_path):
+        _write_bulk(tmp_path)
+
+        store = provider.ensure_bulk_parquet(tmp_path)
+
+        assert store == ScryfallProvider.bulk_parquet_dir(tmp_path)
+        assert sorted(p.name for p in store.iterdir() if p.is_dir()) == ["set=10e", "set=con"]
+
+    def test_pinned_schema(self, provider, tmp_path):
+        _write_bulk(tmp_path)
+
+        lf = ScryfallProvider.scan_bulk_parquet(provider.ensure_bulk_parquet(tmp_path))
+        schema = lf.collect_schema()
+
+        assert schema["power"] == pl.String
+        assert schema["defense"] == pl.String
+        assert schema["flavor_name"] == pl.String
+        assert schema["set"] == pl.String
+
+    def test_set_filter_reads_one_partition(self, provider, tmp_path):
+        _write_bulk(tmp_path)
+        lf = ScryfallProvider.scan_bulk_parquet(provider.ensure_bulk_parquet(tmp_path))
+
+        df = lf.filter(pl.col("set").str.to_uppercase().is_in(["10E"])).collect()
+
+        assert sorted(df["id"].to_list()) == ["a", "c"]
+        assert "set=con" not in lf.filter(pl.col("set") == "10e").explain()
+
+    def test_reused_for_same_release(self, provider, tmp_path):
+        source = _write_bulk(tmp_path)
+        provider._write_bulk_meta(source, "2026-01-01T00:00:00+00:00")
+        store = provider.ensure_bulk_parquet(tmp_path)
+        part = store / "set=con" / "00000000.parquet"
+        before = part.stat().st_mtime_ns
+
+        provider.ensure_bulk_parquet(tmp_path)
+
+        assert part.stat().st_mtime_ns == before
+
+    def test_rebuilt_for_new_release(self, provider, tmp_path):
+        source = _write_bulk(tmp_path)
+        provider._write_bulk_meta(source, "2026-01-01T00:00:00+00:00")
+        provider.ensure_bulk_parquet(tmp_path)
+
+        _write_bulk(tmp_path, [*BULK_ROWS, {"id": "d", "set": "abc", "name": "Delta"}])
+        provider._write_bulk_meta(source, "2026-01-02T00:00:00+00:00")
+        store = provider.ensure_bulk_parquet(tmp_path)
+
+        assert (store / "set=abc").is_dir()
+        assert not store.with_name(store.name + ".tmp").exists()
+
+    def test_missing_source_returns_none(self, provider, tmp_path):
+        assert provider.ensure_bulk_parquet(tmp_path) is None
@@ -1,7 +1,8 @@
-"""Tests for mtgjson5.build.serializers — escape functions, serialize_complex_types, batched."""
+"""Tests for mtgjson5.build.serializers — escape functions, SQL dump writers, serialize_complex_types, batched."""
 
 from __future__ import annotations
 
+import io
 import json
 
 import polars as pl
@@ -13,7 +14,11 @@ from mtgjson5.build.serializers import (
     escape_mysql,
     escape_postgres,
     escape_sqlite,
+    mysql_literal_expr,
+    postgres_copy_expr,
     serialize_complex_types,
+    write_mysql_inserts,
+    write_postgres_copy,
 )
 
 # =============================================================================
@@ -170,6 +175,83 @@ class TestBatched:
         assert not list(batched([], 5))
 
 
+# =============================================================================
+# Vectorized SQL dump writers
+# =============================================================================
+
+
+@pytest.fixture
+def dump_df() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "text": ["plain", "tab\there", "new\nline\r", "back\\slash", 'it\'s "q"', "nul\0", "é 🂡", None],
+            "flag": [True, False, None, True, False, True, None, False],
+            "number": [1, -2, None, 0, 10**12, 3, 4, 5],
+            "empty": [None] * 8,
+        }
+    )
+
+
+class TestSqlDumpExpressions:
+    def test_postgres_matches_escape_postgres(self, dump_df):
+        rendered = dump_df.select(postgres_copy_expr(c, t) for c, t in dump_df.schema.items())
+
+        for column in dump_df.columns:
+            assert rendered[column].to_list() == [escape_postgres(v) for v in dump_df[column]]
+
+    def test_mysql_matches_escape_mysql(self, dump_df):
+        rendered = dump_df.select(mysql_literal_expr(c, t) for c, t in dump_df.schema.items())
+
+        for column in dump_df.columns:
+            assert rendered[column].to_list() == [escape_mysql(v) for v in dump_df[column]]
+
+    def test_floats_are_numerically_equal(self):
+        df = pl.DataFrame({"price": [0.1, 1.5, 2.5e-5, 1e16]})
+
+        rendered = df.select(postgres_copy_expr("price", pl.Float64))["price"].to_list()
+
+        assert [float(v) for v in rendered] == df["price"].to_list()
+
+
+class TestWritePostgresCopy:
+    def test_rows_match_row_escaping(self, dump_df, monkeypatch):
+        monkeypatch.setattr("mtgjson5.build.serializers.SQL_DUMP_CHUNK_ROWS", 3)
+        f = io.StringIO()
+
+        count = write_postgres_copy(f, "cards", dump_df)
+
+        expected = ['COPY "cards" ("text", "flag", "number", "empty") FROM stdin;']
+        expected += ["\t".join(escape_postgres(v) for v in row) for row in dump_df.rows()]
+        assert count == 8
+        assert f.getvalue() == "\n".join(expected) + "\n\\.\n\n"
+
+    def test_empty_frame(self):
+        f = io.StringIO()
+
+        assert write_postgres_copy(f, "t", pl.DataFrame({"a": []}, schema={"a": pl.String})) == 0
+        assert f.getvalue() == 'COPY "t" ("a") FROM stdin;\n\\.\n\n'
+
+
+class TestWriteMysqlInserts:
+    def test_multi_row_statements(self, dump_df, monkeypatch):
+        monkeypatch.setattr("mtgjson5.build.serializers.SQL_DUMP_CHUNK_ROWS", 5)
+        f = io.StringIO()
+
+        count = write_mysql_inserts(f, "cards", dump_df, rows_per_insert=3)
+
+        tuples = ["(" + ", ".join(escape_mysql(v) for v in row) + ")" for row in dump_df.rows()]
+        prefix = "INSERT INTO `cards` (`text`, `flag`, `number`, `empty`) VALUES\n"
+        groups = [tuples[0:3], tuples[3:5], tuples[5:8]]
+        assert count == 8
+        assert f.getvalue() == "".join(prefix + ",\n".join(group) + ";\n" for group in groups)
+
+    def test_empty_frame_writes_nothing(self):
+        f = io.StringIO()
+
+        assert write_mysql_inserts(f, "t", pl.DataFrame({"a": []}, schema={"a": pl.String})) == 0
+        assert f.getvalue() == ""
+
+
 # =============================================================================
 # TestCrossDialectConsistency
 # =============================================================================
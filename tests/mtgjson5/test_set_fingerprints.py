@@ -0,0 +1,132 @@
+"""Tests for per-set input fingerprints used by incremental card builds."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from mtgjson5 import constants
+from mtgjson5.data.context import PipelineContext
+from mtgjson5.pipeline.fingerprint import (
+    FINGERPRINT_FILE,
+    compute_set_fingerprints,
+    has_partitions,
+    load_fingerprints,
+    save_fingerprints,
+)
+
+
+def _cards(**overrides: list) -> pl.LazyFrame:
+    data = {
+        "id": ["s1", "s2", "s3"],
+        "set": ["aaa", "aaa", "bbb"],
+        "name": ["Alpha", "Beta // Gamma", "Delta"],
+        "oracleId": ["o1", "o2", "o3"],
+        "multiverseIds": [[1], [2], []],
+    }
+    data.update(overrides)
+    return pl.LazyFrame(data)
+
+
+def _uuid_map() -> pl.LazyFrame:
+    return pl.LazyFrame({"scryfallId": ["s1", "s2", "s3"], "uuid": ["u1", "u2", "u3"]})
+
+
+def _fingerprints(ctx: PipelineContext) -> dict[str, str]:
+    return compute_set_fingerprints(ctx, ["AAA", "BBB"], _uuid_map())
+
+
+# =============================================================================
+# Fingerprint computation
+# =============================================================================
+
+
+class TestComputeSetFingerprints:
+    def test_deterministic(self):
+        ctx = PipelineContext.for_testing(cards_lf=_cards())
+        assert _fingerprints(ctx) == _fingerprints(ctx)
+
+    def test_card_change_only_affects_its_set(self):
+        before = _fingerprints(PipelineContext.for_testing(cards_lf=_cards()))
+        after = _fingerprints(PipelineContext.for_testing(cards_lf=_cards(name=["Alpha", "Beta // Gamma", "Epsilon"])))
+
+        assert before["AAA"] == after["AAA"]
+        assert before["BBB"] != after["BBB"]
+
+    def test_row_order_does_not_matter(self):
+        cards = _cards()
+        shuffled = cards.reverse()
+        assert _fingerprints(PipelineContext.for_testing(cards_lf=cards)) == _fingerprints(
+            PipelineContext.for_testing(cards_lf=shuffled)
+        )
+
+    def test_lookup_change_attributed_by_key(self):
+        ctx = PipelineContext.for_testing(cards_lf=_cards())
+        ctx.oracle_data_lf = pl.LazyFrame({"oracleId": ["o1", "o3"], "edhrecRank": [10, 20]})
+        before = _fingerprints(ctx)
+
+        ctx.oracle_data_lf = pl.LazyFrame({"oracleId": ["o1", "o3"], "edhrecRank": [10, 21]})
+        after = _fingerprints(ctx)
+
+        assert before["AAA"] == after["AAA"]
+        assert before["BBB"] != after["BBB"]
+
+    def test_name_lookup_matches_face_names_case_insensitively(self):
+        ctx = PipelineContext.for_testing(cards_lf=_cards())
+        ctx.name_lf = pl.LazyFrame({"name": ["GAMMA"], "cardParts": [["x"]]})
+        before = _fingerprints(ctx)
+
+        ctx.name_lf = pl.LazyFrame({"name": ["GAMMA"], "cardParts": [["y"]]})
+        after = _fingerprints(ctx)
+
+        assert before["AAA"] != after["AAA"]
+        assert before["BBB"] == after["BBB"]
+
+    def test_keyed_resource_override(self):
+        before = _fingerprints(PipelineContext.for_testing(cards_lf=_cards(), card_enrichment={"AAA": {"1": {}}}))
+        after = _fingerprints(
+            PipelineContext.for_testing(cards_lf=_cards(), card_enrichment={"AAA": {"1": {"promo": True}}})
+        )
+
+        assert before["AAA"] != after["AAA"]
+        assert before["BBB"] == after["BBB"]
+
+    def test_global_input_affects_every_set(self):
+        before = _fingerprints(PipelineContext.for_testing(cards_lf=_cards(), standard_legal_sets={"AAA"}))
+        after = _fingerprints(PipelineContext.for_testing(cards_lf=_cards(), standard_legal_sets={"AAA", "BBB"}))
+
+        assert before["AAA"] != after["AAA"]
+        assert before["BBB"] != after["BBB"]
+
+
+# =============================================================================
+# Persistence
+# =============================================================================
+
+
+class TestFingerprintStore:
+    def test_round_trip(self, tmp_path):
+        save_fingerprints({"BBB": "2", "AAA": "1"}, tmp_path)
+
+        assert (tmp_path / FINGERPRINT_FILE).exists()
+        assert load_fingerprints(tmp_path) == {"AAA": "1", "BBB": "2"}
+
+    def test_missing_or_corrupt_file(self, tmp_path):
+        assert load_fingerprints(tmp_path) == {}
+        (tmp_path / FINGERPRINT_FILE).write_text("{not json", encoding="utf-8")
+        assert load_fingerprints(tmp_path) == {}
+
+    def test_has_partitions(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(constants, "CACHE_PATH", tmp_path)
+        assert not has_partitions("AAA")
+
+        part = tmp_path / "_parquet_tokens" / "setCode=AAA"
+        part.mkdir(parents=True)
+        (part / "0.parquet").write_bytes(b"")
+        assert has_partitions("AAA")
+
+    def test_has_partitions_windows_safe_code(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(constants, "CACHE_PATH", tmp_path)
+        part = tmp_path / "_parquet" / "setCode=CON_"
+        part.mkdir(parents=True)
+        (part / "0.parquet").write_bytes(b"")
+        assert has_partitions("CON")
@@ -0,0 +1,137 @@
+"""Tests for the shared serialized set fragment store."""
+
+from __future__ import annotations
+
+import shutil
+
+import orjson
+import pytest
+
+from mtgjson5.build.context import AssemblyContext
+from mtgjson5.build.formats.json import JsonOutputBuilder
+from mtgjson5.build.fragments import SetFragmentStore
+from mtgjson5.models.files import AllPrintingsFile, FormatFilter
+
+
+@pytest.fixture
+def store(assembly_ctx: AssemblyContext, tmp_path) -> SetFragmentStore:
+    return SetFragmentStore(assembly_ctx, root=tmp_path / "_set_fragments")
+
+
+class TestSetFragmentStore:
+    def test_fragment_matches_assembled_set(self, store, assembly_ctx):
+        fragment = store.get("TST")
+
+        assert orjson.loads(fragment) == assembly_ctx.sets.build("TST")
+
+    def test_fragment_reused_from_disk(self, store, monkeypatch):
+        first = store.get("TST")
+        monkeypatch.setattr(store.ctx.sets, "build", lambda code: pytest.fail("rebuilt a stored fragment"))
+
+        assert store.get("TST") == first
+
+    def test_hash_mismatch_is_rebuilt(self, store):
+        first = store.get("TST")
+        path = store.root / "TST.json"
+        path.write_bytes(b'{"truncated":')
+
+        assert store.get("TST") == first
+        assert path.read_bytes() == first
+
+    def test_reset_clears_fragments(self, store):
+        store.get("TST")
+        store.reset()
+
+        assert not (store.root / "TST.json").exists()
+
+    def test_iter_fragments_skips_unknown_codes(self, store):
+        codes = [code for code, _ in store.iter_fragments(["TS2", "NOPE", "TST"])]
+
+        assert codes == ["TS2", "TST"]
+
+
+class TestFragmentOutputs:
+    @pytest.fixture
+    def builder(self, assembly_ctx, store, monkeypatch) -> JsonOutputBuilder:
+        monkeypatch.setitem(assembly_ctx.__dict__, "set_fragments", store)
+        return JsonOutputBuilder(assembly_ctx)
+
+    def test_all_printings_embeds_fragments(self, builder, store, tmp_path):
+        out = tmp_path / "AllPrintings.json"
+        count = builder.write_all_printings(out)
+
+        raw = out.read_bytes()
+        assert count == 2
+        assert b'"TST":' + store.get("TST") in raw
+        assert set(orjson.loads(raw)["data"]) == {"TST", "TS2"}
+
+    def test_set_file_wraps_fragment(self, builder, store, assembly_ctx, tmp_path):
+        count = builder.write_set_files(tmp_path, set_codes=["TST"])
+
+        assert count == 1
+        doc = orjson.loads((tmp_path / "TST.json").read_bytes())
+        assert doc["meta"] == assembly_ctx.meta
+        assert doc["data"] == orjson.loads(store.get("TST"))
+
+    def test_format_printings_single_pass(self, builder, assembly_ctx, tmp_path, monkeypatch):
+        loads: list[str] = []
+        get = builder.ctx.set_fragments.get
+
+        def counting_get(code):
+            loads.append(code)
+            return get(code)
+
+        monkeypatch.setattr(builder.ctx.set_fragments, "get", counting_get)
+
+        counts = builder.write_format_printings(tmp_path, ["vintage", "legacy"])
+
+        assert len(loads) == len(set(loads))
+        for fmt in ("vintage", "legacy"):
+            doc = orjson.loads((tmp_path / f"{fmt.title()}.json").read_bytes())
+            assert doc["meta"] == assembly_ctx.meta
+            assert doc["format_name"] == fmt
+            assert counts[fmt.title()] == len(doc["data"])
+            for set_data in doc["data"].values():
+                assert set_data["cards"]
+                assert all(FormatFilter.is_legal(card, fmt) for card in set_data["cards"])
+        assert counts["Vintage"] == 1
+
+    def test_format_printings_match_all_printings_filter(self, builder, tmp_path):
+        builder.write_all_printings(tmp_path / "AllPrintings.json")
+        all_printings = AllPrintingsFile.read(tmp_path / "AllPrintings.json")
+        streamed = tmp_path / "streamed"
+        streamed.mkdir()
+
+        builder.write_format_printings(streamed, ["vintage", "legacy"])
+
+        for fmt in ("vintage", "legacy"):
+            expected = tmp_path / f"{fmt.title()}.json"
+            builder.write_format_file(all_printings, fmt, expected)
+            assert (streamed / expected.name).read_bytes() == expected.read_bytes()
+
+
+class TestParallelFragments:
+    @pytest.fixture
+    def cached_ctx(self, assembly_ctx: AssemblyContext, tmp_path) -> AssemblyContext:
+        cache_dir = tmp_path / "cache"
+        shutil.copytree(assembly_ctx.parquet_dir, cache_dir / "_parquet")
+        shutil.copytree(assembly_ctx.tokens_dir, cache_dir / "_parquet_tokens")
+        assembly_ctx.save_cache(cache_dir)
+        ctx = AssemblyContext.from_cache(cache_dir=cache_dir)
+        assert ctx is not None
+        return ctx
+
+    def test_workers_preserve_order_and_bytes(self, cached_ctx, tmp_path, monkeypatch):
+        # Workers log to the parent's file rather than a new one under LOG_PATH
+        monkeypatch.setattr("mtgjson5.utils._CURRENT_LOG_FILE", str(tmp_path / "workers.log"))
+        serial = SetFragmentStore(cached_ctx, root=tmp_path / "serial")
+        parallel = SetFragmentStore(cached_ctx, root=tmp_path / "parallel")
+
+        expected = list(serial.iter_fragments())
+        got = list(parallel.iter_fragments(workers=2, window=1))
+
+        assert [code for code, _ in got] == sorted(code for code, _ in got)
+        assert got == expected
+
+    def test_missing_cache_falls_back_in_process(self, store):
+        assert list(store.iter_fragments(workers=2)) == list(store.iter_fragments())
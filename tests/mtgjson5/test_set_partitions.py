@@ -0,0 +1,38 @@
+"""Tests for the concurrent per-set parquet partition writer."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from mtgjson5.pipeline.stages.output import write_set_partitions
+
+
+def _frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "setCode": ["AAA", "BBB", "AAA", "CON"],
+            "name": ["a1", "b1", "a2", "c1"],
+        }
+    )
+
+
+class TestWriteSetPartitions:
+    def test_one_partition_per_set(self, tmp_path):
+        written = write_set_partitions(_frame(), tmp_path)
+
+        assert written == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "setCode=AAA",
+            "setCode=BBB",
+            "setCode=CON_",
+        ]
+        aaa = pl.read_parquet(tmp_path / "setCode=AAA" / "0.parquet")
+        assert sorted(aaa["name"].to_list()) == ["a1", "a2"]
+
+    def test_round_trips_through_hive_scan(self, tmp_path):
+        write_set_partitions(_frame(), tmp_path)
+
+        df = pl.read_parquet(tmp_path / "**" / "*.parquet")
+
+        assert df.height == 4
+        assert sorted(df["name"].to_list()) == ["a1", "a2", "b1", "c1"]
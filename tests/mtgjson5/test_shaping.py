@@ -0,0 +1,78 @@
+"""Tests for vectorized printing output shaping."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from mtgjson5.build.context import AssemblyContext
+from mtgjson5.build.shaping import printings_to_dicts, shape_printings
+from mtgjson5.models.cards import CardSet, CardToken
+
+
+def _model_path(df: pl.DataFrame, model) -> list[dict]:
+    models = model.from_dataframe(df)
+    models.sort()
+    return [m.to_polars_dict(exclude_none=True) for m in models]
+
+
+class TestPrintingsToDicts:
+    @pytest.mark.parametrize("code", ["TST", "TS2"])
+    def test_cards_match_model_round_trip(self, assembly_ctx: AssemblyContext, code: str) -> None:
+        df = assembly_ctx.sets.load_set_cards(code)
+
+        assert printings_to_dicts(df, CardSet) == _model_path(df, CardSet)
+
+    def test_tokens_match_model_round_trip(self, assembly_ctx: AssemblyContext) -> None:
+        df = assembly_ctx.sets.load_set_tokens("TST")
+
+        assert printings_to_dicts(df, CardToken) == _model_path(df, CardToken)
+
+    def test_row_rules(self) -> None:
+        df = pl.DataFrame(
+            {
+                "name": ["Fire // Ice", "Bear"],
+                "number": ["10", "2"],
+                "uuid": ["u1", "u2"],
+                "type": ["Instant", "Creature — Bear"],
+                "setCode": ["TST", "TST"],
+                "borderColor": ["black", "black"],
+                "frameVersion": ["2015", "2015"],
+                "rarity": ["common", "common"],
+                "layout": ["split", "normal"],
+                "colors": [["U", "R"], ["G"]],
+                "isPromo": [False, True],
+                "flavorText": ["", "Grr"],
+                "keywords": [[], ["Trample"]],
+                "manaValue": [2, 2],
+                "convertedManaCost": [2, 2],
+                "rulings": [
+                    [{"publishedAt": "2020-01-02", "comment": "b"}, {"publishedAt": "2020-01-01", "comment": "a"}],
+                    [],
+                ],
+                "notAField": [1, 2],
+            }
+        )
+
+        bear, fire = printings_to_dicts(df, CardSet)
+
+        assert [bear["number"], fire["number"]] == ["2", "10"]
+        assert fire["colors"] == ["U", "R"]
+        assert fire["rulings"] == [{"date": "2020-01-01", "text": "a"}, {"date": "2020-01-02", "text": "b"}]
+        assert "isPromo" not in fire
+        assert bear["isPromo"] is True
+        assert "flavorText" not in fire
+        assert "keywords" not in fire
+        assert isinstance(fire["manaValue"], float)
+        assert fire["legalities"] == {}
+        assert fire["purchaseUrls"] == {}
+        assert "notAField" not in fire
+        assert fire == _model_path(df, CardSet)[1]
+
+    def test_shape_is_columnar(self) -> None:
+        df = pl.DataFrame({"name": ["A"], "number": ["1"], "uuid": ["u"], "extra": [1]})
+
+        shaped = shape_printings(df, CardSet)
+
+        assert "extra" not in shaped.columns
+        assert shaped.height == 1
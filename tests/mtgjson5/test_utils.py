@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import pathlib
+import time
 
 from mtgjson5.utils import (
     deep_sort_keys,
@@ -11,6 +12,7 @@ from mtgjson5.utils import (
     get_all_entities_from_content,
     get_file_hash,
     get_str_or_none,
+    map_ordered,
     parse_magic_rules_subset,
     recursive_sort,
     sort_internal_lists,
@@ -324,3 +326,21 @@ class TestDeepSortKeys:
     def test_list_order_preserved(self):
         result = deep_sort_keys([3, 1, 2])
         assert result == [3, 1, 2]
+
+
+# ---------------------------------------------------------------------------
+# map_ordered
+# ---------------------------------------------------------------------------
+
+
+class TestMapOrdered:
+    def test_keeps_input_order(self):
+        def slow_first(n: int) -> int:
+            if n == 0:
+                time.sleep(0.05)
+            return n * 10
+
+        assert list(map_ordered(slow_first, range(6), workers=3)) == [0, 10, 20, 30, 40, 50]
+
+    def test_single_worker_runs_inline(self):
+        assert list(map_ordered(str, [1, 2], workers=1)) == ["1", "2"]